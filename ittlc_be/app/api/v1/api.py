@@ -1,6 +1,6 @@
 # backend/app/api/v1/api.py
 from fastapi import APIRouter
-from app.api.v1.endpoints import users, members, auth, prayers, offerings, families, system
+from app.api.v1.endpoints import users, members, auth, prayers, offerings, families, system, jobs, realtime, sync
 
 api_router = APIRouter()
 api_router.include_router(users.router, prefix="/users", tags=["users"])
@@ -9,4 +9,7 @@ api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(prayers.router, prefix="/prayers", tags=["prayers"])
 api_router.include_router(offerings.router, prefix="/offerings", tags=["offerings"])
 api_router.include_router(families.router, prefix="/families", tags=["families"])
-api_router.include_router(system.router, prefix="/system", tags=["system"])
\ No newline at end of file
+api_router.include_router(system.router, prefix="/system", tags=["system"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+api_router.include_router(realtime.router, prefix="/realtime", tags=["realtime"])
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
@@ -0,0 +1,126 @@
+"""
+백그라운드 작업 API 엔드포인트
+
+오래 걸리는 작업은 202 와 작업 id 를 바로 돌려주고, 진행 상태는 GET /jobs/{id} 로 조회합니다.
+"""
+from fastapi import APIRouter, HTTPException, status, Query
+from fastapi.responses import FileResponse
+from typing import List, Optional
+from datetime import date
+
+from app.schemas import (
+    JobCreate, OfferingImportRequest, BackgroundJob, BackgroundJobDetail
+)
+from app.services.job_queue import job_queue, EXPORT_QUERIES, FINISHED
+
+router = APIRouter()
+
+
+def _validate_params(job_data: JobCreate):
+    """작업 종류별 입력 확인 (작업자에서 실패하기 전에 400 으로 응답)"""
+    params = job_data.params
+    try:
+        for key in ("start_date", "end_date"):
+            if params.get(key) is not None:
+                date.fromisoformat(str(params[key]))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)")
+    if job_data.job_type == "offering_statistics":
+        if not params.get("start_date") or not params.get("end_date"):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date 와 end_date 가 필요합니다")
+        if params["start_date"] > params["end_date"]:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date 가 end_date 보다 늦습니다")
+    elif job_data.job_type == "export" and params.get("dataset") not in EXPORT_QUERIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"dataset 은 {', '.join(EXPORT_QUERIES)} 중 하나여야 합니다"
+        )
+    elif job_data.job_type == "backup" and params.get("kind", "auto") not in ("auto", "full", "incremental"):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="kind 는 auto, full, incremental 중 하나여야 합니다")
+
+
+@router.post("/", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+async def create_job(job_data: JobCreate):
+    """작업 접수 (진행 상태는 GET /jobs/{job_id} 로 확인)"""
+    _validate_params(job_data)
+    try:
+        result = await job_queue.submit(job_data.job_type, job_data.params, job_data.created_by)
+        return {"message": "작업을 접수했습니다", **result}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"작업 접수 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.post("/imports/offerings", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+async def import_offerings(import_data: OfferingImportRequest):
+    """헌금 기록 대량 가져오기 접수"""
+    try:
+        rows = [
+            {**row.model_dump(mode="json"), "created_by": import_data.created_by}
+            for row in import_data.rows
+        ]
+        # 행은 작업 입력 파일로 저장하고 params 에는 행 수만 기록
+        result = await job_queue.submit("offerings_import", {"rows": len(rows)}, import_data.created_by,
+                                        input_rows=rows)
+        return {"message": "가져오기 작업을 접수했습니다", "rows": len(rows), **result}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"작업 접수 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/", response_model=List[BackgroundJob])
+async def get_jobs(
+    job_status: Optional[str] = Query(None, alias="status", description="상태 (queued, running, succeeded, failed, cancelled)"),
+    limit: int = Query(default=50, ge=1, le=200, description="가져올 항목 수")
+):
+    """최근 작업 목록"""
+    try:
+        return await job_queue.list(status=job_status, limit=limit)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"작업 목록 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/{job_id}", response_model=BackgroundJobDetail)
+async def get_job(job_id: int):
+    """작업 상태, 진행률, 결과 조회"""
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다")
+    return job
+
+@router.get("/{job_id}/result")
+async def get_job_result(job_id: int):
+    """작업 결과 내려받기 (파일 결과는 파일로, 그 밖에는 JSON)"""
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다")
+    if job["status"] != "succeeded":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"작업이 완료되지 않았습니다 (상태: {job['status']})"
+        )
+    if job["has_file"]:
+        result_file = await job_queue.result_file(job_id)
+        return FileResponse(
+            result_file["result_path"],
+            filename=result_file["result_filename"],
+            media_type=result_file["result_content_type"]
+        )
+    return job["result"]
+
+@router.delete("/{job_id}", response_model=BackgroundJobDetail)
+async def cancel_job(job_id: int):
+    """작업 취소 (실행 중인 작업은 작업자가 확인하는 대로 중단)"""
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다")
+    if job["status"] in FINISHED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"이미 끝난 작업입니다 (상태: {job['status']})"
+        )
+    return await job_queue.cancel(job_id)
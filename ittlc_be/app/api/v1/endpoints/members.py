@@ -1,8 +1,11 @@
 # backend/app/api/v1/endpoints/members.py
-from fastapi import APIRouter, HTTPException
-from typing import List
+import base64
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
 from app import schemas
 from app.services.libsql_service import libsql_service
+from app.core.serialization import list_response
 
 router = APIRouter()
 
@@ -54,7 +57,7 @@ async def read_members(skip: int = 0, limit: int = 100):
     """멤버 목록 조회"""
     try:
         members = await libsql_service.get_members(skip=skip, limit=limit)
-        return members
+        return list_response(schemas.Member, members)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"멤버 목록 조회 실패: {str(e)}")
 
@@ -85,9 +88,10 @@ async def update_member(member_id: int, member: schemas.MemberUpdate):
         for field, value in member.dict(exclude_unset=True).items():
             if value is not None:
                 update_data[field] = value
+        modified_by = update_data.pop("modified_by", None)
         
-        # 멤버 업데이트
-        updated_member = await libsql_service.update_member(member_id, update_data)
+        # 멤버 업데이트 (바뀐 필드는 수정 이력에 기록)
+        updated_member = await libsql_service.update_member(member_id, update_data, modified_by=modified_by)
         if updated_member is None:
             raise HTTPException(status_code=500, detail="멤버 업데이트 실패")
         
@@ -98,6 +102,42 @@ async def update_member(member_id: int, member: schemas.MemberUpdate):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"멤버 업데이트 실패: {str(e)}")
 
+def _encode_cursor(item: dict) -> str:
+    return base64.urlsafe_b64encode(f"{item['modified_at']}|{item['id']}".encode()).decode()
+
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        modified_at, history_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return modified_at, int(history_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="cursor 형식이 올바르지 않습니다")
+
+@router.get("/{member_id}/history", response_model=schemas.MemberHistoryPage)
+async def read_member_history(
+    member_id: int,
+    start: Optional[datetime] = Query(None, description="이 시각 이후 (UTC)"),
+    end: Optional[datetime] = Query(None, description="이 시각 이전 (UTC)"),
+    field: Optional[str] = Query(None, description="필드 이름"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(default=50, ge=1, le=200, description="가져올 항목 수")
+):
+    """멤버 수정 이력 (최근 순, 커서 페이지)"""
+    position = _decode_cursor(cursor) if cursor else None
+    try:
+        items = await libsql_service.get_member_history(
+            member_id,
+            start=start.strftime("%Y-%m-%d %H:%M:%S") if start else None,
+            end=end.strftime("%Y-%m-%d %H:%M:%S") if end else None,
+            field_name=field,
+            cursor=position,
+            limit=limit + 1,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"멤버 수정 이력 조회 실패: {str(e)}")
+    # 한 건 더 읽어 다음 페이지가 있는지 판단
+    next_cursor = _encode_cursor(items[limit - 1]) if len(items) > limit else None
+    return {"items": items[:limit], "next_cursor": next_cursor}
+
 @router.delete("/{member_id}")
 async def delete_member(member_id: int):
     """멤버 삭제"""
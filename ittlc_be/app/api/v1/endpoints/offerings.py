@@ -11,11 +11,14 @@ from app.schemas import (
     OfferingStatistics, MemberOfferingSummary, OfferingSearchFilter
 )
 from app.services.offering_service import offering_service
+from app.core.serialization import list_response
+from app.core.etag import ConditionalGet
 
 router = APIRouter()
 
 # 헌금 종류 관련 엔드포인트
-@router.get("/types", response_model=List[OfferingType])
+@router.get("/types", response_model=List[OfferingType],
+            dependencies=[Depends(ConditionalGet("offering_types"))])
 async def get_offering_types(
     active_only: bool = Query(default=True, description="활성 헌금 종류만 조회")
 ):
@@ -61,7 +64,7 @@ async def get_offerings(
             start_date=start_date,
             end_date=end_date
         )
-        return offerings
+        return list_response(Offering, offerings)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -12,11 +12,13 @@ from app.schemas import (
     PrayerComment, PrayerCommentCreate, PrayerCommentUpdate
 )
 from app.services.prayer_service_fixed import prayer_service
+from app.core.etag import ConditionalGet
 
 router = APIRouter()
 
 # 기도 카테고리 관련 엔드포인트
-@router.get("/categories", response_model=List[PrayerCategory])
+@router.get("/categories", response_model=List[PrayerCategory],
+            dependencies=[Depends(ConditionalGet("prayer_categories"))])
 async def get_prayer_categories(
     active_only: bool = Query(default=True, description="활성 카테고리만 조회")
 ):
@@ -144,7 +146,14 @@ async def participate_prayer(prayer_id: int, user_id: int):
     """기도 참여"""
     try:
         result = await prayer_service.participate_prayer(prayer_id, user_id)
+        if result is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="기도 제목을 찾을 수 없습니다"
+            )
         return {"message": "기도 참여가 완료되었습니다", "id": result["id"]}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -156,7 +165,14 @@ async def get_prayer_participants(prayer_id: int):
     """기도 참여자 목록 조회"""
     try:
         participants = await prayer_service.get_prayer_participants(prayer_id)
+        if participants is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="기도 제목을 찾을 수 없습니다"
+            )
         return participants
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -173,7 +189,14 @@ async def create_prayer_comment(prayer_id: int, comment_data: PrayerCommentCreat
         comment_dict["prayer_id"] = prayer_id
         
         result = await prayer_service.create_prayer_comment(comment_dict)
+        if result is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="기도 제목을 찾을 수 없습니다"
+            )
         return {"message": "댓글이 생성되었습니다", "id": result["id"]}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -185,7 +208,14 @@ async def get_prayer_comments(prayer_id: int):
     """기도 댓글 목록 조회"""
     try:
         comments = await prayer_service.get_prayer_comments(prayer_id)
+        if comments is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="기도 제목을 찾을 수 없습니다"
+            )
         return comments
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
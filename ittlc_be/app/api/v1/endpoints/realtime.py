@@ -0,0 +1,142 @@
+"""
+실시간 알림 API 엔드포인트 (WebSocket / SSE)
+
+브라우저의 WebSocket/EventSource 는 헤더를 정할 수 없으므로 로그인 토큰은 token 쿼리 파라미터로 받습니다.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import jwt
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from app.api.v1.endpoints.auth import ALGORITHM, SECRET_KEY
+from app.core.config import settings
+from app.services.realtime import Connection, prayer_channel, realtime_hub
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _user_id(token: Optional[str]) -> Optional[int]:
+    """로그인 토큰의 사용자 id (토큰이 없으면 None, 잘못된 토큰은 ValueError)"""
+    if not token:
+        return None
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        return int(payload["sub"])
+    except (jwt.PyJWTError, KeyError, ValueError):
+        raise ValueError("유효하지 않은 토큰입니다")
+
+
+async def _subscribe_prayer(connection: Connection, prayer_id: int) -> bool:
+    if len(connection.channels) >= settings.REALTIME_MAX_CHANNELS:
+        return False
+    if not await realtime_hub.can_subscribe_prayer(prayer_id, connection.user_id):
+        return False
+    realtime_hub.subscribe(connection, prayer_channel(prayer_id))
+    return True
+
+
+@router.get("/events")
+async def stream_events(
+    prayer_id: List[int] = Query(default=[], description="구독할 기도 id (여러 개 가능)"),
+    token: Optional[str] = Query(None, description="로그인 토큰 (내 기도 알림 채널)")
+):
+    """SSE 알림 스트림 (메시지는 JSON 배열, 하트비트는 주석 줄)"""
+    try:
+        user_id = _user_id(token)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    connection = realtime_hub.connect(user_id)
+    if connection is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="연결 수가 많습니다. 잠시 후 다시 시도해주세요")
+    try:
+        for requested in prayer_id:
+            if not await _subscribe_prayer(connection, requested):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"기도 {requested} 를 구독할 수 없습니다")
+    except BaseException:
+        realtime_hub.disconnect(connection)
+        raise
+
+    async def events():
+        try:
+            # 끊기면 브라우저가 3초 뒤 재연결
+            yield b"retry: 3000\n\n"
+            async for batch in realtime_hub.stream(connection):
+                yield b"data: " + realtime_hub.encode(batch) + b"\n\n" if batch else b": ping\n\n"
+        finally:
+            realtime_hub.disconnect(connection)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def websocket_events(websocket: WebSocket, token: Optional[str] = None):
+    """WebSocket 알림 ({"action": "subscribe" | "unsubscribe", "prayer_id": 1} 로 구독 변경)"""
+    try:
+        user_id = _user_id(token)
+    except ValueError:
+        await websocket.close(code=4401)
+        return
+    connection = realtime_hub.connect(user_id)
+    if connection is None:
+        # 1013: 일시적 과부하, 나중에 다시 시도
+        await websocket.close(code=1013)
+        return
+    await websocket.accept()
+    receiver = asyncio.create_task(_receive(websocket, connection))
+    try:
+        async for batch in realtime_hub.stream(connection):
+            message = realtime_hub.encode(batch or [{"type": "ping"}]).decode()
+            # 받는 쪽이 느려 전송이 밀리면 연결을 끊고 클라이언트가 재연결 후 다시 조회하게 함
+            await asyncio.wait_for(websocket.send_text(message), realtime_hub.send_timeout)
+    except (WebSocketDisconnect, asyncio.TimeoutError, RuntimeError):
+        pass
+    finally:
+        receiver.cancel()
+        realtime_hub.disconnect(connection)
+        await asyncio.gather(receiver, return_exceptions=True)
+
+
+async def _receive(websocket: WebSocket, connection: Connection):
+    """클라이언트의 구독/해제 요청 처리 (연결이 끊기면 전송 루프도 종료)
+
+    요청 하나가 실패해도(잘못된 JSON, DB 오류 등) error 메시지로 응답하고 다음 요청을 계속 받음
+    """
+    try:
+        while True:
+            try:
+                request = await websocket.receive_json()
+            except ValueError:
+                realtime_hub.publish_to(connection, {"type": "error", "detail": "JSON 메시지가 필요합니다"})
+                continue
+            try:
+                await _handle_request(connection, request)
+            except Exception as e:
+                logger.warning(f"실시간 요청 처리 실패 (user={connection.user_id}): {e}")
+                realtime_hub.publish_to(connection, {"type": "error", "detail": "요청을 처리하지 못했습니다"})
+    except (WebSocketDisconnect, RuntimeError):
+        connection.close()
+
+
+async def _handle_request(connection: Connection, request: Dict[str, Any]):
+    if not isinstance(request, dict) or not isinstance(request.get("prayer_id"), int):
+        realtime_hub.publish_to(connection, {"type": "error", "detail": "prayer_id 가 필요합니다"})
+        return
+    action, prayer_id = request.get("action"), request["prayer_id"]
+    if action == "subscribe":
+        subscribed = await _subscribe_prayer(connection, prayer_id)
+        realtime_hub.publish_to(connection, {"type": "subscribed" if subscribed else "forbidden",
+                                             "prayer_id": prayer_id})
+    elif action == "unsubscribe":
+        realtime_hub.unsubscribe(connection, prayer_channel(prayer_id))
+        realtime_hub.publish_to(connection, {"type": "unsubscribed", "prayer_id": prayer_id})
+    else:
+        realtime_hub.publish_to(connection, {"type": "error", "detail": "action 은 subscribe 또는 unsubscribe 여야 합니다"})
@@ -0,0 +1,29 @@
+"""
+델타 동기화 API 엔드포인트
+"""
+from fastapi import APIRouter, HTTPException, status, Query
+from typing import Optional
+
+from app.core.config import settings
+from app.services.sync_service import SyncTokenError, sync_service
+
+router = APIRouter()
+
+@router.get("/", response_model=dict)
+async def sync(
+    since: Optional[str] = Query(None, description="이전 응답의 token (없으면 처음부터)"),
+    max_bytes: Optional[int] = Query(None, ge=1024, le=4 * 1024 * 1024, description="응답 크기 목표 (바이트)")
+):
+    """since 이후 바뀐 성도/가족/헌금/기도와 참조 데이터 (삭제는 deleted 의 id 목록)
+
+    reset 이면 로컬 캐시를 비우고 받은 행으로 다시 채우고, has_more 이면 token 으로 이어서 요청합니다.
+    """
+    try:
+        return await sync_service.sync(since, max_bytes or settings.SYNC_MAX_BYTES)
+    except SyncTokenError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"동기화 중 오류가 발생했습니다: {str(e)}"
+        )
@@ -8,15 +8,20 @@ from datetime import datetime, date
 from app.schemas import (
     SystemSetting, SystemSettingCreate, SystemSettingUpdate, SystemSettingListResponse,
     SystemLog, SystemLogCreate, SystemLogListResponse, SystemLogFilter,
-    BackupHistory, BackupHistoryCreate, BackupHistoryUpdate, BackupHistoryListResponse,
-    DashboardStats
+    BackupHistory, BackupHistoryCreate, BackupHistoryUpdate, BackupHistoryListResponse, BackupRequest,
+    DashboardStats, DashboardSnapshot, JobInfo, JobRun
 )
 from app.services.system_service import system_service
+from app.core.serialization import list_response
+from app.core.etag import ConditionalGet, current_month
 
 router = APIRouter()
 
 # 대시보드 관련 엔드포인트
-@router.get("/dashboard/stats", response_model=DashboardStats)
+@router.get("/dashboard/stats", response_model=DashboardStats,
+            dependencies=[Depends(ConditionalGet(
+                "members", "families", "prayers", "offerings", extra=current_month
+            ))])
 async def get_dashboard_stats():
     """대시보드 통계 조회"""
     try:
@@ -28,8 +33,23 @@ async def get_dashboard_stats():
             detail=f"대시보드 통계 조회 중 오류가 발생했습니다: {str(e)}"
         )
 
+@router.get("/dashboard/history", response_model=List[DashboardSnapshot])
+async def get_dashboard_history(
+    days: int = Query(default=30, ge=1, le=366, description="조회할 기간 (일)")
+):
+    """대시보드 통계 스냅샷 이력 조회"""
+    try:
+        history = await system_service.get_dashboard_history(days)
+        return history
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"대시보드 이력 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
 # 시스템 설정 관련 엔드포인트
-@router.get("/settings", response_model=List[SystemSetting])
+@router.get("/settings", response_model=List[SystemSetting],
+            dependencies=[Depends(ConditionalGet("system_settings"))])
 async def get_system_settings():
     """시스템 설정 목록 조회"""
     try:
@@ -53,7 +73,8 @@ async def create_system_setting(setting_data: SystemSettingCreate):
             detail=f"시스템 설정 생성 중 오류가 발생했습니다: {str(e)}"
         )
 
-@router.get("/settings/{setting_key}", response_model=SystemSetting)
+@router.get("/settings/{setting_key}", response_model=SystemSetting,
+            dependencies=[Depends(ConditionalGet("system_settings"))])
 async def get_system_setting(setting_key: str):
     """시스템 설정 조회"""
     try:
@@ -114,7 +135,7 @@ async def get_system_logs(
             start_date=start_date,
             end_date=end_date
         )
-        return logs
+        return list_response(SystemLog, logs)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -149,18 +170,37 @@ async def get_backup_history(
             detail=f"백업 이력 조회 중 오류가 발생했습니다: {str(e)}"
         )
 
-@router.post("/backups", response_model=dict)
-async def create_backup(backup_data: BackupHistoryCreate):
-    """백업 생성"""
+@router.post("/backups", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+async def create_backup(backup_data: BackupRequest):
+    """백업 시작 (진행 상태는 GET /backups/{backup_id} 로 확인)"""
     try:
         result = await system_service.create_backup(backup_data.dict())
-        return {"message": "백업이 생성되었습니다", "id": result["id"]}
+        return {"message": "백업을 시작했습니다", **result}
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"백업 생성 중 오류가 발생했습니다: {str(e)}"
         )
 
+@router.get("/backups/{backup_id}", response_model=BackupHistory)
+async def get_backup(backup_id: int):
+    """백업 기록 조회"""
+    try:
+        backup = await system_service.get_backup(backup_id)
+        if backup is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="백업을 찾을 수 없습니다"
+            )
+        return backup
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"백업 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
 @router.put("/backups/{backup_id}/status", response_model=dict)
 async def update_backup_status(backup_id: int, status_data: BackupHistoryUpdate):
     """백업 상태 업데이트"""
@@ -181,4 +221,35 @@ async def update_backup_status(backup_id: int, status_data: BackupHistoryUpdate)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"백업 상태 업데이트 중 오류가 발생했습니다: {str(e)}"
-        ) 
\ No newline at end of file
+        ) 
+
+# 주기 작업 관련 엔드포인트
+@router.get("/jobs", response_model=List[JobInfo])
+async def get_jobs():
+    """주기 작업 목록 (일정, 다음 실행 시각, 이 워커의 마지막 실행 결과)"""
+    return system_service.get_jobs()
+
+@router.post("/jobs/{job_name}/run", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+async def run_job(job_name: str):
+    """주기 작업 즉시 실행 (결과는 GET /jobs/{job_name}/runs 로 확인)"""
+    result = system_service.run_job(job_name)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다"
+        )
+    return {"message": "작업을 시작했습니다", **result}
+
+@router.get("/jobs/{job_name}/runs", response_model=List[JobRun])
+async def get_job_runs(
+    job_name: str,
+    limit: int = Query(default=20, ge=1, le=100, description="조회할 개수")
+):
+    """주기 작업 실행 이력 (최근 순)"""
+    try:
+        return await system_service.get_job_runs(job_name, limit)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"작업 이력 조회 중 오류가 발생했습니다: {str(e)}"
+        )
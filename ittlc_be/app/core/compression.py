@@ -0,0 +1,226 @@
+"""
+응답 압축 미들웨어 (gzip / brotli)
+
+- Accept-Encoding 협상 (q 값 반영, brotli 우선)
+- 작은 응답, 이미 인코딩된 응답, 스트리밍 응답(내보내기 등)은 건너뜀
+- 캐시 가능한 GET 응답은 압축 결과를 LRU 캐시에 보관하여 재압축하지 않음
+- offload_size 이상인 본문은 스레드에서 압축하여 이벤트 루프(다른 요청, WebSocket/SSE 하트비트)를 막지 않음
+- 압축률과 CPU 시간을 메트릭으로 기록
+"""
+import asyncio
+import gzip
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import metrics
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+# 압축 효과가 있는 콘텐츠 타입
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "text/",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q 값} 으로 파싱"""
+    encodings: Dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[token] = quality
+    return encodings
+
+
+def negotiate_encoding(header: str, available: Tuple[str, ...]) -> Optional[str]:
+    """클라이언트가 허용하는 인코딩 중 가장 선호도가 높은 것 선택"""
+    accepted = parse_accept_encoding(header)
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressedBodyCache:
+    """(인코딩, 원문 해시) → 압축 결과 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._size = 0
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: Tuple[str, bytes], body: bytes):
+        if len(body) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = body
+        self._size += len(body)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6,
+                 brotli_quality: int = 4, cache_entries: int = 256, offload_size: int = 64 * 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.available = ("br", "gzip") if brotli is not None else ("gzip",)
+        self.cache = CompressedBodyCache(max_entries=cache_entries)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""), self.available)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, scope["method"] == "GET", send)
+        await self.app(scope, receive, responder)
+
+    async def compress(self, encoding: str, body: bytes, cacheable: bool) -> bytes:
+        """본문 압축 (캐시 조회 및 메트릭 기록 포함)"""
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest()) if cacheable else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                metrics.incr("compression.cache_hits")
+                self._record(encoding, body, cached)
+                return cached
+
+        if len(body) >= self.offload_size:
+            metrics.incr("compression.offloaded")
+            compressed = await asyncio.to_thread(self._compress, encoding, body)
+        else:
+            compressed = self._compress(encoding, body)
+
+        if key is not None:
+            metrics.incr("compression.cache_misses")
+            self.cache.put(key, compressed)
+        self._record(encoding, body, compressed)
+        return compressed
+
+    def _compress(self, encoding: str, body: bytes) -> bytes:
+        started = time.thread_time()
+        if encoding == "br":
+            compressed = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+        metrics.observe("compression.cpu_ms", (time.thread_time() - started) * 1000)
+        return compressed
+
+    @staticmethod
+    def _record(encoding: str, body: bytes, compressed: bytes):
+        metrics.incr(f"compression.responses.{encoding}")
+        metrics.incr("compression.bytes_in", len(body))
+        metrics.incr("compression.bytes_out", len(compressed))
+        metrics.observe("compression.ratio", len(compressed) / len(body))
+
+
+class _CompressionResponder:
+    """응답 메시지를 가로채 첫 본문 청크를 보고 압축 여부를 결정"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, is_get: bool, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.is_get = is_get
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        if not self._compressible(Headers(raw=self.start_message["headers"])):
+            await self._flush_passthrough(message)
+            return
+        # 여러 청크로 나뉘는 응답은 스트리밍(내보내기 등)으로 간주하고 그대로 전달
+        if message.get("more_body", False):
+            metrics.incr("compression.skipped.streaming")
+            await self._flush_passthrough(message)
+            return
+
+        body = message.get("body", b"")
+        if len(body) < self.middleware.minimum_size:
+            metrics.incr("compression.skipped.small")
+            await self._flush_passthrough(message)
+            return
+
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        cache_control = headers.get("cache-control", "").lower()
+        cacheable = (
+            self.is_get
+            and self.start_message["status"] == 200
+            and "no-store" not in cache_control
+            and "private" not in cache_control
+        )
+        compressed = await self.middleware.compress(self.encoding, body, cacheable)
+
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        if "etag" in headers and not headers["etag"].startswith("W/"):
+            # 강한 ETag는 표현(인코딩)별로 달라야 하므로 약한 ETag로 변환
+            headers["ETag"] = f"W/{headers['etag']}"
+        await self.send(self.start_message)
+        await self.send({"type": "http.response.body", "body": compressed})
+
+    def _compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        if self.start_message["status"] < 200 or self.start_message["status"] in (204, 304):
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def _flush_passthrough(self, message: Message):
+        self.passthrough = True
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers.add_vary_header("Accept-Encoding")
+        await self.send(self.start_message)
+        await self.send(message)
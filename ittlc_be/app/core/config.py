@@ -14,6 +14,108 @@ class Settings(BaseSettings):
     LIBSQL_URL: str = "libsql://ittlcdb-hozza.aws-ap-northeast-1.turso.io"
     LIBSQL_AUTH_TOKEN: Optional[str] = None
 
+    # 데이터베이스 엔진 (auto: file: URL은 로컬 aiosqlite, 그 외는 LibSQL HTTP / libsql / local)
+    DATABASE_ENGINE: str = "auto"
+    LOCAL_DB_READERS: int = 4
+
+    # SQL 문 레지스트리 / 로컬 엔진 준비된 문장 캐시 크기
+    STATEMENT_CACHE_SIZE: int = 512
+
+    # 응답 압축 설정
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_CACHE_ENTRIES: int = 256
+    # 이 크기 이상의 본문은 스레드에서 압축 (바이트)
+    COMPRESSION_OFFLOAD_SIZE: int = 65536
+
+    # 대시보드 통계 주기 재계산 간격 (초)
+    DASHBOARD_REFRESH_INTERVAL: float = 300.0
+
+    # 동일 조회 병합 결과 재사용 시간 (초, 0이면 진행 중인 호출만 병합)
+    SINGLEFLIGHT_TTL: float = 0.0
+
+    # 임베디드 읽기 복제본 (경로를 지정하면 읽기를 로컬 SQLite 파일에서 처리)
+    LIBSQL_REPLICA_PATH: Optional[str] = None
+    LIBSQL_REPLICA_SYNC_INTERVAL: float = 5.0
+    LIBSQL_REPLICA_MAX_STALENESS: float = 60.0
+
+    # 원격 읽기 복제본 (쉼표로 구분한 URL, 지연이 MAX_LAG 초 이하인 복제본만 읽기에 사용)
+    LIBSQL_READ_REPLICA_URLS: Optional[str] = None
+    LIBSQL_REPLICA_MAX_LAG: float = 5.0
+
+    # LibSQL(HTTP) 복원력 정책: 문장 제한 시간, 재시도(지터 지수 백오프), 서킷 브레이커
+    LIBSQL_STATEMENT_TIMEOUT: float = 10.0
+    LIBSQL_MAX_RETRIES: int = 3
+    LIBSQL_RETRY_BASE_DELAY: float = 0.1
+    LIBSQL_RETRY_MAX_DELAY: float = 2.0
+    LIBSQL_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    LIBSQL_CIRCUIT_RESET_TIMEOUT: float = 10.0
+
+    # DB 호출 스케줄러 (동시 실행 상한, 0이면 사용 안 함)
+    DB_MAX_CONCURRENCY: int = 16
+    DB_LANE_WEIGHTS: str = "write=4,read=2,background=1"
+    DB_BACKGROUND_MAX_CONCURRENCY: int = 2
+    DB_QUEUE_TIMEOUT: float = 5.0
+    DB_BACKGROUND_QUEUE_TIMEOUT: float = 60.0
+
+    # 백업 (압축: auto=zstandard 설치 시 zstd, 아니면 gzip / 원본 읽기 속도 제한, 0이면 제한 없음)
+    BACKUP_DIR: str = "./data/backups"
+    BACKUP_COMPRESSION: str = "auto"
+    BACKUP_COMPRESSION_LEVEL: Optional[int] = None
+    BACKUP_MAX_BYTES_PER_SECOND: int = 16 * 1024 * 1024
+    BACKUP_PAGES_PER_STEP: int = 256
+    BACKUP_DUMP_PAGE_SIZE: int = 2000
+    # 증분 백업: 체인(전체 + 증분) 최대 길이, 넘으면 다음 백업은 전체 백업
+    BACKUP_MAX_CHAIN_LENGTH: int = 7
+
+    # 주기 작업 스케줄러 (cron: 분 시 일 월 요일, JOB_TIMEZONE 기준 / 빈 문자열이면 해당 작업 사용 안 함)
+    JOB_SCHEDULER_ENABLED: bool = True
+    JOB_TIMEZONE: str = "Asia/Seoul"
+    JOB_JITTER_SECONDS: float = 30.0
+    JOB_LOG_RETENTION_CRON: str = "30 3 * * *"
+    JOB_BACKUP_CRON: str = "0 2 * * *"
+    JOB_DASHBOARD_REFRESH_CRON: str = "@hourly"
+    JOB_PRAYER_EXPIRY_CRON: str = "10 0 * * *"
+    LOG_RETENTION_DAYS: int = 90
+
+    # 백그라운드 작업 대기열 (/jobs): 작업자 수, CPU 작업용 프로세스 수(0 이면 스레드), 결과 파일 보관
+    JOB_QUEUE_ENABLED: bool = True
+    JOB_QUEUE_WORKERS: int = 2
+    JOB_QUEUE_PROCESSES: int = 2
+    JOB_QUEUE_POLL_INTERVAL: float = 2.0
+    JOB_QUEUE_LEASE_TTL: float = 60.0
+    JOB_QUEUE_MAX_ATTEMPTS: int = 3
+    JOB_RESULT_DIR: str = "./data/jobs"
+    JOB_RESULT_RETENTION_DAYS: int = 7
+    JOB_QUEUE_CLEANUP_CRON: str = "0 4 * * *"
+
+    # 변경 이벤트 디스패처 (트리거가 기록한 change_events 를 구독자에게 전달)
+    # 소비자 이름별로 커서를 저장하므로 재시작 후 이어서 전달
+    OUTBOX_ENABLED: bool = True
+    OUTBOX_CONSUMER: str = "app"
+    OUTBOX_POLL_INTERVAL: float = 1.0
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_RETENTION_DAYS: int = 7
+    JOB_OUTBOX_CLEANUP_CRON: str = "45 3 * * *"
+
+    # 소프트 삭제 정리: 삭제 후 보관 기간이 지난 성도/가정/헌금/기도를 실제 삭제 (묶음 크기 단위로 나눠 실행)
+    SOFT_DELETE_RETENTION_DAYS: int = 30
+    SOFT_DELETE_PURGE_CHUNK_SIZE: int = 500
+    JOB_SOFT_DELETE_PURGE_CRON: str = "30 4 * * *"
+
+    # 실시간 알림 (/realtime): 워커당 최대 연결 수, 연결당 대기 메시지 한도(넘으면 resync),
+    # 병합 대기 시간, 하트비트 간격, 전송 제한 시간(넘으면 연결 종료)
+    REALTIME_MAX_CONNECTIONS: int = 5000
+    REALTIME_MAX_PENDING: int = 100
+    REALTIME_COALESCE_WINDOW: float = 0.1
+    REALTIME_HEARTBEAT_INTERVAL: float = 25.0
+    REALTIME_SEND_TIMEOUT: float = 10.0
+    REALTIME_MAX_CHANNELS: int = 50
+
+    # 델타 동기화 (/sync) 응답 한 페이지의 목표 크기 (바이트)
+    SYNC_MAX_BYTES: int = 256 * 1024
+
     class Config:
         env_file = env_path
         case_sensitive = True
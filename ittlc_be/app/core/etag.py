@@ -0,0 +1,72 @@
+"""
+ETag / 조건부 GET 지원
+
+사용 예:
+    @router.get("/types", dependencies=[Depends(ConditionalGet("offering_types"))])
+
+If-None-Match 가 현재 ETag와 일치하면 엔드포인트(=DB 쿼리)를 실행하지 않고
+NotModified 예외로 304 응답을 돌려줍니다. (예외 처리기는 app/main.py 에 등록)
+"""
+from datetime import datetime
+from typing import Callable, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import Response as PlainResponse
+
+from app.core.metrics import metrics
+from app.db.table_versions import table_versions
+
+
+class NotModified(Exception):
+    def __init__(self, etag: str):
+        self.etag = etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더와 ETag 비교 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def current_month() -> str:
+    """월 단위로 값이 바뀌는 응답(대시보드 등)용 ETag 보조 값
+
+    대시보드 집계와 같은 UTC 기준 (SQLite 의 'now' 도 UTC). 서버 시간대를 쓰면 월이 바뀌는 몇 시간 동안
+    ETag 와 집계의 "이번 달"이 어긋나 지난 달 응답이 304 로 재사용됨
+    """
+    return datetime.utcnow().strftime("%Y-%m")
+
+
+class ConditionalGet:
+    """테이블 버전 기반 조건부 GET 의존성"""
+
+    def __init__(self, *tables: str, extra: Optional[Callable[[], str]] = None):
+        self.tables = tables
+        self.extra = extra
+
+    async def __call__(self, request: Request, response: Response) -> Optional[str]:
+        etag = await table_versions.etag(self.tables, extra=self.extra() if self.extra else "")
+        if etag is None:
+            return None
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            metrics.incr("etag.not_modified")
+            raise NotModified(etag)
+        metrics.incr("etag.miss")
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+        return etag
+
+
+def not_modified_response(etag: str) -> PlainResponse:
+    """304 응답 생성"""
+    return PlainResponse(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
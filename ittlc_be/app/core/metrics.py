@@ -0,0 +1,110 @@
+"""
+프로세스 내 메트릭 수집기
+
+카운터/게이지/관측값(지연 시간, 비율 등)을 메모리에 모아 두고
+/metrics 엔드포인트에서 스냅샷으로 노출합니다.
+"""
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict
+
+
+class _Observation:
+    """관측값 요약 (개수/합/최소/최대 + 최근 샘플 기반 백분위)"""
+    __slots__ = ("count", "total", "minimum", "maximum", "samples")
+
+    def __init__(self, sample_size: int):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.samples: Deque[float] = deque(maxlen=sample_size)
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.samples.append(value)
+
+    def summary(self) -> Dict[str, float]:
+        ordered = sorted(self.samples)
+
+        def percentile(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))]
+
+        return {
+            "count": self.count,
+            "sum": round(self.total, 4),
+            "avg": round(self.total / self.count, 4) if self.count else 0.0,
+            "min": round(self.minimum, 4) if self.count else 0.0,
+            "max": round(self.maximum, 4) if self.count else 0.0,
+            "p50": round(percentile(0.50), 4),
+            "p95": round(percentile(0.95), 4),
+            "p99": round(percentile(0.99), 4),
+        }
+
+
+class MetricsRegistry:
+    def __init__(self, sample_size: int = 1024):
+        self._lock = threading.Lock()
+        self._sample_size = sample_size
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, Any] = {}
+        self._observations: Dict[str, _Observation] = {}
+
+    def incr(self, name: str, value: float = 1):
+        """카운터 증가"""
+        with self._lock:
+            self._counters[name] += value
+
+    def set_gauge(self, name: str, value: Any):
+        """게이지 값 설정"""
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: float):
+        """관측값 기록"""
+        with self._lock:
+            observation = self._observations.get(name)
+            if observation is None:
+                observation = self._observations[name] = _Observation(self._sample_size)
+            observation.add(value)
+
+    @contextmanager
+    def timer(self, name: str):
+        """블록 실행 시간을 밀리초 단위로 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - started) * 1000)
+
+    def counter(self, name: str) -> float:
+        """카운터 현재 값"""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """전체 메트릭 스냅샷"""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "observations": {name: obs.summary() for name, obs in self._observations.items()},
+            }
+
+    def reset(self):
+        """모든 메트릭 초기화"""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._observations.clear()
+
+
+# 전역 메트릭 인스턴스
+metrics = MetricsRegistry()
@@ -0,0 +1,63 @@
+"""
+응답 직렬화 유틸리티 (orjson + pydantic v2 TypeAdapter)
+
+대용량 목록 응답은 FastAPI 기본 경로(response_model 검증 → jsonable_encoder → json.dumps)
+대신 스키마별로 미리 만들어 둔 TypeAdapter로 한 번에 검증/직렬화합니다.
+"""
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Iterable, List, Mapping, Tuple, Type
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """응답 스키마별 List[schema] TypeAdapter 반환 (스키마당 한 번만 생성)"""
+    return TypeAdapter(List[schema])
+
+
+@lru_cache(maxsize=None)
+def schema_fields(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    """응답 스키마의 필드 이름 목록"""
+    return tuple(schema.model_fields.keys())
+
+
+def _default(value: Any) -> Any:
+    """orjson이 기본 지원하지 않는 타입 처리"""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"직렬화할 수 없는 타입입니다: {type(value).__name__}")
+
+
+def serialize_list(schema: Type[BaseModel], rows: Iterable[Any], trusted: bool = False) -> bytes:
+    """목록 데이터를 JSON 바이트로 직렬화
+
+    trusted=True 이면 서비스 코드에서 온 행으로 간주하여 검증을 건너뛰고
+    스키마 필드만 골라 orjson으로 바로 직렬화합니다. (DB 원본 값 형식 그대로 출력)
+    """
+    if trusted:
+        fields = schema_fields(schema)
+        projected = [
+            {field: row.get(field) for field in fields} if isinstance(row, Mapping)
+            else {field: getattr(row, field, None) for field in fields}
+            for row in rows
+        ]
+        return orjson.dumps(projected, default=_default)
+
+    adapter = list_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(list(rows), from_attributes=True))
+
+
+def list_response(schema: Type[BaseModel], rows: Iterable[Any], trusted: bool = False,
+                  status_code: int = 200) -> Response:
+    """직렬화된 목록을 Response로 반환 (response_model 재검증을 거치지 않음)"""
+    return Response(
+        content=serialize_list(schema, rows, trusted=trusted),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -0,0 +1,551 @@
+"""
+백업 파일 형식과 복원
+
+app/services/backup_service.py (백업 실행) 와 restore.py (복원 명령) 가 함께 사용하며,
+DB 연결 없이 백업 디렉터리만으로 체인을 찾아 복원할 수 있도록 백업마다 메타데이터 파일(.json)을 남깁니다.
+
+형식
+- sqlite: SQLite 데이터베이스 파일 전체 (로컬 엔진 전체 백업)
+- pages: 부모 백업 이후 내용이 바뀐 페이지만 (로컬 엔진 증분, 페이지 번호 + 페이지 내용)
+- sql: SQL 덤프 (원격 전체 백업) 또는 변경 행 upsert/삭제 문장 (원격 증분)
+
+체인 = 전체 백업 하나 + 그 뒤 증분들. 복원은 전체 백업을 만든 뒤 증분을 순서대로 적용하고,
+백업 시점에 기록한 테이블별 행 수/체크섬과 비교해 검증합니다.
+"""
+import asyncio
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 시 gzip 사용
+    zstandard = None
+
+# 백업 파일 형식
+SQLITE_FORMAT = "sqlite"
+PAGES_FORMAT = "pages"
+SQL_FORMAT = "sql"
+
+FULL = "full"
+INCREMENTAL = "incremental"
+
+EXTENSIONS = {SQLITE_FORMAT: ".db", PAGES_FORMAT: ".pages", SQL_FORMAT: ".sql", "zstd": ".zst", "gzip": ".gz"}
+
+# 검증(행 수/체크섬)에서 제외하는 테이블: 삭제 기록은 살아 있는 DB 의 증분 백업용이라 전체 백업 후 정리됨
+VERIFY_EXCLUDED_TABLES = frozenset({"deleted_rows"})
+
+# 파일 복사/검증 시 한 번에 읽는 크기 (SQLite 페이지 크기의 배수)
+CHUNK_SIZE = 1024 * 1024
+
+_PAGES_MAGIC = b"ITTLCPG1"
+_PAGES_HEADER = struct.Struct(">II")  # page_size, page_count
+_PAGE_NUMBER = struct.Struct(">I")
+# 페이지 비교용 해시 크기 (페이지당 8바이트)
+DIGEST_SIZE = 8
+
+
+class BackupCancelled(Exception):
+    """앱 종료로 백업이 중단됨"""
+
+
+class BackupVerificationError(Exception):
+    """백업/복원 결과가 기록된 체크섬이나 행 수와 다름"""
+
+
+class ByteRateLimiter:
+    """바이트 단위 토큰 버킷 (rate 가 0 이면 제한 없음, 스레드와 이벤트 루프에서 함께 사용)"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        # 기본 버스트는 1초 분량
+        self.burst = burst if burst is not None else rate
+        self.throttled_seconds = 0.0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: int) -> float:
+        """amount 바이트를 사용하고 기다려야 할 시간 반환 (토큰이 모자라면 빚으로 남김)"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            delay = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            self.throttled_seconds += delay
+            return delay
+
+    def throttle(self, amount: int):
+        """스레드용: 필요한 만큼 잠듦"""
+        delay = self.reserve(amount)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait(self, amount: int):
+        """이벤트 루프용: 필요한 만큼 대기"""
+        delay = self.reserve(amount)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def check_cancel(cancel: Optional[threading.Event]):
+    if cancel is not None and cancel.is_set():
+        raise BackupCancelled("앱 종료로 백업이 중단되었습니다")
+
+
+# 압축
+def resolve_compression(name: str) -> str:
+    """auto 는 zstandard 가 설치되어 있으면 zstd, 아니면 gzip"""
+    if name == "auto":
+        return "zstd" if zstandard is not None else "gzip"
+    if name == "zstd" and zstandard is None:
+        raise ValueError("BACKUP_COMPRESSION=zstd 에는 zstandard 패키지가 필요합니다")
+    if name not in ("zstd", "gzip"):
+        raise ValueError(f"알 수 없는 BACKUP_COMPRESSION: {name}")
+    return name
+
+
+def _open_compressor(fileobj, compression: str, level: Optional[int]):
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=level if level is not None else 3).stream_writer(fileobj, closefd=False)
+    # mtime=0: 같은 내용이면 같은 압축 결과 (체크섬 비교 가능)
+    return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=level if level is not None else 6, mtime=0)
+
+
+def open_decompressor(fileobj, compression: str):
+    if compression == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd 백업을 읽으려면 zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().stream_reader(fileobj, closefd=False)
+    return gzip.GzipFile(fileobj=fileobj, mode="rb")
+
+
+class _HashingFile:
+    """압축기 출력(디스크에 쓰는 바이트)의 체크섬과 크기 계산"""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        return self.fileobj.write(data)
+
+    def flush(self):
+        self.fileobj.flush()
+
+
+class ArtifactWriter:
+    """압축 백업 파일 쓰기 (.part 파일에 쓰고 검증 후 commit() 에서 최종 이름으로 변경)"""
+
+    def __init__(self, path: Path, compression: str, level: Optional[int] = None):
+        self.path = path
+        self.part_path = path.with_name(path.name + ".part")
+        self.compression = compression
+        self.raw_size = 0
+        self._file = open(self.part_path, "wb")
+        self._hashing = _HashingFile(self._file)
+        self._compressor = _open_compressor(self._hashing, compression, level)
+
+    def write(self, data: bytes):
+        self.raw_size += len(data)
+        self._compressor.write(data)
+
+    def finish(self) -> Dict[str, Any]:
+        """압축 스트림을 닫고 디스크에 반영, 파일 크기와 체크섬 반환"""
+        self._compressor.close()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        return {"file_size": self._hashing.size, "checksum": self._hashing.sha256.hexdigest(),
+                "raw_size": self.raw_size}
+
+    def commit(self):
+        os.replace(self.part_path, self.path)
+
+    def abort(self):
+        with contextlib.suppress(Exception):
+            self._file.close()
+        with contextlib.suppress(FileNotFoundError):
+            self.part_path.unlink()
+
+
+# SQL 덤프
+def sql_literal(value: Any) -> str:
+    """SQL 덤프용 리터럴 (sqlite3 .dump 과 같은 표기)"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"X'{bytes(value).hex()}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+# 스키마 지문 계산용 조회 (로컬/원격 공통)
+SCHEMA_QUERY = ("SELECT type, name, sql FROM sqlite_master "
+                "WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' ORDER BY rowid")
+
+
+def schema_fingerprint(rows: Iterable) -> str:
+    """sqlite_master 의 (type, name, sql) 목록으로 스키마 지문 계산 (증분이 같은 스키마인지 확인)"""
+    normalized = sorted(f"{kind}|{name}|{' '.join((sql or '').split())}" for kind, name, sql in rows)
+    return hashlib.sha256("\n".join(normalized).encode()).hexdigest()
+
+
+# 검증
+def user_tables(connection: sqlite3.Connection) -> List[str]:
+    return [row[0] for row in connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+    ) if row[0] not in VERIFY_EXCLUDED_TABLES]
+
+
+def table_counts(connection: sqlite3.Connection) -> Dict[str, int]:
+    """검증 대상 테이블별 행 수"""
+    return {table: connection.execute(f"SELECT COUNT(*) FROM {quote_identifier(table)}").fetchone()[0]
+            for table in user_tables(connection)}
+
+
+def table_checksums(connection: sqlite3.Connection, cancel: Optional[threading.Event] = None) -> Dict[str, Dict[str, Any]]:
+    """테이블별 행 수와 내용 체크섬 (rowid 순서로 행을 SQL 리터럴로 직렬화한 SHA-256)"""
+    checksums = {}
+    for table in user_tables(connection):
+        digest = hashlib.sha256()
+        rows = 0
+        cursor = connection.execute(f"SELECT * FROM {quote_identifier(table)} ORDER BY rowid")
+        while True:
+            check_cancel(cancel)
+            batch = cursor.fetchmany(5000)
+            if not batch:
+                break
+            rows += len(batch)
+            digest.update("".join(",".join(sql_literal(value) for value in row) + "\n" for row in batch).encode())
+        checksums[table] = {"rows": rows, "sha256": digest.hexdigest()}
+    return checksums
+
+
+def check_integrity(connection: sqlite3.Connection):
+    result = [row[0] for row in connection.execute("PRAGMA integrity_check")]
+    if result != ["ok"]:
+        raise BackupVerificationError(f"무결성 검사 실패: {'; '.join(result[:5])}")
+
+
+def compare_tables(expected: Dict[str, Any], actual: Dict[str, Any]) -> List[str]:
+    """기록된 값과 다른 테이블 목록 (행 수 dict 또는 체크섬 dict 모두 지원)"""
+    return sorted(table for table in set(expected) | set(actual) if expected.get(table) != actual.get(table))
+
+
+# 로컬 SQLite (페이지 단위)
+def snapshot_sqlite(source_path: str, snapshot_path: Path, limiter: ByteRateLimiter,
+                    cancel: Optional[threading.Event], pages_per_step: int = 256, on_restart=None):
+    """온라인 백업 API 로 원본의 스냅샷 파일 생성 (스레드에서 실행)"""
+    source = sqlite3.connect(source_path, isolation_level=None)
+    snapshot = sqlite3.connect(snapshot_path, isolation_level=None)
+    try:
+        # 읽기 트랜잭션을 먼저 열어 두면 복사 도중 다른 연결의 커밋이 보이지 않아 재시작하지 않음
+        source.execute("BEGIN")
+        source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        page_size = source.execute("PRAGMA page_size").fetchone()[0]
+        copied = 0
+
+        def progress(status, remaining, total):
+            nonlocal copied
+            check_cancel(cancel)
+            done = total - remaining
+            if done < copied and on_restart is not None:
+                on_restart()
+            limiter.throttle(max(done - copied, 0) * page_size)
+            copied = done
+
+        source.backup(snapshot, pages=max(1, pages_per_step), progress=progress)
+        source.execute("COMMIT")
+    finally:
+        snapshot.close()
+        source.close()
+
+
+def sqlite_page_size(path: Path) -> int:
+    with open(path, "rb") as database:
+        header = database.read(100)
+    page_size = int.from_bytes(header[16:18], "big")
+    # 헤더 값 1 은 65536 바이트 페이지
+    return 65536 if page_size == 1 else page_size
+
+
+def _iter_pages(path: Path, page_size: int, limiter: ByteRateLimiter, cancel: Optional[threading.Event]):
+    with open(path, "rb") as database:
+        number = 0
+        while True:
+            check_cancel(cancel)
+            chunk = database.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            limiter.throttle(len(chunk))
+            for offset in range(0, len(chunk), page_size):
+                number += 1
+                yield number, chunk[offset:offset + page_size]
+
+
+def write_sqlite_full(snapshot_path: Path, writer: ArtifactWriter, limiter: ByteRateLimiter,
+                      cancel: Optional[threading.Event]) -> bytes:
+    """스냅샷 파일 전체를 압축해 쓰고 페이지 해시 목록 반환"""
+    page_size = sqlite_page_size(snapshot_path)
+    digests = bytearray()
+    for _, page in _iter_pages(snapshot_path, page_size, limiter, cancel):
+        digests += hashlib.blake2b(page, digest_size=DIGEST_SIZE).digest()
+        writer.write(page)
+    return bytes(digests)
+
+
+def write_page_delta(snapshot_path: Path, parent_digests: bytes, writer: ArtifactWriter,
+                     limiter: ByteRateLimiter, cancel: Optional[threading.Event]) -> Dict[str, Any]:
+    """부모 백업과 해시가 다른 페이지만 쓰기, 새 페이지 해시 목록과 변경 페이지 수 반환"""
+    page_size = sqlite_page_size(snapshot_path)
+    page_count = os.path.getsize(snapshot_path) // page_size
+    writer.write(_PAGES_MAGIC + _PAGES_HEADER.pack(page_size, page_count))
+    digests = bytearray()
+    changed = 0
+    for number, page in _iter_pages(snapshot_path, page_size, limiter, cancel):
+        digest = hashlib.blake2b(page, digest_size=DIGEST_SIZE).digest()
+        digests += digest
+        start = (number - 1) * DIGEST_SIZE
+        if parent_digests[start:start + DIGEST_SIZE] != digest:
+            writer.write(_PAGE_NUMBER.pack(number) + page)
+            changed += 1
+    return {"digests": bytes(digests), "changed_pages": changed, "page_count": page_count}
+
+
+def _read_exact(reader, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = reader.read(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return bytes(data)
+
+
+def apply_page_delta(reader, target_path: Path, limiter: ByteRateLimiter, cancel: Optional[threading.Event]):
+    """페이지 증분을 데이터베이스 파일에 적용 (페이지 수가 줄었으면 잘라냄)"""
+    header = _read_exact(reader, len(_PAGES_MAGIC) + _PAGES_HEADER.size)
+    if not header.startswith(_PAGES_MAGIC):
+        raise BackupVerificationError("페이지 증분 파일 형식이 아닙니다")
+    page_size, page_count = _PAGES_HEADER.unpack(header[len(_PAGES_MAGIC):])
+    with open(target_path, "r+b") as target:
+        while True:
+            check_cancel(cancel)
+            prefix = _read_exact(reader, _PAGE_NUMBER.size)
+            if not prefix:
+                break
+            page = _read_exact(reader, page_size)
+            if len(prefix) != _PAGE_NUMBER.size or len(page) != page_size:
+                raise BackupVerificationError("페이지 증분 파일이 중간에 끊겼습니다")
+            limiter.throttle(page_size)
+            (number,) = _PAGE_NUMBER.unpack(prefix)
+            target.seek((number - 1) * page_size)
+            target.write(page)
+        target.truncate(page_count * page_size)
+
+
+def apply_sql(reader, connection: sqlite3.Connection, limiter: ByteRateLimiter, cancel: Optional[threading.Event]):
+    """SQL 덤프/증분을 완결된 문장 단위로 실행 (문자열 안의 줄바꿈은 complete_statement 가 판단)"""
+    pending = ""
+    remainder = b""
+    while True:
+        check_cancel(cancel)
+        chunk = reader.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        limiter.throttle(len(chunk))
+        *lines, remainder = (remainder + chunk).split(b"\n")
+        for line in lines:
+            pending += line.decode("utf-8") + "\n"
+            if sqlite3.complete_statement(pending):
+                connection.execute(pending)
+                pending = ""
+    pending += remainder.decode("utf-8")
+    if pending.strip():
+        if not sqlite3.complete_statement(pending):
+            raise BackupVerificationError("SQL 백업이 중간에 끊겼습니다")
+        connection.execute(pending)
+    if connection.in_transaction:
+        raise BackupVerificationError("SQL 백업에 COMMIT 이 없습니다")
+
+
+def file_sha256(path: Path, limiter: ByteRateLimiter, cancel: Optional[threading.Event]) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as artifact:
+        while True:
+            check_cancel(cancel)
+            chunk = artifact.read(CHUNK_SIZE)
+            if not chunk:
+                return digest.hexdigest()
+            limiter.throttle(len(chunk))
+            digest.update(chunk)
+
+
+def restore_chain(chain: List[Dict[str, Any]], target_path: Path, limiter: Optional[ByteRateLimiter] = None,
+                  cancel: Optional[threading.Event] = None):
+    """체인(전체 백업 + 증분들, 각 항목에 path 포함)을 target_path 에 새 데이터베이스로 복원
+
+    각 파일의 체크섬을 먼저 확인합니다. SQL 증분을 적용하는 동안에는 트리거를 내려 두어
+    (버전 카운터/삭제 기록 트리거가 다시 실행되지 않도록) 원본과 같은 내용을 만듭니다.
+    """
+    limiter = limiter or ByteRateLimiter(0)
+    if not chain or chain[0]["kind"] != FULL:
+        raise BackupVerificationError("체인이 전체 백업으로 시작하지 않습니다")
+    for entry in chain:
+        if file_sha256(Path(entry["path"]), limiter, cancel) != entry["checksum"]:
+            raise BackupVerificationError(f"백업 파일 체크섬 불일치: {entry['filename']}")
+
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        with contextlib.suppress(FileNotFoundError):
+            Path(str(target_path) + suffix).unlink()
+
+    base, increments = chain[0], chain[1:]
+    with open(base["path"], "rb") as artifact:
+        reader = open_decompressor(artifact, base["compression"])
+        if base["format"] == SQLITE_FORMAT:
+            with open(target_path, "wb") as target:
+                while True:
+                    check_cancel(cancel)
+                    chunk = reader.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    limiter.throttle(len(chunk))
+                    target.write(chunk)
+        else:
+            connection = sqlite3.connect(target_path, isolation_level=None)
+            try:
+                connection.execute("PRAGMA journal_mode=OFF")
+                apply_sql(reader, connection, limiter, cancel)
+            finally:
+                connection.close()
+
+    if not increments:
+        return
+    if any(entry["format"] == PAGES_FORMAT for entry in increments):
+        # 페이지 증분은 파일을 직접 고치므로 WAL 모드 헤더를 롤백 저널 모드로 바꾸지 않고 그대로 적용
+        for entry in increments:
+            with open(entry["path"], "rb") as artifact:
+                apply_page_delta(open_decompressor(artifact, entry["compression"]), target_path, limiter, cancel)
+        return
+
+    connection = sqlite3.connect(target_path, isolation_level=None)
+    try:
+        connection.execute("PRAGMA journal_mode=OFF")
+        triggers = connection.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'").fetchall()
+        for name, _ in triggers:
+            connection.execute(f"DROP TRIGGER {quote_identifier(name)}")
+        for entry in increments:
+            with open(entry["path"], "rb") as artifact:
+                apply_sql(open_decompressor(artifact, entry["compression"]), connection, limiter, cancel)
+        for _, sql in triggers:
+            connection.execute(sql)
+    finally:
+        connection.close()
+
+
+def verify_database(path: Path, expected_counts: Optional[Dict[str, int]] = None,
+                    expected_tables: Optional[Dict[str, Dict[str, Any]]] = None,
+                    cancel: Optional[threading.Event] = None) -> Dict[str, Dict[str, Any]]:
+    """복원한 DB 의 integrity_check 후 행 수/체크섬 비교, 계산한 테이블별 체크섬 반환"""
+    connection = sqlite3.connect(path)
+    try:
+        check_integrity(connection)
+        checksums = table_checksums(connection, cancel)
+    finally:
+        connection.close()
+    if expected_counts is not None:
+        mismatched = compare_tables(expected_counts, {table: value["rows"] for table, value in checksums.items()})
+        if mismatched:
+            raise BackupVerificationError(f"행 수 불일치: {', '.join(mismatched)}")
+    if expected_tables is not None:
+        mismatched = compare_tables(expected_tables, checksums)
+        if mismatched:
+            raise BackupVerificationError(f"테이블 체크섬 불일치: {', '.join(mismatched)}")
+    return checksums
+
+
+class BackupCatalog:
+    """백업 디렉터리의 메타데이터 파일(<백업 파일>.json) 목록 (검증을 통과한 백업만 기록됨)"""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """스냅샷 시각 순서로 정렬한 백업 목록 (파일이 없는 항목 제외)"""
+        entries = []
+        if not self.directory.exists():
+            return entries
+        for meta_path in self.directory.glob("*.json"):
+            with open(meta_path, encoding="utf-8") as meta_file:
+                entry = json.load(meta_file)
+            entry["path"] = str(self.directory / entry["filename"])
+            if Path(entry["path"]).exists():
+                entries.append(entry)
+        entries.sort(key=lambda entry: (entry["snapshot_at"], entry.get("id") or 0))
+        return entries
+
+    def get(self, filename: str) -> Optional[Dict[str, Any]]:
+        return next((entry for entry in self.entries() if entry["filename"] == filename), None)
+
+    def latest(self, source: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        entries = [entry for entry in self.entries() if source is None or entry.get("source") == source]
+        return entries[-1] if entries else None
+
+    def chain(self, entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """entry 까지의 체인 (전체 백업부터 순서대로)"""
+        by_name = {item["filename"]: item for item in self.entries()}
+        chain = [entry]
+        while chain[0]["kind"] != FULL:
+            parent = by_name.get(chain[0].get("parent"))
+            if parent is None:
+                raise BackupVerificationError(f"부모 백업을 찾을 수 없습니다: {chain[0].get('parent')}")
+            chain.insert(0, parent)
+        return chain
+
+    def until(self, timestamp: str, source: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """timestamp(UTC, 'YYYY-MM-DD HH:MM:SS') 이전의 마지막 스냅샷"""
+        entries = [entry for entry in self.entries()
+                   if entry["snapshot_at"] <= timestamp and (source is None or entry.get("source") == source)]
+        return entries[-1] if entries else None
+
+    def digests_path(self, entry: Dict[str, Any]) -> Path:
+        return self.directory / (entry["filename"] + ".digests")
+
+    def write(self, entry: Dict[str, Any], digests: Optional[bytes] = None):
+        """메타데이터 (및 페이지 해시) 파일 기록 - 백업 파일을 최종 이름으로 바꾼 뒤 호출"""
+        if digests is not None:
+            self._write_atomic(self.digests_path(entry), digests)
+        meta = {key: value for key, value in entry.items() if key != "path"}
+        self._write_atomic(self.directory / (entry["filename"] + ".json"),
+                           json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8"))
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        part = path.with_name(path.name + ".part")
+        with open(part, "wb") as output:
+            output.write(data)
+            output.flush()
+            os.fsync(output.fileno())
+        os.replace(part, path)
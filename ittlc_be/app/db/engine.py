@@ -0,0 +1,269 @@
+"""
+데이터베이스 엔진 추상화
+
+서비스는 get_engine().get_client() 로 받은 클라이언트의 execute/batch/close 만 사용합니다.
+- LibSQLEngine: Turso(HTTP) 또는 libsql_client 가 지원하는 URL
+- LocalSQLiteEngine: aiosqlite 기반 로컬 파일 (WAL, 전용 쓰기 연결 + 읽기 연결 풀)
+- ReplicaEngine: 로컬 읽기 복제본 + primary 쓰기 (app/db/replica.py)
+- RoutingEngine: primary + 원격 읽기 복제본 라우팅 (app/db/router.py)
+- ScheduledEngine: 위 엔진 앞단의 동시 실행 상한/우선순위 레인 (app/db/scheduler.py)
+
+DATABASE_ENGINE=auto 이면 file: URL은 로컬 엔진, 그 외는 LibSQL 엔진을 사용합니다.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import aiosqlite
+from libsql_client import Statement
+from libsql_client.result import ResultSet
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.my_libsql_client import LibSQLClient
+from app.db.replica import EmbeddedReplica
+from app.db.router import RoutingEngine
+from app.db.scheduler import DBScheduler, ScheduledEngine, parse_weights
+from app.db.sql import is_read_only, to_result_set
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseEngine:
+    """엔진 공통 인터페이스"""
+    name = "base"
+
+    async def start(self):
+        """엔진 준비 (연결 풀 생성, 최초 동기화 등)"""
+        pass
+
+    async def stop(self):
+        """엔진 정리"""
+        pass
+
+    async def get_client(self):
+        """execute/batch/close 를 제공하는 클라이언트 반환"""
+        raise NotImplementedError
+
+    def describe(self) -> Dict[str, Any]:
+        return {"engine": self.name}
+
+
+class LibSQLEngine(DatabaseEngine):
+    """Turso(HTTP) 엔진 - 호출마다 클라이언트 생성"""
+    name = "libsql"
+
+    def __init__(self, url: str, auth_token: Optional[str] = None):
+        self.url = to_http_url(url)
+        self.auth_token = auth_token
+
+    async def get_client(self):
+        return await LibSQLClient.create(url=self.url, auth_token=self.auth_token)
+
+    def describe(self) -> Dict[str, Any]:
+        return {"engine": self.name, "url": self.url}
+
+
+class LocalSQLiteClient:
+    """LocalSQLiteEngine 용 클라이언트 (연결은 엔진이 소유하므로 close 는 아무 일도 하지 않음)"""
+
+    def __init__(self, engine: "LocalSQLiteEngine"):
+        self.engine = engine
+
+    async def execute(self, sql: str, params: Optional[list] = None) -> ResultSet:
+        return await self.engine.execute(sql, params)
+
+    async def batch(self, statements: list) -> List[ResultSet]:
+        return await self.engine.batch(statements)
+
+    async def close(self):
+        pass
+
+
+class LocalSQLiteEngine(DatabaseEngine):
+    """aiosqlite 로컬 엔진 - 쓰기는 전용 연결 하나로 직렬화, 읽기는 연결 풀에서 병렬 처리"""
+    name = "local"
+
+    def __init__(self, path: str, readers: int = 4, busy_timeout_ms: int = 5000,
+                 cached_statements: int = 256):
+        self.path = path
+        self.readers = max(1, readers)
+        self.busy_timeout_ms = busy_timeout_ms
+        # 연결별 준비된 문장 캐시 크기 (statements 레지스트리가 SQL 문자열을 고정해 재사용률을 높임)
+        self.cached_statements = cached_statements
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._reader_pool: Optional[asyncio.Queue] = None
+        self._reader_connections: List[aiosqlite.Connection] = []
+        self._start_lock = asyncio.Lock()
+
+    async def _connect(self) -> aiosqlite.Connection:
+        # isolation_level=None: 문장 단위 자동 커밋, 배치는 명시적 BEGIN/COMMIT
+        connection = await aiosqlite.connect(self.path, isolation_level=None,
+                                             cached_statements=self.cached_statements)
+        await connection.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+        return connection
+
+    async def start(self):
+        async with self._start_lock:
+            if self._writer is not None:
+                return
+            writer = await self._connect()
+            await writer.execute("PRAGMA journal_mode=WAL")
+            await writer.execute("PRAGMA synchronous=NORMAL")
+            pool: asyncio.Queue = asyncio.Queue()
+            for _ in range(self.readers):
+                reader = await self._connect()
+                await reader.execute("PRAGMA query_only=ON")
+                self._reader_connections.append(reader)
+                pool.put_nowait(reader)
+            self._reader_pool = pool
+            self._writer = writer
+
+    async def stop(self):
+        async with self._start_lock:
+            for connection in [self._writer, *self._reader_connections]:
+                if connection is not None:
+                    await connection.close()
+            self._writer = None
+            self._reader_pool = None
+            self._reader_connections = []
+
+    async def get_client(self) -> LocalSQLiteClient:
+        if self._writer is None:
+            await self.start()
+        return LocalSQLiteClient(self)
+
+    async def execute(self, sql: str, params: Optional[list] = None) -> ResultSet:
+        if is_read_only(sql):
+            metrics.incr("db.local.reads")
+            reader = await self._reader_pool.get()
+            try:
+                async with reader.execute(sql, params or []) as cursor:
+                    return to_result_set(cursor.description, await cursor.fetchall())
+            finally:
+                self._reader_pool.put_nowait(reader)
+
+        metrics.incr("db.local.writes")
+        async with self._write_lock:
+            return await self._execute_write(sql, params)
+
+    async def batch(self, statements: list) -> List[ResultSet]:
+        """배치를 하나의 트랜잭션으로 실행 (하나라도 실패하면 전체 롤백)"""
+        metrics.incr("db.local.batches")
+        async with self._write_lock:
+            await self._writer.execute("BEGIN")
+            try:
+                results = []
+                for statement in statements:
+                    statement = Statement.convert(statement)
+                    results.append(await self._execute_write(statement.sql, statement.args))
+                await self._writer.execute("COMMIT")
+                return results
+            except Exception:
+                await self._writer.execute("ROLLBACK")
+                raise
+
+    async def _execute_write(self, sql: str, params: Optional[list]) -> ResultSet:
+        async with self._writer.execute(sql, params or []) as cursor:
+            rows = await cursor.fetchall()
+            # rowcount 는 SELECT/DDL 에서 -1
+            return to_result_set(cursor.description, rows,
+                                 max(cursor.rowcount, 0), cursor.lastrowid)
+
+    def describe(self) -> Dict[str, Any]:
+        return {"engine": self.name, "path": self.path, "readers": self.readers}
+
+
+class ReplicaEngine(DatabaseEngine):
+    """임베디드 읽기 복제본 엔진 (읽기는 로컬 파일, 쓰기는 primary)"""
+    name = "replica"
+
+    def __init__(self, replica: EmbeddedReplica):
+        self.replica = replica
+
+    async def start(self):
+        await self.replica.start()
+
+    async def stop(self):
+        await self.replica.stop()
+
+    async def get_client(self):
+        return self.replica
+
+    def describe(self) -> Dict[str, Any]:
+        return {"engine": self.name, "primary_url": self.replica.primary_url, **self.replica.freshness()}
+
+
+def to_http_url(url: str) -> str:
+    """libsql:// URL을 HTTP URL로 변환 (file: 등 다른 URL은 그대로 사용)"""
+    if url.startswith("libsql://"):
+        return "https://" + url[len("libsql://"):]
+    return url
+
+
+def local_path(url: str) -> str:
+    """file: URL에서 로컬 파일 경로 추출"""
+    path = url[len("file:"):]
+    if path.startswith("//"):
+        path = path[2:]
+    return path.split("?", 1)[0]
+
+
+def create_engine(url: str, auth_token: Optional[str] = None, kind: str = "auto",
+                  replica_path: Optional[str] = None,
+                  read_replica_urls: Optional[List[str]] = None, **options) -> DatabaseEngine:
+    """설정값으로 엔진 생성 (읽기 복제본 URL이 있으면 라우터로 묶음)"""
+    if read_replica_urls:
+        primary = create_engine(url, auth_token, kind, replica_path, **options)
+        replicas = [
+            (f"replica{index}", create_engine(replica_url, auth_token, kind, **options))
+            for index, replica_url in enumerate(read_replica_urls, start=1)
+        ]
+        return RoutingEngine(primary, replicas, max_lag=options.get("replica_max_lag", 5.0))
+    if replica_path:
+        return ReplicaEngine(EmbeddedReplica(
+            primary_url=to_http_url(url),
+            auth_token=auth_token,
+            replica_path=replica_path,
+            sync_interval=options.get("replica_sync_interval", 5.0),
+            max_staleness=options.get("replica_max_staleness", 60.0),
+        ))
+    if kind == "local" or (kind == "auto" and url.startswith("file:")):
+        return LocalSQLiteEngine(local_path(url) if url.startswith("file:") else url,
+                                 readers=options.get("local_readers", 4),
+                                 cached_statements=options.get("statement_cache_size", 256))
+    if kind not in ("auto", "libsql"):
+        raise ValueError(f"알 수 없는 DATABASE_ENGINE: {kind}")
+    return LibSQLEngine(url, auth_token)
+
+
+_engine: Optional[DatabaseEngine] = None
+
+
+def get_engine() -> DatabaseEngine:
+    """설정(.env)으로부터 만든 전역 엔진 반환"""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            settings.LIBSQL_URL,
+            settings.LIBSQL_AUTH_TOKEN,
+            kind=settings.DATABASE_ENGINE,
+            replica_path=settings.LIBSQL_REPLICA_PATH,
+            replica_sync_interval=settings.LIBSQL_REPLICA_SYNC_INTERVAL,
+            replica_max_staleness=settings.LIBSQL_REPLICA_MAX_STALENESS,
+            local_readers=settings.LOCAL_DB_READERS,
+            read_replica_urls=[url.strip() for url in (settings.LIBSQL_READ_REPLICA_URLS or "").split(",") if url.strip()],
+            replica_max_lag=settings.LIBSQL_REPLICA_MAX_LAG,
+            statement_cache_size=settings.STATEMENT_CACHE_SIZE,
+        )
+        if settings.DB_MAX_CONCURRENCY > 0:
+            _engine = ScheduledEngine(_engine, DBScheduler(
+                max_concurrency=settings.DB_MAX_CONCURRENCY,
+                weights=parse_weights(settings.DB_LANE_WEIGHTS),
+                background_limit=settings.DB_BACKGROUND_MAX_CONCURRENCY,
+                queue_timeout=settings.DB_QUEUE_TIMEOUT,
+                background_queue_timeout=settings.DB_BACKGROUND_QUEUE_TIMEOUT,
+            ))
+        logger.info(f"데이터베이스 엔진: {_engine.describe()}")
+    return _engine
@@ -0,0 +1,162 @@
+"""
+조회 결과 → 레코드 변환
+
+컬럼 구성(layout)마다 컬럼 이름과 레코드 클래스를 한 번만 만들어 캐시합니다.
+- as_dicts / first_dict: 기존 서비스 코드가 쓰는 dict 목록
+- as_records: __slots__ 레코드 객체 목록 (dict 보다 메모리와 생성 비용이 작음)
+- as_tuples: 값 튜플 목록
+
+레코드는 속성(record.name)과 키(record["name"], record.get("name")) 접근을 모두 지원하므로
+응답 스키마(from_attributes=True)와 app/core/serialization.py 가 그대로 사용할 수 있습니다.
+"""
+import keyword
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+
+from libsql_client.result import Row
+
+
+class Record:
+    """컬럼 구성별로 생성되는 레코드 클래스의 기반 클래스"""
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+    def values(self) -> List[Any]:
+        return [getattr(self, field) for field in self._fields]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(field, getattr(self, field)) for field in self._fields]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Record):
+            return self.items() == other.items()
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        return NotImplemented
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+_RESERVED = frozenset(dir(Record))
+
+
+def _usable_as_attributes(columns: Tuple[str, ...]) -> bool:
+    return (
+        len(set(columns)) == len(columns)
+        and all(
+            isinstance(column, str) and column.isidentifier() and not keyword.iskeyword(column)
+            and not column.startswith("_") and column not in _RESERVED
+            for column in columns
+        )
+    )
+
+
+def _make_record_type(columns: Tuple[str, ...]) -> Type[Record]:
+    """컬럼 순서대로 값을 받는 __init__ 을 가진 __slots__ 클래스 생성"""
+    arguments = ", ".join(f"_{index}" for index in range(len(columns)))
+    assignments = "\n".join(f"    self.{column} = _{index}" for index, column in enumerate(columns)) or "    pass"
+    namespace: Dict[str, Any] = {}
+    exec(f"def __init__(self, {arguments}):\n{assignments}\n", namespace)
+    return type("Record", (Record,), {
+        "__slots__": columns,
+        "_fields": columns,
+        "__init__": namespace["__init__"],
+    })
+
+
+class RowLayout:
+    """하나의 컬럼 구성에 대한 변환기"""
+    __slots__ = ("columns", "record_type")
+
+    def __init__(self, columns: Tuple[str, ...]):
+        self.columns = columns
+        # 컬럼 이름이 속성으로 쓸 수 없으면(중복, COUNT(*) 등) dict 로 대신 변환
+        self.record_type = _make_record_type(columns) if _usable_as_attributes(columns) else None
+
+    def dicts(self, rows: Sequence[Any]) -> List[Dict[str, Any]]:
+        columns = self.columns
+        return [dict(zip(columns, values)) for values in _values(rows)]
+
+    def records(self, rows: Sequence[Any]) -> List[Any]:
+        if self.record_type is None:
+            return self.dicts(rows)
+        record_type = self.record_type
+        return [record_type(*values) for values in _values(rows)]
+
+
+@lru_cache(maxsize=1024)
+def layout_for(columns: Tuple[Any, ...]) -> RowLayout:
+    """컬럼 구성별 변환기 (구성당 한 번만 생성)"""
+    # 구버전 클라이언트는 컬럼을 name 속성을 가진 객체로 돌려줌
+    return RowLayout(tuple(getattr(column, "name", column) for column in columns))
+
+
+def _values(rows: Sequence[Any]):
+    if rows and isinstance(rows[0], Row):
+        return map(Row.astuple, rows)
+    return rows
+
+
+def _layout(result, default_columns: Optional[Sequence[str]] = None) -> RowLayout:
+    columns = tuple(result.columns or ())
+    if not columns:
+        width = len(result.rows[0]) if result.rows else 0
+        columns = tuple(default_columns or (f"col_{index}" for index in range(width)))
+    return layout_for(columns)
+
+
+def column_names(result, default_columns: Optional[Sequence[str]] = None) -> Tuple[str, ...]:
+    """결과의 컬럼 이름 (컬럼 정보가 없으면 default_columns)"""
+    return _layout(result, default_columns).columns
+
+
+def as_dicts(result, default_columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+    """결과 전체를 dict 목록으로 변환"""
+    if not result.rows:
+        return []
+    return _layout(result, default_columns).dicts(result.rows)
+
+
+def first_dict(result, default_columns: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
+    """첫 행을 dict 로 변환 (행이 없으면 None)"""
+    if not result.rows:
+        return None
+    return _layout(result, default_columns).dicts(result.rows[:1])[0]
+
+
+def as_records(result) -> List[Any]:
+    """결과 전체를 __slots__ 레코드 목록으로 변환"""
+    if not result.rows:
+        return []
+    return _layout(result).records(result.rows)
+
+
+def as_tuples(result) -> List[Tuple[Any, ...]]:
+    """결과 전체를 값 튜플 목록으로 변환"""
+    return [tuple(values) for values in _values(result.rows)]
@@ -0,0 +1,253 @@
+"""
+스키마 마이그레이션
+
+migrations/NNNN_이름.sql 파일을 번호 순서대로 적용하고 schema_migrations 테이블에
+버전과 체크섬을 기록합니다.
+- 각 마이그레이션은 기록 INSERT 와 함께 하나의 batch(한 번의 왕복, 하나의 트랜잭션)로 실행
+- 이미 적용된 파일이 수정되면 체크섬 불일치로 중단
+- dry-run: 실행할 문장만 계산
+- drift: 마이그레이션을 메모리 DB에 적용한 결과와 실제 DB의 sqlite_master 비교
+"""
+import hashlib
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "migrations"
+
+_FILE_NAME = re.compile(r"^(\d+)_([A-Za-z0-9_]+)\.sql$")
+_TOKENS = re.compile(
+    r"""
+    (?P<comment>--[^\n]*|/\*.*?\*/)
+    | (?P<string>'(?:[^']|'')*'|"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])
+    | (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<semicolon>;)
+    | (?P<other>[^A-Za-z_;'"`\[\-/]+|.)
+    """,
+    re.S | re.X,
+)
+_TRIGGER = re.compile(r"^CREATE\s+(?:TEMP\s+|TEMPORARY\s+)?TRIGGER\b", re.I)
+_WHITESPACE = re.compile(r"\s+")
+
+# drift 비교에서 제외하는 객체 (마이그레이션 기록, 복제본 상태, sqlite 내부 객체)
+IGNORED_OBJECTS = ("schema_migrations", "_replica_state")
+
+
+class MigrationError(Exception):
+    """마이그레이션 적용 불가 (체크섬 불일치, 실행 오류 등)"""
+
+
+def split_statements(sql: str) -> List[str]:
+    """SQL 스크립트를 문장 단위로 분리 (문자열/주석/트리거 본문 안의 ; 는 무시)"""
+    statements: List[str] = []
+    current: List[str] = []
+    depth = 0
+    for match in _TOKENS.finditer(sql):
+        kind = match.lastgroup
+        text = match.group()
+        if kind == "comment":
+            continue
+        if kind == "word":
+            upper = text.upper()
+            statement_so_far = "".join(current).lstrip()
+            if _TRIGGER.match(statement_so_far):
+                # 트리거 본문의 BEGIN ... END (CASE ... END 포함) 안에서는 ; 로 끊지 않음
+                if upper in ("BEGIN", "CASE"):
+                    depth += 1
+                elif upper == "END":
+                    depth -= 1
+        if kind == "semicolon" and depth <= 0:
+            statement = "".join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+            depth = 0
+            continue
+        current.append(text)
+    tail = "".join(current).strip()
+    if tail:
+        statements.append(tail)
+    return statements
+
+
+def checksum(sql: str) -> str:
+    """줄바꿈 형식과 무관한 파일 체크섬"""
+    normalized = sql.replace("\r\n", "\n").strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class Migration:
+    def __init__(self, version: int, name: str, sql: str):
+        self.version = version
+        self.name = name
+        self.sql = sql
+        self.checksum = checksum(sql)
+        self.statements = split_statements(sql)
+
+    def __repr__(self) -> str:
+        return f"Migration({self.version:04d}_{self.name})"
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    """마이그레이션 파일을 번호 순서대로 읽기"""
+    migrations = []
+    for path in sorted(Path(directory).glob("*.sql")):
+        match = _FILE_NAME.match(path.name)
+        if not match:
+            logger.warning(f"마이그레이션 파일 이름 형식이 아닙니다: {path.name}")
+            continue
+        migrations.append(Migration(int(match.group(1)), match.group(2), path.read_text(encoding="utf-8")))
+    versions = [migration.version for migration in migrations]
+    if len(versions) != len(set(versions)):
+        raise MigrationError(f"중복된 마이그레이션 번호가 있습니다: {versions}")
+    return migrations
+
+
+def normalize_sql(sql: Optional[str]) -> str:
+    """sqlite_master.sql 비교용 정규화 (공백/대소문자/IF NOT EXISTS 차이 무시)"""
+    if not sql:
+        return ""
+    sql = _WHITESPACE.sub(" ", sql).strip().rstrip(";").lower()
+    return sql.replace(" if not exists", "")
+
+
+def expected_schema(migrations: List[Migration]) -> Dict[tuple, str]:
+    """마이그레이션을 메모리 DB에 적용했을 때의 스키마 {(type, name): 정규화된 sql}
+
+    실행기와 같은 분리된 문장(주석 제거됨)을 실행해야 sqlite_master 에 남는 sql 이 같아짐
+    """
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    try:
+        for migration in migrations:
+            for statement in migration.statements:
+                connection.execute(statement)
+        rows = connection.execute("SELECT type, name, sql FROM sqlite_master").fetchall()
+    finally:
+        connection.close()
+    return _schema_map(rows)
+
+
+def _schema_map(rows) -> Dict[tuple, str]:
+    return {
+        (row[0], row[1]): normalize_sql(row[2])
+        for row in rows
+        if not row[1].startswith("sqlite_") and row[1] not in IGNORED_OBJECTS and row[2]
+    }
+
+
+class MigrationRunner:
+    def __init__(self, client, migrations: Optional[List[Migration]] = None):
+        self.client = client
+        self.migrations = load_migrations() if migrations is None else migrations
+
+    async def ensure_table(self):
+        await self.client.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name VARCHAR(200) NOT NULL,
+                checksum VARCHAR(64) NOT NULL,
+                execution_ms INTEGER,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    async def applied(self) -> Dict[int, Dict[str, Any]]:
+        """적용된 마이그레이션 {version: {name, checksum, applied_at}}"""
+        await self.ensure_table()
+        result = await self.client.execute(
+            "SELECT version, name, checksum, applied_at FROM schema_migrations ORDER BY version"
+        )
+        return {row[0]: {"name": row[1], "checksum": row[2], "applied_at": row[3]} for row in result.rows}
+
+    async def status(self) -> List[Dict[str, Any]]:
+        """파일별 적용 상태 (applied / pending / checksum_mismatch / missing_file)"""
+        applied = await self.applied()
+        rows = []
+        for migration in self.migrations:
+            record = applied.pop(migration.version, None)
+            if record is None:
+                state = "pending"
+            elif record["checksum"] != migration.checksum:
+                state = "checksum_mismatch"
+            else:
+                state = "applied"
+            rows.append({"version": migration.version, "name": migration.name, "state": state,
+                         "applied_at": record["applied_at"] if record else None})
+        for version, record in applied.items():
+            rows.append({"version": version, "name": record["name"], "state": "missing_file",
+                         "applied_at": record["applied_at"]})
+        return sorted(rows, key=lambda row: row["version"])
+
+    async def pending(self) -> List[Migration]:
+        """적용할 마이그레이션 목록 (적용된 파일의 체크섬이 다르면 MigrationError)"""
+        applied = await self.applied()
+        mismatched = [
+            f"{migration.version:04d}_{migration.name}" for migration in self.migrations
+            if migration.version in applied and applied[migration.version]["checksum"] != migration.checksum
+        ]
+        if mismatched:
+            raise MigrationError(f"이미 적용된 마이그레이션이 수정되었습니다: {', '.join(mismatched)}")
+        return [migration for migration in self.migrations if migration.version not in applied]
+
+    async def migrate(self, dry_run: bool = False, target: Optional[int] = None) -> List[Migration]:
+        """대기 중인 마이그레이션 적용 (마이그레이션마다 batch 한 번), 적용한 목록 반환"""
+        pending = [
+            migration for migration in await self.pending()
+            if target is None or migration.version <= target
+        ]
+        if dry_run:
+            return pending
+
+        for migration in pending:
+            started = time.perf_counter()
+            statements = list(migration.statements)
+            statements.append((
+                "INSERT INTO schema_migrations (version, name, checksum, execution_ms) VALUES (?, ?, ?, ?)",
+                [migration.version, migration.name, migration.checksum, 0],
+            ))
+            try:
+                await self.client.batch(statements)
+            except Exception as e:
+                raise MigrationError(f"{migration.version:04d}_{migration.name} 적용 실패 (롤백됨): {e}") from e
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            await self.client.execute(
+                "UPDATE schema_migrations SET execution_ms = ? WHERE version = ?",
+                [elapsed_ms, migration.version]
+            )
+            logger.info(f"마이그레이션 적용: {migration.version:04d}_{migration.name} ({elapsed_ms}ms)")
+        return pending
+
+    async def baseline(self, version: int) -> List[Migration]:
+        """이미 스키마가 있는 DB에서 version 이하를 실행 없이 적용된 것으로 기록"""
+        applied = await self.applied()
+        marked = [
+            migration for migration in self.migrations
+            if migration.version <= version and migration.version not in applied
+        ]
+        if marked:
+            await self.client.batch([
+                ("INSERT INTO schema_migrations (version, name, checksum, execution_ms) VALUES (?, ?, ?, NULL)",
+                 [migration.version, migration.name, migration.checksum])
+                for migration in marked
+            ])
+        return marked
+
+    async def drift(self) -> Dict[str, List[str]]:
+        """적용된 마이그레이션 기준 기대 스키마와 실제 스키마 비교"""
+        applied = await self.applied()
+        expected = expected_schema([m for m in self.migrations if m.version in applied])
+        result = await self.client.execute("SELECT type, name, sql FROM sqlite_master")
+        actual = _schema_map(result.rows)
+        return {
+            "missing": sorted(f"{kind} {name}" for kind, name in expected.keys() - actual.keys()),
+            "unexpected": sorted(f"{kind} {name}" for kind, name in actual.keys() - expected.keys()),
+            "changed": sorted(
+                f"{kind} {name}" for (kind, name) in expected.keys() & actual.keys()
+                if expected[(kind, name)] != actual[(kind, name)]
+            ),
+        }
@@ -1,16 +1,215 @@
 """
 LibSQL 클라이언트 설정
+
+Turso(HTTP) 호출에 복원력 정책을 적용합니다.
+- 문장별 제한 시간 (LIBSQL_STATEMENT_TIMEOUT)
+- 일시적 오류 분류 후 재시도: 읽기는 모든 일시적 오류, 쓰기는 서버에 도달하지 않은 것이 확실한 경우만
+  (연결 실패/요청 한도/잠김) 지터를 섞은 지수 백오프로 재시도
+- 서킷 브레이커: 호스트별로 연속 실패가 쌓이면 열려서 즉시 실패하고,
+  reset_timeout 뒤 half-open 상태에서 시험 호출로 복구 여부 확인
+
+재시도 후에도 실패한 일시적 오류와 열린 서킷은 DatabaseUnavailable(503)로 올라갑니다.
 """
+import asyncio
+import logging
 import os
-from libsql_client import create_client
-from typing import Optional
+import random
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+from libsql_client import LibsqlError, Statement, create_client
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.sql import is_read_only
+
+logger = logging.getLogger(__name__)
+
+_HTTP_STATUS = re.compile(r"HTTP status (\d{3})")
+
+# 오류 분류
+FATAL = "fatal"              # SQL 오류, 인증 실패 등 (재시도 무의미)
+TIMEOUT = "timeout"          # 제한 시간 초과 (쓰기는 반영됐을 수 있음)
+TRANSIENT = "transient"      # 연결 끊김, 5xx 등 (쓰기는 반영됐을 수 있음)
+UNREACHABLE = "unreachable"  # 연결 자체 실패 (요청이 서버에 도달하지 않음)
+THROTTLED = "throttled"      # 요청 한도(429)/잠김 (서버가 실행하지 않고 거절)
+
+# 쓰기도 안전하게 재시도할 수 있는 분류
+_NOT_APPLIED = (UNREACHABLE, THROTTLED)
+
+
+class DatabaseUnavailable(Exception):
+    """데이터베이스를 일시적으로 사용할 수 없음 (잠시 후 재시도 가능)"""
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(DatabaseUnavailable):
+    """서킷이 열려 있어 호출하지 않고 즉시 실패"""
+
+
+def classify(error: BaseException) -> str:
+    """오류를 재시도 관점에서 분류"""
+    if isinstance(error, asyncio.TimeoutError):
+        return TIMEOUT
+    if isinstance(error, aiohttp.ClientConnectorError):
+        return UNREACHABLE
+    if isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)):
+        return TRANSIENT
+    if isinstance(error, LibsqlError):
+        if error.code in ("SQLITE_BUSY", "SQLITE_LOCKED"):
+            return THROTTLED
+        if error.code in ("HRANA_WEBSOCKET_ERROR", "CLIENT_CLOSED"):
+            return TRANSIENT
+        if error.code == "SERVER_ERROR":
+            match = _HTTP_STATUS.search(str(error))
+            status = int(match.group(1)) if match else 500
+            if status == 429:
+                return THROTTLED
+            if status >= 500:
+                return TRANSIENT
+    return FATAL
+
+
+class RetryPolicy:
+    """재시도 횟수와 지터 지수 백오프 (full jitter)"""
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.1, max_delay: float = 2.0,
+                 statement_timeout: float = 10.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statement_timeout = statement_timeout
+
+    def delay(self, attempt: int) -> float:
+        """attempt 번째 재시도 전 대기 시간 (0 ~ min(max_delay, base * 2^attempt) 균등 분포)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def should_retry(self, kind: str, idempotent: bool, attempt: int) -> bool:
+        if attempt >= self.max_retries or kind == FATAL:
+            return False
+        return idempotent or kind in _NOT_APPLIED
+
+
+class CircuitBreaker:
+    """호스트별 서킷 브레이커 (closed → open → half_open → closed)"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 10.0,
+                 half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probes = 0
+        self._publish()
+
+    def before_call(self):
+        """호출 허용 여부 확인 (열려 있으면 CircuitOpenError)"""
+        if self.state == self.OPEN:
+            remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+            if remaining > 0:
+                metrics.incr(f"db.circuit.{self.name}.rejected")
+                raise CircuitOpenError(f"데이터베이스 연결 차단 중 ({self.name}, {remaining:.1f}초 후 재시도)",
+                                       retry_after=remaining)
+            self._transition(self.HALF_OPEN)
+        if self.state == self.HALF_OPEN:
+            if self._probes >= self.half_open_max_calls:
+                metrics.incr(f"db.circuit.{self.name}.rejected")
+                raise CircuitOpenError(f"데이터베이스 연결 확인 중 ({self.name})", retry_after=1.0)
+            self._probes += 1
+
+    def record_success(self):
+        if self.state == self.HALF_OPEN:
+            self._probes = max(0, self._probes - 1)
+            self._transition(self.CLOSED)
+        self.failures = 0
+
+    def record_failure(self, kind: str):
+        """일시적 오류만 실패로 셈 (SQL 오류는 서버가 정상이라는 뜻)"""
+        if kind == FATAL:
+            self.record_success()
+            return
+        if self.state == self.HALF_OPEN:
+            self._probes = max(0, self._probes - 1)
+            self._transition(self.OPEN)
+            return
+        self.failures += 1
+        if self.state == self.CLOSED and self.failures >= self.failure_threshold:
+            self._transition(self.OPEN)
+
+    def abandon(self):
+        """결과를 보지 못하고 취소된 호출 (half-open 시험 자리 반환)"""
+        if self.state == self.HALF_OPEN:
+            self._probes = max(0, self._probes - 1)
+
+    def _transition(self, state: str):
+        if state == self.state:
+            return
+        logger.warning(f"서킷 {self.name}: {self.state} → {state}")
+        self.state = state
+        if state == self.OPEN:
+            self.opened_at = time.monotonic()
+            metrics.incr(f"db.circuit.{self.name}.opened")
+        if state != self.HALF_OPEN:
+            self._probes = 0
+        if state == self.CLOSED:
+            self.failures = 0
+        self._publish()
+
+    def _publish(self):
+        metrics.set_gauge(f"db.circuit.{self.name}.state", self.state)
+
+    def describe(self) -> Dict[str, Any]:
+        info = {"state": self.state, "failures": self.failures}
+        if self.state == self.OPEN:
+            info["retry_after"] = round(max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at)), 2)
+        return info
+
+
+# 호스트별 서킷 (클라이언트는 호출마다 새로 만들어지므로 상태는 여기에 유지)
+circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def breaker_for(url: str) -> CircuitBreaker:
+    name = urlparse(url).hostname or url
+    breaker = circuit_breakers.get(name)
+    if breaker is None:
+        breaker = circuit_breakers[name] = CircuitBreaker(
+            name,
+            failure_threshold=settings.LIBSQL_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.LIBSQL_CIRCUIT_RESET_TIMEOUT,
+        )
+    return breaker
+
+
+def default_policy() -> RetryPolicy:
+    return RetryPolicy(
+        max_retries=settings.LIBSQL_MAX_RETRIES,
+        base_delay=settings.LIBSQL_RETRY_BASE_DELAY,
+        max_delay=settings.LIBSQL_RETRY_MAX_DELAY,
+        statement_timeout=settings.LIBSQL_STATEMENT_TIMEOUT,
+    )
+
 
 class LibSQLClient:
-    def __init__(self, client):
+    def __init__(self, client, breaker: Optional[CircuitBreaker] = None, policy: Optional[RetryPolicy] = None):
         self.client = client
+        self.breaker = breaker
+        self.policy = policy or RetryPolicy(max_retries=0, statement_timeout=0)
 
     @classmethod
-    async def create(cls, url=None, auth_token=None):
+    async def create(cls, url=None, auth_token=None, policy: Optional[RetryPolicy] = None):
         url = url or os.getenv("LIBSQL_URL", "libsql://ittlcdb-hozza.aws-ap-northeast-1.turso.io")
         auth_token = auth_token or os.getenv("LIBSQL_AUTH_TOKEN")
         if auth_token:
@@ -20,20 +219,56 @@ class LibSQLClient:
             )
         else:
             client = create_client(url=url)
-        return cls(client)
+        return cls(client, breaker_for(url), policy or default_policy())
 
     async def execute(self, sql: str, params: Optional[list] = None):
-        """SQL 실행"""
+        """SQL 실행 (읽기는 일시적 오류 시 재시도)"""
         if params:
-            return await self.client.execute(sql, params)
-        return await self.client.execute(sql)
-    
+            return await self._call(lambda: self.client.execute(sql, params), is_read_only(sql))
+        return await self._call(lambda: self.client.execute(sql), is_read_only(sql))
+
     async def batch(self, statements: list):
-        """배치 실행"""
-        return await self.client.batch(statements)
-    
+        """배치 실행 (모두 읽기일 때만 일시적 오류 시 재시도)"""
+        idempotent = all(is_read_only(Statement.convert(statement).sql) for statement in statements)
+        return await self._call(lambda: self.client.batch(statements), idempotent)
+
+    async def _call(self, operation: Callable[[], Awaitable[Any]], idempotent: bool):
+        attempt = 0
+        while True:
+            if self.breaker is not None:
+                self.breaker.before_call()
+            try:
+                if self.policy.statement_timeout > 0:
+                    result = await asyncio.wait_for(operation(), self.policy.statement_timeout)
+                else:
+                    result = await operation()
+            except asyncio.CancelledError:
+                if self.breaker is not None:
+                    self.breaker.abandon()
+                raise
+            except Exception as e:
+                kind = classify(e)
+                if self.breaker is not None:
+                    self.breaker.record_failure(kind)
+                if kind == TIMEOUT:
+                    metrics.incr("db.libsql.deadline_exceeded")
+                if not self.policy.should_retry(kind, idempotent, attempt):
+                    if kind == FATAL:
+                        raise
+                    metrics.incr("db.libsql.retries_exhausted")
+                    raise DatabaseUnavailable(f"데이터베이스 일시 오류 ({kind}): {str(e) or type(e).__name__}") from e
+                delay = self.policy.delay(attempt)
+                attempt += 1
+                metrics.incr(f"db.libsql.retries.{kind}")
+                logger.info(f"LibSQL 일시 오류({kind}), {delay:.2f}초 후 재시도 {attempt}/{self.policy.max_retries}: {e}")
+                await asyncio.sleep(delay)
+                continue
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return result
+
     async def close(self):
         """클라이언트 종료"""
         await self.client.close()
 
-# 전역 인스턴스 제거 (필요할 때 async로 생성) 
\ No newline at end of file
+# 전역 인스턴스 제거 (필요할 때 async로 생성)
@@ -0,0 +1,370 @@
+"""
+임베디드 읽기 복제본 (embedded replica)
+
+각 앱 인스턴스가 로컬 SQLite 파일을 primary(Turso)에서 동기화해 두고
+읽기는 로컬에서, 쓰기는 primary로 전달합니다.
+
+- 동기화: primary의 table_versions 를 비교해 바뀐 테이블만 가져옴
+  (updated_at 이 있는 테이블은 워터마크 이후 행만, 나머지는 테이블 전체)
+- 신선도: 마지막 동기화 시각/지연을 추적하고 max_staleness 초과 시 primary에서 읽음
+- read-your-writes: 쓰기한 세션은 그 이후 동기화가 끝날 때까지 primary에서 읽음
+
+테스트 시에는 file: URL의 로컬 primary가 Turso를 대신할 수 있습니다.
+"""
+import asyncio
+import contextvars
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import aiosqlite
+from libsql_client.result import ResultSet
+
+from app.core.metrics import metrics
+from app.db.my_libsql_client import LibSQLClient
+from app.db.sql import is_read_only, referenced_tables, to_result_set
+from app.db.table_versions import TRACKED_TABLES
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청의 세션 식별자 (read-your-writes 판단용, app/main.py 미들웨어에서 설정)
+current_session: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "replica_session", default=None
+)
+
+# 쓰기한 세션의 읽기를 primary 로 보내는 최대 시간 (초)
+READ_YOUR_WRITES_WINDOW = 30.0
+
+# 세션별 마지막 쓰기 시각 (monotonic, 오래된 쓰기부터). 복제본 엔진/라우터/single-flight 가 함께 사용
+# 세션 키는 클라이언트가 정하는 값(X-Session-Id, Authorization, IP)이므로
+# 쓰기를 기록할 때마다 창이 지난 항목을 앞에서부터 버리고, 개수도 MAX_TRACKED_SESSIONS 로 제한
+MAX_TRACKED_SESSIONS = 10_000
+_session_writes: "OrderedDict[str, float]" = OrderedDict()
+
+
+def record_session_write():
+    """현재 세션의 쓰기 시각 기록"""
+    session = current_session.get()
+    if session is None:
+        return
+    now = time.monotonic()
+    _session_writes.pop(session, None)
+    _session_writes[session] = now
+    while _session_writes:
+        oldest = next(iter(_session_writes.values()))
+        if now - oldest <= READ_YOUR_WRITES_WINDOW and len(_session_writes) <= MAX_TRACKED_SESSIONS:
+            break
+        _session_writes.popitem(last=False)
+
+
+def session_written_at() -> Optional[float]:
+    """현재 세션이 READ_YOUR_WRITES_WINDOW 안에 쓴 마지막 시각 (없으면 None)"""
+    session = current_session.get()
+    if session is None:
+        return None
+    written_at = _session_writes.get(session)
+    if written_at is None or time.monotonic() - written_at > READ_YOUR_WRITES_WINDOW:
+        return None
+    return written_at
+
+
+def session_recently_wrote() -> bool:
+    """현재 세션이 READ_YOUR_WRITES_WINDOW 안에 쓰기를 했는지"""
+    return session_written_at() is not None
+
+
+# 전체 복사 시 한 번에 가져올 행 수
+SYNC_PAGE_SIZE = 5000
+
+
+class EmbeddedReplica:
+    def __init__(self, primary_url: str, auth_token: Optional[str], replica_path: str,
+                 sync_interval: float = 5.0, max_staleness: float = 60.0,
+                 tables: Iterable[str] = TRACKED_TABLES):
+        self.primary_url = primary_url
+        self.auth_token = auth_token
+        self.replica_path = replica_path
+        self.sync_interval = sync_interval
+        self.max_staleness = max_staleness
+        self.tables = tuple(tables)
+        self._table_set = frozenset(self.tables)
+
+        self._reader: Optional[aiosqlite.Connection] = None
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._sync_lock = asyncio.Lock()
+        self._sync_requested = asyncio.Event()
+        self._sync_task: Optional[asyncio.Task] = None
+
+        self._synced_versions: Dict[str, Optional[int]] = {}
+        self._watermarks: Dict[str, Optional[str]] = {}
+        self._has_updated_at: Dict[str, bool] = {}
+        self._last_sync_started = 0.0     # monotonic, 마지막 성공 동기화의 시작 시각
+        self._last_synced_at: Optional[float] = None  # epoch, 마지막 성공 동기화 완료 시각
+
+    # 연결 관리
+    async def open(self):
+        """로컬 파일 열기 및 최초 동기화"""
+        if self._reader is not None:
+            return
+        Path(self.replica_path).parent.mkdir(parents=True, exist_ok=True)
+        self._writer = await aiosqlite.connect(self.replica_path)
+        await self._writer.execute("PRAGMA journal_mode=WAL")
+        await self._writer.execute("""
+            CREATE TABLE IF NOT EXISTS _replica_state (
+                table_name TEXT PRIMARY KEY,
+                version INTEGER,
+                watermark TEXT
+            )
+        """)
+        await self._writer.commit()
+        await self._load_state()
+        self._reader = await aiosqlite.connect(self.replica_path)
+        await self._reader.execute("PRAGMA query_only=ON")
+
+        try:
+            await self.sync()
+        except Exception as e:
+            # primary 장애 시에도 기존 로컬 사본으로 기동 (신선도 초과 시 읽기는 primary로)
+            logger.warning(f"복제본 최초 동기화 실패: {e}")
+
+    async def _load_state(self):
+        """로컬 파일에 커밋된 동기화 상태(테이블 버전/워터마크) 읽기"""
+        self._synced_versions.clear()
+        self._watermarks.clear()
+        async with self._writer.execute("SELECT table_name, version, watermark FROM _replica_state") as cursor:
+            for table_name, version, watermark in await cursor.fetchall():
+                self._synced_versions[table_name] = version
+                self._watermarks[table_name] = watermark
+
+    async def start(self):
+        """백그라운드 동기화 루프 시작"""
+        await self.open()
+        if self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """동기화 루프 종료 및 로컬 연결 닫기"""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+        for connection in (self._reader, self._writer):
+            if connection is not None:
+                await connection.close()
+        self._reader = self._writer = None
+
+    async def close(self):
+        """서비스 코드의 클라이언트 close() 호환용 (연결은 stop() 에서 닫음)"""
+        pass
+
+    async def _primary(self) -> LibSQLClient:
+        return await LibSQLClient.create(url=self.primary_url, auth_token=self.auth_token)
+
+    # 신선도
+    @property
+    def lag_seconds(self) -> Optional[float]:
+        if self._last_synced_at is None:
+            return None
+        return max(0.0, time.time() - self._last_synced_at)
+
+    def freshness(self) -> Dict[str, Any]:
+        """복제본 신선도 정보"""
+        return {
+            "replica_path": self.replica_path,
+            "last_synced_at": self._last_synced_at,
+            "lag_seconds": self.lag_seconds,
+            "max_staleness": self.max_staleness,
+            "synced_versions": dict(self._synced_versions),
+        }
+
+    def _is_stale(self) -> bool:
+        lag = self.lag_seconds
+        if lag is not None:
+            metrics.set_gauge("replica.lag_seconds", round(lag, 3))
+        return lag is None or lag > self.max_staleness
+
+    def _session_needs_primary(self) -> bool:
+        written_at = session_written_at()
+        # 쓰기 이후 시작된 동기화가 완료됐으면 로컬에서 읽어도 자기 쓰기가 보임
+        return written_at is not None and written_at >= self._last_sync_started
+
+    def _can_serve_locally(self, sql: str) -> bool:
+        if self._reader is None or not is_read_only(sql):
+            return False
+        tables = referenced_tables(sql)
+        if not tables or not tables <= self._table_set:
+            return False
+        return not self._is_stale() and not self._session_needs_primary()
+
+    # 실행
+    async def execute(self, sql: str, params: Optional[list] = None) -> ResultSet:
+        if self._can_serve_locally(sql):
+            metrics.incr("replica.reads.local")
+            with metrics.timer("replica.local_read_ms"):
+                async with self._reader.execute(sql, params or []) as cursor:
+                    rows = await cursor.fetchall()
+                    return to_result_set(cursor.description, rows)
+
+        primary = await self._primary()
+        try:
+            result = await primary.execute(sql, params)
+        finally:
+            await primary.close()
+        if is_read_only(sql):
+            metrics.incr("replica.reads.primary")
+        else:
+            self._record_write()
+        return result
+
+    async def batch(self, statements: list) -> List[ResultSet]:
+        """배치는 항상 primary에서 실행"""
+        primary = await self._primary()
+        try:
+            results = await primary.batch(statements)
+        finally:
+            await primary.close()
+        self._record_write()
+        return results
+
+    def _record_write(self):
+        metrics.incr("replica.writes")
+        record_session_write()
+        # 쓰기 직후 동기화를 앞당겨 read-your-writes 구간을 짧게 유지
+        self._sync_requested.set()
+
+    # 동기화
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._sync_requested.wait(), timeout=self.sync_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._sync_requested.clear()
+            try:
+                await self.sync()
+            except Exception as e:
+                metrics.incr("replica.sync_failures")
+                logger.warning(f"복제본 동기화 실패: {e}")
+
+    async def sync(self) -> List[str]:
+        """primary에서 변경된 테이블만 가져오기, 동기화한 테이블 목록 반환"""
+        async with self._sync_lock:
+            started = time.monotonic()
+            synced: List[str] = []
+            primary = await self._primary()
+            try:
+                with metrics.timer("replica.sync_ms"):
+                    result = await primary.execute("SELECT table_name, version FROM table_versions")
+                    versions = {row[0]: row[1] for row in result.rows}
+                    for table in self.tables:
+                        version = versions.get(table)
+                        if version is not None and version == self._synced_versions.get(table):
+                            continue
+                        await self._sync_table(primary, table)
+                        self._synced_versions[table] = version
+                        await self._writer.execute(
+                            "INSERT OR REPLACE INTO _replica_state (table_name, version, watermark) VALUES (?, ?, ?)",
+                            [table, version, self._watermarks.get(table)]
+                        )
+                        synced.append(table)
+                    # 한 번에 커밋하므로 읽기 연결은 동기화 도중의 중간 상태를 보지 않음 (WAL)
+                    await self._writer.commit()
+            except Exception:
+                # 로컬 파일과 메모리 상태를 마지막 커밋 시점으로 되돌림
+                await self._writer.rollback()
+                await self._load_state()
+                raise
+            finally:
+                await primary.close()
+
+            self._last_sync_started = started
+            self._last_synced_at = time.time()
+            metrics.incr("replica.syncs")
+            metrics.set_gauge("replica.lag_seconds", 0.0)
+            return synced
+
+    async def _sync_table(self, primary: LibSQLClient, table: str):
+        columns = await self._ensure_schema(primary, table)
+        if columns is None:
+            return
+
+        watermark = self._watermarks.get(table)
+        if self._has_updated_at.get(table) and watermark is not None:
+            # 워터마크 이후 변경분만 upsert (같은 초 갱신을 놓치지 않도록 >= 사용)
+            result = await primary.execute(
+                f"SELECT * FROM {table} WHERE updated_at >= ? ORDER BY updated_at", [watermark]
+            )
+            await self._upsert(table, result)
+            # 삭제는 워터마크로 감지할 수 없으므로 행 수가 다르면 전체 복사
+            primary_count = (await primary.execute(f"SELECT COUNT(*) FROM {table}")).rows[0][0]
+            async with self._writer.execute(f"SELECT COUNT(*) FROM {table}") as cursor:
+                local_count = (await cursor.fetchone())[0]
+            if primary_count == local_count:
+                metrics.incr("replica.incremental_table_syncs")
+                return
+
+        await self._copy_table(primary, table)
+        metrics.incr("replica.full_table_syncs")
+
+    async def _copy_table(self, primary: LibSQLClient, table: str):
+        """테이블 전체를 id 순서로 페이지 단위 복사 (sync() 의 로컬 트랜잭션 안에서 교체)"""
+        await self._writer.execute(f"DELETE FROM {table}")
+        last_id = None
+        while True:
+            if last_id is None:
+                result = await primary.execute(
+                    f"SELECT * FROM {table} ORDER BY id LIMIT ?", [SYNC_PAGE_SIZE]
+                )
+            else:
+                result = await primary.execute(
+                    f"SELECT * FROM {table} WHERE id > ? ORDER BY id LIMIT ?",
+                    [last_id, SYNC_PAGE_SIZE]
+                )
+            if not result.rows:
+                break
+            await self._upsert(table, result)
+            last_id = result.rows[-1][result.columns.index("id")]
+            if len(result.rows) < SYNC_PAGE_SIZE:
+                break
+
+    async def _upsert(self, table: str, result: ResultSet):
+        if not result.rows:
+            return
+        columns = list(result.columns)
+        placeholders = ", ".join("?" for _ in columns)
+        await self._writer.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+            [tuple(row) for row in result.rows]
+        )
+        if "updated_at" in columns:
+            index = columns.index("updated_at")
+            newest = max((row[index] for row in result.rows if row[index] is not None), default=None)
+            if newest is not None and (self._watermarks.get(table) is None or newest > self._watermarks[table]):
+                self._watermarks[table] = newest
+
+    async def _ensure_schema(self, primary: LibSQLClient, table: str) -> Optional[List[str]]:
+        """로컬에 primary와 같은 테이블/인덱스 생성 (트리거는 복제하지 않음)"""
+        async with self._writer.execute(f"PRAGMA table_info({table})") as cursor:
+            local_columns = [row[1] for row in await cursor.fetchall()]
+
+        result = await primary.execute(f"PRAGMA table_info({table})")
+        primary_columns = [row[1] for row in result.rows]
+        if not primary_columns:
+            return None
+        self._has_updated_at[table] = "updated_at" in primary_columns
+        if local_columns == primary_columns:
+            return primary_columns
+
+        # 최초 생성이거나 primary 스키마가 바뀐 경우 다시 만듦
+        ddl = await primary.execute(
+            "SELECT type, sql FROM sqlite_master WHERE tbl_name = ? AND sql IS NOT NULL "
+            "AND type IN ('table', 'index') ORDER BY type DESC",
+            [table]
+        )
+        await self._writer.execute(f"DROP TABLE IF EXISTS {table}")
+        for _, statement in ddl.rows:
+            await self._writer.execute(statement)
+        self._watermarks[table] = None
+        self._synced_versions.pop(table, None)
+        return primary_columns
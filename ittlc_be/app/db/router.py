@@ -0,0 +1,241 @@
+"""
+읽기/쓰기 라우팅
+
+primary 엔진 하나와 읽기 복제본 엔진 여러 개를 묶어 하나의 엔진처럼 동작합니다.
+- 쓰기/배치 → primary
+- 읽기 → 지연(lag)이 max_lag 이하인 복제본 (라운드 로빈)
+- 같은 요청에서 쓰기가 있었거나 read_primary() 힌트가 있으면 → primary
+- 같은 세션(app/db/replica.current_session)이 쓴 뒤 복제본이 그 시점까지 따라오지 못했으면 → primary
+
+복제본 지연은 table_versions 버전 합계로 추정합니다. 버전은 증가만 하므로
+복제본의 합계가 primary 의 어느 시점 합계에 도달했는지로 "어느 시각까지 반영됐는지"를 알 수 있습니다.
+관측한 어느 시점의 합계에도 도달하지 못한 복제본은 지연을 알 수 없으므로 최신이 아닌 것으로 취급합니다.
+"""
+import asyncio
+import contextlib
+import contextvars
+import itertools
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.core.metrics import metrics
+from app.db.replica import record_session_write, session_written_at
+from app.db.sql import is_read_only
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청에서 primary 로 읽어야 하는지 (쓰기 후 또는 명시적 힌트)
+_primary_hint: contextvars.ContextVar[bool] = contextvars.ContextVar("db_primary_hint", default=False)
+
+VERSION_SUM_SQL = "SELECT COALESCE(SUM(version), 0) FROM table_versions"
+
+
+def require_primary():
+    """현재 요청의 이후 읽기를 primary 로 보냄"""
+    _primary_hint.set(True)
+
+
+def primary_hinted() -> bool:
+    """현재 요청의 읽기가 primary 로 고정됐는지 (같은 요청의 쓰기 이후 또는 read_primary 힌트)"""
+    return _primary_hint.get()
+
+
+@contextlib.contextmanager
+def read_primary():
+    """블록 안의 읽기를 primary 로 보냄"""
+    token = _primary_hint.set(True)
+    try:
+        yield
+    finally:
+        _primary_hint.reset(token)
+
+
+class ReplicaEndpoint:
+    """복제본 하나의 상태 (마지막으로 반영된 primary 시각)"""
+
+    def __init__(self, name: str, engine):
+        self.name = name
+        self.engine = engine
+        self.healthy = False
+        self.version_sum: Optional[int] = None
+        self.synced_through: Optional[float] = None  # 이 시각 이전의 primary 쓰기는 모두 반영됨 (monotonic)
+        self.lag_seconds: Optional[float] = None
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag_seconds,
+            **self.engine.describe(),
+        }
+
+
+class RoutingClient:
+    """RoutingEngine 용 클라이언트 (문장마다 대상 엔진을 고름)"""
+
+    def __init__(self, router: "RoutingEngine"):
+        self.router = router
+
+    async def execute(self, sql: str, params: Optional[list] = None):
+        return await self.router.execute(sql, params)
+
+    async def batch(self, statements: list):
+        return await self.router.batch(statements)
+
+    async def close(self):
+        pass
+
+
+class RoutingEngine:
+    """primary + 읽기 복제본 라우터 (DatabaseEngine 과 같은 인터페이스)"""
+    name = "routing"
+
+    def __init__(self, primary, replicas: List[Tuple[str, Any]], max_lag: float = 5.0,
+                 probe_interval: float = 1.0):
+        self.primary = primary
+        self.replicas = [ReplicaEndpoint(name, engine) for name, engine in replicas]
+        self.max_lag = max_lag
+        self.probe_interval = probe_interval
+        self._round_robin = itertools.count()
+        # primary 버전 합계 이력: (관측 시각, 합계)
+        self._primary_history: Deque[Tuple[float, int]] = deque(maxlen=600)
+        self._probe_task: Optional[asyncio.Task] = None
+
+    # 수명 주기
+    async def start(self):
+        await self.primary.start()
+        for replica in self.replicas:
+            await replica.engine.start()
+        await self.probe()
+        if self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            await asyncio.gather(self._probe_task, return_exceptions=True)
+            self._probe_task = None
+        for replica in self.replicas:
+            await replica.engine.stop()
+        await self.primary.stop()
+
+    async def get_client(self) -> RoutingClient:
+        return RoutingClient(self)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "engine": self.name,
+            "primary": self.primary.describe(),
+            "max_lag": self.max_lag,
+            "replicas": [replica.describe() for replica in self.replicas],
+        }
+
+    # 라우팅
+    def choose(self, sql: str) -> Tuple[Any, str]:
+        """(대상 엔진, 라우팅 사유) 반환"""
+        if not is_read_only(sql):
+            return self.primary, "write"
+        if _primary_hint.get():
+            return self.primary, "hint"
+        written_at = session_written_at()
+        fresh = [
+            replica for replica in self.replicas
+            if replica.healthy and replica.lag_seconds is not None and replica.lag_seconds <= self.max_lag
+        ]
+        if not fresh:
+            return self.primary, "stale_replicas"
+        if written_at is not None:
+            # 세션의 마지막 쓰기가 반영된 복제본만 사용
+            fresh = [replica for replica in fresh if (replica.synced_through or 0.0) >= written_at]
+            if not fresh:
+                return self.primary, "session"
+        replica = fresh[next(self._round_robin) % len(fresh)]
+        return replica.engine, f"replica.{replica.name}"
+
+    def _record_write(self):
+        # 같은 요청의 이후 읽기와 같은 세션의 다음 요청은 primary 에서 읽음
+        _primary_hint.set(True)
+        record_session_write()
+
+    async def execute(self, sql: str, params: Optional[list] = None):
+        engine, reason = self.choose(sql)
+        metrics.incr(f"db.route.{reason}")
+        client = await engine.get_client()
+        try:
+            result = await client.execute(sql, params)
+        finally:
+            await client.close()
+        if engine is self.primary and reason == "write":
+            self._record_write()
+        return result
+
+    async def batch(self, statements: list):
+        metrics.incr("db.route.write")
+        client = await self.primary.get_client()
+        try:
+            results = await client.batch(statements)
+        finally:
+            await client.close()
+        self._record_write()
+        return results
+
+    # 지연 추적
+    async def _version_sum(self, engine) -> int:
+        client = await engine.get_client()
+        try:
+            result = await client.execute(VERSION_SUM_SQL)
+            return result.rows[0][0] or 0
+        finally:
+            await client.close()
+
+    async def probe(self):
+        """primary 와 각 복제본의 버전 합계를 비교해 지연 갱신"""
+        now = time.monotonic()
+        try:
+            primary_sum = await self._version_sum(self.primary)
+        except Exception as e:
+            logger.warning(f"primary 버전 조회 실패: {e}")
+            return
+        if not self._primary_history or self._primary_history[-1][1] != primary_sum:
+            self._primary_history.append((now, primary_sum))
+
+        for replica in self.replicas:
+            try:
+                replica.version_sum = await self._version_sum(replica.engine)
+                replica.healthy = True
+            except Exception as e:
+                replica.healthy = False
+                replica.lag_seconds = None
+                metrics.incr(f"db.replica.{replica.name}.probe_failures")
+                logger.warning(f"복제본 {replica.name} 상태 조회 실패: {e}")
+                continue
+            replica.synced_through, replica.lag_seconds = self._estimate_lag(replica.version_sum, now)
+            if replica.lag_seconds is not None:
+                metrics.set_gauge(f"db.replica.{replica.name}.lag_seconds", round(replica.lag_seconds, 3))
+
+    def _estimate_lag(self, replica_sum: int, now: float) -> Tuple[Optional[float], Optional[float]]:
+        """(반영된 primary 시각, 지연 초) 계산 - 복제본이 가진 마지막 primary 관측 시점 기준
+
+        primary 관측 이력이 없거나 복제본이 가장 오래된 관측 합계에도 도달하지 못했으면 (None, None)
+        (처음 관측할 때 뒤처져 있던 복제본을 지연 0 으로 보지 않도록, 따라잡을 때까지 최신이 아닌 것으로 취급)
+        """
+        synced_through: Optional[float] = None
+        for observed_at, primary_sum in self._primary_history:
+            if primary_sum > replica_sum:
+                if synced_through is None:
+                    return None, None
+                return synced_through, now - synced_through
+            synced_through = observed_at
+        if synced_through is None:
+            return None, None
+        return now, 0.0
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            try:
+                await self.probe()
+            except Exception as e:
+                logger.warning(f"복제본 지연 측정 실패: {e}")
@@ -0,0 +1,258 @@
+"""
+DB 호출 스케줄러 (동시 실행 상한 + 우선순위 레인)
+
+Turso 요청 한도 안에서 모든 DB 호출(execute/batch 한 번)이 전역 슬롯 하나를 차지하며 실행됩니다.
+슬롯이 모자라면 레인별 대기열에 들어가고, 슬롯이 비면 레인 가중치에 따라 공평하게 배분합니다.
+- write: 대화형 쓰기 (헌금 등록 등, 기본 가중치가 가장 높음)
+- read: 대화형 읽기
+- background: 주기 재계산/보관 정리/내보내기 등 (동시 실행 수를 따로 제한해 대화형 요청 몫을 남김)
+
+레인은 db_lane() 으로 지정하고, 지정하지 않으면 문장 종류(읽기/쓰기)로 정합니다.
+대기 시간이 제한을 넘으면 대기열에서 빠지고 QueueTimeout 이 발생하며(실행되지 않음),
+호출자가 취소된 경우에도 대기열에서 바로 제거됩니다.
+"""
+import asyncio
+import contextlib
+import contextvars
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.metrics import metrics
+from app.db.my_libsql_client import DatabaseUnavailable
+from app.db.sql import is_read_only
+
+logger = logging.getLogger(__name__)
+
+WRITE = "write"
+READ = "read"
+BACKGROUND = "background"
+LANES = (WRITE, READ, BACKGROUND)
+
+# 현재 작업의 레인 (None 이면 문장 종류로 결정)
+_current_lane: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("db_lane", default=None)
+
+
+@contextlib.contextmanager
+def db_lane(name: str):
+    """블록 안의 DB 호출을 지정한 레인으로 스케줄링"""
+    if name not in LANES:
+        raise ValueError(f"알 수 없는 DB 레인: {name}")
+    token = _current_lane.set(name)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+def current_lane() -> Optional[str]:
+    """db_lane() 으로 지정된 현재 레인 (지정되지 않았으면 None)"""
+    return _current_lane.get()
+
+
+def lane_for(sql: Optional[str] = None) -> str:
+    """현재 작업과 문장으로 레인 결정 (sql 이 None 이면 배치 = 쓰기)"""
+    lane = _current_lane.get()
+    if lane is not None:
+        return lane
+    if sql is not None and is_read_only(sql):
+        return READ
+    return WRITE
+
+
+class QueueTimeout(DatabaseUnavailable):
+    """DB 호출이 대기열에서 제한 시간 안에 슬롯을 받지 못함 (실행되지 않음)"""
+
+    def __init__(self, lane: str, waited: float):
+        super().__init__(f"DB 호출 대기 시간 초과 ({lane} 레인, {waited:.1f}초)")
+        self.lane = lane
+        self.waited = waited
+
+
+class _Lane:
+    __slots__ = ("name", "weight", "limit", "timeout", "waiters", "in_flight", "pass_value")
+
+    def __init__(self, name: str, weight: float, limit: Optional[int], timeout: float):
+        self.name = name
+        self.weight = max(weight, 0.01)
+        self.limit = limit
+        self.timeout = timeout
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.in_flight = 0
+        # stride 스케줄링: 배정받을 때마다 1/weight 씩 증가, 가장 작은 레인이 다음 차례
+        self.pass_value = 0.0
+
+    def has_room(self) -> bool:
+        return self.limit is None or self.in_flight < self.limit
+
+
+class DBScheduler:
+    def __init__(self, max_concurrency: int = 16, weights: Optional[Dict[str, float]] = None,
+                 background_limit: Optional[int] = None, queue_timeout: float = 5.0,
+                 background_queue_timeout: float = 60.0):
+        weights = {WRITE: 4.0, READ: 2.0, BACKGROUND: 1.0, **(weights or {})}
+        self.max_concurrency = max(1, max_concurrency)
+        if background_limit is None:
+            background_limit = max(1, self.max_concurrency // 4)
+        self.lanes: Dict[str, _Lane] = {
+            WRITE: _Lane(WRITE, weights[WRITE], None, queue_timeout),
+            READ: _Lane(READ, weights[READ], None, queue_timeout),
+            BACKGROUND: _Lane(BACKGROUND, weights[BACKGROUND],
+                              min(background_limit, self.max_concurrency), background_queue_timeout),
+        }
+        self.in_flight = 0
+
+    @contextlib.asynccontextmanager
+    async def slot(self, lane_name: str):
+        """슬롯 하나를 받아 블록 실행 (대기 시간 초과 시 QueueTimeout)"""
+        lane = self.lanes[lane_name]
+        await self._acquire(lane)
+        try:
+            yield
+        finally:
+            self._release(lane)
+
+    async def _acquire(self, lane: _Lane):
+        started = time.perf_counter()
+        if self.in_flight < self.max_concurrency and lane.has_room() and not self._has_waiters():
+            self._admit(lane)
+            self._record_wait(lane, started)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        if not lane.waiters:
+            # 쉬고 있던 레인이 밀린 몫을 한꺼번에 가져가지 않도록 현재 진행 중인 레인 기준으로 맞춤
+            active = [other.pass_value for other in self.lanes.values() if other.waiters]
+            if active:
+                lane.pass_value = max(lane.pass_value, min(active))
+        lane.waiters.append(waiter)
+        # 다른 레인만 상한에 걸려 있는 경우 빈 슬롯을 바로 배정
+        self._dispatch()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), lane.timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 받은 직후에 제한 시간/취소가 겹친 경우 슬롯을 돌려줌
+                self._release(lane)
+            else:
+                waiter.cancel()
+                with contextlib.suppress(ValueError):
+                    lane.waiters.remove(waiter)
+                self._update_gauges()
+            if isinstance(e, asyncio.CancelledError):
+                metrics.incr(f"db.queue.{lane.name}.cancelled")
+                raise
+            waited = time.perf_counter() - started
+            metrics.incr(f"db.queue.{lane.name}.timeouts")
+            logger.warning(f"DB 호출 대기 시간 초과: {lane.name} 레인 {waited:.1f}초 "
+                           f"(실행 중 {self.in_flight}/{self.max_concurrency})")
+            raise QueueTimeout(lane.name, waited) from None
+        self._record_wait(lane, started)
+
+    def _admit(self, lane: _Lane):
+        self.in_flight += 1
+        lane.in_flight += 1
+        lane.pass_value += 1.0 / lane.weight
+        metrics.incr(f"db.queue.{lane.name}.admitted")
+
+    def _release(self, lane: _Lane):
+        self.in_flight -= 1
+        lane.in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        """빈 슬롯을 가중치 순서(stride)로 대기 중인 레인에 배정"""
+        while self.in_flight < self.max_concurrency:
+            candidates = [lane for lane in self.lanes.values() if lane.waiters and lane.has_room()]
+            if not candidates:
+                break
+            lane = min(candidates, key=lambda candidate: candidate.pass_value)
+            waiter = lane.waiters.popleft()
+            if waiter.done():
+                continue
+            self._admit(lane)
+            waiter.set_result(None)
+        self._update_gauges()
+
+    def _has_waiters(self) -> bool:
+        return any(lane.waiters for lane in self.lanes.values())
+
+    def _record_wait(self, lane: _Lane, started: float):
+        metrics.observe(f"db.queue.{lane.name}.wait_ms", (time.perf_counter() - started) * 1000)
+        self._update_gauges()
+
+    def _update_gauges(self):
+        metrics.set_gauge("db.queue.in_flight", self.in_flight)
+        for lane in self.lanes.values():
+            metrics.set_gauge(f"db.queue.{lane.name}.waiting", len(lane.waiters))
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "lanes": {
+                lane.name: {
+                    "weight": lane.weight,
+                    "limit": lane.limit,
+                    "timeout": lane.timeout,
+                    "in_flight": lane.in_flight,
+                    "waiting": len(lane.waiters),
+                }
+                for lane in self.lanes.values()
+            },
+        }
+
+
+class ScheduledClient:
+    """클라이언트 호출마다 스케줄러 슬롯을 받아 실행"""
+
+    def __init__(self, client, scheduler: DBScheduler):
+        self.client = client
+        self.scheduler = scheduler
+
+    async def execute(self, sql: str, params: Optional[list] = None):
+        async with self.scheduler.slot(lane_for(sql)):
+            return await self.client.execute(sql, params)
+
+    async def batch(self, statements: list):
+        async with self.scheduler.slot(lane_for()):
+            return await self.client.batch(statements)
+
+    async def close(self):
+        await self.client.close()
+
+
+class ScheduledEngine:
+    """엔진 앞단의 스케줄러 (DatabaseEngine 과 같은 인터페이스)"""
+
+    def __init__(self, engine, scheduler: DBScheduler):
+        self.engine = engine
+        self.scheduler = scheduler
+        self.name = engine.name
+
+    async def start(self):
+        await self.engine.start()
+
+    async def stop(self):
+        await self.engine.stop()
+
+    async def get_client(self) -> ScheduledClient:
+        return ScheduledClient(await self.engine.get_client(), self.scheduler)
+
+    def describe(self) -> Dict[str, Any]:
+        return {**self.engine.describe(), "scheduler": self.scheduler.describe()}
+
+
+def parse_weights(value: Optional[str]) -> Dict[str, float]:
+    """'write=4,read=2,background=1' 형태의 레인 가중치 설정 해석"""
+    weights = {}
+    for part in (value or "").split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in LANES:
+            raise ValueError(f"알 수 없는 DB 레인: {name}")
+        weights[name] = float(weight)
+    return weights
@@ -0,0 +1,51 @@
+"""
+SQL 문 분석 유틸리티
+
+라우팅(읽기/쓰기 구분)과 복제 대상 판단에 쓰이는 가벼운 정규식 기반 분석기와
+로컬 sqlite 결과를 libsql_client 결과 형태로 바꾸는 변환기입니다.
+"""
+import re
+from typing import Any, FrozenSet, Optional, Sequence
+
+from libsql_client.result import ResultSet, Row
+
+_LEADING_COMMENTS = re.compile(r"^\s*(?:(?:--[^\n]*\n)|(?:/\*.*?\*/)|\s)*", re.S)
+_WRITE_KEYWORDS = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|REPLACE|CREATE|DROP|ALTER|VACUUM|REINDEX|ATTACH|DETACH)\b", re.I
+)
+_TABLE_REFERENCES = re.compile(r"\b(?:FROM|JOIN|INTO|UPDATE)\s+([A-Za-z_][A-Za-z0-9_]*)", re.I)
+_READ_PRAGMA = re.compile(r"^PRAGMA\s+[A-Za-z_]+\s*(\(\s*[A-Za-z_][A-Za-z0-9_]*\s*\))?\s*;?\s*$", re.I)
+
+
+def strip_leading_comments(sql: str) -> str:
+    """앞쪽 주석과 공백 제거"""
+    return _LEADING_COMMENTS.sub("", sql, count=1)
+
+
+def is_read_only(sql: str) -> bool:
+    """데이터를 변경하지 않는 문장인지 판단"""
+    body = strip_leading_comments(sql)
+    keyword = body[:10].upper()
+    if keyword.startswith(("SELECT", "EXPLAIN", "VALUES")):
+        return True
+    if keyword.startswith("WITH"):
+        # WITH ... INSERT/UPDATE/DELETE 형태는 쓰기
+        return _WRITE_KEYWORDS.search(body) is None
+    if keyword.startswith("PRAGMA"):
+        # 값 할당이 없는 PRAGMA(조회)만 읽기로 취급
+        return _READ_PRAGMA.match(body) is not None
+    return False
+
+
+def referenced_tables(sql: str) -> FrozenSet[str]:
+    """문장에서 참조하는 테이블 이름 집합 (FROM/JOIN/INTO/UPDATE 뒤 식별자)"""
+    return frozenset(name.lower() for name in _TABLE_REFERENCES.findall(sql))
+
+
+def to_result_set(cursor_description, rows: Sequence[Sequence[Any]],
+                  rows_affected: int = 0, last_insert_rowid: Optional[int] = None) -> ResultSet:
+    """sqlite3 결과를 libsql_client ResultSet 형태로 변환 (서비스 코드 호환)"""
+    columns = tuple(column[0] for column in cursor_description or ())
+    column_idxs = {name: idx for idx, name in enumerate(columns)}
+    return ResultSet(columns, [Row(column_idxs, tuple(row)) for row in rows],
+                     rows_affected, last_insert_rowid)
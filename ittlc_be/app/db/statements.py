@@ -0,0 +1,92 @@
+"""
+SQL 문 레지스트리
+
+필터 조합마다 달라지는 목록 조회 SQL을 조합(shape)별로 한 번만 만들어 재사용합니다.
+같은 조합은 항상 같은 SQL 문자열을 쓰므로 로컬 엔진(sqlite3 statement cache)에서는
+준비된 문장이 그대로 재사용됩니다. LibSQL HTTP 엔진은 문자열 생성 비용만 줄어듭니다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from app.core.metrics import metrics
+
+
+class StatementRegistry:
+    """SQL 문자열 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._statements: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, build: Callable[[], str]) -> str:
+        """key 에 해당하는 SQL 반환 (없으면 build() 로 만들어 저장)"""
+        with self._lock:
+            sql = self._statements.get(key)
+            if sql is not None:
+                self._statements.move_to_end(key)
+                metrics.incr("statements.hits")
+                return sql
+
+        sql = build()
+        with self._lock:
+            self._statements[key] = sql
+            self._statements.move_to_end(key)
+            while len(self._statements) > self.max_entries:
+                self._statements.popitem(last=False)
+                metrics.incr("statements.evictions")
+            metrics.set_gauge("statements.size", len(self._statements))
+        metrics.incr("statements.misses")
+        return sql
+
+    def define(self, name: str, base: str, filters: Dict[str, str], suffix: str = "",
+               where: str = "") -> "StatementShape":
+        """필터 조합형 조회문 정의"""
+        return StatementShape(self, name, base, filters, suffix, where)
+
+    def clear(self):
+        with self._lock:
+            self._statements.clear()
+        metrics.set_gauge("statements.size", 0)
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+
+class StatementShape:
+    """base + 선택적 AND 조건들 + suffix 로 이루어진 조회문
+
+    filters 는 {인자 이름: "컬럼 조건 = ?"} 형태이며, 값이 참으로 평가되는 필터만 WHERE 에 붙습니다.
+    where 는 항상 붙는 조건입니다 (예: 소프트 삭제되지 않은 행만).
+    """
+
+    def __init__(self, registry: StatementRegistry, name: str, base: str,
+                 filters: Dict[str, str], suffix: str = "", where: str = ""):
+        self.registry = registry
+        self.name = name
+        self.base = base.strip()
+        self.filters = dict(filters)
+        self.suffix = suffix.strip()
+        self.where = where.strip()
+
+    def bind(self, values: Dict[str, Any], *extra_params: Any) -> Tuple[str, List[Any]]:
+        """(SQL, 파라미터) 반환 - extra_params 는 suffix 의 ? 에 차례로 들어감 (LIMIT/OFFSET 등)"""
+        active = tuple(key for key in self.filters if values.get(key))
+        sql = self.registry.get((self.name, active), lambda: self._build(active))
+        params = [values[key] for key in active]
+        params.extend(extra_params)
+        return sql, params
+
+    def _build(self, active: Tuple[str, ...]) -> str:
+        parts = [self.base]
+        conditions = ([self.where] if self.where else []) + [self.filters[key] for key in active]
+        if conditions:
+            parts.append("WHERE " + " AND ".join(conditions))
+        if self.suffix:
+            parts.append(self.suffix)
+        return " ".join(parts)
+
+
+# 전역 SQL 문 레지스트리
+statements = StatementRegistry()
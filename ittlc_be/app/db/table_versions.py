@@ -0,0 +1,90 @@
+"""
+테이블 버전 카운터
+
+database_schema.sql 의 트리거가 쓰기 시마다 table_versions 행을 1씩 증가시킵니다.
+여기서는 그 값을 메모리에 캐시해 두고 약한 ETag를 계산합니다.
+캐시가 신선한 동안에는 조건부 GET이 DB 조회 없이 메모리 비교만으로 끝납니다.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 버전 카운터를 유지하는 테이블 목록 (database_schema.sql 트리거와 일치해야 함)
+TRACKED_TABLES = (
+    "users", "members", "families",
+    "prayer_categories", "prayers", "prayer_participants", "prayer_comments",
+    "offering_types", "offerings",
+    "system_settings",
+)
+
+
+class TableVersionTracker:
+    def __init__(self, refresh_interval: float = 2.0,
+                 client_factory: Optional[Callable[[], Awaitable]] = None):
+        self.refresh_interval = refresh_interval
+        self._client_factory = client_factory
+        self._versions: Dict[str, int] = {}
+        self._refreshed_at = 0.0
+        self._lock = asyncio.Lock()
+        self._invalidation_listeners: List[Callable[[], None]] = []
+
+    async def _get_client(self):
+        if self._client_factory is None:
+            # 순환 import 방지를 위해 지연 import
+            from app.services.libsql_service import libsql_service
+            self._client_factory = libsql_service.get_client
+        return await self._client_factory()
+
+    def invalidate(self):
+        """이 프로세스에서 쓰기가 일어났음을 표시 (다음 조회 시 DB에서 다시 읽음)"""
+        self._refreshed_at = 0.0
+        for listener in self._invalidation_listeners:
+            listener()
+
+    def on_invalidate(self, listener: Callable[[], None]):
+        """쓰기 발생 시 호출할 콜백 등록 (결과 캐시 폐기 등)"""
+        self._invalidation_listeners.append(listener)
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self._refreshed_at < self.refresh_interval
+
+    async def refresh(self) -> bool:
+        """table_versions 테이블 전체를 한 번의 쿼리로 다시 읽기"""
+        async with self._lock:
+            if self.is_fresh():
+                return True
+            client = await self._get_client()
+            try:
+                result = await client.execute("SELECT table_name, version FROM table_versions")
+                self._versions = {row[0]: row[1] for row in result.rows}
+                self._refreshed_at = time.monotonic()
+                return True
+            except Exception as e:
+                # 구 스키마(table_versions 없음)에서는 ETag 없이 동작
+                logger.warning(f"테이블 버전 조회 실패: {e}")
+                return False
+            finally:
+                await client.close()
+
+    async def get_versions(self, tables: Iterable[str]) -> Optional[Dict[str, int]]:
+        """요청한 테이블들의 현재 버전 반환 (조회 불가 시 None)"""
+        if not self.is_fresh() and not await self.refresh():
+            return None
+        return {table: self._versions.get(table, 0) for table in tables}
+
+    async def etag(self, tables: Iterable[str], extra: str = "") -> Optional[str]:
+        """테이블 버전으로부터 약한 ETag 계산"""
+        versions = await self.get_versions(tables)
+        if versions is None:
+            return None
+        fingerprint = ",".join(f"{table}:{version}" for table, version in sorted(versions.items()))
+        digest = hashlib.blake2b(f"{fingerprint}|{extra}".encode(), digest_size=8).hexdigest()
+        return f'W/"{digest}"'
+
+
+# 전역 테이블 버전 추적기 인스턴스
+table_versions = TableVersionTracker()
@@ -1,13 +1,33 @@
-from fastapi import FastAPI
+import asyncio
+import hashlib
+import math
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.v1.api import api_router
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.etag import NotModified, not_modified_response
+from app.core.metrics import metrics
+from app.db.my_libsql_client import CircuitBreaker, DatabaseUnavailable, circuit_breakers
+from app.db.replica import current_session
+from app.db.statements import statements
+from app.services.backup_service import backup_service
 from app.services.libsql_service import libsql_service
+from app.services.dashboard_service import dashboard_materializer
+from app.services.job_queue import job_queue
+from app.services.job_scheduler import job_scheduler
+from app.services.outbox import outbox_dispatcher
+from app.services.singleflight import singleflight
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="ITTLC Backend API",
     description="ITTLC 프로젝트의 백엔드 API 서버 (LibSQL)",
-    version="1.0.0"
+    version="1.0.0",
+    # 모든 JSON 응답을 orjson으로 인코딩
+    default_response_class=ORJSONResponse
 )
 
 # CORS 미들웨어 설정
@@ -19,6 +39,54 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 미들웨어 설정 (gzip / brotli)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    cache_entries=settings.COMPRESSION_CACHE_ENTRIES,
+    offload_size=settings.COMPRESSION_OFFLOAD_SIZE,
+)
+
+# 복제본 read-your-writes 판단용 세션 식별
+@app.middleware("http")
+async def replica_session_middleware(request: Request, call_next):
+    session = request.headers.get("X-Session-Id")
+    if session is None and "Authorization" in request.headers:
+        session = hashlib.blake2b(request.headers["Authorization"].encode(), digest_size=8).hexdigest()
+    if session is None and request.client:
+        session = request.client.host
+    token = current_session.set(session)
+    try:
+        return await call_next(request)
+    finally:
+        current_session.reset(token)
+
+# 조건부 GET: If-None-Match 일치 시 304 응답
+@app.exception_handler(NotModified)
+async def not_modified_handler(request: Request, exc: NotModified):
+    return not_modified_response(exc.etag)
+
+# 데이터베이스 일시 장애(서킷 차단, 재시도 소진, 대기열 시간 초과): 재시도 가능하다고 503 응답
+def database_unavailable_response(exc: DatabaseUnavailable):
+    return ORJSONResponse(status_code=503, content={"detail": str(exc)},
+                          headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))})
+
+@app.exception_handler(DatabaseUnavailable)
+async def database_unavailable_handler(request: Request, exc: DatabaseUnavailable):
+    return database_unavailable_response(exc)
+
+# 엔드포인트가 except Exception 으로 감싼 500 응답도 원인이 DB 일시 장애면 503 으로 응답
+@app.exception_handler(HTTPException)
+async def database_aware_http_exception_handler(request: Request, exc: HTTPException):
+    cause = exc.__cause__ or exc.__context__
+    while cause is not None:
+        if isinstance(cause, DatabaseUnavailable):
+            return database_unavailable_response(cause)
+        cause = cause.__cause__ or cause.__context__
+    return await http_exception_handler(request, exc)
+
 # API 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
@@ -26,6 +94,9 @@ app.include_router(api_router, prefix="/api/v1")
 async def startup_event():
     """앱 시작 시 LibSQL 연결 확인"""
     try:
+        # 엔진 준비 (로컬 연결 풀 생성, 복제본 최초 동기화)
+        await libsql_service.start()
+
         # LibSQL 연결 테스트
         client = await libsql_service.get_client()
         result = await client.execute("SELECT 1 as test")
@@ -34,9 +105,30 @@ async def startup_event():
         print(f"❌ LibSQL 연결 실패: {e}")
         raise
 
+    singleflight.ttl = settings.SINGLEFLIGHT_TTL
+    statements.max_entries = settings.STATEMENT_CACHE_SIZE
+
+    # 대시보드 통계 주기 재계산 시작
+    dashboard_materializer.refresh_interval = settings.DASHBOARD_REFRESH_INTERVAL
+    await dashboard_materializer.start()
+
+    # 유지보수 작업 스케줄러 시작 (작업마다 한 워커만 실행)
+    await job_scheduler.start()
+
+    # 백그라운드 작업 대기열 작업자 시작
+    await job_queue.start()
+
+    # 변경 이벤트 디스패처 시작 (저장된 커서부터 이어서 전달)
+    await outbox_dispatcher.start()
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """앱 종료 시 LibSQL 연결 종료"""
+    await outbox_dispatcher.stop()
+    await job_queue.stop()
+    await job_scheduler.stop()
+    await dashboard_materializer.stop()
+    await backup_service.stop()
     await libsql_service.close()
     print("🔌 LibSQL 연결 종료")
 
@@ -61,3 +153,33 @@ async def health_check():
             "message": f"데이터베이스 연결 오류: {str(e)}",
             "database": "LibSQL (Turso)"
         }
+
+@app.get("/ready")
+async def readiness_check():
+    """트래픽 수신 가능 여부 (서킷이 열려 있거나 DB 응답이 없으면 503)"""
+    ready = all(breaker.state != CircuitBreaker.OPEN for breaker in circuit_breakers.values())
+    error = None
+    if ready:
+        try:
+            client = await libsql_service.get_client()
+            try:
+                await asyncio.wait_for(client.execute("SELECT 1"), timeout=2.0)
+            finally:
+                await client.close()
+        except Exception as e:
+            ready, error = False, str(e) or type(e).__name__
+    circuits = {name: breaker.describe() for name, breaker in circuit_breakers.items()}
+    content = {"status": "ready" if ready else "unavailable", "circuits": circuits}
+    if error:
+        content["error"] = error
+    return ORJSONResponse(status_code=200 if ready else 503, content=content)
+
+@app.get("/metrics")
+async def get_metrics():
+    """프로세스 내 메트릭 스냅샷 조회"""
+    return metrics.snapshot()
+
+@app.get("/database")
+async def database_status():
+    """사용 중인 데이터베이스 엔진 정보 (복제본 사용 시 신선도 포함)"""
+    return libsql_service.engine.describe()
@@ -1,5 +1,5 @@
 from .users import User, UserCreate, UserUpdate, UserInDB
-from .members import Member, MemberCreate, MemberUpdate
+from .members import Member, MemberCreate, MemberUpdate, MemberHistory, MemberHistoryPage
 
 # 기도 관리 스키마
 from .prayers import (
@@ -29,7 +29,13 @@ from .families import (
 from .system import (
     SystemSetting, SystemSettingCreate, SystemSettingUpdate,
     SystemLog, SystemLogCreate, SystemLogFilter,
-    BackupHistory, BackupHistoryCreate, BackupHistoryUpdate,
-    DashboardStats,
+    BackupHistory, BackupHistoryCreate, BackupHistoryUpdate, BackupRequest,
+    DashboardStats, DashboardSnapshot, JobInfo, JobRun,
     SystemSettingListResponse, SystemLogListResponse, BackupHistoryListResponse
 )
+
+# 백그라운드 작업 스키마
+from .jobs import (
+    JobCreate, OfferingImportRequest, OfferingImportRow,
+    BackgroundJob, BackgroundJobDetail
+)
@@ -0,0 +1,46 @@
+"""
+백그라운드 작업 스키마
+"""
+from pydantic import BaseModel, Field
+from datetime import datetime, date
+from typing import Optional, List, Any, Literal
+
+# 작업 접수 요청
+class JobCreate(BaseModel):
+    job_type: Literal["offering_statistics", "export", "backup"]
+    # offering_statistics: start_date, end_date / export: dataset(offerings|members|families), start_date, end_date
+    # backup: kind(auto|full|incremental)
+    params: dict = Field(default_factory=dict)
+    created_by: Optional[int] = None
+
+class OfferingImportRow(BaseModel):
+    member_id: int
+    offering_date: date
+    offering_type: str = Field(..., min_length=1, max_length=50)
+    amount: float = Field(..., gt=0)
+    memo: Optional[str] = None
+
+class OfferingImportRequest(BaseModel):
+    created_by: int
+    rows: List[OfferingImportRow] = Field(..., min_length=1, max_length=100000)
+
+# 작업 상태
+class BackgroundJob(BaseModel):
+    id: int
+    job_type: str
+    status: str
+    progress: float = 0
+    progress_message: Optional[str] = None
+    error_message: Optional[str] = None
+    attempts: int = 0
+    created_by: Optional[int] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class BackgroundJobDetail(BackgroundJob):
+    cancel_requested: bool = False
+    # 성공한 작업의 결과 (파일 결과는 result_filename 과 GET /jobs/{id}/result)
+    result: Optional[Any] = None
+    result_filename: Optional[str] = None
+    has_file: bool = False
@@ -44,6 +44,8 @@ class MemberUpdate(BaseModel):
     family_role: Optional[str] = Field(None, max_length=20)
     is_active: Optional[bool] = None
     notes: Optional[str] = None
+    # 수정 이력에 남길 수정자 (없으면 등록자로 기록)
+    modified_by: Optional[int] = None
 
 class Member(MemberBase):
     id: int
@@ -73,4 +75,20 @@ class MemberSearch(BaseModel):
     phone: Optional[str] = None
     district: Optional[str] = None
     position: Optional[str] = None
-    is_active: Optional[bool] = None
\ No newline at end of file
+    is_active: Optional[bool] = None
+
+# 성도 수정 이력 스키마
+class MemberHistory(BaseModel):
+    id: int
+    member_id: int
+    field_name: str
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+    modified_by: int
+    modified_by_username: Optional[str] = None
+    modified_at: datetime
+
+class MemberHistoryPage(BaseModel):
+    items: List[MemberHistory]
+    # 다음 페이지 요청에 cursor 로 전달 (없으면 마지막 페이지)
+    next_cursor: Optional[str] = None
@@ -2,7 +2,7 @@
 시스템 관리 및 대시보드 스키마
 """
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import datetime, date
 from typing import Optional, List, Any
 from decimal import Decimal
 
@@ -63,16 +63,62 @@ class BackupHistoryCreate(BackupHistoryBase):
 class BackupHistoryUpdate(BaseModel):
     status: str = Field(..., pattern=r'^(success|failed|in_progress)$')
 
+class BackupRequest(BaseModel):
+    backup_type: str = Field(default="manual", pattern=r'^(manual|auto|scheduled)$')
+    created_by: Optional[int] = None
+    # auto: 같은 원본의 이전 백업이 있으면 증분, 없으면 전체
+    kind: str = Field(default="auto", pattern=r'^(auto|full|incremental)$')
+
 class BackupHistory(BackupHistoryBase):
     id: int
     created_by: Optional[int] = None
     created_at: datetime
+    # 백업 결과 (완료 후 기록)
+    format: Optional[str] = None
+    compression: Optional[str] = None
+    raw_size: Optional[int] = None
+    checksum: Optional[str] = None
+    completed_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+    backup_kind: Optional[str] = None
+    parent_filename: Optional[str] = None
+    snapshot_at: Optional[datetime] = None
     # 조인된 사용자 정보
     created_by_username: Optional[str] = None
 
     class Config:
         from_attributes = True
 
+# 주기 작업 스키마
+class JobInfo(BaseModel):
+    name: str
+    description: str
+    schedule: str
+    next_run: Optional[datetime] = None
+    running: bool
+    # 이 워커에서의 마지막 실행 결과
+    last_status: Optional[str] = None
+    last_trigger: Optional[str] = None
+    last_duration_ms: Optional[float] = None
+    last_finished_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+class JobRun(BaseModel):
+    id: int
+    job_name: str
+    trigger_type: str
+    owner: str
+    status: str
+    scheduled_for: Optional[str] = None
+    result: Optional[str] = None
+    error_message: Optional[str] = None
+    duration_ms: Optional[float] = None
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
 # 대시보드 통계 스키마
 class DashboardStats(BaseModel):
     member_count: int
@@ -80,6 +126,10 @@ class DashboardStats(BaseModel):
     monthly_prayer_count: int
     monthly_offering_amount: Decimal
 
+# 대시보드 통계 스냅샷 스키마 (추이 차트용)
+class DashboardSnapshot(DashboardStats):
+    snapshot_date: date
+
 # 응답 스키마들
 class SystemSettingListResponse(BaseModel):
     settings: List[SystemSetting]
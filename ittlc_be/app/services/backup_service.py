@@ -0,0 +1,535 @@
+"""
+데이터베이스 백업 엔진
+
+create_backup() 은 backup_history 에 in_progress 행을 만들고 바로 반환하며,
+실제 백업은 백그라운드 작업으로 실행한 뒤 결과(상태/크기/체크섬)를 같은 행에 기록합니다.
+
+- 로컬 엔진(file:): SQLite 온라인 백업 API 로 스냅샷 파일을 만든 뒤
+  전체 백업은 파일 전체, 증분 백업은 부모 백업과 해시가 다른 페이지만 저장.
+  원본 연결에 읽기 트랜잭션을 열어 둔 채 복사하므로 도중에 쓰기가 있어도 같은 스냅샷을 복사함 (WAL)
+- 원격 Turso: 읽기 트랜잭션(hrana 스트림) 하나 안에서 테이블을 rowid 순서로 페이지 조회해 SQL 로 스트리밍.
+  전체 백업은 덤프, 증분 백업은 부모 스냅샷 이후 워터마크(updated_at, 추가 전용 테이블은 created_at 등)가
+  바뀐 행의 upsert 와 deleted_rows 삭제 기록의 DELETE. 워터마크가 없는 작은 테이블은 통째로 다시 씀
+- 증분(kind=auto 의 기본)은 같은 원본의 마지막 백업을 부모로 하며, 스키마가 바뀌었거나
+  체인 길이가 BACKUP_MAX_CHAIN_LENGTH 에 도달하면 전체 백업으로 실행
+- 압축: zstd (zstandard 설치 시) 또는 gzip, 저장한 파일의 SHA-256 체크섬과 크기 기록
+- 검증: 체인(전체 + 증분들)을 임시 DB 로 복원해 integrity_check 와 테이블별 행 수/체크섬 비교.
+  통과한 백업만 최종 이름으로 바꾸고 메타데이터 파일(.json)을 남김 (restore.py 가 DB 없이 사용)
+- 파일 I/O 와 압축은 스레드에서 실행하고 읽는 바이트 수를 BACKUP_MAX_BYTES_PER_SECOND 로 제한하며,
+  원격 조회는 DB 스케줄러의 background 레인을 사용
+
+한 프로세스에서는 백업이 한 번에 하나씩 실행됩니다 (나머지는 in_progress 상태로 대기).
+"""
+import asyncio
+import contextlib
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from libsql_client import create_client
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.backup import (
+    DIGEST_SIZE, EXTENSIONS, FULL, INCREMENTAL, PAGES_FORMAT, SCHEMA_QUERY, SQL_FORMAT, SQLITE_FORMAT,
+    VERIFY_EXCLUDED_TABLES,
+    ArtifactWriter, BackupCancelled, BackupCatalog, BackupVerificationError, ByteRateLimiter,
+    quote_identifier, resolve_compression, restore_chain, schema_fingerprint, snapshot_sqlite,
+    sql_literal, table_checksums, verify_database, write_page_delta, write_sqlite_full,
+)
+from app.db.engine import LibSQLEngine, LocalSQLiteEngine, ReplicaEngine, get_engine, local_path
+from app.db.mapping import first_dict
+from app.db.router import RoutingEngine
+from app.db.scheduler import BACKGROUND, db_lane
+
+logger = logging.getLogger(__name__)
+
+# updated_at 이 없지만 행이 추가/삭제만 되는 테이블의 워터마크 컬럼
+APPEND_ONLY_WATERMARKS = {
+    "system_logs": "created_at",
+    "member_history": "modified_at",
+    "prayer_participants": "participated_at",
+    "change_events": "created_at",
+}
+
+
+def utc_timestamp() -> str:
+    """CURRENT_TIMESTAMP 와 같은 표기의 현재 UTC 시각"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _unlink_database(path: Path):
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        with contextlib.suppress(FileNotFoundError):
+            Path(str(path) + suffix).unlink()
+
+
+def backup_local(source_path: str, backup_dir: Path, stem: str, compression: str, level: Optional[int],
+                 parent: Optional[Dict[str, Any]], parent_digests: Optional[bytes], limiter: ByteRateLimiter,
+                 cancel: threading.Event, pages_per_step: int = 256) -> Tuple[ArtifactWriter, Dict[str, Any], bytes]:
+    """로컬 SQLite 백업 (스레드에서 실행)
+
+    스냅샷을 만든 뒤 부모와 스키마/페이지 크기가 같으면 바뀐 페이지만, 아니면 파일 전체를 압축해 씀.
+    (finish 한 writer, 메타데이터, 페이지 해시 목록) 반환
+    """
+    snapshot_path = backup_dir / f"{stem}.snapshot"
+    writer = None
+    try:
+        snapshot_at = utc_timestamp()
+        snapshot_sqlite(source_path, snapshot_path, limiter, cancel, pages_per_step,
+                        on_restart=lambda: metrics.incr("backup.restarts"))
+        connection = sqlite3.connect(snapshot_path)
+        try:
+            schema = schema_fingerprint(connection.execute(SCHEMA_QUERY))
+            page_size = connection.execute("PRAGMA page_size").fetchone()[0]
+            tables = table_checksums(connection, cancel)
+        finally:
+            connection.close()
+
+        entry: Dict[str, Any] = {"snapshot_at": snapshot_at, "schema": schema, "page_size": page_size,
+                                 "tables": tables}
+        if (parent is not None and parent_digests is not None
+                and parent.get("schema") == schema and parent.get("page_size") == page_size):
+            writer = ArtifactWriter(backup_dir / f"{stem}{EXTENSIONS[PAGES_FORMAT]}{EXTENSIONS[compression]}",
+                                    compression, level)
+            delta = write_page_delta(snapshot_path, parent_digests, writer, limiter, cancel)
+            digests = delta["digests"]
+            entry.update(kind=INCREMENTAL, format=PAGES_FORMAT, parent=parent["filename"],
+                         changed_pages=delta["changed_pages"], page_count=delta["page_count"])
+        else:
+            writer = ArtifactWriter(backup_dir / f"{stem}{EXTENSIONS[SQLITE_FORMAT]}{EXTENSIONS[compression]}",
+                                    compression, level)
+            digests = write_sqlite_full(snapshot_path, writer, limiter, cancel)
+            entry.update(kind=FULL, format=SQLITE_FORMAT, parent=None, page_count=len(digests) // DIGEST_SIZE)
+        entry.update(writer.finish())
+        return writer, entry, digests
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            snapshot_path.unlink()
+
+
+def verify_chain(chain: List[Dict[str, Any]], verify_path: Path, limiter: ByteRateLimiter,
+                 cancel: threading.Event) -> Dict[str, Dict[str, Any]]:
+    """체인을 임시 DB 로 복원해 마지막 백업에 기록된 행 수/체크섬과 비교 (스레드에서 실행), 테이블별 체크섬 반환"""
+    entry = chain[-1]
+    try:
+        restore_chain(chain, verify_path, limiter, cancel)
+        return verify_database(verify_path, entry.get("counts"), entry.get("tables"), cancel)
+    finally:
+        _unlink_database(verify_path)
+
+
+def to_ws_url(url: str) -> str:
+    """원격 URL을 트랜잭션을 지원하는 hrana(WebSocket) URL로 변환"""
+    if url.startswith("https://"):
+        return "wss://" + url[len("https://"):]
+    if url.startswith("http://"):
+        return "ws://" + url[len("http://"):]
+    return url
+
+
+class BackupService:
+    def __init__(self, backup_dir: str = "./data/backups", compression: str = "auto",
+                 compression_level: Optional[int] = None, max_bytes_per_second: float = 16 * 1024 * 1024,
+                 pages_per_step: int = 256, dump_page_size: int = 2000, statement_timeout: float = 10.0,
+                 max_chain_length: int = 7):
+        self.engine = get_engine()
+        self.backup_dir = Path(backup_dir)
+        self.catalog = BackupCatalog(self.backup_dir)
+        self.compression = compression
+        self.compression_level = compression_level
+        self.max_bytes_per_second = max_bytes_per_second
+        self.pages_per_step = pages_per_step
+        self.dump_page_size = dump_page_size
+        self.statement_timeout = statement_timeout
+        self.max_chain_length = max_chain_length
+        self._run_lock = asyncio.Lock()
+        self._cancel = threading.Event()
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+    async def get_client(self):
+        """데이터베이스 클라이언트 반환"""
+        return await self.engine.get_client()
+
+    # 백업 요청
+    async def create_backup(self, backup_type: str = "manual", created_by: Optional[int] = None,
+                            kind: str = "auto") -> Dict[str, Any]:
+        """backup_history 에 in_progress 행을 만들고 백그라운드 백업 시작
+
+        kind: auto (부모 백업이 있으면 증분) / full / incremental (부모가 없으면 전체로 실행).
+        파일 이름의 확장자는 실행 시 정해지는 형식에 따라 완료 후 기록됩니다.
+        """
+        source = self._source()
+        compression = resolve_compression(self.compression)
+        stem = f"ittlc-{datetime.now():%Y%m%d-%H%M%S}-{secrets.token_hex(3)}"
+
+        client = await self.get_client()
+        try:
+            result = await client.execute(
+                """
+                INSERT INTO backup_history (filename, backup_type, status, created_by, compression)
+                VALUES (?, ?, 'in_progress', ?, ?)
+                """,
+                [stem, backup_type, created_by, compression]
+            )
+        finally:
+            await client.close()
+
+        backup_id = result.last_insert_rowid
+        self._cancel.clear()
+        task = asyncio.create_task(self._run(backup_id, stem, kind, compression, source))
+        self._tasks[backup_id] = task
+        task.add_done_callback(lambda _: self._finished(backup_id))
+        metrics.set_gauge("backup.in_progress", len(self._tasks))
+        return {"id": backup_id, "status": "in_progress", "kind": kind}
+
+    async def get_backup(self, backup_id: int) -> Optional[Dict[str, Any]]:
+        """백업 기록 조회 (진행 상태 확인용)"""
+        client = await self.get_client()
+        try:
+            result = await client.execute(
+                """
+                SELECT bh.*, u.username as created_by_username
+                FROM backup_history bh
+                LEFT JOIN users u ON bh.created_by = u.id
+                WHERE bh.id = ?
+                """,
+                [backup_id]
+            )
+            return first_dict(result)
+        finally:
+            await client.close()
+
+    async def wait(self, backup_id: int) -> Optional[Dict[str, Any]]:
+        """백업이 끝날 때까지 기다린 뒤 기록 반환 (정기 백업 작업용)"""
+        task = self._tasks.get(backup_id)
+        if task is not None:
+            await asyncio.shield(task)
+        return await self.get_backup(backup_id)
+
+    async def stop(self):
+        """진행 중인 백업 중단 (스레드 작업은 다음 확인 지점에서 멈추고 .part 파일 삭제)"""
+        self._cancel.set()
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _finished(self, backup_id: int):
+        self._tasks.pop(backup_id, None)
+        metrics.set_gauge("backup.in_progress", len(self._tasks))
+
+    def _source(self) -> Tuple[str, ...]:
+        """백업 원본: ("local", 파일 경로) 또는 ("remote", URL, 토큰)"""
+        engine = self.engine
+        while True:
+            if isinstance(engine, RoutingEngine):
+                engine = engine.primary
+            elif hasattr(engine, "scheduler"):
+                engine = engine.engine
+            else:
+                break
+        if isinstance(engine, LocalSQLiteEngine):
+            return ("local", engine.path)
+        if isinstance(engine, ReplicaEngine):
+            url, auth_token = engine.replica.primary_url, engine.replica.auth_token
+        elif isinstance(engine, LibSQLEngine):
+            url, auth_token = engine.url, engine.auth_token
+        else:
+            raise ValueError(f"백업을 지원하지 않는 엔진: {engine.name}")
+        if url.startswith("file:"):
+            return ("local", local_path(url))
+        return ("remote", url, auth_token)
+
+    @staticmethod
+    def _source_id(source: Tuple[str, ...]) -> str:
+        """카탈로그에서 체인을 구분하는 원본 식별자"""
+        if source[0] == "local":
+            return "file:" + os.path.abspath(source[1])
+        return source[1]
+
+    def _parent(self, kind: str, source_id: str) -> Optional[Dict[str, Any]]:
+        """증분 백업의 부모 (같은 원본의 마지막 백업), 전체 백업을 해야 하면 None"""
+        if kind == FULL:
+            return None
+        parent = self.catalog.latest(source_id)
+        if parent is None:
+            return None
+        try:
+            chain = self.catalog.chain(parent)
+        except BackupVerificationError as e:
+            logger.warning(f"백업 체인이 끊겨 전체 백업을 실행합니다: {e}")
+            return None
+        if len(chain) >= self.max_chain_length:
+            return None
+        return parent
+
+    # 백업 실행
+    async def _run(self, backup_id: int, stem: str, kind: str, compression: str, source: Tuple[str, ...]):
+        started = time.perf_counter()
+        limiter = ByteRateLimiter(self.max_bytes_per_second)
+        entry: Dict[str, Any] = {}
+        try:
+            async with self._run_lock:
+                with db_lane(BACKGROUND):
+                    self.backup_dir.mkdir(parents=True, exist_ok=True)
+                    source_id = self._source_id(source)
+                    parent = self._parent(kind, source_id)
+                    if source[0] == "local":
+                        parent_digests = None
+                        digests_path = self.catalog.digests_path(parent) if parent is not None else None
+                        if digests_path is not None and digests_path.exists():
+                            parent_digests = await asyncio.to_thread(digests_path.read_bytes)
+                        writer, entry, digests = await asyncio.to_thread(
+                            backup_local, source[1], self.backup_dir, stem, compression, self.compression_level,
+                            parent, parent_digests, limiter, self._cancel, self.pages_per_step
+                        )
+                    else:
+                        writer, entry = await self._backup_remote(source[1], source[2], stem, compression,
+                                                                  parent, limiter)
+                        digests = None
+                    try:
+                        entry.update(id=backup_id, filename=writer.path.name, source=source_id,
+                                     compression=compression, path=str(writer.part_path))
+                        chain = (self.catalog.chain(parent) if entry["kind"] == INCREMENTAL else []) + [entry]
+                        verify_path = self.backup_dir / f"{stem}.verify"
+                        tables = await asyncio.to_thread(verify_chain, chain, verify_path, limiter, self._cancel)
+                        # 원격 백업은 복원 결과의 체크섬을 기록해 두고 restore.py 가 비교
+                        entry.setdefault("tables", tables)
+                        writer.commit()
+                    except BaseException:
+                        writer.abort()
+                        raise
+                    entry["path"] = str(writer.path)
+                    await asyncio.to_thread(self.catalog.write, entry, digests)
+                    if entry["kind"] == FULL:
+                        await self._purge_deleted_rows(entry["snapshot_at"])
+                    await self._record(backup_id, "success", entry)
+        except asyncio.CancelledError:
+            metrics.incr("backup.failures")
+            await self._record(backup_id, "failed", error="앱 종료로 백업이 중단되었습니다")
+            raise
+        except Exception as e:
+            metrics.incr("backup.failures")
+            logger.exception(f"백업 실패 ({stem})")
+            await self._record(backup_id, "failed", error=str(e) or type(e).__name__)
+            return
+
+        elapsed = time.perf_counter() - started
+        metrics.incr("backup.success")
+        metrics.incr(f"backup.{entry['kind']}")
+        metrics.observe("backup.duration_ms", elapsed * 1000)
+        if entry["kind"] == INCREMENTAL:
+            changed = (f"{entry['changed_pages']}/{entry['page_count']} 페이지" if entry["format"] == PAGES_FORMAT
+                       else f"{entry['changed_rows']}행 변경, {entry['deleted_rows']}행 삭제")
+            detail = f"증분 ← {entry['parent']}, {changed}"
+        else:
+            detail = "전체"
+        logger.info(f"백업 완료: {entry['filename']} ({detail}, {entry['raw_size']} → {entry['file_size']} bytes, "
+                    f"{elapsed:.1f}초, 속도 제한 대기 {limiter.throttled_seconds:.1f}초)")
+
+    async def _record(self, backup_id: int, status: str, entry: Optional[Dict[str, Any]] = None,
+                      error: Optional[str] = None):
+        """백업 결과를 backup_history 에 기록"""
+        entry = entry or {}
+        try:
+            client = await self.get_client()
+            try:
+                await client.execute(
+                    """
+                    UPDATE backup_history
+                    SET status = ?, filename = COALESCE(?, filename), format = ?, backup_kind = ?,
+                        parent_filename = ?, snapshot_at = ?, file_size = ?, raw_size = ?, checksum = ?,
+                        error_message = ?, completed_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                    """,
+                    [status, entry.get("filename"), entry.get("format"), entry.get("kind"), entry.get("parent"),
+                     entry.get("snapshot_at"), entry.get("file_size"), entry.get("raw_size"), entry.get("checksum"),
+                     error, backup_id]
+                )
+            finally:
+                await client.close()
+        except Exception as e:
+            logger.error(f"백업 결과 기록 실패 (id={backup_id}, {status}): {e}")
+
+    async def _purge_deleted_rows(self, snapshot_at: str):
+        """전체 백업 스냅샷 이전의 삭제 기록 정리 (이후 증분은 이 백업을 부모로 함)"""
+        try:
+            client = await self.get_client()
+            try:
+                await client.execute("DELETE FROM deleted_rows WHERE deleted_at < ?", [snapshot_at])
+            finally:
+                await client.close()
+        except Exception as e:
+            logger.warning(f"삭제 기록 정리 실패: {e}")
+
+    async def _backup_remote(self, url: str, auth_token: Optional[str], stem: str, compression: str,
+                             parent: Optional[Dict[str, Any]],
+                             limiter: ByteRateLimiter) -> Tuple[ArtifactWriter, Dict[str, Any]]:
+        """원격 DB 를 읽기 트랜잭션 하나 안에서 SQL 로 스트리밍 (finish 한 writer, 메타데이터) 반환
+
+        부모와 스키마가 같고 deleted_rows 테이블이 있으면 증분, 아니면 전체 덤프.
+        """
+        client = create_client(to_ws_url(url), auth_token=auth_token)
+        transaction = client.transaction()
+        scheduler = getattr(self.engine, "scheduler", None)
+        writer = None
+
+        async def query(sql: str, params: Optional[list] = None):
+            if self._cancel.is_set():
+                raise BackupCancelled("앱 종료로 백업이 중단되었습니다")
+            slot = scheduler.slot(BACKGROUND) if scheduler is not None else contextlib.nullcontext()
+            async with slot:
+                return await asyncio.wait_for(transaction.execute(sql, params), self.statement_timeout)
+
+        async def emit(text: str):
+            data = text.encode("utf-8")
+            await limiter.wait(len(data))
+            await asyncio.to_thread(writer.write, data)
+
+        try:
+            # 스냅샷 시각을 먼저 기록 (이후 커밋된 행은 다음 증분의 워터마크 조건에 다시 걸림)
+            snapshot_at = (await query("SELECT CURRENT_TIMESTAMP")).rows[0][0]
+            schema = await query(SCHEMA_QUERY)
+            fingerprint = schema_fingerprint(schema.rows)
+            names = {name for kind, name, _ in schema.rows if kind == "table"}
+            incremental = parent is not None and parent.get("schema") == fingerprint and "deleted_rows" in names
+
+            writer = ArtifactWriter(self.backup_dir / f"{stem}{EXTENSIONS[SQL_FORMAT]}{EXTENSIONS[compression]}",
+                                    compression, self.compression_level)
+            entry: Dict[str, Any] = {"snapshot_at": snapshot_at, "schema": fingerprint, "format": SQL_FORMAT}
+            if incremental:
+                entry.update(kind=INCREMENTAL, parent=parent["filename"])
+                entry.update(await self._write_increment(query, emit, schema.rows, parent["snapshot_at"]))
+            else:
+                entry.update(kind=FULL, parent=None, counts=await self._write_dump(query, emit, schema.rows))
+            await emit("COMMIT;\n")
+            entry.update(await asyncio.to_thread(writer.finish))
+            return writer, entry
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+        finally:
+            with contextlib.suppress(Exception):
+                await transaction.rollback()
+            await client.close()
+
+    async def _copy_rows(self, query, emit, table: str, verb: str,
+                         where: str = "", params: Optional[list] = None) -> int:
+        """테이블 행을 rowid 순서로 페이지 조회해 INSERT 문으로 출력, 행 수 반환"""
+        params = params or []
+        condition = f"{where} AND " if where else ""
+        copied = 0
+        last_rowid = None
+        while True:
+            if last_rowid is None:
+                page = await query(f"SELECT rowid, * FROM {quote_identifier(table)} "
+                                   f"{'WHERE ' + where if where else ''} ORDER BY rowid LIMIT ?",
+                                   params + [self.dump_page_size])
+            else:
+                page = await query(f"SELECT rowid, * FROM {quote_identifier(table)} WHERE {condition}rowid > ? "
+                                   f"ORDER BY rowid LIMIT ?", params + [last_rowid, self.dump_page_size])
+            if not page.rows:
+                break
+            await emit("".join(
+                f"{verb} INTO {quote_identifier(table)} VALUES({','.join(sql_literal(value) for value in row[1:])});\n"
+                for row in page.rows
+            ))
+            copied += len(page.rows)
+            last_rowid = page.rows[-1][0]
+            if len(page.rows) < self.dump_page_size:
+                break
+        return copied
+
+    async def _write_sequences(self, query, emit):
+        """AUTOINCREMENT 카운터 (삭제된 id 를 다시 쓰지 않도록)"""
+        sequences = await query(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_sequence'"
+        )
+        if sequences.rows:
+            sequence = await query("SELECT name, seq FROM sqlite_sequence")
+            await emit("DELETE FROM sqlite_sequence;\n" + "".join(
+                f"INSERT INTO sqlite_sequence VALUES({sql_literal(name)},{sql_literal(seq)});\n"
+                for name, seq in sequence.rows
+            ))
+
+    async def _write_dump(self, query, emit, schema_rows) -> Dict[str, int]:
+        """전체 SQL 덤프, 테이블별 행 수 반환 (삭제 기록은 구조만 복사)"""
+        counts: Dict[str, int] = {}
+        await emit("PRAGMA foreign_keys=OFF;\nBEGIN TRANSACTION;\n")
+        for kind, table, ddl in schema_rows:
+            if kind != "table":
+                continue
+            await emit(f"{ddl};\n")
+            if table not in VERIFY_EXCLUDED_TABLES:
+                counts[table] = await self._copy_rows(query, emit, table, "INSERT")
+        await self._write_sequences(query, emit)
+        # 인덱스/트리거/뷰는 데이터 뒤에 생성 (트리거가 적재 중에 실행되지 않도록)
+        for kind, name, sql in schema_rows:
+            if kind != "table":
+                await emit(f"{sql};\n")
+        return counts
+
+    async def _write_increment(self, query, emit, schema_rows, since: str) -> Dict[str, Any]:
+        """since(부모 스냅샷 시각) 이후 바뀐 행의 upsert 와 삭제 기록의 DELETE 출력
+
+        워터마크 컬럼이 없는 테이블은 비우고 다시 씀. 복원 쪽에서 트리거를 내리고 적용하므로
+        upsert 가 버전 카운터/삭제 기록을 건드리지 않음.
+        """
+        await emit("PRAGMA foreign_keys=OFF;\nBEGIN TRANSACTION;\n")
+        counts: Dict[str, int] = {}
+        watermarked = set()
+        changed_rows = 0
+        for kind, table, _ in schema_rows:
+            if kind != "table" or table in VERIFY_EXCLUDED_TABLES:
+                continue
+            columns = {row[1] for row in (await query(f"PRAGMA table_info({quote_identifier(table)})")).rows}
+            watermark = "updated_at" if "updated_at" in columns else APPEND_ONLY_WATERMARKS.get(table)
+            if watermark in columns:
+                watermarked.add(table)
+                changed_rows += await self._copy_rows(query, emit, table, "INSERT OR REPLACE",
+                                                      f"{quote_identifier(watermark)} >= ?", [since])
+            else:
+                await emit(f"DELETE FROM {quote_identifier(table)};\n")
+                await self._copy_rows(query, emit, table, "INSERT")
+            counts[table] = (await query(f"SELECT COUNT(*) FROM {quote_identifier(table)}")).rows[0][0]
+
+        deleted_rows = 0
+        last_id = 0
+        while True:
+            page = await query("SELECT id, table_name, row_id FROM deleted_rows WHERE deleted_at >= ? AND id > ? "
+                               "ORDER BY id LIMIT ?", [since, last_id, self.dump_page_size])
+            if not page.rows:
+                break
+            await emit("".join(f"DELETE FROM {quote_identifier(table)} WHERE rowid = {int(row_id)};\n"
+                               for _, table, row_id in page.rows if table in watermarked))
+            deleted_rows += len(page.rows)
+            last_id = page.rows[-1][0]
+            if len(page.rows) < self.dump_page_size:
+                break
+        await self._write_sequences(query, emit)
+        return {"counts": counts, "changed_rows": changed_rows, "deleted_rows": deleted_rows}
+
+
+# 전역 백업 서비스 인스턴스
+backup_service = BackupService(
+    backup_dir=settings.BACKUP_DIR,
+    compression=settings.BACKUP_COMPRESSION,
+    compression_level=settings.BACKUP_COMPRESSION_LEVEL,
+    max_bytes_per_second=settings.BACKUP_MAX_BYTES_PER_SECOND,
+    pages_per_step=settings.BACKUP_PAGES_PER_STEP,
+    dump_page_size=settings.BACKUP_DUMP_PAGE_SIZE,
+    statement_timeout=settings.LIBSQL_STATEMENT_TIMEOUT,
+    max_chain_length=settings.BACKUP_MAX_CHAIN_LENGTH,
+)
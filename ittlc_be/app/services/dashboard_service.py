@@ -0,0 +1,270 @@
+"""
+대시보드 통계 materializer
+
+대시보드 수치를 메모리와 dashboard_snapshots 테이블에 유지합니다.
+- 읽기: 메모리 값 반환 (O(1))
+- 갱신: 주기적 전체 재계산 + 성도/가족/기도/헌금 쓰기 시 증분 반영
+- 이력: 일 단위 스냅샷을 저장하여 추이 차트가 과거 수치를 재계산하지 않도록 함
+"""
+import asyncio
+import logging
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from app.core.etag import current_month
+from app.core.metrics import metrics
+from app.db.mapping import as_dicts
+from app.db.scheduler import BACKGROUND, db_lane
+from app.db.table_versions import table_versions
+from app.services.singleflight import singleflight
+
+logger = logging.getLogger(__name__)
+
+# 대시보드 수치에 영향을 주는 테이블
+SOURCE_TABLES = ("members", "families", "prayers", "offerings")
+
+
+class DashboardMaterializer:
+    def __init__(self, refresh_interval: float = 300.0, stale_debounce: float = 5.0):
+        self.refresh_interval = refresh_interval
+        self.stale_debounce = stale_debounce
+        self._stats: Optional[Dict[str, Any]] = None
+        self._month: Optional[str] = None
+        self._source_versions: Optional[Dict[str, int]] = None
+        self._refreshed_at = 0.0
+        self._refresh_lock = asyncio.Lock()
+        self._pending_refresh: Optional[asyncio.Task] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    async def get_client(self):
+        """LibSQL 클라이언트 반환"""
+        # 순환 import 방지를 위해 지연 import
+        from app.services.libsql_service import libsql_service
+        return await libsql_service.get_client()
+
+    # 조회
+    async def get_stats(self) -> Dict[str, Any]:
+        """대시보드 통계 조회 (메모리 값 반환, 최초/월 변경 시에만 동기 계산)"""
+        if self._stats is None or self._month != current_month():
+            await self.refresh()
+        else:
+            await self._check_external_writes()
+        metrics.incr("dashboard.reads")
+        return dict(self._stats)
+
+    async def get_history(self, days: int = 30) -> List[Dict[str, Any]]:
+        """최근 N일 스냅샷 이력 조회"""
+        client = await self.get_client()
+        try:
+            result = await client.execute(
+                """
+                SELECT snapshot_date, member_count, family_count,
+                       monthly_prayer_count, monthly_offering_amount
+                FROM dashboard_snapshots
+                WHERE snapshot_date >= date('now', ?)
+                ORDER BY snapshot_date
+                """,
+                [f"-{days} days"]
+            )
+            return as_dicts(result)
+        finally:
+            await client.close()
+
+    # 전체 재계산
+    async def refresh(self) -> Dict[str, Any]:
+        """집계 쿼리로 전체 재계산 후 메모리/스냅샷 테이블 갱신 (동시 호출은 하나로 병합)"""
+        return await singleflight.do(("DashboardMaterializer.refresh",), self._refresh, ttl=0)
+
+    async def _refresh(self) -> Dict[str, Any]:
+        async with self._refresh_lock:
+            versions = await table_versions.get_versions(SOURCE_TABLES)
+            client = await self.get_client()
+            try:
+                with metrics.timer("dashboard.refresh_ms"):
+                    stats = await self._compute(client)
+                    await self._save_snapshot(client, stats)
+            finally:
+                await client.close()
+
+            self._stats = stats
+            self._month = current_month()
+            self._source_versions = versions
+            self._refreshed_at = time.monotonic()
+            metrics.incr("dashboard.refreshes")
+            return dict(stats)
+
+    async def _compute(self, client) -> Dict[str, Any]:
+        # 성도 수
+        member_count_result = await client.execute("SELECT COUNT(*) FROM members WHERE deleted_at IS NULL")
+        member_count = member_count_result.rows[0][0] if member_count_result.rows else 0
+
+        # 가족 수 (families 테이블이 없을 수 있으므로 안전하게 처리)
+        try:
+            family_count_result = await client.execute("SELECT COUNT(*) FROM families WHERE deleted_at IS NULL")
+            family_count = family_count_result.rows[0][0] if family_count_result.rows else 0
+        except Exception:
+            family_count = 0
+
+        # 이달의 기도 제목 수 (created_at 범위 조건으로 인덱스 사용)
+        try:
+            prayer_count_result = await client.execute("""
+                SELECT COUNT(*) FROM prayers
+                WHERE created_at >= datetime('now', 'start of month')
+                  AND created_at < datetime('now', 'start of month', '+1 month')
+                  AND deleted_at IS NULL
+            """)
+            prayer_count = prayer_count_result.rows[0][0] if prayer_count_result.rows else 0
+        except Exception:
+            prayer_count = 0
+
+        # 이달의 헌금 총액 (offering_date 범위 조건으로 인덱스 사용)
+        try:
+            offering_amount_result = await client.execute("""
+                SELECT COALESCE(SUM(amount), 0) FROM offerings
+                WHERE offering_date >= date('now', 'start of month')
+                  AND offering_date < date('now', 'start of month', '+1 month')
+                  AND deleted_at IS NULL
+            """)
+            offering_amount = offering_amount_result.rows[0][0] if offering_amount_result.rows else 0
+        except Exception:
+            offering_amount = 0
+
+        return {
+            "member_count": member_count,
+            "family_count": family_count,
+            "monthly_prayer_count": prayer_count,
+            "monthly_offering_amount": offering_amount
+        }
+
+    async def _save_snapshot(self, client, stats: Dict[str, Any]):
+        """오늘 날짜 스냅샷 저장 (하루 한 행, 최신 값으로 덮어씀)"""
+        try:
+            await client.execute(
+                """
+                INSERT INTO dashboard_snapshots (snapshot_date, member_count, family_count,
+                                                 monthly_prayer_count, monthly_offering_amount)
+                VALUES (date('now'), ?, ?, ?, ?)
+                ON CONFLICT(snapshot_date) DO UPDATE SET
+                    member_count = excluded.member_count,
+                    family_count = excluded.family_count,
+                    monthly_prayer_count = excluded.monthly_prayer_count,
+                    monthly_offering_amount = excluded.monthly_offering_amount,
+                    created_at = CURRENT_TIMESTAMP
+                """,
+                [stats["member_count"], stats["family_count"],
+                 stats["monthly_prayer_count"], stats["monthly_offering_amount"]]
+            )
+        except Exception as e:
+            # 구 스키마(dashboard_snapshots 없음)에서는 메모리 값만 유지
+            logger.warning(f"대시보드 스냅샷 저장 실패: {e}")
+
+    # 증분 반영
+    # record_* 는 한 행 쓰기(추가 또는 소프트 삭제) 직후 호출되며, 그 쓰기로 해당 테이블 버전이 1 오름
+    def record_member(self, delta: int):
+        """성도 추가/삭제 반영"""
+        self._expect_write("members")
+        self._apply("member_count", delta)
+
+    def record_family(self, delta: int):
+        """가족 추가/삭제 반영"""
+        self._expect_write("families")
+        self._apply("family_count", delta)
+
+    def record_prayer(self, delta: int):
+        """이달 기도 제목 추가/삭제 반영"""
+        self._expect_write("prayers")
+        self._apply("monthly_prayer_count", delta)
+
+    def record_offering(self, amount: Any, offering_date: Any):
+        """헌금 기록 추가 반영 (이번 달 헌금만 합산)"""
+        self._expect_write("offerings")
+        if _month_of(offering_date) == self._month:
+            self._apply("monthly_offering_amount", float(amount))
+
+    def mark_stale(self):
+        """증분 계산이 어려운 변경(수정/삭제) 후 백그라운드 재계산 예약"""
+        if self._stats is None or (self._pending_refresh and not self._pending_refresh.done()):
+            return
+        try:
+            self._pending_refresh = asyncio.get_running_loop().create_task(self._debounced_refresh())
+        except RuntimeError:
+            self._stats = None
+
+    def _expect_write(self, table: str):
+        """이미 반영한 자기 쓰기의 버전 증가를 기대 버전에 더함 (외부 쓰기로 오인하지 않도록)"""
+        if self._source_versions is not None:
+            self._source_versions[table] = self._source_versions.get(table, 0) + 1
+
+    def _apply(self, key: str, delta: Any):
+        if self._stats is None or self._month != current_month():
+            return
+        self._stats[key] = (self._stats[key] or 0) + delta
+        metrics.incr("dashboard.incremental_updates")
+
+    async def _debounced_refresh(self):
+        wait = self.stale_debounce - (time.monotonic() - self._refreshed_at)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            with db_lane(BACKGROUND):
+                await self.refresh()
+        except Exception as e:
+            logger.warning(f"대시보드 재계산 실패: {e}")
+
+    async def _check_external_writes(self):
+        """다른 워커의 쓰기(기대 버전을 넘는 테이블 버전)가 감지되면 재계산 예약
+
+        기대 버전보다 낮은 버전은 자기 쓰기가 아직 보이지 않는 읽기(복제본 지연)로 보고 무시
+        """
+        if not table_versions.is_fresh():
+            return
+        versions = await table_versions.get_versions(SOURCE_TABLES)
+        if versions is None or self._source_versions is None:
+            return
+        expected = self._source_versions
+        if any(versions[table] > expected.get(table, 0) for table in SOURCE_TABLES):
+            self._source_versions = {table: max(versions[table], expected.get(table, 0)) for table in SOURCE_TABLES}
+            self.mark_stale()
+
+    # 주기적 갱신
+    async def start(self):
+        """주기적 재계산 루프 시작"""
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """주기적 재계산 루프 종료"""
+        tasks = [task for task in (self._loop_task, self._pending_refresh) if task is not None and not task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # 병합 태스크로 실행 중인 재계산은 취소되지 않으므로 엔진 연결이 닫히기 전에 끝나길 대기
+        async with self._refresh_lock:
+            pass
+        self._loop_task = None
+
+    async def _run(self):
+        # 주기 재계산은 대화형 요청보다 낮은 우선순위로 실행
+        with db_lane(BACKGROUND):
+            await self._loop()
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"대시보드 주기 갱신 실패: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+
+def _month_of(value: Any) -> Optional[str]:
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m")
+    if isinstance(value, str) and len(value) >= 7:
+        return value[:7]
+    return None
+
+
+# 전역 대시보드 materializer 인스턴스
+dashboard_materializer = DashboardMaterializer()
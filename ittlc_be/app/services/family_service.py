@@ -1,11 +1,13 @@
 """
 가족 관리 서비스
 """
-import os
 from typing import Optional, List, Dict, Any
-from libsql_client import create_client
+from app.db.engine import get_engine
+from app.db.mapping import as_dicts, first_dict
 from dotenv import load_dotenv
 from pathlib import Path
+from app.db.table_versions import table_versions
+from app.services.dashboard_service import dashboard_materializer
 
 # .env 파일 로드
 env_path = Path(__file__).parent.parent.parent / '.env'
@@ -13,18 +15,12 @@ load_dotenv(env_path)
 
 class FamilyService:
     def __init__(self):
-        self.libsql_url = os.getenv("LIBSQL_URL")
-        self.auth_token = os.getenv("LIBSQL_AUTH_TOKEN")
-        
-        if not self.libsql_url:
-            raise ValueError("LIBSQL_URL이 설정되지 않았습니다.")
-        
-        # HTTP URL로 변환
-        self.http_url = self.libsql_url.replace("libsql://", "https://")
+        # 설정에 따라 Turso(HTTP) / 로컬 aiosqlite / 읽기 복제본 엔진 사용
+        self.engine = get_engine()
     
     async def get_client(self):
-        """LibSQL 클라이언트 반환"""
-        return create_client(url=self.http_url, auth_token=self.auth_token)
+        """데이터베이스 클라이언트 반환"""
+        return await self.engine.get_client()
     
     # 가족 관련 메서드
     async def create_family(self, family_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -40,6 +36,8 @@ class FamilyService:
                 family_data.get('head_member_id'),
                 family_data.get('address')
             ])
+            table_versions.invalidate()
+            dashboard_materializer.record_family(1)
             return {"id": result.last_insert_rowid}
         finally:
             await client.close()
@@ -51,12 +49,12 @@ class FamilyService:
             sql = """
             SELECT f.*, m.name as head_member_name
             FROM families f
-            LEFT JOIN members m ON f.head_member_id = m.id
-            WHERE f.id = ?
+            LEFT JOIN members m ON f.head_member_id = m.id AND m.deleted_at IS NULL
+            WHERE f.id = ? AND f.deleted_at IS NULL
             """
             result = await client.execute(sql, [family_id])
             if result.rows:
-                return dict(zip([col.name for col in result.columns], result.rows[0]))
+                return first_dict(result)
             return None
         finally:
             await client.close()
@@ -67,14 +65,15 @@ class FamilyService:
         try:
             sql = """
             SELECT f.*, m.name as head_member_name,
-                   (SELECT COUNT(*) FROM members WHERE family_id = f.id) as member_count
+                   (SELECT COUNT(*) FROM members WHERE family_id = f.id AND deleted_at IS NULL) as member_count
             FROM families f
-            LEFT JOIN members m ON f.head_member_id = m.id
+            LEFT JOIN members m ON f.head_member_id = m.id AND m.deleted_at IS NULL
+            WHERE f.deleted_at IS NULL
             ORDER BY f.family_name
             LIMIT ? OFFSET ?
             """
             result = await client.execute(sql, [limit, skip])
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_dicts(result)
         finally:
             await client.close()
     
@@ -84,11 +83,11 @@ class FamilyService:
         try:
             sql = """
             SELECT * FROM members
-            WHERE family_id = ?
+            WHERE family_id = ? AND deleted_at IS NULL
             ORDER BY family_role, birth_date
             """
             result = await client.execute(sql, [family_id])
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_dicts(result)
         finally:
             await client.close()
     
@@ -109,24 +108,25 @@ class FamilyService:
             
             values.append(family_id)
             
-            sql = f"UPDATE families SET {', '.join(update_fields)} WHERE id = ?"
+            sql = f"UPDATE families SET {', '.join(update_fields)} WHERE id = ? AND deleted_at IS NULL"
             await client.execute(sql, values)
             
+            table_versions.invalidate()
             return await self.get_family_by_id(family_id)
         finally:
             await client.close()
     
     async def delete_family(self, family_id: int) -> bool:
-        """가족 삭제"""
+        """가족 삭제 (소프트 삭제, 구성원 연결은 보관 기간이 지나 정리 작업이 실제 삭제할 때 해제)"""
         client = await self.get_client()
         try:
-            # 먼저 가족 구성원들의 family_id를 NULL로 설정
-            await client.execute("UPDATE members SET family_id = NULL WHERE family_id = ?", [family_id])
-            
-            # 가족 삭제
-            sql = "DELETE FROM families WHERE id = ?"
+            sql = "UPDATE families SET deleted_at = CURRENT_TIMESTAMP WHERE id = ? AND deleted_at IS NULL"
             result = await client.execute(sql, [family_id])
-            return result.rows_affected > 0
+            table_versions.invalidate()
+            deleted = result.rows_affected > 0
+            if deleted:
+                dashboard_materializer.record_family(-1)
+            return deleted
         finally:
             await client.close()
     
@@ -136,6 +136,7 @@ class FamilyService:
         try:
             sql = "UPDATE members SET family_id = ?, family_role = ? WHERE id = ?"
             result = await client.execute(sql, [family_id, family_role, member_id])
+            table_versions.invalidate()
             return result.rows_affected > 0
         finally:
             await client.close()
@@ -146,6 +147,7 @@ class FamilyService:
         try:
             sql = "UPDATE members SET family_id = NULL, family_role = NULL WHERE id = ?"
             result = await client.execute(sql, [member_id])
+            table_versions.invalidate()
             return result.rows_affected > 0
         finally:
             await client.close()
@@ -0,0 +1,649 @@
+"""
+백그라운드 작업 대기열
+
+오래 걸리는 요청(여러 해에 걸친 통계, 대량 가져오기/내보내기, 백업)을 background_jobs 테이블에
+접수하고 앱 안의 작업자들이 처리합니다. 클라이언트는 202 응답의 작업 id 로 진행 상태를 조회하고
+결과를 내려받거나 취소합니다 (/jobs/{id}).
+
+- 접수: submit() 은 queued 행을 만들고 바로 반환 (같은 프로세스의 작업자는 즉시 깨움)
+- 처리: 작업자(asyncio 태스크)가 조건부 UPDATE 로 작업을 가져가고 임대(lease_until)를 갱신.
+  워커가 죽어 임대가 만료된 작업은 다른 작업자가 다시 가져가며, JOB_QUEUE_MAX_ATTEMPTS 번 넘게
+  시도한 작업은 실패 처리
+- I/O 위주 작업은 이벤트 루프에서, CSV 렌더링 같은 CPU 작업은 프로세스 풀(run_cpu)에서 실행
+- 취소: 대기 중이면 바로 cancelled, 실행 중이면 cancel_requested 를 기록하고 작업자가 임대 갱신 때 확인해 중단
+- 앱 종료 시 실행 중인 작업은 queued 로 되돌려 다음 작업자가 이어서 처리
+- 큰 입력(가져오기 행)은 params 대신 JOB_RESULT_DIR 아래 파일로 두고, 작업이 끝나면 삭제
+- 다시 처리될 수 있는 쓰기 작업은 커밋과 같은 batch 에서 재개 지점(checkpoint)을 기록하고 그 지점부터 이어서 처리
+
+작업의 DB 호출은 스케줄러의 background 레인으로 실행됩니다.
+"""
+import asyncio
+import contextlib
+import csv
+import io
+import json
+import logging
+import os
+import secrets
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.mapping import as_dicts, column_names, first_dict
+from app.db.my_libsql_client import DatabaseUnavailable
+from app.db.scheduler import BACKGROUND, db_lane
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """사용자 요청으로 작업이 취소됨"""
+
+
+class JobContext:
+    """작업 처리기에 전달되는 실행 정보 (진행률 기록, 취소 확인, CPU 작업 실행, 결과 파일)"""
+
+    def __init__(self, queue: "JobQueue", job: Dict[str, Any]):
+        self.queue = queue
+        self.id = job["id"]
+        self.params: Dict[str, Any] = json.loads(job["params"]) if job.get("params") else {}
+        self.created_by = job.get("created_by")
+        # 이전 시도가 커밋한 재개 지점 (가져오기: 넣은 행 수)
+        self.checkpoint: int = job.get("checkpoint") or 0
+        self.cancel_requested = False
+        self.lease_lost = False
+        self.result_file: Optional[Path] = None
+        self.result_filename: Optional[str] = None
+        self.result_content_type: Optional[str] = None
+        self._progress_written = 0.0
+
+    def check_cancelled(self):
+        if self.cancel_requested:
+            raise JobCancelled("작업이 취소되었습니다")
+
+    async def progress(self, fraction: float, message: Optional[str] = None):
+        """진행률(0~1) 기록 (DB 쓰기는 1초에 한 번으로 제한)"""
+        self.check_cancelled()
+        now = time.monotonic()
+        if now - self._progress_written < 1.0 and fraction < 1.0:
+            return
+        self._progress_written = now
+        await self.queue._execute(
+            "UPDATE background_jobs SET progress = ?, progress_message = ? WHERE id = ?",
+            [round(min(max(fraction, 0.0), 1.0), 4), message, self.id]
+        )
+
+    async def run_cpu(self, func: Callable[..., Any], *args) -> Any:
+        """CPU 위주 함수를 프로세스 풀에서 실행 (func 와 인자는 pickle 가능해야 함)"""
+        self.check_cancelled()
+        pool = self.queue.process_pool()
+        if pool is None:
+            return await asyncio.to_thread(func, *args)
+        return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+
+    async def read_input(self) -> List[Dict[str, Any]]:
+        """submit(input_rows=...) 로 저장한 입력 행 읽기"""
+        path = Path(self.params["input_path"])
+        text = await asyncio.to_thread(path.read_text, encoding="utf-8")
+        return [json.loads(line) for line in text.splitlines() if line]
+
+    def open_result(self, filename: str, content_type: str) -> Path:
+        """다운로드용 결과 파일 경로 지정 (작업이 성공하면 /jobs/{id}/result 로 제공)"""
+        self.queue.result_dir.mkdir(parents=True, exist_ok=True)
+        self.result_file = self.queue.result_dir / f"job-{self.id}-{secrets.token_hex(4)}{Path(filename).suffix}"
+        self.result_filename = filename
+        self.result_content_type = content_type
+        return self.result_file
+
+
+Handler = Callable[[JobContext], Awaitable[Any]]
+
+
+class JobQueue:
+    def __init__(self, result_dir: str = "./data/jobs", workers: int = 2, processes: int = 2,
+                 poll_interval: float = 2.0, lease_ttl: float = 60.0, max_attempts: int = 3,
+                 enabled: bool = True):
+        self.result_dir = Path(result_dir)
+        self.workers = workers
+        self.processes = processes
+        self.poll_interval = poll_interval
+        self.lease_ttl = lease_ttl
+        self.max_attempts = max_attempts
+        self.enabled = enabled
+        self.handlers: Dict[str, Handler] = {}
+        # 임대 소유자 식별 (호스트:프로세스:임의값)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(2)}"
+        self._wakeup = asyncio.Event()
+        self._workers: List[asyncio.Task] = []
+        self._running: Dict[int, JobContext] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def get_client(self):
+        """LibSQL 클라이언트 반환"""
+        # 순환 import 방지를 위해 지연 import
+        from app.services.libsql_service import libsql_service
+        return await libsql_service.get_client()
+
+    async def _execute(self, sql: str, params: Optional[list] = None):
+        client = await self.get_client()
+        try:
+            return await client.execute(sql, params)
+        finally:
+            await client.close()
+
+    def handler(self, job_type: str):
+        """작업 종류별 처리기 등록 데코레이터"""
+        def register(func: Handler) -> Handler:
+            self.handlers[job_type] = func
+            return func
+        return register
+
+    def process_pool(self) -> Optional[ProcessPoolExecutor]:
+        """CPU 작업용 프로세스 풀 (처음 사용할 때 생성, processes=0 이면 스레드에서 실행)"""
+        if self.processes <= 0:
+            return None
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processes)
+        return self._pool
+
+    # 접수 / 조회 / 취소
+    async def submit(self, job_type: str, params: Optional[Dict[str, Any]] = None,
+                     created_by: Optional[int] = None,
+                     input_rows: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """작업 접수 (queued 상태로 기록하고 바로 반환)
+
+        input_rows 는 params 에 넣지 않고 결과 디렉터리의 JSON Lines 파일로 저장 (params 에는 경로만 기록)
+        """
+        if job_type not in self.handlers:
+            raise ValueError(f"알 수 없는 작업 종류: {job_type}")
+        params = dict(params or {})
+        input_path: Optional[Path] = None
+        if input_rows is not None:
+            input_path = await asyncio.to_thread(self._write_input, input_rows)
+            params["input_path"] = str(input_path)
+        try:
+            result = await self._execute(
+                "INSERT INTO background_jobs (job_type, params, created_by) VALUES (?, ?, ?)",
+                [job_type, json.dumps(params, ensure_ascii=False, default=str), created_by]
+            )
+        except Exception:
+            if input_path is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    input_path.unlink()
+            raise
+        metrics.incr(f"job_queue.{job_type}.submitted")
+        self._wakeup.set()
+        return {"id": result.last_insert_rowid, "job_type": job_type, "status": QUEUED}
+
+    def _write_input(self, rows: List[Dict[str, Any]]) -> Path:
+        self.result_dir.mkdir(parents=True, exist_ok=True)
+        path = self.result_dir / f"input-{secrets.token_hex(8)}.jsonl"
+        with path.open("w", encoding="utf-8") as output:
+            for row in rows:
+                output.write(json.dumps(row, ensure_ascii=False, default=str))
+                output.write("\n")
+        return path
+
+    async def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회 (결과 JSON 은 파싱해서 반환, 입력 값은 제외)"""
+        result = await self._execute(
+            """
+            SELECT id, job_type, status, progress, progress_message, result, result_filename,
+                   result_path IS NOT NULL as has_file, error_message, cancel_requested, attempts,
+                   created_by, created_at, started_at, finished_at
+            FROM background_jobs WHERE id = ?
+            """,
+            [job_id]
+        )
+        job = first_dict(result)
+        if job is not None and job.get("result"):
+            job["result"] = json.loads(job["result"])
+        return job
+
+    async def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 작업 목록"""
+        sql = """
+            SELECT id, job_type, status, progress, progress_message, error_message, attempts,
+                   created_by, created_at, started_at, finished_at
+            FROM background_jobs
+        """
+        params: list = []
+        if status:
+            sql += " WHERE status = ?"
+            params.append(status)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        return as_dicts(await self._execute(sql, params))
+
+    async def result_file(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """성공한 작업의 결과 파일 정보 (경로, 파일 이름, 형식)"""
+        result = await self._execute(
+            """
+            SELECT result_path, result_filename, result_content_type FROM background_jobs
+            WHERE id = ? AND status = 'succeeded' AND result_path IS NOT NULL
+            """,
+            [job_id]
+        )
+        return first_dict(result)
+
+    async def cancel(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """작업 취소 (대기 중이면 즉시, 실행 중이면 작업자가 다음 확인 때 중단), 변경 후 상태 반환"""
+        result = await self._execute(
+            """
+            UPDATE background_jobs SET status = 'cancelled', cancel_requested = TRUE, finished_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND status = 'queued'
+            """,
+            [job_id]
+        )
+        if result.rows_affected == 0:
+            await self._execute(
+                "UPDATE background_jobs SET cancel_requested = TRUE WHERE id = ? AND status = 'running'",
+                [job_id]
+            )
+            context = self._running.get(job_id)
+            if context is not None:
+                context.cancel_requested = True
+        return await self.get(job_id)
+
+    async def purge(self, days: int) -> int:
+        """완료 후 days 일 지난 작업과 결과/입력 파일 삭제, 삭제한 작업 수 반환"""
+        result = await self._execute(
+            """
+            SELECT id, result_path, params FROM background_jobs
+            WHERE finished_at < datetime('now', ?) AND status IN ('succeeded', 'failed', 'cancelled')
+            """,
+            [f"-{int(days)} days"]
+        )
+        for _, path, params in result.rows:
+            # 작업자가 죽어 실패 처리된 작업은 입력 파일이 남아 있을 수 있음
+            input_path = json.loads(params).get("input_path") if params else None
+            for leftover in (path, input_path):
+                if leftover:
+                    with contextlib.suppress(FileNotFoundError):
+                        await asyncio.to_thread(Path(leftover).unlink)
+        ids = [row[0] for row in result.rows]
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            await self._execute(f"DELETE FROM background_jobs WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+        return len(ids)
+
+    # 작업자
+    async def start(self):
+        """작업자 시작"""
+        if not self.enabled or self._workers:
+            return
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(max(1, self.workers))]
+        logger.info(f"작업 대기열 시작: 작업자 {len(self._workers)}개, 프로세스 풀 {self.processes}개")
+
+    async def stop(self):
+        """작업자 중단 (실행 중인 작업은 queued 로 되돌림)"""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _worker(self):
+        with db_lane(BACKGROUND):
+            while True:
+                try:
+                    job = await self._claim()
+                except Exception as e:
+                    logger.warning(f"작업 가져오기 실패: {e}")
+                    job = None
+                if job is not None:
+                    await self._run(job)
+                    continue
+                self._wakeup.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+
+    async def _claim(self) -> Optional[Dict[str, Any]]:
+        """대기 중이거나 임대가 만료된 작업 하나를 가져옴 (다른 작업자와 경합하면 None)"""
+        now = time.time()
+        # 시도 횟수를 다 쓴 채 임대가 만료된 작업은 실패 처리
+        await self._execute(
+            """
+            UPDATE background_jobs
+            SET status = 'failed', error_message = '작업자가 응답하지 않아 중단되었습니다', finished_at = CURRENT_TIMESTAMP
+            WHERE status = 'running' AND lease_until < ? AND attempts >= ?
+            """,
+            [now, self.max_attempts]
+        )
+        candidate = await self._execute(
+            """
+            SELECT id FROM background_jobs
+            WHERE status = 'queued' OR (status = 'running' AND lease_until < ?)
+            ORDER BY id LIMIT 1
+            """,
+            [now]
+        )
+        if not candidate.rows:
+            return None
+        job_id = candidate.rows[0][0]
+        claimed = await self._execute(
+            """
+            UPDATE background_jobs
+            SET status = 'running', owner = ?, lease_until = ?, attempts = attempts + 1,
+                started_at = COALESCE(started_at, CURRENT_TIMESTAMP)
+            WHERE id = ? AND (status = 'queued' OR (status = 'running' AND lease_until < ?))
+            """,
+            [self.owner, now + self.lease_ttl, job_id, now]
+        )
+        if claimed.rows_affected == 0:
+            return None
+        return first_dict(await self._execute("SELECT * FROM background_jobs WHERE id = ?", [job_id]))
+
+    async def _heartbeat(self, context: JobContext, task: asyncio.Task):
+        """임대 연장과 취소 요청 확인 (lease_ttl 의 1/3 마다)"""
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            try:
+                await self._execute(
+                    "UPDATE background_jobs SET lease_until = ? WHERE id = ? AND owner = ?",
+                    [time.time() + self.lease_ttl, context.id, self.owner]
+                )
+                result = await self._execute(
+                    "SELECT cancel_requested FROM background_jobs WHERE id = ? AND owner = ?",
+                    [context.id, self.owner]
+                )
+                if not result.rows:
+                    # 임대가 만료돼 다른 작업자가 가져감: 결과를 기록하지 않고 중단
+                    context.lease_lost = True
+                    task.cancel()
+                    return
+                if result.rows[0][0]:
+                    context.cancel_requested = True
+                    task.cancel()
+                    return
+            except Exception as e:
+                logger.warning(f"작업 임대 연장 실패 (job={context.id}): {e}")
+
+    async def _run(self, job: Dict[str, Any]):
+        context = JobContext(self, job)
+        job_type = job["job_type"]
+        handler = self.handlers.get(job_type)
+        started = time.perf_counter()
+        self._running[context.id] = context
+        metrics.set_gauge("job_queue.running", len(self._running))
+        try:
+            if handler is None:
+                raise ValueError(f"알 수 없는 작업 종류: {job_type}")
+            task = asyncio.create_task(handler(context))
+            heartbeat = asyncio.create_task(self._heartbeat(context, task))
+            try:
+                result = await task
+            finally:
+                heartbeat.cancel()
+        except (JobCancelled, asyncio.CancelledError) as e:
+            self._discard_result(context)
+            if context.lease_lost:
+                logger.warning(f"작업 임대를 잃어 중단 (job={context.id})")
+            elif context.cancel_requested:
+                metrics.incr(f"job_queue.{job_type}.cancelled")
+                await self._finish(context.id, CANCELLED, error="작업이 취소되었습니다")
+                self._discard_input(context)
+            elif isinstance(e, asyncio.CancelledError):
+                # 앱 종료: 다음 작업자가 다시 처리 (checkpoint 를 기록하는 작업은 그 지점부터)
+                await self._finish(context.id, QUEUED)
+                raise
+        except Exception as e:
+            self._discard_result(context)
+            error = str(e) or type(e).__name__
+            if isinstance(e, DatabaseUnavailable) and job["attempts"] < self.max_attempts:
+                logger.warning(f"작업 일시 실패, 다시 대기열로 (job={context.id}): {error}")
+                await self._finish(context.id, QUEUED, error=error)
+            else:
+                logger.exception(f"작업 실패 (job={context.id}, {job_type})")
+                metrics.incr(f"job_queue.{job_type}.failures")
+                await self._finish(context.id, FAILED, error=error)
+                self._discard_input(context)
+        else:
+            metrics.incr(f"job_queue.{job_type}.success")
+            metrics.observe(f"job_queue.{job_type}.duration_ms", (time.perf_counter() - started) * 1000)
+            await self._finish(context.id, SUCCEEDED, result=result, context=context)
+            self._discard_input(context)
+        finally:
+            self._running.pop(context.id, None)
+            metrics.set_gauge("job_queue.running", len(self._running))
+
+    @staticmethod
+    def _discard_result(context: JobContext):
+        if context.result_file is not None:
+            with contextlib.suppress(FileNotFoundError):
+                context.result_file.unlink()
+
+    @staticmethod
+    def _discard_input(context: JobContext):
+        if context.params.get("input_path"):
+            with contextlib.suppress(FileNotFoundError):
+                Path(context.params["input_path"]).unlink()
+
+    async def _finish(self, job_id: int, status: str, result: Any = None, error: Optional[str] = None,
+                      context: Optional[JobContext] = None):
+        """작업 결과 기록 (QUEUED 면 대기열로 되돌림)"""
+        try:
+            if status == QUEUED:
+                await self._execute(
+                    """
+                    UPDATE background_jobs SET status = 'queued', owner = NULL, lease_until = 0, error_message = ?
+                    WHERE id = ? AND owner = ?
+                    """,
+                    [error, job_id, self.owner]
+                )
+                return
+            has_file = context is not None and context.result_file is not None
+            await self._execute(
+                """
+                UPDATE background_jobs
+                SET status = ?, result = ?, error_message = ?, progress = CASE WHEN ? = 'succeeded' THEN 1 ELSE progress END,
+                    result_path = ?, result_filename = ?, result_content_type = ?,
+                    owner = NULL, lease_until = 0, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND owner = ?
+                """,
+                [status, json.dumps(result, ensure_ascii=False, default=str) if result is not None else None, error,
+                 status, str(context.result_file) if has_file else None,
+                 context.result_filename if has_file else None, context.result_content_type if has_file else None,
+                 job_id, self.owner]
+            )
+        except Exception as e:
+            logger.error(f"작업 결과 기록 실패 (job={job_id}, {status}): {e}")
+
+
+# CPU 작업 (프로세스 풀에서 실행되므로 모듈 최상위 함수)
+def render_csv(columns: List[str], rows: List[list], header: bool) -> bytes:
+    """행 목록을 CSV 로 렌더링 (첫 조각은 엑셀용 BOM 과 머리글 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8-sig" if header else "utf-8")
+
+
+def merge_statistics(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """연도별 헌금 통계를 하나로 합침 (get_offering_statistics 와 같은 형식)"""
+    total_amount, total_count = 0, 0
+    by_type: Dict[str, Dict[str, Any]] = {}
+    monthly: List[Dict[str, Any]] = []
+    for part in parts:
+        total_amount += part["total"].get("total_amount") or 0
+        total_count += part["total"].get("total_count") or 0
+        for row in part["by_type"]:
+            merged = by_type.setdefault(row["offering_type"], {"offering_type": row["offering_type"],
+                                                                "amount": 0, "count": 0})
+            merged["amount"] += row["amount"] or 0
+            merged["count"] += row["count"] or 0
+        monthly.extend(part["monthly"])
+    return {
+        "total": {"total_amount": total_amount, "total_count": total_count},
+        "by_type": sorted(by_type.values(), key=lambda row: row["amount"], reverse=True),
+        "monthly": monthly,
+    }
+
+
+# 내보내기 대상: (조회문, 날짜 필터 컬럼, 키셋 페이지 컬럼, 소프트 삭제 컬럼)
+EXPORT_QUERIES = {
+    "offerings": (
+        """
+        SELECT o.id, o.offering_date, o.member_id, m.name as member_name, o.offering_type, o.amount, o.memo,
+               o.created_at
+        FROM offerings o
+        JOIN members m ON o.member_id = m.id
+        """,
+        "o.offering_date",
+        "o.id",
+        "o.deleted_at",
+    ),
+    "members": ("SELECT * FROM members", "registration_date", "id", "deleted_at"),
+    "families": ("SELECT * FROM families", None, "id", "deleted_at"),
+}
+
+EXPORT_PAGE_SIZE = 2000
+IMPORT_ROWS_PER_STATEMENT = 100
+IMPORT_STATEMENTS_PER_BATCH = 10
+
+
+# 전역 작업 대기열 인스턴스
+job_queue = JobQueue(
+    result_dir=settings.JOB_RESULT_DIR,
+    workers=settings.JOB_QUEUE_WORKERS,
+    processes=settings.JOB_QUEUE_PROCESSES,
+    poll_interval=settings.JOB_QUEUE_POLL_INTERVAL,
+    lease_ttl=settings.JOB_QUEUE_LEASE_TTL,
+    max_attempts=settings.JOB_QUEUE_MAX_ATTEMPTS,
+    enabled=settings.JOB_QUEUE_ENABLED,
+)
+
+
+# 작업 종류 (서비스는 순환 import 방지를 위해 실행 시 import)
+@job_queue.handler("offering_statistics")
+async def offering_statistics_job(context: JobContext) -> Dict[str, Any]:
+    """기간별 헌금 통계를 연 단위로 나눠 계산 (연도마다 진행률 갱신)"""
+    from app.services.offering_service import offering_service
+    start, end = date.fromisoformat(context.params["start_date"]), date.fromisoformat(context.params["end_date"])
+    ranges = [(max(start, date(year, 1, 1)), min(end, date(year, 12, 31))) for year in range(start.year, end.year + 1)]
+    parts = []
+    for index, (range_start, range_end) in enumerate(ranges):
+        parts.append(await offering_service.get_offering_statistics(range_start, range_end))
+        await context.progress((index + 1) / len(ranges), f"{range_start.year}년 집계 완료")
+    return merge_statistics(parts)
+
+
+@job_queue.handler("export")
+async def export_job(context: JobContext) -> Dict[str, Any]:
+    """CSV 내보내기 (키셋 페이지로 읽고 렌더링은 프로세스 풀에서 실행)"""
+    dataset = context.params["dataset"]
+    base_sql, date_column, key_column, deleted_column = EXPORT_QUERIES[dataset]
+    conditions, params = [f"{deleted_column} IS NULL"], []
+    if date_column and context.params.get("start_date"):
+        conditions.append(f"{date_column} >= ?")
+        params.append(context.params["start_date"])
+    if date_column and context.params.get("end_date"):
+        conditions.append(f"{date_column} <= ?")
+        params.append(context.params["end_date"])
+    where = " AND ".join(conditions)
+
+    count = await context.queue._execute(
+        f"SELECT COUNT(*) FROM ({base_sql} {'WHERE ' + where if where else ''})", params
+    )
+    total = count.rows[0][0]
+    path = context.open_result(f"{dataset}-{date.today():%Y%m%d}.csv", "text/csv; charset=utf-8")
+    exported = 0
+    last_key = None
+    with open(path, "wb") as output:
+        while True:
+            page_conditions = conditions + ([f"{key_column} > ?"] if last_key is not None else [])
+            page_params = params + ([last_key] if last_key is not None else [])
+            page = await context.queue._execute(
+                f"{base_sql} {'WHERE ' + ' AND '.join(page_conditions) if page_conditions else ''} "
+                f"ORDER BY {key_column} LIMIT ?",
+                page_params + [EXPORT_PAGE_SIZE]
+            )
+            rows = [list(row) for row in page.rows]
+            columns = list(column_names(page))
+            if exported == 0 or rows:
+                chunk = await context.run_cpu(render_csv, columns, rows, exported == 0)
+                await asyncio.to_thread(output.write, chunk)
+            if not rows:
+                break
+            exported += len(rows)
+            last_key = rows[-1][columns.index("id")]
+            await context.progress(exported / total if total else 1.0, f"{exported}/{total}행")
+            if len(rows) < EXPORT_PAGE_SIZE:
+                break
+    return {"dataset": dataset, "rows": exported, "size": path.stat().st_size}
+
+
+@job_queue.handler("offerings_import")
+async def offerings_import_job(context: JobContext) -> Dict[str, Any]:
+    """헌금 기록 대량 가져오기 (여러 행 INSERT 를 배치로 묶어 한 번에 커밋, 배치마다 진행률 갱신)
+
+    batch 마다 checkpoint 를 같은 트랜잭션에서 갱신하므로, 다시 대기열로 돌아가거나(DB 일시 오류, 앱 종료)
+    임대가 넘어간 뒤에는 마지막으로 커밋한 행 다음부터 이어서 넣습니다.
+    checkpoint 갱신은 임대 소유자와 이전 값이 맞을 때만 적용되고 INSERT 는 갱신이 적용된 경우에만
+    행을 넣으므로, 임대를 잃은 작업자의 batch 는 아무 행도 넣지 않습니다.
+    """
+    from app.db.table_versions import table_versions
+    from app.services.dashboard_service import dashboard_materializer
+    rows = await context.read_input()
+    columns = ("member_id", "offering_date", "offering_type", "amount", "memo", "created_by")
+    per_batch = IMPORT_ROWS_PER_STATEMENT * IMPORT_STATEMENTS_PER_BATCH
+    owner = context.queue.owner
+    imported = context.checkpoint
+    client = await context.queue.get_client()
+    try:
+        for start in range(imported, len(rows), per_batch):
+            context.check_cancelled()
+            batch = rows[start:start + per_batch]
+            checkpoint = start + len(batch)
+            statements = [(
+                "UPDATE background_jobs SET checkpoint = ? WHERE id = ? AND owner = ? AND checkpoint = ?",
+                [checkpoint, context.id, owner, start]
+            )]
+            for offset in range(0, len(batch), IMPORT_ROWS_PER_STATEMENT):
+                chunk = batch[offset:offset + IMPORT_ROWS_PER_STATEMENT]
+                statements.append((
+                    f"INSERT INTO offerings ({', '.join(columns)}) SELECT * FROM (VALUES "
+                    + ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk))
+                    + ") WHERE EXISTS (SELECT 1 FROM background_jobs WHERE id = ? AND owner = ? AND checkpoint = ?)",
+                    [row.get(column, context.created_by if column == "created_by" else None)
+                     for row in chunk for column in columns] + [context.id, owner, checkpoint]
+                ))
+            results = await client.batch(statements)
+            if results[0].rows_affected == 0:
+                # 다른 작업자가 임대를 가져감: 그 작업자가 checkpoint 부터 이어서 처리
+                context.lease_lost = True
+                raise JobCancelled("작업 임대를 잃었습니다")
+            imported = checkpoint
+            table_versions.invalidate()
+            await context.progress(imported / len(rows), f"{imported}/{len(rows)}행")
+    finally:
+        await client.close()
+        if imported > context.checkpoint:
+            dashboard_materializer.mark_stale()
+    return {"imported": imported}
+
+
+@job_queue.handler("backup")
+async def backup_job(context: JobContext) -> Optional[Dict[str, Any]]:
+    """백업 실행 후 완료까지 대기"""
+    from app.services.backup_service import backup_service
+    backup = await backup_service.create_backup(backup_type="manual", created_by=context.created_by,
+                                                kind=context.params.get("kind", "auto"))
+    await context.progress(0.0, f"백업 {backup['id']} 진행 중")
+    return await backup_service.wait(backup["id"])
@@ -0,0 +1,412 @@
+"""
+주기 작업 스케줄러
+
+startup_event 에서 시작하는 asyncio 스케줄러로, 보관 기간 지난 로그 정리/정기 백업/
+대시보드 재계산/기간 지난 기도 제목 종료 같은 유지보수 작업을 cron 형식 일정으로 실행합니다.
+
+- 일정: 5필드 cron (분 시 일 월 요일, JOB_TIMEZONE 기준) 또는 @hourly/@daily/@weekly/@monthly
+- 한 워커만 실행: job_leases 테이블의 임대를 얻은 워커만 실행하며, 같은 예약 시각(last_slot)은
+  한 번만 실행됨. 실행 중에는 임대를 갱신하고 끝나면 반납 (워커가 죽으면 lease_ttl 후 만료)
+- 지터: 예약 시각에 0~jitter 초를 더해 여러 워커가 동시에 DB 에 몰리지 않도록 함
+- 실행 이력은 job_runs 테이블, 작업별 실행 시간/성공/실패/건너뜀은 메트릭(jobs.<이름>.*)으로 기록
+- trigger() 로 일정과 관계없이 즉시 실행 (/system/jobs/{이름}/run)
+
+작업의 DB 호출은 스케줄러의 background 레인으로 실행됩니다.
+"""
+import asyncio
+import json
+import logging
+import os
+import random
+import secrets
+import socket
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.mapping import as_dicts
+from app.db.scheduler import BACKGROUND, db_lane
+
+logger = logging.getLogger(__name__)
+
+# 예약 시각 표기 (문자열 비교로 순서 판단)
+SLOT_FORMAT = "%Y-%m-%d %H:%M"
+
+
+class CronSchedule:
+    """5필드 cron 표현식 (분 시 일 월 요일, 요일 0/7=일요일)"""
+
+    ALIASES = {
+        "@hourly": "0 * * * *",
+        "@daily": "0 0 * * *",
+        "@weekly": "0 0 * * 0",
+        "@monthly": "0 0 1 * *",
+    }
+    FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        parts = self.ALIASES.get(expression.strip(), expression).split()
+        if len(parts) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드가 필요합니다: {expression!r}")
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse(part, low, high, expression) for part, (low, high) in zip(parts, self.FIELDS)
+        )
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        # 일/요일 중 하나만 제한하면 그 조건만, 둘 다 제한하면 둘 중 하나만 맞아도 실행 (cron 규칙)
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int, expression: str) -> FrozenSet[int]:
+        values = set()
+        for part in field.split(","):
+            step = 1
+            has_step = "/" in part
+            if has_step:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start, end = (int(value) for value in part.split("-", 1))
+            else:
+                # "5/15" 는 5 부터 끝까지 15 간격, 단독 숫자는 그 값만
+                start = int(part)
+                end = high if has_step else start
+            if step < 1 or start < low or end > high or start > end:
+                raise ValueError(f"cron 필드 범위 오류: {field!r} ({expression!r})")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """moment 이후 첫 실행 시각 (분 단위)"""
+        moment = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 표현식: {self.expression!r}")
+
+
+class Job:
+    def __init__(self, name: str, schedule: str, func: Callable[[], Awaitable[Any]],
+                 description: str = "", lease_ttl: float = 600.0):
+        self.name = name
+        self.schedule = schedule
+        self.cron = CronSchedule(schedule)
+        self.func = func
+        self.description = description
+        self.lease_ttl = lease_ttl
+        self.next_run: Optional[datetime] = None
+        self.running = False
+        self.last_run: Dict[str, Any] = {}
+
+
+class JobScheduler:
+    def __init__(self, timezone: str = "Asia/Seoul", jitter: float = 30.0, enabled: bool = True):
+        self.timezone = ZoneInfo(timezone)
+        self.jitter = jitter
+        self.enabled = enabled
+        self.jobs: Dict[str, Job] = {}
+        # 임대 소유자 식별 (호스트:프로세스:임의값)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(2)}"
+        self._loops: List[asyncio.Task] = []
+        self._manual: set = set()
+
+    async def get_client(self):
+        """LibSQL 클라이언트 반환"""
+        # 순환 import 방지를 위해 지연 import
+        from app.services.libsql_service import libsql_service
+        return await libsql_service.get_client()
+
+    def register(self, name: str, schedule: str, func: Callable[[], Awaitable[Any]],
+                 description: str = "", lease_ttl: float = 600.0) -> Optional[Job]:
+        """작업 등록 (일정이 빈 문자열이면 등록하지 않음)"""
+        if not schedule:
+            return None
+        job = self.jobs[name] = Job(name, schedule, func, description, lease_ttl)
+        return job
+
+    # 조회
+    def describe(self) -> List[Dict[str, Any]]:
+        """등록된 작업 목록 (다음 실행 시각, 마지막 실행 결과)"""
+        return [
+            {
+                "name": job.name,
+                "description": job.description,
+                "schedule": job.schedule,
+                "next_run": job.next_run.isoformat() if job.next_run else None,
+                "running": job.running,
+                **{f"last_{key}": value for key, value in job.last_run.items()},
+            }
+            for job in self.jobs.values()
+        ]
+
+    async def history(self, name: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """작업 실행 이력 (최근 순)"""
+        client = await self.get_client()
+        try:
+            result = await client.execute(
+                """
+                SELECT * FROM job_runs
+                WHERE job_name = ?
+                ORDER BY started_at DESC, id DESC
+                LIMIT ?
+                """,
+                [name, limit]
+            )
+            return as_dicts(result)
+        finally:
+            await client.close()
+
+    # 실행
+    async def start(self):
+        """작업별 일정 루프 시작"""
+        if not self.enabled or self._loops:
+            return
+        self._loops = [asyncio.create_task(self._loop(job)) for job in self.jobs.values()]
+        logger.info(f"작업 스케줄러 시작: {', '.join(self.jobs) or '(없음)'} (소유자 {self.owner})")
+
+    async def stop(self):
+        """일정 루프와 실행 중인 작업 중단 (임대는 만료 시간 후 다른 워커가 가져감)"""
+        tasks = [task for task in [*self._loops, *self._manual] if not task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loops = []
+
+    def trigger(self, name: str) -> Dict[str, Any]:
+        """일정과 관계없이 즉시 실행 (백그라운드, 다른 워커가 실행 중이면 건너뜀)"""
+        job = self.jobs.get(name)
+        if job is None:
+            raise KeyError(name)
+        task = asyncio.create_task(self._run_in_background(job, "manual", None))
+        self._manual.add(task)
+        task.add_done_callback(self._manual.discard)
+        return {"job": name}
+
+    async def _run_in_background(self, job: Job, trigger: str, slot: Optional[str]):
+        with db_lane(BACKGROUND):
+            try:
+                await self._execute(job, trigger, slot)
+            except Exception as e:
+                logger.warning(f"작업 실행 준비 실패 ({job.name}): {e}")
+
+    async def _loop(self, job: Job):
+        with db_lane(BACKGROUND):
+            while True:
+                now = datetime.now(self.timezone)
+                job.next_run = job.cron.next_after(now)
+                await asyncio.sleep((job.next_run - now).total_seconds() + random.uniform(0, self.jitter))
+                try:
+                    await self._execute(job, "schedule", job.next_run.strftime(SLOT_FORMAT))
+                except Exception as e:
+                    logger.warning(f"작업 실행 준비 실패 ({job.name}): {e}")
+
+    async def _execute(self, job: Job, trigger: str, slot: Optional[str]) -> Optional[int]:
+        """임대를 얻으면 작업을 실행하고 이력 기록, 실행 기록 id 반환 (건너뛰면 None)"""
+        if job.running or not await self._acquire(job, slot):
+            metrics.incr(f"jobs.{job.name}.skipped")
+            return None
+
+        job.running = True
+        run_id = await self._start_run(job, trigger, slot)
+        heartbeat = asyncio.create_task(self._renew(job))
+        started = time.perf_counter()
+        status, result, error = "failed", None, None
+        try:
+            result = await job.func()
+            status = "success"
+        except asyncio.CancelledError:
+            error = "앱 종료로 작업이 중단되었습니다"
+            raise
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            logger.exception(f"작업 실패: {job.name}")
+        finally:
+            heartbeat.cancel()
+            job.running = False
+            duration_ms = (time.perf_counter() - started) * 1000
+            metrics.incr(f"jobs.{job.name}.{'success' if status == 'success' else 'failures'}")
+            metrics.observe(f"jobs.{job.name}.duration_ms", duration_ms)
+            job.last_run = {"status": status, "trigger": trigger, "duration_ms": round(duration_ms, 1),
+                            "finished_at": datetime.now(self.timezone).isoformat(), "error": error}
+            await self._finish_run(run_id, status, result, error, duration_ms)
+            await self._release(job)
+        logger.info(f"작업 완료: {job.name} ({trigger}, {duration_ms:.0f}ms)")
+        return run_id
+
+    # 임대 / 이력
+    async def _acquire(self, job: Job, slot: Optional[str]) -> bool:
+        """임대가 비었거나 만료됐고, 예약 실행이면 이 예약 시각을 아직 실행하지 않았을 때만 획득"""
+        now = time.time()
+        client = await self.get_client()
+        try:
+            result = await client.execute(
+                """
+                INSERT INTO job_leases (job_name, owner, lease_until, last_slot)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(job_name) DO UPDATE SET
+                    owner = excluded.owner,
+                    lease_until = excluded.lease_until,
+                    last_slot = COALESCE(excluded.last_slot, job_leases.last_slot)
+                WHERE job_leases.lease_until < ?
+                  AND (excluded.last_slot IS NULL OR job_leases.last_slot IS NULL
+                       OR job_leases.last_slot < excluded.last_slot)
+                """,
+                [job.name, self.owner, now + job.lease_ttl, slot, now]
+            )
+            return result.rows_affected > 0
+        finally:
+            await client.close()
+
+    async def _renew(self, job: Job):
+        """실행 중 임대 연장 (lease_ttl 의 1/3 마다)"""
+        while True:
+            await asyncio.sleep(job.lease_ttl / 3)
+            try:
+                client = await self.get_client()
+                try:
+                    await client.execute(
+                        "UPDATE job_leases SET lease_until = ? WHERE job_name = ? AND owner = ?",
+                        [time.time() + job.lease_ttl, job.name, self.owner]
+                    )
+                finally:
+                    await client.close()
+            except Exception as e:
+                logger.warning(f"작업 임대 연장 실패 ({job.name}): {e}")
+
+    async def _release(self, job: Job):
+        try:
+            client = await self.get_client()
+            try:
+                await client.execute(
+                    "UPDATE job_leases SET lease_until = 0 WHERE job_name = ? AND owner = ?",
+                    [job.name, self.owner]
+                )
+            finally:
+                await client.close()
+        except Exception as e:
+            logger.warning(f"작업 임대 반납 실패 ({job.name}): {e}")
+
+    async def _start_run(self, job: Job, trigger: str, slot: Optional[str]) -> Optional[int]:
+        try:
+            client = await self.get_client()
+            try:
+                result = await client.execute(
+                    """
+                    INSERT INTO job_runs (job_name, trigger_type, owner, status, scheduled_for)
+                    VALUES (?, ?, ?, 'running', ?)
+                    """,
+                    [job.name, trigger, self.owner, slot]
+                )
+                return result.last_insert_rowid
+            finally:
+                await client.close()
+        except Exception as e:
+            logger.warning(f"작업 실행 기록 실패 ({job.name}): {e}")
+            return None
+
+    async def _finish_run(self, run_id: Optional[int], status: str, result: Any, error: Optional[str],
+                          duration_ms: float):
+        if run_id is None:
+            return
+        try:
+            client = await self.get_client()
+            try:
+                await client.execute(
+                    """
+                    UPDATE job_runs
+                    SET status = ?, result = ?, error_message = ?, duration_ms = ?, finished_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                    """,
+                    [status, json.dumps(result, ensure_ascii=False, default=str) if result is not None else None,
+                     error, round(duration_ms, 1), run_id]
+                )
+            finally:
+                await client.close()
+        except Exception as e:
+            logger.warning(f"작업 결과 기록 실패 (run={run_id}): {e}")
+
+
+# 유지보수 작업 (순환 import 방지를 위해 서비스는 실행 시 import)
+async def clear_old_logs_job() -> Dict[str, Any]:
+    from app.services.system_service import system_service
+    return {"deleted": await system_service.clear_old_logs(settings.LOG_RETENTION_DAYS)}
+
+
+async def scheduled_backup_job() -> Optional[Dict[str, Any]]:
+    from app.services.backup_service import backup_service
+    backup = await backup_service.create_backup(backup_type="scheduled")
+    return await backup_service.wait(backup["id"])
+
+
+async def dashboard_refresh_job() -> Dict[str, Any]:
+    from app.services.dashboard_service import dashboard_materializer
+    return await dashboard_materializer.refresh()
+
+
+async def prayer_expiry_job() -> Dict[str, Any]:
+    from app.services.prayer_service import prayer_service
+    return {"expired": await prayer_service.expire_prayers()}
+
+
+async def job_queue_cleanup_job() -> Dict[str, Any]:
+    from app.services.job_queue import job_queue
+    return {"deleted": await job_queue.purge(settings.JOB_RESULT_RETENTION_DAYS)}
+
+
+async def outbox_cleanup_job() -> Dict[str, Any]:
+    from app.services.outbox import outbox_dispatcher
+    return {"deleted": await outbox_dispatcher.purge(settings.OUTBOX_RETENTION_DAYS)}
+
+
+async def soft_delete_purge_job() -> Dict[str, Any]:
+    from app.services.purge_service import purge_service
+    return await purge_service.purge(settings.SOFT_DELETE_RETENTION_DAYS, settings.SOFT_DELETE_PURGE_CHUNK_SIZE)
+
+
+def register_maintenance_jobs(scheduler: JobScheduler):
+    scheduler.register("log_retention", settings.JOB_LOG_RETENTION_CRON, clear_old_logs_job,
+                       f"{settings.LOG_RETENTION_DAYS}일 지난 시스템 로그 삭제")
+    scheduler.register("backup", settings.JOB_BACKUP_CRON, scheduled_backup_job,
+                       "정기 백업 (이전 백업이 있으면 증분)", lease_ttl=1800.0)
+    scheduler.register("dashboard_refresh", settings.JOB_DASHBOARD_REFRESH_CRON, dashboard_refresh_job,
+                       "대시보드 통계 재계산 및 일 단위 스냅샷 저장")
+    scheduler.register("prayer_expiry", settings.JOB_PRAYER_EXPIRY_CRON, prayer_expiry_job,
+                       "기도 기간이 끝난 진행 중 기도 제목을 완료 처리")
+    scheduler.register("job_queue_cleanup", settings.JOB_QUEUE_CLEANUP_CRON, job_queue_cleanup_job,
+                       f"{settings.JOB_RESULT_RETENTION_DAYS}일 지난 백그라운드 작업과 결과 파일 삭제")
+    scheduler.register("outbox_cleanup", settings.JOB_OUTBOX_CLEANUP_CRON, outbox_cleanup_job,
+                       f"{settings.OUTBOX_RETENTION_DAYS}일 지난 변경 이벤트 삭제 (모든 소비자가 처리한 것만)")
+    scheduler.register("soft_delete_purge", settings.JOB_SOFT_DELETE_PURGE_CRON, soft_delete_purge_job,
+                       f"삭제 후 {settings.SOFT_DELETE_RETENTION_DAYS}일 지난 성도/가정/헌금/기도를 실제 삭제",
+                       lease_ttl=1800.0)
+
+
+# 전역 작업 스케줄러 인스턴스
+job_scheduler = JobScheduler(
+    timezone=settings.JOB_TIMEZONE,
+    jitter=settings.JOB_JITTER_SECONDS,
+    enabled=settings.JOB_SCHEDULER_ENABLED,
+)
+register_maintenance_jobs(job_scheduler)
@@ -1,11 +1,13 @@
 """
 LibSQL 직접 연결 서비스
 """
-import os
 from typing import Optional, List, Dict, Any
-from app.db.my_libsql_client import LibSQLClient
+from app.db.engine import get_engine
+from app.db.mapping import Record, as_dicts, as_records, first_dict
 from dotenv import load_dotenv
 from pathlib import Path
+from app.db.table_versions import table_versions
+from app.services.dashboard_service import dashboard_materializer
 
 # .env 파일 로드
 env_path = Path(__file__).parent.parent.parent / '.env'
@@ -13,28 +15,26 @@ load_dotenv(env_path)
 
 class LibSQLService:
     def __init__(self):
-        self.libsql_url = os.getenv("LIBSQL_URL")
-        self.auth_token = os.getenv("LIBSQL_AUTH_TOKEN")
-        
-        if not self.libsql_url:
-            raise ValueError("LIBSQL_URL이 설정되지 않았습니다.")
-        
-        # HTTP URL로 변환 (file:// URL인 경우 그대로 사용)
-        if self.libsql_url.startswith("file:"):
-            self.http_url = self.libsql_url
-        else:
-            self.http_url = self.libsql_url.replace("libsql://", "https://")
+        # 설정에 따라 Turso(HTTP) / 로컬 aiosqlite / 읽기 복제본 엔진 사용
+        self.engine = get_engine()
     
     async def get_client(self):
-        """LibSQL 클라이언트 반환"""
-        return await LibSQLClient.create(url=self.http_url, auth_token=self.auth_token)
+        """데이터베이스 클라이언트 반환"""
+        return await self.engine.get_client()
+
+    async def start(self):
+        """엔진 준비 (로컬 연결 풀 생성, 복제본 최초 동기화 등)"""
+        await self.engine.start()
     
     async def close(self):
         """클라이언트 종료"""
-        # 필요할 때마다 생성하므로 굳이 닫을 필요가 없습니다.
-        pass
+        # 필요할 때마다 생성하므로 굳이 닫을 필요가 없습니다. (엔진이 소유한 연결만 정리)
+        await self.engine.stop()
     
     # User 관련 메서드
+    # 컬럼 정보가 없을 때 사용할 사용자 컬럼 이름
+    USER_COLUMNS = ['user_id', 'email', 'password_hash', 'username', 'role', 'is_active', 'created_at', 'updated_at']
+
     async def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """사용자 생성"""
         libsql_client = await self.get_client()
@@ -50,6 +50,7 @@ class LibSQLService:
                 user_data.get('role', 'user'),
                 user_data.get('is_active', True)
             ])
+            table_versions.invalidate()
             return {"user_id": result.last_insert_rowid}
         finally:
             await libsql_client.close()
@@ -60,24 +61,7 @@ class LibSQLService:
         try:
             sql = "SELECT * FROM users WHERE email = ?"
             result = await libsql_client.execute(sql, [email])
-            if result.rows:
-                # 컬럼 이름을 안전하게 처리
-                if hasattr(result, 'columns') and result.columns:
-                    # columns가 문자열 리스트인 경우
-                    if isinstance(result.columns, list) and isinstance(result.columns[0], str):
-                        column_names = result.columns
-                    # columns가 객체 리스트인 경우
-                    elif hasattr(result.columns[0], 'name'):
-                        column_names = [col.name for col in result.columns]
-                    else:
-                        # 기본 컬럼 이름 사용
-                        column_names = ['user_id', 'email', 'password_hash', 'username', 'role', 'is_active', 'created_at', 'updated_at']
-                else:
-                    # 기본 컬럼 이름 사용
-                    column_names = ['user_id', 'email', 'password_hash', 'username', 'role', 'is_active', 'created_at', 'updated_at']
-                
-                return dict(zip(column_names, result.rows[0]))
-            return None
+            return first_dict(result, self.USER_COLUMNS)
         finally:
             await libsql_client.close()
     
@@ -87,24 +71,7 @@ class LibSQLService:
         try:
             sql = "SELECT * FROM users WHERE user_id = ?"
             result = await libsql_client.execute(sql, [user_id])
-            if result.rows:
-                # 컬럼 이름을 안전하게 처리
-                if hasattr(result, 'columns') and result.columns:
-                    # columns가 문자열 리스트인 경우
-                    if isinstance(result.columns, list) and isinstance(result.columns[0], str):
-                        column_names = result.columns
-                    # columns가 객체 리스트인 경우
-                    elif hasattr(result.columns[0], 'name'):
-                        column_names = [col.name for col in result.columns]
-                    else:
-                        # 기본 컬럼 이름 사용
-                        column_names = ['user_id', 'email', 'password_hash', 'username', 'role', 'is_active', 'created_at', 'updated_at']
-                else:
-                    # 기본 컬럼 이름 사용
-                    column_names = ['user_id', 'email', 'password_hash', 'username', 'role', 'is_active', 'created_at', 'updated_at']
-                
-                return dict(zip(column_names, result.rows[0]))
-            return None
+            return first_dict(result, self.USER_COLUMNS)
         finally:
             await libsql_client.close()
     
@@ -114,23 +81,7 @@ class LibSQLService:
         try:
             sql = "SELECT * FROM users LIMIT ? OFFSET ?"
             result = await libsql_client.execute(sql, [limit, skip])
-            
-            # 컬럼 이름을 안전하게 처리
-            if hasattr(result, 'columns') and result.columns:
-                # columns가 문자열 리스트인 경우
-                if isinstance(result.columns, list) and isinstance(result.columns[0], str):
-                    column_names = result.columns
-                # columns가 객체 리스트인 경우
-                elif hasattr(result.columns[0], 'name'):
-                    column_names = [col.name for col in result.columns]
-                else:
-                    # 기본 컬럼 이름 사용
-                    column_names = ['user_id', 'email', 'password_hash', 'username', 'role', 'is_active', 'created_at', 'updated_at']
-            else:
-                # 기본 컬럼 이름 사용
-                column_names = ['user_id', 'email', 'password_hash', 'username', 'role', 'is_active', 'created_at', 'updated_at']
-            
-            return [dict(zip(column_names, row)) for row in result.rows]
+            return as_dicts(result, self.USER_COLUMNS)
         finally:
             await libsql_client.close()
     
@@ -160,6 +111,8 @@ class LibSQLService:
                 member_data.get('registration_date'),
                 member_data.get('memo')
             ])
+            table_versions.invalidate()
+            dashboard_materializer.record_member(1)
             return {"member_id": result.last_insert_rowid}
         finally:
             await libsql_client.close()
@@ -168,10 +121,10 @@ class LibSQLService:
         """이메일로 멤버 조회"""
         libsql_client = await self.get_client()
         try:
-            sql = "SELECT * FROM members WHERE email = ?"
+            sql = "SELECT * FROM members WHERE email = ? AND deleted_at IS NULL"
             result = await libsql_client.execute(sql, [email])
             if result.rows:
-                return dict(zip([col.name for col in result.columns], result.rows[0]))
+                return first_dict(result)
             return None
         finally:
             await libsql_client.close()
@@ -180,36 +133,58 @@ class LibSQLService:
         """ID로 멤버 조회"""
         libsql_client = await self.get_client()
         try:
-            sql = "SELECT * FROM members WHERE member_id = ?"
+            sql = "SELECT * FROM members WHERE id = ? AND deleted_at IS NULL"
             result = await libsql_client.execute(sql, [member_id])
             if result.rows:
-                return dict(zip([col.name for col in result.columns], result.rows[0]))
+                return first_dict(result)
             return None
         finally:
             await libsql_client.close()
     
-    async def get_members(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-        """멤버 목록 조회"""
+    async def get_members(self, skip: int = 0, limit: int = 100) -> List[Record]:
+        """멤버 목록 조회 (읽기 전용 레코드)"""
         libsql_client = await self.get_client()
         try:
-            sql = "SELECT * FROM members LIMIT ? OFFSET ?"
+            sql = "SELECT * FROM members WHERE deleted_at IS NULL LIMIT ? OFFSET ?"
             result = await libsql_client.execute(sql, [limit, skip])
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_records(result)
         finally:
             await libsql_client.close()
     
-    async def update_member(self, member_id: int, member_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """멤버 업데이트"""
+    # 수정 이력을 남기는 성도 컬럼 (member_history.field_name)
+    MEMBER_HISTORY_FIELDS = (
+        'name', 'name_en', 'birth_date', 'gender', 'phone', 'email', 'address', 'job',
+        'registration_date', 'baptism_date', 'position', 'district', 'family_id', 'family_role',
+        'is_active', 'notes',
+    )
+
+    async def update_member(self, member_id: int, member_data: Dict[str, Any],
+                            modified_by: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """멤버 업데이트 (바뀐 필드의 수정 이력을 UPDATE 와 같은 batch 에서 기록)
+
+        이력은 UPDATE 직전에 INSERT ... SELECT 로 현재 값과 비교해 실제로 바뀐 필드만 남기므로
+        이전 값을 읽는 왕복이 따로 없습니다. modified_by 가 없으면 성도 등록자로 기록합니다.
+        """
         libsql_client = await self.get_client()
         try:
             # 업데이트할 필드들
             update_fields = []
             values = []
+            history = []
+            history_params = []
             
             for key, value in member_data.items():
                 if value is not None and key != 'member_id':
+                    if hasattr(value, 'isoformat'):
+                        value = value.isoformat()
                     update_fields.append(f"{key} = ?")
                     values.append(value)
+                    if key in self.MEMBER_HISTORY_FIELDS:
+                        history.append(
+                            f"SELECT id, '{key}', {key}, ?, COALESCE(?, created_by) FROM members "
+                            f"WHERE id = ? AND deleted_at IS NULL AND {key} IS NOT ?"
+                        )
+                        history_params.extend([value, modified_by, member_id, value])
             
             if not update_fields:
                 return None
@@ -217,20 +192,65 @@ class LibSQLService:
             update_fields.append("updated_at = CURRENT_TIMESTAMP")
             values.append(member_id)
             
-            sql = f"UPDATE members SET {', '.join(update_fields)} WHERE member_id = ?"
-            await libsql_client.execute(sql, values)
+            statements = []
+            if history:
+                statements.append((
+                    "INSERT INTO member_history (member_id, field_name, old_value, new_value, modified_by) "
+                    + " UNION ALL ".join(history),
+                    history_params
+                ))
+            statements.append((f"UPDATE members SET {', '.join(update_fields)} WHERE id = ? AND deleted_at IS NULL", values))
+            await libsql_client.batch(statements)
             
+            table_versions.invalidate()
             return await self.get_member_by_id(member_id)
         finally:
             await libsql_client.close()
+
+    async def get_member_history(self, member_id: int, start: Optional[str] = None, end: Optional[str] = None,
+                                 field_name: Optional[str] = None, cursor: Optional[tuple] = None,
+                                 limit: int = 50) -> List[Dict[str, Any]]:
+        """성도 수정 이력 (최근 순, cursor 는 이전 페이지 마지막 항목의 (modified_at, id))"""
+        libsql_client = await self.get_client()
+        try:
+            sql = """
+            SELECT h.id, h.member_id, h.field_name, h.old_value, h.new_value, h.modified_by,
+                   u.username as modified_by_username, h.modified_at
+            FROM member_history h
+            LEFT JOIN users u ON h.modified_by = u.id
+            WHERE h.member_id = ?
+            """
+            params: List[Any] = [member_id]
+            if start:
+                sql += " AND h.modified_at >= ?"
+                params.append(start)
+            if end:
+                sql += " AND h.modified_at < ?"
+                params.append(end)
+            if field_name:
+                sql += " AND h.field_name = ?"
+                params.append(field_name)
+            if cursor:
+                sql += " AND (h.modified_at, h.id) < (?, ?)"
+                params.extend(cursor)
+            sql += " ORDER BY h.modified_at DESC, h.id DESC LIMIT ?"
+            params.append(limit)
+            result = await libsql_client.execute(sql, params)
+            return as_dicts(result)
+        finally:
+            await libsql_client.close()
     
     async def delete_member(self, member_id: int) -> bool:
-        """멤버 삭제"""
+        """멤버 삭제 (소프트 삭제, 보관 기간이 지나면 정리 작업이 실제 삭제)"""
         libsql_client = await self.get_client()
         try:
-            sql = "DELETE FROM members WHERE member_id = ?"
+            sql = "UPDATE members SET deleted_at = CURRENT_TIMESTAMP WHERE id = ? AND deleted_at IS NULL"
             result = await libsql_client.execute(sql, [member_id])
-            return result.rows_affected > 0
+            table_versions.invalidate()
+            deleted = result.rows_affected > 0
+            if deleted:
+                dashboard_materializer.record_member(-1)
+            return deleted
         finally:
             await libsql_client.close()
 
@@ -1,33 +1,51 @@
 """
 헌금 관리 서비스
 """
-import os
 from typing import Optional, List, Dict, Any
-from libsql_client import create_client
+from app.db.engine import get_engine
+from app.db.mapping import Record, as_dicts, as_records, first_dict
+from app.db.statements import statements
 from dotenv import load_dotenv
 from pathlib import Path
+from app.db.table_versions import table_versions
+from app.services.dashboard_service import dashboard_materializer
+from app.services.singleflight import singleflight
 from datetime import datetime, date
 
 # .env 파일 로드
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(env_path)
 
+# 헌금 기록 목록 조회문 (필터 조합별로 한 번만 생성)
+OFFERING_LIST_SQL = statements.define(
+    "offerings.list",
+    """
+    SELECT o.*, m.name as member_name, u.username as created_by_username
+    FROM offerings o
+    JOIN members m ON o.member_id = m.id
+    JOIN users u ON o.created_by = u.id
+    """,
+    {
+        "member_id": "o.member_id = ?",
+        "offering_type": "o.offering_type = ?",
+        "start_date": "o.offering_date >= ?",
+        "end_date": "o.offering_date <= ?",
+    },
+    "ORDER BY o.offering_date DESC, o.created_at DESC LIMIT ? OFFSET ?",
+    where="o.deleted_at IS NULL"
+)
+
 class OfferingService:
     def __init__(self):
-        self.libsql_url = os.getenv("LIBSQL_URL")
-        self.auth_token = os.getenv("LIBSQL_AUTH_TOKEN")
-        
-        if not self.libsql_url:
-            raise ValueError("LIBSQL_URL이 설정되지 않았습니다.")
-        
-        # HTTP URL로 변환
-        self.http_url = self.libsql_url.replace("libsql://", "https://")
+        # 설정에 따라 Turso(HTTP) / 로컬 aiosqlite / 읽기 복제본 엔진 사용
+        self.engine = get_engine()
     
     async def get_client(self):
-        """LibSQL 클라이언트 반환"""
-        return create_client(url=self.http_url, auth_token=self.auth_token)
+        """데이터베이스 클라이언트 반환"""
+        return await self.engine.get_client()
     
     # 헌금 종류 관련 메서드
+    @singleflight.coalesce()
     async def get_offering_types(self, active_only: bool = True) -> List[Dict[str, Any]]:
         """헌금 종류 목록 조회"""
         client = await self.get_client()
@@ -38,7 +56,7 @@ class OfferingService:
             sql += " ORDER BY name"
             
             result = await client.execute(sql)
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_dicts(result)
         finally:
             await client.close()
     
@@ -55,6 +73,7 @@ class OfferingService:
                 type_data.get('description'),
                 type_data.get('is_active', True)
             ])
+            table_versions.invalidate()
             return {"id": result.last_insert_rowid}
         finally:
             await client.close()
@@ -76,6 +95,8 @@ class OfferingService:
                 offering_data.get('memo'),
                 offering_data['created_by']
             ])
+            table_versions.invalidate()
+            dashboard_materializer.record_offering(offering_data['amount'], offering_data['offering_date'])
             return {"id": result.last_insert_rowid}
         finally:
             await client.close()
@@ -89,53 +110,32 @@ class OfferingService:
             FROM offerings o
             JOIN members m ON o.member_id = m.id
             JOIN users u ON o.created_by = u.id
-            WHERE o.id = ?
+            WHERE o.id = ? AND o.deleted_at IS NULL
             """
             result = await client.execute(sql, [offering_id])
             if result.rows:
-                return dict(zip([col.name for col in result.columns], result.rows[0]))
+                return first_dict(result)
             return None
         finally:
             await client.close()
     
+    @singleflight.coalesce()
     async def get_offerings(self, skip: int = 0, limit: int = 20,
                            member_id: Optional[int] = None,
                            offering_type: Optional[str] = None,
                            start_date: Optional[date] = None,
-                           end_date: Optional[date] = None) -> List[Dict[str, Any]]:
-        """헌금 기록 목록 조회"""
+                           end_date: Optional[date] = None) -> List[Record]:
+        """헌금 기록 목록 조회 (읽기 전용 레코드)"""
         client = await self.get_client()
         try:
-            sql = """
-            SELECT o.*, m.name as member_name, u.username as created_by_username
-            FROM offerings o
-            JOIN members m ON o.member_id = m.id
-            JOIN users u ON o.created_by = u.id
-            WHERE 1=1
-            """
-            params = []
-            
-            if member_id:
-                sql += " AND o.member_id = ?"
-                params.append(member_id)
-            
-            if offering_type:
-                sql += " AND o.offering_type = ?"
-                params.append(offering_type)
-            
-            if start_date:
-                sql += " AND o.offering_date >= ?"
-                params.append(start_date.isoformat())
-            
-            if end_date:
-                sql += " AND o.offering_date <= ?"
-                params.append(end_date.isoformat())
-            
-            sql += " ORDER BY o.offering_date DESC, o.created_at DESC LIMIT ? OFFSET ?"
-            params.extend([limit, skip])
-            
+            sql, params = OFFERING_LIST_SQL.bind({
+                "member_id": member_id,
+                "offering_type": offering_type,
+                "start_date": start_date.isoformat() if start_date else None,
+                "end_date": end_date.isoformat() if end_date else None,
+            }, limit, skip)
             result = await client.execute(sql, params)
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_records(result)
         finally:
             await client.close()
     
@@ -157,19 +157,23 @@ class OfferingService:
             update_fields.append("updated_at = CURRENT_TIMESTAMP")
             values.append(offering_id)
             
-            sql = f"UPDATE offerings SET {', '.join(update_fields)} WHERE id = ?"
+            sql = f"UPDATE offerings SET {', '.join(update_fields)} WHERE id = ? AND deleted_at IS NULL"
             await client.execute(sql, values)
             
+            table_versions.invalidate()
+            dashboard_materializer.mark_stale()
             return await self.get_offering_by_id(offering_id)
         finally:
             await client.close()
     
     async def delete_offering(self, offering_id: int) -> bool:
-        """헌금 기록 삭제"""
+        """헌금 기록 삭제 (소프트 삭제, 보관 기간이 지나면 정리 작업이 실제 삭제)"""
         client = await self.get_client()
         try:
-            sql = "DELETE FROM offerings WHERE id = ?"
+            sql = "UPDATE offerings SET deleted_at = CURRENT_TIMESTAMP WHERE id = ? AND deleted_at IS NULL"
             result = await client.execute(sql, [offering_id])
+            table_versions.invalidate()
+            dashboard_materializer.mark_stale()
             return result.rows_affected > 0
         finally:
             await client.close()
@@ -183,21 +187,21 @@ class OfferingService:
             sql_total = """
             SELECT SUM(amount) as total_amount, COUNT(*) as total_count
             FROM offerings
-            WHERE offering_date BETWEEN ? AND ?
+            WHERE offering_date BETWEEN ? AND ? AND deleted_at IS NULL
             """
             result_total = await client.execute(sql_total, [start_date.isoformat(), end_date.isoformat()])
-            total_data = dict(zip([col.name for col in result_total.columns], result_total.rows[0]))
+            total_data = first_dict(result_total)
             
             # 헌금 종류별 통계
             sql_by_type = """
             SELECT offering_type, SUM(amount) as amount, COUNT(*) as count
             FROM offerings
-            WHERE offering_date BETWEEN ? AND ?
+            WHERE offering_date BETWEEN ? AND ? AND deleted_at IS NULL
             GROUP BY offering_type
             ORDER BY amount DESC
             """
             result_by_type = await client.execute(sql_by_type, [start_date.isoformat(), end_date.isoformat()])
-            by_type_data = [dict(zip([col.name for col in result_by_type.columns], row)) for row in result_by_type.rows]
+            by_type_data = as_dicts(result_by_type)
             
             # 월별 헌금 통계
             sql_monthly = """
@@ -206,12 +210,12 @@ class OfferingService:
                 SUM(amount) as amount,
                 COUNT(*) as count
             FROM offerings
-            WHERE offering_date BETWEEN ? AND ?
+            WHERE offering_date BETWEEN ? AND ? AND deleted_at IS NULL
             GROUP BY strftime('%Y-%m', offering_date)
             ORDER BY month
             """
             result_monthly = await client.execute(sql_monthly, [start_date.isoformat(), end_date.isoformat()])
-            monthly_data = [dict(zip([col.name for col in result_monthly.columns], row)) for row in result_monthly.rows]
+            monthly_data = as_dicts(result_monthly)
             
             return {
                 "total": total_data,
@@ -233,12 +237,12 @@ class OfferingService:
                 MIN(offering_date) as first_date,
                 MAX(offering_date) as last_date
             FROM offerings
-            WHERE member_id = ? AND strftime('%Y', offering_date) = ?
+            WHERE member_id = ? AND strftime('%Y', offering_date) = ? AND deleted_at IS NULL
             GROUP BY offering_type
             ORDER BY total_amount DESC
             """
             result = await client.execute(sql, [member_id, str(year)])
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_dicts(result)
         finally:
             await client.close()
 
@@ -0,0 +1,209 @@
+"""
+변경 이벤트 디스패처 (트랜잭셔널 아웃박스)
+
+도메인 테이블(members, families, offerings, prayers, prayer_participants, prayer_comments,
+system_settings)의 쓰기는 같은 트랜잭션 안에서 capture_* 트리거가 change_events 에 기록합니다.
+디스패처는 소비자 커서(outbox_cursors) 다음부터 이벤트를 묶음으로 읽어 구독자에게 전달하고
+커서를 저장하므로, 서비스 코드에 후처리를 넣지 않아도 모든 쓰기 경로(다른 워커, 가져오기 작업,
+migrate 스크립트 포함)에 반응할 수 있습니다.
+
+- 이 프로세스의 쓰기(table_versions.invalidate)는 바로 깨워서 읽고, 그 밖에는 poll_interval 마다 확인
+- 구독자는 관심 테이블의 이벤트만 묶음(List[dict])으로 받음. 한 구독자의 오류는 다른 구독자와 커서 진행을 막지 않음
+- 커서가 없는 첫 시작은 과거 이벤트를 재생하지 않고 현재 위치부터 시작
+"""
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.mapping import as_dicts
+from app.db.scheduler import BACKGROUND, db_lane
+from app.db.table_versions import table_versions
+
+logger = logging.getLogger(__name__)
+
+# 변경 이벤트를 기록하는 테이블 (migrations/0009_change_events.sql 트리거와 일치해야 함)
+OUTBOX_TABLES = (
+    "members", "families", "offerings",
+    "prayers", "prayer_participants", "prayer_comments",
+    "system_settings",
+)
+
+Subscriber = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+class OutboxDispatcher:
+    def __init__(self, consumer: str = "app", poll_interval: float = 1.0, batch_size: int = 500,
+                 enabled: bool = True):
+        self.consumer = consumer
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.enabled = enabled
+        self.last_event_id: Optional[int] = None
+        self._subscribers: List[Tuple[str, Optional[FrozenSet[str]], Subscriber]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def get_client(self):
+        """LibSQL 클라이언트 반환"""
+        # 순환 import 방지를 위해 지연 import
+        from app.services.libsql_service import libsql_service
+        return await libsql_service.get_client()
+
+    def subscribe(self, name: str, handler: Subscriber, tables: Optional[Tuple[str, ...]] = None):
+        """구독자 등록 (tables 를 주면 그 테이블의 이벤트만 전달)"""
+        self._subscribers.append((name, frozenset(tables) if tables else None, handler))
+
+    def notify(self):
+        """이 프로세스에서 쓰기가 일어났음을 알림 (다음 폴링을 기다리지 않고 읽음)"""
+        self._wakeup.set()
+
+    async def start(self):
+        """디스패처 루프 시작"""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"변경 이벤트 디스패처 시작: 소비자 {self.consumer}, 구독자 {len(self._subscribers)}개")
+
+    async def stop(self):
+        """디스패처 루프 종료 (처리 중인 묶음의 커서는 저장되지 않아 다음 시작 때 다시 전달)"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        # 이벤트 전달은 대화형 요청보다 낮은 우선순위로 실행
+        with db_lane(BACKGROUND):
+            while True:
+                try:
+                    if self.last_event_id is None:
+                        self.last_event_id = await self._load_cursor()
+                    if await self.dispatch_once() == self.batch_size:
+                        # 밀린 이벤트가 더 있으면 바로 다음 묶음
+                        continue
+                except Exception as e:
+                    logger.warning(f"변경 이벤트 전달 실패: {e}")
+                self._wakeup.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+
+    async def _load_cursor(self) -> int:
+        """저장된 커서 (없으면 현재 마지막 이벤트부터 시작하도록 기록)"""
+        client = await self.get_client()
+        try:
+            result = await client.execute(
+                "SELECT last_event_id FROM outbox_cursors WHERE consumer = ?", [self.consumer]
+            )
+            if result.rows:
+                return result.rows[0][0]
+            latest = await client.execute("SELECT COALESCE(MAX(id), 0) FROM change_events")
+            last_event_id = latest.rows[0][0]
+            await client.execute(
+                "INSERT OR IGNORE INTO outbox_cursors (consumer, last_event_id) VALUES (?, ?)",
+                [self.consumer, last_event_id]
+            )
+            return last_event_id
+        finally:
+            await client.close()
+
+    async def dispatch_once(self) -> int:
+        """커서 다음 이벤트 한 묶음을 구독자에게 전달하고 커서 저장, 전달한 이벤트 수 반환"""
+        client = await self.get_client()
+        try:
+            result = await client.execute(
+                """
+                SELECT id, table_name, row_id, op, changed_columns, version, parent_id, user_id, created_at
+                FROM change_events WHERE id > ? ORDER BY id LIMIT ?
+                """,
+                [self.last_event_id, self.batch_size]
+            )
+            events = as_dicts(result)
+            if not events:
+                return 0
+            started = time.perf_counter()
+            for event in events:
+                event["changed_columns"] = event["changed_columns"].split(",") if event["changed_columns"] else []
+            await self._fan_out(events)
+            last_event_id = events[-1]["id"]
+            # 같은 소비자 이름을 쓰는 워커가 여럿이면 앞선 위치만 저장
+            await client.execute(
+                """
+                INSERT INTO outbox_cursors (consumer, last_event_id, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(consumer) DO UPDATE SET
+                    last_event_id = MAX(last_event_id, excluded.last_event_id),
+                    updated_at = excluded.updated_at
+                """,
+                [self.consumer, last_event_id]
+            )
+            self.last_event_id = last_event_id
+            metrics.incr("outbox.events", len(events))
+            metrics.observe("outbox.batch_ms", (time.perf_counter() - started) * 1000)
+            metrics.set_gauge("outbox.last_event_id", last_event_id)
+            return len(events)
+        finally:
+            await client.close()
+
+    async def _fan_out(self, events: List[Dict[str, Any]]):
+        """구독자마다 관심 테이블의 이벤트만 골라 동시에 전달"""
+        calls, names = [], []
+        for name, tables, handler in self._subscribers:
+            selected = events if tables is None else [event for event in events if event["table_name"] in tables]
+            if selected:
+                calls.append(handler(selected))
+                names.append(name)
+        for name, outcome in zip(names, await asyncio.gather(*calls, return_exceptions=True)):
+            if isinstance(outcome, Exception):
+                metrics.incr(f"outbox.subscribers.{name}.failures")
+                logger.warning(f"변경 이벤트 구독자 오류 ({name}): {outcome}")
+
+    async def purge(self, days: int) -> int:
+        """days 일 지난 이벤트 삭제, 삭제한 이벤트 수 반환
+
+        최근 days 일 안에 커서가 움직인 소비자가 아직 읽지 않은 이벤트는 남겨 둠
+        (그보다 오래 멈춘 소비자는 기다리지 않음)
+        """
+        client = await self.get_client()
+        try:
+            result = await client.execute(
+                """
+                DELETE FROM change_events
+                WHERE created_at < datetime('now', ?)
+                  AND id <= COALESCE(
+                      (SELECT MIN(last_event_id) FROM outbox_cursors WHERE updated_at >= datetime('now', ?)),
+                      (SELECT MAX(id) FROM change_events)
+                  )
+                """,
+                [f"-{int(days)} days", f"-{int(days)} days"]
+            )
+            return result.rows_affected
+        finally:
+            await client.close()
+
+
+# 기본 구독자
+async def invalidate_table_versions(events: List[Dict[str, Any]]):
+    """다른 워커의 쓰기도 바로 ETag/결과 캐시에 반영 (다음 조회 때 table_versions 를 다시 읽음)"""
+    table_versions.invalidate()
+
+
+async def count_changes(events: List[Dict[str, Any]]):
+    """테이블/작업별 변경 건수"""
+    for event in events:
+        metrics.incr(f"outbox.{event['table_name']}.{event['op']}")
+
+
+# 전역 변경 이벤트 디스패처 인스턴스
+outbox_dispatcher = OutboxDispatcher(
+    consumer=settings.OUTBOX_CONSUMER,
+    poll_interval=settings.OUTBOX_POLL_INTERVAL,
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    enabled=settings.OUTBOX_ENABLED,
+)
+outbox_dispatcher.subscribe("table_versions", invalidate_table_versions)
+outbox_dispatcher.subscribe("metrics", count_changes)
+# 이 프로세스의 쓰기는 서비스가 table_versions.invalidate() 를 호출하므로 그때 바로 깨움
+table_versions.on_invalidate(outbox_dispatcher.notify)
@@ -1,9 +1,9 @@
 """
 기도 관리 서비스
 """
-import os
 from typing import Optional, List, Dict, Any
-from libsql_client import create_client
+from app.db.engine import get_engine
+from app.db.mapping import as_dicts, first_dict
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -13,36 +13,16 @@ load_dotenv(env_path)
 
 class PrayerService:
     def __init__(self):
-        self.libsql_url = os.getenv("LIBSQL_URL")
-        self.auth_token = os.getenv("LIBSQL_AUTH_TOKEN")
-        
-        if not self.libsql_url:
-            raise ValueError("LIBSQL_URL이 설정되지 않았습니다.")
-        
-        # HTTP URL로 변환
-        self.http_url = self.libsql_url.replace("libsql://", "https://")
+        # 설정에 따라 Turso(HTTP) / 로컬 aiosqlite / 읽기 복제본 엔진 사용
+        self.engine = get_engine()
     
     async def get_client(self):
-        """LibSQL 클라이언트 반환"""
-        return create_client(url=self.http_url, auth_token=self.auth_token)
+        """데이터베이스 클라이언트 반환"""
+        return await self.engine.get_client()
     
     def _safe_dict_from_result(self, result, default_columns=None):
         """결과를 안전하게 딕셔너리로 변환"""
-        if not result.rows:
-            return []
-        
-        # 컬럼 이름을 안전하게 처리
-        if hasattr(result, 'columns') and result.columns:
-            if isinstance(result.columns, list) and isinstance(result.columns[0], str):
-                column_names = result.columns
-            elif hasattr(result.columns[0], 'name'):
-                column_names = [col.name for col in result.columns]
-            else:
-                column_names = default_columns or []
-        else:
-            column_names = default_columns or []
-        
-        return [dict(zip(column_names, row)) for row in result.rows]
+        return as_dicts(result, default_columns)
     
     # 기도 카테고리 관련 메서드
     async def get_prayer_categories(self, active_only: bool = True) -> List[Dict[str, Any]]:
@@ -107,10 +87,10 @@ class PrayerService:
         """ID로 기도 제목 조회"""
         client = await self.get_client()
         try:
-            sql = "SELECT * FROM prayers WHERE id = ?"
+            sql = "SELECT * FROM prayers WHERE id = ? AND deleted_at IS NULL"
             result = await client.execute(sql, [prayer_id])
             if result.rows:
-                return dict(zip([col.name for col in result.columns], result.rows[0]))
+                return first_dict(result)
             return None
         finally:
             await client.close()
@@ -123,7 +103,7 @@ class PrayerService:
         """기도 제목 목록 조회"""
         client = await self.get_client()
         try:
-            sql = "SELECT * FROM prayers WHERE 1=1"
+            sql = "SELECT * FROM prayers WHERE deleted_at IS NULL"
             params = []
             
             if category:
@@ -146,7 +126,7 @@ class PrayerService:
             params.extend([limit, skip])
             
             result = await client.execute(sql, params)
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_dicts(result)
         finally:
             await client.close()
     
@@ -176,15 +156,28 @@ class PrayerService:
             await client.close()
     
     async def delete_prayer(self, prayer_id: int) -> bool:
-        """기도 제목 삭제"""
+        """기도 제목 삭제 (소프트 삭제)"""
         client = await self.get_client()
         try:
-            sql = "DELETE FROM prayers WHERE id = ?"
+            sql = "UPDATE prayers SET deleted_at = CURRENT_TIMESTAMP WHERE id = ? AND deleted_at IS NULL"
             result = await client.execute(sql, [prayer_id])
             return result.rows_affected > 0
         finally:
             await client.close()
     
+    async def expire_prayers(self) -> int:
+        """기도 기간이 끝난 진행 중 기도 제목을 완료 처리 (주기 작업용), 처리한 개수 반환"""
+        client = await self.get_client()
+        try:
+            sql = """
+            UPDATE prayers SET status = 'completed', updated_at = CURRENT_TIMESTAMP
+            WHERE status = 'active' AND prayer_period_end < date('now', 'localtime') AND deleted_at IS NULL
+            """
+            result = await client.execute(sql)
+            return result.rows_affected
+        finally:
+            await client.close()
+    
     # 기도 참여 관련 메서드
     async def participate_prayer(self, prayer_id: int, user_id: int) -> Dict[str, Any]:
         """기도 참여"""
@@ -211,7 +204,7 @@ class PrayerService:
             ORDER BY pp.participated_at DESC
             """
             result = await client.execute(sql, [prayer_id])
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_dicts(result)
         finally:
             await client.close()
     
@@ -246,7 +239,7 @@ class PrayerService:
             ORDER BY pc.created_at ASC
             """
             result = await client.execute(sql, [prayer_id])
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_dicts(result)
         finally:
             await client.close()
     
@@ -1,11 +1,15 @@
 """
 기도 관리 서비스 (수정된 버전)
 """
-import os
 from typing import Optional, List, Dict, Any
-from libsql_client import create_client
+from app.db.engine import get_engine
+from app.db.mapping import as_dicts
+from app.db.statements import statements
 from dotenv import load_dotenv
 from pathlib import Path
+from app.db.table_versions import table_versions
+from app.services.dashboard_service import dashboard_materializer
+from app.services.singleflight import singleflight
 import logging
 from datetime import datetime, date
 
@@ -17,41 +21,32 @@ logger = logging.getLogger(__name__)
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(env_path)
 
+# 기도 제목 목록 조회문 (필터 조합별로 한 번만 생성)
+PRAYER_LIST_SQL = statements.define(
+    "prayers.list",
+    "SELECT * FROM prayers",
+    {
+        "category": "category = ?",
+        "status": "status = ?",
+        "visibility": "visibility = ?",
+        "user_id": "created_by = ?",
+    },
+    "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+    where="deleted_at IS NULL"
+)
+
 class PrayerService:
     def __init__(self):
-        self.libsql_url = os.getenv("LIBSQL_URL")
-        self.auth_token = os.getenv("LIBSQL_AUTH_TOKEN")
-        
-        if not self.libsql_url:
-            raise ValueError("LIBSQL_URL이 설정되지 않았습니다.")
-        
-        # HTTP URL로 변환
-        self.http_url = self.libsql_url.replace("libsql://", "https://")
+        # 설정에 따라 Turso(HTTP) / 로컬 aiosqlite / 읽기 복제본 엔진 사용
+        self.engine = get_engine()
     
     async def get_client(self):
-        """LibSQL 클라이언트 반환"""
-        return create_client(url=self.http_url, auth_token=self.auth_token)
+        """데이터베이스 클라이언트 반환"""
+        return await self.engine.get_client()
     
     def _safe_dict_from_result(self, result, default_columns=None):
         """결과를 안전하게 딕셔너리로 변환"""
-        if not result.rows:
-            return []
-        
-        # 컬럼 이름을 안전하게 처리
-        try:
-            if hasattr(result, 'columns') and result.columns:
-                if isinstance(result.columns, list) and isinstance(result.columns[0], str):
-                    column_names = result.columns
-                elif hasattr(result.columns[0], 'name'):
-                    column_names = [col.name for col in result.columns]
-                else:
-                    column_names = default_columns or [f"col_{i}" for i in range(len(result.rows[0]))]
-            else:
-                column_names = default_columns or [f"col_{i}" for i in range(len(result.rows[0]))]
-        except:
-            column_names = default_columns or [f"col_{i}" for i in range(len(result.rows[0]))]
-        
-        return [dict(zip(column_names, row)) for row in result.rows]
+        return as_dicts(result, default_columns)
     
     async def ensure_tables(self):
         """필요한 테이블들을 생성"""
@@ -133,6 +128,7 @@ class PrayerService:
             await client.close()
     
     # 기도 카테고리 관련 메서드
+    @singleflight.coalesce()
     async def get_prayer_categories(self, active_only: bool = True) -> List[Dict[str, Any]]:
         """기도 카테고리 목록 조회"""
         await self.ensure_tables()
@@ -163,38 +159,19 @@ class PrayerService:
                 category_data.get('color'),
                 category_data.get('is_active', True)
             ])
+            table_versions.invalidate()
             return {"id": result.last_insert_rowid}
         finally:
             await client.close()
     
     # 기도 제목 관련 메서드
+    @singleflight.coalesce()
     async def get_prayers(self, skip: int = 0, limit: int = 20, **filters) -> List[Dict[str, Any]]:
         """기도 제목 목록 조회"""
         await self.ensure_tables()
         client = await self.get_client()
         try:
-            sql = "SELECT * FROM prayers WHERE 1=1"
-            params = []
-            
-            if filters.get('category'):
-                sql += " AND category = ?"
-                params.append(filters['category'])
-            
-            if filters.get('status'):
-                sql += " AND status = ?"
-                params.append(filters['status'])
-            
-            if filters.get('visibility'):
-                sql += " AND visibility = ?"
-                params.append(filters['visibility'])
-            
-            if filters.get('user_id'):
-                sql += " AND created_by = ?"
-                params.append(filters['user_id'])
-            
-            sql += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-            params.extend([limit, skip])
-            
+            sql, params = PRAYER_LIST_SQL.bind(filters, limit, skip)
             result = await client.execute(sql, params)
             return self._safe_dict_from_result(result, [
                 'id', 'title', 'content', 'category', 'is_anonymous', 'visibility', 'status',
@@ -209,7 +186,7 @@ class PrayerService:
         await self.ensure_tables()
         client = await self.get_client()
         try:
-            sql = "SELECT * FROM prayers WHERE id = ?"
+            sql = "SELECT * FROM prayers WHERE id = ? AND deleted_at IS NULL"
             result = await client.execute(sql, [prayer_id])
             
             if not result.rows:
@@ -248,6 +225,8 @@ class PrayerService:
                 prayer_data.get('tags'),
                 prayer_data['created_by']
             ])
+            table_versions.invalidate()
+            dashboard_materializer.record_prayer(1)
             return {"id": result.last_insert_rowid}
         finally:
             await client.close()
@@ -278,96 +257,124 @@ class PrayerService:
             updates.append("updated_at = CURRENT_TIMESTAMP")
             params.append(prayer_id)
             
-            sql = f"UPDATE prayers SET {', '.join(updates)} WHERE id = ?"
+            sql = f"UPDATE prayers SET {', '.join(updates)} WHERE id = ? AND deleted_at IS NULL"
             await client.execute(sql, params)
             
+            table_versions.invalidate()
             return await self.get_prayer_by_id(prayer_id)
         finally:
             await client.close()
     
     async def delete_prayer(self, prayer_id: int) -> bool:
-        """기도 제목 삭제"""
+        """기도 제목 삭제 (소프트 삭제, 참여/댓글은 보관 기간이 지나 정리 작업이 기도 제목과 함께 삭제)"""
         await self.ensure_tables()
         client = await self.get_client()
         try:
-            # 관련 데이터 삭제
-            await client.execute("DELETE FROM prayer_comments WHERE prayer_id = ?", [prayer_id])
-            await client.execute("DELETE FROM prayer_participants WHERE prayer_id = ?", [prayer_id])
-            
-            # 기도 제목 삭제
-            result = await client.execute("DELETE FROM prayers WHERE id = ?", [prayer_id])
+            result = await client.execute(
+                "UPDATE prayers SET deleted_at = CURRENT_TIMESTAMP WHERE id = ? AND deleted_at IS NULL", [prayer_id]
+            )
+            table_versions.invalidate()
+            dashboard_materializer.mark_stale()
             return result.rows_affected > 0
         finally:
             await client.close()
     
     # 기도 참여 관련 메서드
-    async def participate_prayer(self, prayer_id: int, user_id: int) -> Dict[str, Any]:
-        """기도 참여"""
+    async def participate_prayer(self, prayer_id: int, user_id: int) -> Optional[Dict[str, Any]]:
+        """기도 참여 (삭제되었거나 없는 기도 제목이면 None)"""
         await self.ensure_tables()
         client = await self.get_client()
         try:
             sql = """
                 INSERT OR IGNORE INTO prayer_participants (prayer_id, user_id)
-                VALUES (?, ?)
+                SELECT ?, ? WHERE EXISTS (SELECT 1 FROM prayers WHERE id = ? AND deleted_at IS NULL)
             """
-            result = await client.execute(sql, [prayer_id, user_id])
+            result = await client.execute(sql, [prayer_id, user_id, prayer_id])
+            if result.rows_affected == 0:
+                # 이미 참여했거나 기도 제목이 없음
+                existing = await client.execute(
+                    """
+                    SELECT pp.id FROM prayer_participants pp
+                    JOIN prayers p ON p.id = pp.prayer_id AND p.deleted_at IS NULL
+                    WHERE pp.prayer_id = ? AND pp.user_id = ?
+                    """,
+                    [prayer_id, user_id]
+                )
+                return {"id": existing.rows[0][0]} if existing.rows else None
+            table_versions.invalidate()
             return {"id": result.last_insert_rowid}
         finally:
             await client.close()
     
-    async def get_prayer_participants(self, prayer_id: int) -> List[Dict[str, Any]]:
-        """기도 참여자 목록 조회"""
+    async def get_prayer_participants(self, prayer_id: int) -> Optional[List[Dict[str, Any]]]:
+        """기도 참여자 목록 조회 (삭제되었거나 없는 기도 제목이면 None)"""
         await self.ensure_tables()
         client = await self.get_client()
         try:
+            # 기도 제목 행에 LEFT JOIN: 참여자가 없으면 빈 참여자 한 행, 기도 제목이 없으면 0행
             sql = """
-                SELECT pp.*, 'user' as username, 'User Name' as full_name
-                FROM prayer_participants pp
-                WHERE pp.prayer_id = ?
+                SELECT pp.id, p.id as prayer_id, pp.user_id, pp.participated_at,
+                       'user' as username, 'User Name' as full_name
+                FROM prayers p
+                LEFT JOIN prayer_participants pp ON pp.prayer_id = p.id
+                WHERE p.id = ? AND p.deleted_at IS NULL
                 ORDER BY pp.participated_at DESC
             """
             result = await client.execute(sql, [prayer_id])
-            return self._safe_dict_from_result(result, [
+            rows = self._safe_dict_from_result(result, [
                 'id', 'prayer_id', 'user_id', 'participated_at', 'username', 'full_name'
             ])
+            if not rows:
+                return None
+            return [row for row in rows if row["id"] is not None]
         finally:
             await client.close()
     
     # 기도 댓글 관련 메서드
-    async def create_prayer_comment(self, comment_data: Dict[str, Any]) -> Dict[str, Any]:
-        """기도 댓글 생성"""
+    async def create_prayer_comment(self, comment_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """기도 댓글 생성 (삭제되었거나 없는 기도 제목이면 None)"""
         await self.ensure_tables()
         client = await self.get_client()
         try:
             sql = """
                 INSERT INTO prayer_comments (prayer_id, user_id, comment, is_anonymous)
-                VALUES (?, ?, ?, ?)
+                SELECT ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM prayers WHERE id = ? AND deleted_at IS NULL)
             """
             result = await client.execute(sql, [
                 comment_data['prayer_id'],
                 comment_data['user_id'],
                 comment_data['comment'],
-                comment_data.get('is_anonymous', False)
+                comment_data.get('is_anonymous', False),
+                comment_data['prayer_id']
             ])
+            if result.rows_affected == 0:
+                return None
+            table_versions.invalidate()
             return {"id": result.last_insert_rowid}
         finally:
             await client.close()
     
-    async def get_prayer_comments(self, prayer_id: int) -> List[Dict[str, Any]]:
-        """기도 댓글 목록 조회"""
+    async def get_prayer_comments(self, prayer_id: int) -> Optional[List[Dict[str, Any]]]:
+        """기도 댓글 목록 조회 (삭제되었거나 없는 기도 제목이면 None)"""
         await self.ensure_tables()
         client = await self.get_client()
         try:
+            # 기도 제목 행에 LEFT JOIN: 댓글이 없으면 빈 댓글 한 행, 기도 제목이 없으면 0행
             sql = """
-                SELECT pc.*, 'user' as username, 'User Name' as full_name
-                FROM prayer_comments pc
-                WHERE pc.prayer_id = ?
+                SELECT pc.id, p.id as prayer_id, pc.user_id, pc.comment, pc.is_anonymous, pc.created_at,
+                       'user' as username, 'User Name' as full_name
+                FROM prayers p
+                LEFT JOIN prayer_comments pc ON pc.prayer_id = p.id
+                WHERE p.id = ? AND p.deleted_at IS NULL
                 ORDER BY pc.created_at ASC
             """
             result = await client.execute(sql, [prayer_id])
-            return self._safe_dict_from_result(result, [
+            rows = self._safe_dict_from_result(result, [
                 'id', 'prayer_id', 'user_id', 'comment', 'is_anonymous', 'created_at', 'username', 'full_name'
             ])
+            if not rows:
+                return None
+            return [row for row in rows if row["id"] is not None]
         finally:
             await client.close()
     
@@ -378,6 +385,7 @@ class PrayerService:
         try:
             sql = "DELETE FROM prayer_comments WHERE id = ? AND user_id = ?"
             result = await client.execute(sql, [comment_id, user_id])
+            table_versions.invalidate()
             return result.rows_affected > 0
         finally:
             await client.close()
@@ -0,0 +1,90 @@
+"""
+소프트 삭제 정리 서비스
+
+성도/가정/헌금/기도 삭제는 deleted_at 만 기록합니다 (migrations/0011_soft_delete.sql).
+보관 기간이 지난 행은 주기 작업(soft_delete_purge)이 실제로 삭제합니다.
+- 테이블마다 deleted_at 순으로 chunk_size 개씩 id 를 골라, 딸린 데이터 정리와 삭제를 한 batch 로 실행
+  (쓰기 잠금을 잡는 시간과 트랜잭션 크기가 묶음 크기로 제한되고, 묶음 사이에 다른 요청이 끼어들 수 있음)
+- 딸린 데이터: 기도의 참여/댓글과 성도 수정 이력은 삭제, 가정 구성원(소프트 삭제된 성도 포함)/가장 연결은 해제
+- 헌금 기록이 남아 있는 성도는 정리하지 않음 (소프트 삭제된 헌금도 실제로 삭제되기 전까지는 성도를 참조하므로,
+  먼저 지우면 외래 키를 강제하는 DB 에서는 삭제가 실패하고 그렇지 않은 DB 에서는 헌금이 없는 성도를 가리킴).
+  헌금이 먼저 정리되므로 함께 삭제된 헌금만 있는 성도는 같은 실행에서 정리됨
+- 실제 삭제는 deleted_rows 트리거로 증분 백업에 전달됨. 변경 이벤트는 소프트 삭제 때 이미 기록되었으므로 남기지 않음
+"""
+import asyncio
+from typing import Dict, Tuple
+
+from app.core.metrics import metrics
+from app.db.scheduler import BACKGROUND, db_lane
+from app.db.table_versions import table_versions
+
+# 정리 순서대로 (테이블, 추가 조건, 삭제 전에 같은 batch 에서 실행할 딸린 데이터 정리문)
+# 정리문의 {ids} 는 고른 id 수만큼의 ? 로 바뀜
+PURGE_PLANS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("offerings", "", ()),
+    ("prayers", "", (
+        "DELETE FROM prayer_comments WHERE prayer_id IN ({ids})",
+        "DELETE FROM prayer_participants WHERE prayer_id IN ({ids})",
+    )),
+    ("families", "", (
+        # 소프트 삭제된 성도도 아직 가정을 참조하므로 함께 연결 해제 (members.family_id 외래 키)
+        "UPDATE members SET family_id = NULL, family_role = NULL WHERE family_id IN ({ids})",
+    )),
+    ("members", "AND NOT EXISTS (SELECT 1 FROM offerings o WHERE o.member_id = members.id)", (
+        "DELETE FROM member_history WHERE member_id IN ({ids})",
+        "UPDATE families SET head_member_id = NULL WHERE head_member_id IN ({ids})",
+    )),
+)
+
+
+class PurgeService:
+    async def get_client(self):
+        """LibSQL 클라이언트 반환"""
+        # 순환 import 방지를 위해 지연 import
+        from app.services.libsql_service import libsql_service
+        return await libsql_service.get_client()
+
+    async def purge(self, days: int, chunk_size: int = 500) -> Dict[str, int]:
+        """삭제 후 days 일 지난 행을 chunk_size 개씩 실제 삭제, 테이블별 삭제 수 반환"""
+        purged: Dict[str, int] = {}
+        client = await self.get_client()
+        try:
+            with db_lane(BACKGROUND):
+                for table, condition, children in PURGE_PLANS:
+                    purged[table] = await self._purge_table(client, table, condition, children, days, chunk_size)
+        finally:
+            await client.close()
+        if any(purged.values()):
+            # 가정 정리의 구성원 연결 해제는 조회 결과가 바뀜
+            table_versions.invalidate()
+        return purged
+
+    async def _purge_table(self, client, table: str, condition: str, children: Tuple[str, ...],
+                           days: int, chunk_size: int) -> int:
+        total = 0
+        while True:
+            result = await client.execute(
+                f"""
+                SELECT id FROM {table}
+                WHERE deleted_at IS NOT NULL AND deleted_at < datetime('now', ?) {condition}
+                ORDER BY deleted_at LIMIT ?
+                """,
+                [f"-{int(days)} days", chunk_size]
+            )
+            ids = [row[0] for row in result.rows]
+            if not ids:
+                return total
+            marks = ", ".join("?" * len(ids))
+            statements = [(sql.format(ids=marks), ids) for sql in children]
+            statements.append((f"DELETE FROM {table} WHERE id IN ({marks})", ids))
+            await client.batch(statements)
+            total += len(ids)
+            metrics.incr(f"purge.{table}", len(ids))
+            if len(ids) < chunk_size:
+                return total
+            # 묶음 사이에 다른 작업에 차례를 넘김
+            await asyncio.sleep(0)
+
+
+# 전역 소프트 삭제 정리 서비스 인스턴스
+purge_service = PurgeService()
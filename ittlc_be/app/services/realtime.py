@@ -0,0 +1,275 @@
+"""
+실시간 알림 허브 (WebSocket / SSE)
+
+기도 참여와 댓글을 폴링 없이 받을 수 있도록 채널별로 메시지를 밀어 줍니다.
+- 채널: prayer:{기도 id} (참여자 수, 댓글, 기도 상태 변경), user:{사용자 id} (내 기도에 달린 참여/댓글)
+- 메시지 원천: 변경 이벤트 디스패처(outbox)의 prayers / prayer_participants / prayer_comments 이벤트.
+  묶음마다 필요한 정보(참여자 수, 새 댓글, 기도 작성자)를 쿼리 한두 번으로 모아 조회
+- 병합: 연결마다 보낼 메시지를 키(예: 기도별 참여자 수)로 모아 두고 coalesce_window 동안 모인 것을
+  한 프레임(JSON 배열)으로 전송. 같은 키의 새 메시지는 이전 것을 대체
+- 배압: 연결마다 대기 메시지 수를 max_pending 으로 제한. 넘치면 대기 메시지를 버리고 resync 하나만 보내
+  클라이언트가 다시 조회하게 함. 전송이 send_timeout 안에 끝나지 않는 연결은 끊음
+- 유휴 연결은 구독 채널 집합과 빈 대기열만 유지하고 하트비트 때만 깨어남
+"""
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set
+
+import orjson
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.services.outbox import outbox_dispatcher
+
+logger = logging.getLogger(__name__)
+
+RESYNC = {"type": "resync"}
+
+
+def prayer_channel(prayer_id: int) -> str:
+    return f"prayer:{prayer_id}"
+
+
+def user_channel(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+class Connection:
+    """구독자 한 명 (전송 방식과 무관한 대기열)"""
+    __slots__ = ("id", "user_id", "channels", "pending", "overflowed", "closed", "_ready")
+
+    def __init__(self, connection_id: int, user_id: Optional[int] = None):
+        self.id = connection_id
+        self.user_id = user_id
+        self.channels: Set[str] = set()
+        self.pending: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self.overflowed = False
+        self.closed = False
+        self._ready = asyncio.Event()
+
+    def push(self, key: Hashable, message: Dict[str, Any], max_pending: int):
+        """메시지 적재 (같은 키는 최신 메시지로 대체, 한도를 넘으면 resync 하나로 줄임)"""
+        if self.closed:
+            return
+        if self.overflowed:
+            return
+        self.pending.pop(key, None)
+        self.pending[key] = message
+        if len(self.pending) > max_pending:
+            self.pending.clear()
+            self.overflowed = True
+            metrics.incr("realtime.overflows")
+        self._ready.set()
+
+    async def next_batch(self, timeout: float, coalesce_window: float) -> List[Dict[str, Any]]:
+        """보낼 메시지 묶음 (timeout 동안 없으면 빈 목록 = 하트비트 차례)"""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        if coalesce_window > 0:
+            # 짧은 시간 안에 이어지는 변경을 한 프레임으로 병합
+            await asyncio.sleep(coalesce_window)
+        self._ready.clear()
+        if self.overflowed:
+            self.overflowed = False
+            return [RESYNC]
+        batch = list(self.pending.values())
+        self.pending.clear()
+        return batch
+
+    def close(self):
+        self.closed = True
+        self._ready.set()
+
+
+class RealtimeHub:
+    def __init__(self, max_connections: int = 5000, max_pending: int = 100, coalesce_window: float = 0.1,
+                 heartbeat_interval: float = 25.0, send_timeout: float = 10.0):
+        self.max_connections = max_connections
+        self.max_pending = max_pending
+        self.coalesce_window = coalesce_window
+        self.heartbeat_interval = heartbeat_interval
+        self.send_timeout = send_timeout
+        self._channels: Dict[str, Set[Connection]] = {}
+        self._connections: Dict[int, Connection] = {}
+        self._next_id = 0
+
+    async def get_client(self):
+        """LibSQL 클라이언트 반환"""
+        # 순환 import 방지를 위해 지연 import
+        from app.services.libsql_service import libsql_service
+        return await libsql_service.get_client()
+
+    @property
+    def connection_count(self) -> int:
+        return len(self._connections)
+
+    def connect(self, user_id: Optional[int] = None) -> Optional[Connection]:
+        """연결 등록 (한도를 넘으면 None), 로그인한 사용자는 자기 채널을 자동 구독"""
+        if len(self._connections) >= self.max_connections:
+            metrics.incr("realtime.rejected")
+            return None
+        self._next_id += 1
+        connection = Connection(self._next_id, user_id)
+        self._connections[connection.id] = connection
+        if user_id is not None:
+            self.subscribe(connection, user_channel(user_id))
+        metrics.set_gauge("realtime.connections", len(self._connections))
+        return connection
+
+    def disconnect(self, connection: Connection):
+        connection.close()
+        for channel in list(connection.channels):
+            self.unsubscribe(connection, channel)
+        self._connections.pop(connection.id, None)
+        metrics.set_gauge("realtime.connections", len(self._connections))
+
+    def subscribe(self, connection: Connection, channel: str):
+        connection.channels.add(channel)
+        self._channels.setdefault(channel, set()).add(connection)
+
+    def unsubscribe(self, connection: Connection, channel: str):
+        connection.channels.discard(channel)
+        subscribers = self._channels.get(channel)
+        if subscribers is not None:
+            subscribers.discard(connection)
+            if not subscribers:
+                del self._channels[channel]
+
+    def publish(self, channel: str, message: Dict[str, Any], key: Optional[Hashable] = None):
+        """채널 구독자 모두에게 메시지 적재 (key 가 같은 대기 메시지는 대체)"""
+        subscribers = self._channels.get(channel)
+        if not subscribers:
+            return
+        message = {"channel": channel, **message}
+        key = (channel, key) if key is not None else (channel, id(message))
+        for connection in subscribers:
+            connection.push(key, message, self.max_pending)
+        metrics.incr("realtime.published")
+
+    def publish_to(self, connection: Connection, message: Dict[str, Any]):
+        """한 연결에만 메시지 적재 (구독 응답 등)"""
+        connection.push(("direct", id(message)), message, self.max_pending)
+
+    async def can_subscribe_prayer(self, prayer_id: int, user_id: Optional[int]) -> bool:
+        """기도 채널 구독 권한 (공개 기도는 누구나, 교인 공개는 로그인 사용자, 비공개는 작성자만)"""
+        client = await self.get_client()
+        try:
+            result = await client.execute(
+                "SELECT visibility, created_by FROM prayers WHERE id = ? AND deleted_at IS NULL", [prayer_id]
+            )
+        finally:
+            await client.close()
+        if not result.rows:
+            return False
+        visibility, created_by = result.rows[0]
+        if visibility == "public":
+            return True
+        if visibility == "members":
+            return user_id is not None
+        return user_id is not None and user_id == created_by
+
+    async def stream(self, connection: Connection):
+        """보낼 메시지 묶음을 차례로 내보냄 (빈 목록은 하트비트), 연결이 닫히면 종료"""
+        while not connection.closed:
+            batch = await connection.next_batch(self.heartbeat_interval, self.coalesce_window)
+            if connection.closed:
+                return
+            if batch:
+                metrics.incr("realtime.frames")
+            yield batch
+
+    def encode(self, batch: List[Dict[str, Any]]) -> bytes:
+        return orjson.dumps(batch)
+
+    # 변경 이벤트 → 채널 메시지
+    async def on_changes(self, events: List[Dict[str, Any]]):
+        """outbox 구독자: 기도 관련 변경을 채널로 전달 (구독자가 없으면 조회도 하지 않음)"""
+        if not self._channels:
+            return
+        prayer_ids: Set[int] = set()
+        comment_ids: Set[int] = set()
+        for event in events:
+            prayer_id = event["row_id"] if event["table_name"] == "prayers" else event["parent_id"]
+            if prayer_id is not None:
+                prayer_ids.add(prayer_id)
+            if event["table_name"] == "prayer_comments" and event["op"] != "delete":
+                comment_ids.add(event["row_id"])
+        if not prayer_ids:
+            return
+        prayers, counts, comments = await self._load(prayer_ids, comment_ids)
+
+        for event in events:
+            table, op = event["table_name"], event["op"]
+            prayer_id = event["row_id"] if table == "prayers" else event["parent_id"]
+            owner = prayers.get(prayer_id, {}).get("created_by")
+            if table == "prayers":
+                message = {"type": "prayer", "op": op, "prayer_id": prayer_id,
+                           "status": prayers.get(prayer_id, {}).get("status"),
+                           "changed": event["changed_columns"], "version": event["version"]}
+                self.publish(prayer_channel(prayer_id), message, key="prayer")
+            elif table == "prayer_participants":
+                message = {"type": "participants", "prayer_id": prayer_id, "count": counts.get(prayer_id, 0)}
+                # 참여자 수는 마지막 값만 의미가 있으므로 기도별로 병합
+                self.publish(prayer_channel(prayer_id), message, key="participants")
+                if owner is not None and owner != event["user_id"]:
+                    self.publish(user_channel(owner), message, key=("participants", prayer_id))
+            elif table == "prayer_comments":
+                comment = comments.get(event["row_id"]) if op != "delete" else None
+                message = {"type": "comment", "op": op, "prayer_id": prayer_id, "comment_id": event["row_id"],
+                           "comment": comment}
+                self.publish(prayer_channel(prayer_id), message, key=("comment", event["row_id"]))
+                if op == "insert" and owner is not None and owner != event["user_id"]:
+                    self.publish(user_channel(owner), message, key=("comment", event["row_id"]))
+
+    async def _load(self, prayer_ids: Iterable[int], comment_ids: Iterable[int]):
+        """묶음에 필요한 기도 작성자/상태, 참여자 수, 댓글 내용을 IN 조회로 모아서 읽기"""
+        prayer_ids, comment_ids = sorted(prayer_ids), sorted(comment_ids)
+        marks = ", ".join("?" * len(prayer_ids))
+        statements = [
+            (f"SELECT id, created_by, status FROM prayers WHERE id IN ({marks})", prayer_ids),
+            (f"""
+             SELECT prayer_id, COUNT(*) FROM prayer_participants
+             WHERE prayer_id IN ({marks}) GROUP BY prayer_id
+             """, prayer_ids),
+        ]
+        if comment_ids:
+            statements.append((f"""
+                SELECT pc.id, pc.prayer_id, pc.user_id, pc.comment, pc.is_anonymous, pc.created_at,
+                       u.username, u.full_name
+                FROM prayer_comments pc
+                JOIN users u ON pc.user_id = u.id
+                WHERE pc.id IN ({', '.join('?' * len(comment_ids))})
+                """, comment_ids))
+        client = await self.get_client()
+        try:
+            # 읽기 전용이므로 batch(쓰기 트랜잭션) 대신 개별 조회 (읽기 복제본/연결 풀 사용)
+            results = [await client.execute(sql, params) for sql, params in statements]
+        finally:
+            await client.close()
+        prayers = {row[0]: {"created_by": row[1], "status": row[2]} for row in results[0].rows}
+        counts = {row[0]: row[1] for row in results[1].rows}
+        comments = {}
+        if comment_ids:
+            for row in results[2].rows:
+                comment = dict(zip(("id", "prayer_id", "user_id", "comment", "is_anonymous", "created_at",
+                                    "username", "full_name"), row))
+                if comment["is_anonymous"]:
+                    # 익명 댓글은 작성자 정보 없이 전송
+                    comment.update(user_id=None, username=None, full_name=None)
+                comments[comment["id"]] = comment
+        return prayers, counts, comments
+
+
+# 전역 실시간 허브 인스턴스
+realtime_hub = RealtimeHub(
+    max_connections=settings.REALTIME_MAX_CONNECTIONS,
+    max_pending=settings.REALTIME_MAX_PENDING,
+    coalesce_window=settings.REALTIME_COALESCE_WINDOW,
+    heartbeat_interval=settings.REALTIME_HEARTBEAT_INTERVAL,
+    send_timeout=settings.REALTIME_SEND_TIMEOUT,
+)
+outbox_dispatcher.subscribe("realtime", realtime_hub.on_changes,
+                            tables=("prayers", "prayer_participants", "prayer_comments"))
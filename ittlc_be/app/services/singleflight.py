@@ -0,0 +1,117 @@
+"""
+동일 조회 요청 병합 (single-flight)
+
+같은 쿼리 지문(메서드 + 인자)으로 동시에 들어온 호출은 진행 중인 DB 호출 하나를
+함께 기다립니다. ttl 을 주면 완료된 결과를 그 시간 동안 재사용합니다(micro-TTL).
+반환값은 여러 호출자가 공유하므로 읽기 전용으로 다뤄야 합니다.
+
+병합된 호출은 첫 호출자의 contextvars(DB 레인, primary 힌트, 세션)로 실행되므로
+- DB 레인은 쿼리 지문에 포함 (background 작업과 요청이 서로의 우선순위로 실행되지 않음)
+- 읽기가 primary 로 고정된 호출자(같은 요청/세션의 쓰기 이후, read_primary 힌트)는 병합하지 않고
+  직접 실행 (다른 호출자가 복제본에서, 또는 자기 쓰기 전에 시작한 결과를 받지 않도록)
+"""
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.metrics import metrics
+from app.db.replica import session_recently_wrote
+from app.db.router import primary_hinted
+from app.db.scheduler import current_lane
+from app.db.table_versions import table_versions
+
+
+def _freeze(value: Any) -> Hashable:
+    """인자를 해시 가능한 형태로 변환"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _pinned_to_primary() -> bool:
+    """현재 호출자의 읽기가 primary 로 가야 하는지"""
+    return primary_hinted() or session_recently_wrote()
+
+
+class SingleFlight:
+    def __init__(self, ttl: float = 0.0):
+        self.ttl = ttl
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._results: Dict[Hashable, Tuple[float, Any]] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]],
+                 ttl: Optional[float] = None) -> Any:
+        """key 가 같은 동시 호출을 하나의 func() 실행으로 병합"""
+        ttl = self.ttl if ttl is None else ttl
+        metrics.incr("singleflight.calls")
+
+        if _pinned_to_primary():
+            metrics.incr("singleflight.bypassed")
+            return await func()
+
+        if ttl > 0:
+            cached = self._results.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._record_shared("singleflight.ttl_hits")
+                    return cached[1]
+                del self._results[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._record_shared("singleflight.coalesced")
+        else:
+            # 첫 호출자가 취소되어도 나머지 호출자가 결과를 받도록 별도 태스크로 실행
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish, key, ttl))
+            self._update_rate()
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, ttl: float, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        if task.exception() is None and ttl > 0:
+            self._results[key] = (time.monotonic() + ttl, task.result())
+
+    def _record_shared(self, counter: str):
+        metrics.incr(counter)
+        self._update_rate()
+
+    @staticmethod
+    def _update_rate():
+        calls = metrics.counter("singleflight.calls")
+        shared = metrics.counter("singleflight.coalesced") + metrics.counter("singleflight.ttl_hits")
+        metrics.set_gauge("singleflight.coalescing_rate", round(shared / calls, 4) if calls else 0.0)
+
+    def forget(self, prefix: Optional[str] = None):
+        """micro-TTL 결과 폐기 (prefix 지정 시 해당 메서드 결과만)"""
+        if prefix is None:
+            self._results.clear()
+            return
+        for key in [key for key in self._results if isinstance(key, tuple) and key and key[0] == prefix]:
+            del self._results[key]
+
+    def coalesce(self, name: Optional[str] = None, ttl: Optional[float] = None):
+        """서비스 메서드용 데코레이터 (self 를 제외한 인자로 쿼리 지문 생성)"""
+        def decorator(method):
+            prefix = name or method.__qualname__
+
+            @functools.wraps(method)
+            async def wrapper(service, *args, **kwargs):
+                key = (prefix, current_lane(), _freeze(args), _freeze(kwargs))
+                return await self.do(key, lambda: method(service, *args, **kwargs), ttl=ttl)
+            return wrapper
+        return decorator
+
+
+# 전역 single-flight 인스턴스
+singleflight = SingleFlight()
+
+# 쓰기가 일어나면 micro-TTL 결과를 버려 자기 쓰기를 바로 읽을 수 있게 함
+table_versions.on_invalidate(singleflight.forget)
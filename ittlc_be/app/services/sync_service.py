@@ -0,0 +1,204 @@
+"""
+델타 동기화 서비스 (GET /sync)
+
+프론트엔드 로컬 캐시가 마지막 동기화 이후 바뀐 행만 받아 가도록 change_events(변경 이벤트 로그)를 읽습니다.
+- 처음(since 없음): 동기화 대상 테이블을 id 순으로 나눠 보내는 스냅샷 단계. 시작 시점의 이벤트 위치를
+  토큰에 담아 두고 스냅샷이 끝나면 그 위치부터 델타 단계로 이어감 (스냅샷 중 바뀐 행은 델타로 다시 전달)
+- 델타: 이벤트를 id 순으로 읽어 행마다 현재 값(또는 삭제 표시)을 한 번만 전달. 소프트 삭제된 행도 삭제로 전달
+- 참조 데이터(헌금 종류, 기도 카테고리)는 작아서 table_versions 값이 바뀌었을 때 통째로 전달
+- 페이지는 응답 크기(max_bytes)로 나눔. has_more 이면 받은 token 으로 바로 다시 요청
+- 토큰의 위치가 보관 기간이 지나 정리된 이벤트를 가리키면 reset 과 함께 스냅샷부터 다시 시작
+"""
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+from app.core.metrics import metrics
+from app.db.mapping import as_dicts
+
+# 행 단위로 동기화하는 테이블 (change_events 를 기록하는 테이블이어야 함)
+SYNC_TABLES = ("families", "members", "prayers", "offerings")
+# 통째로 보내는 참조 데이터
+REFERENCE_TABLES = ("offering_types", "prayer_categories")
+
+# 스냅샷 단계에서 한 번에 읽는 행 수 / 델타 단계에서 한 번에 읽는 이벤트 수
+SNAPSHOT_READ_SIZE = 500
+EVENT_READ_SIZE = 1000
+
+
+class SyncTokenError(ValueError):
+    """해석할 수 없는 동기화 토큰"""
+
+
+def encode_token(state: Dict[str, Any]) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps(state)).decode().rstrip("=")
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    try:
+        state = orjson.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (binascii.Error, orjson.JSONDecodeError, ValueError):
+        raise SyncTokenError("동기화 토큰을 해석할 수 없습니다")
+    if not isinstance(state, dict) or not isinstance(state.get("e"), int):
+        raise SyncTokenError("동기화 토큰을 해석할 수 없습니다")
+    return state
+
+
+class SyncService:
+    async def get_client(self):
+        """LibSQL 클라이언트 반환"""
+        # 순환 import 방지를 위해 지연 import
+        from app.services.libsql_service import libsql_service
+        return await libsql_service.get_client()
+
+    async def sync(self, since: Optional[str], max_bytes: int) -> Dict[str, Any]:
+        """since 토큰 이후의 변경 한 페이지"""
+        client = await self.get_client()
+        try:
+            reset = False
+            if since:
+                state = decode_token(since)
+                if "s" not in state and await self._expired(client, state["e"]):
+                    reset = True
+                    state = None
+            else:
+                state = None
+            if state is None:
+                latest = await client.execute("SELECT COALESCE(MAX(id), 0) FROM change_events")
+                state = {"e": latest.rows[0][0], "s": 0, "k": 0, "r": {}}
+
+            response: Dict[str, Any] = {"changes": {}, "deleted": {}, "reference": {}, "reset": reset or not since}
+            budget = _Budget(max_bytes)
+            await self._reference(client, state, response, budget)
+            if "s" in state:
+                has_more = await self._snapshot(client, state, response, budget)
+                metrics.incr("sync.snapshot_pages")
+            else:
+                has_more = await self._delta(client, state, response, budget)
+                metrics.incr("sync.delta_pages")
+            metrics.observe("sync.page_bytes", budget.used)
+            response["has_more"] = has_more
+            response["token"] = encode_token(state)
+            return response
+        finally:
+            await client.close()
+
+    async def _expired(self, client, event_id: int) -> bool:
+        """토큰 위치 다음 이벤트가 이미 정리되었는지 (outbox_cleanup)"""
+        result = await client.execute(
+            """
+            SELECT MIN(id), (SELECT seq FROM sqlite_sequence WHERE name = 'change_events')
+            FROM change_events
+            """
+        )
+        oldest, last = result.rows[0]
+        if oldest is not None:
+            return oldest > event_id + 1
+        return (last or 0) > event_id
+
+    async def _reference(self, client, state: Dict[str, Any], response: Dict[str, Any], budget: "_Budget"):
+        """버전이 바뀐 참조 테이블 전체 전달"""
+        result = await client.execute(
+            f"SELECT table_name, version FROM table_versions WHERE table_name IN "
+            f"({', '.join('?' * len(REFERENCE_TABLES))})",
+            list(REFERENCE_TABLES)
+        )
+        known = state.setdefault("r", {})
+        for table, version in result.rows:
+            if known.get(table) == version:
+                continue
+            rows = as_dicts(await client.execute(f"SELECT * FROM {table} ORDER BY id"))
+            response["reference"][table] = rows
+            budget.add(rows)
+            known[table] = version
+
+    async def _snapshot(self, client, state: Dict[str, Any], response: Dict[str, Any], budget: "_Budget") -> bool:
+        """스냅샷 단계: 테이블마다 id 순으로 예산만큼 전달, 끝나면 델타 단계로 전환"""
+        while state["s"] < len(SYNC_TABLES):
+            table = SYNC_TABLES[state["s"]]
+            rows = as_dicts(await client.execute(
+                f"SELECT * FROM {table} WHERE id > ? AND deleted_at IS NULL ORDER BY id LIMIT ?",
+                [state["k"], SNAPSHOT_READ_SIZE]
+            ))
+            for row in rows:
+                if budget.full:
+                    return True
+                response["changes"].setdefault(table, []).append(row)
+                budget.add(row)
+                state["k"] = row["id"]
+            if len(rows) < SNAPSHOT_READ_SIZE:
+                state["s"] += 1
+                state["k"] = 0
+            if budget.full:
+                break
+        if state["s"] < len(SYNC_TABLES):
+            return True
+        del state["s"], state["k"]
+        return False
+
+    async def _delta(self, client, state: Dict[str, Any], response: Dict[str, Any], budget: "_Budget") -> bool:
+        """델타 단계: 이벤트 순서대로 행마다 현재 값 또는 삭제 표시를 한 번만 전달"""
+        result = await client.execute(
+            "SELECT id, table_name, row_id FROM change_events WHERE id > ? ORDER BY id LIMIT ?",
+            [state["e"], EVENT_READ_SIZE]
+        )
+        has_more = len(result.rows) == EVENT_READ_SIZE
+        events: List[Tuple[int, str, int]] = [tuple(row) for row in result.rows if row[1] in SYNC_TABLES]
+        if not events:
+            # 동기화 대상이 아닌 테이블(기도 참여, 댓글 등)의 이벤트만 있으면 위치만 이동
+            if result.rows:
+                state["e"] = result.rows[-1][0]
+            return has_more
+
+        # 이벤트에 나온 행의 현재 값을 테이블별 IN 조회로 한 번에 읽음
+        wanted: Dict[str, set] = {}
+        for _, table, row_id in events:
+            wanted.setdefault(table, set()).add(row_id)
+        current: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        for table, ids in wanted.items():
+            ids = sorted(ids)
+            rows = as_dicts(await client.execute(
+                f"SELECT * FROM {table} WHERE id IN ({', '.join('?' * len(ids))})", ids
+            ))
+            current[table] = {row["id"]: row for row in rows}
+
+        sent = set()
+        for event_id, table, row_id in events:
+            if (table, row_id) in sent:
+                state["e"] = event_id
+                continue
+            if budget.full:
+                return True
+            row = current[table].get(row_id)
+            if row is None or row.get("deleted_at") is not None:
+                response["deleted"].setdefault(table, []).append(row_id)
+                budget.add(row_id)
+            else:
+                response["changes"].setdefault(table, []).append(row)
+                budget.add(row)
+            sent.add((table, row_id))
+            state["e"] = event_id
+        state["e"] = result.rows[-1][0]
+        return has_more
+
+
+class _Budget:
+    """응답 크기 예산 (직렬화한 크기 기준, 최소 한 항목은 항상 포함)"""
+    __slots__ = ("limit", "used")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+
+    @property
+    def full(self) -> bool:
+        return self.used >= self.limit
+
+    def add(self, value: Any):
+        self.used += len(orjson.dumps(value, default=str))
+
+
+# 전역 동기화 서비스 인스턴스
+sync_service = SyncService()
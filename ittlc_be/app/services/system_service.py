@@ -1,30 +1,50 @@
 """
 시스템 관리 서비스
 """
-import os
+from datetime import datetime
 from typing import Optional, List, Dict, Any
-from libsql_client import create_client
+from app.db.engine import get_engine
+from app.db.mapping import Record, as_dicts, as_records, first_dict
+from app.db.scheduler import BACKGROUND, db_lane
+from app.db.statements import statements
 from dotenv import load_dotenv
 from pathlib import Path
+from app.db.table_versions import table_versions
+from app.services.backup_service import backup_service
+from app.services.dashboard_service import dashboard_materializer
+from app.services.job_scheduler import job_scheduler
+from app.services.singleflight import singleflight
 
 # .env 파일 로드
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(env_path)
 
+# 시스템 로그 목록 조회문 (필터 조합별로 한 번만 생성)
+LOG_LIST_SQL = statements.define(
+    "system_logs.list",
+    """
+    SELECT sl.*, u.username
+    FROM system_logs sl
+    LEFT JOIN users u ON sl.user_id = u.id
+    """,
+    {
+        "log_level": "sl.log_level = ?",
+        "log_type": "sl.log_type = ?",
+        "user_id": "sl.user_id = ?",
+        "start_date": "sl.created_at >= ?",
+        "end_date": "sl.created_at <= ?",
+    },
+    "ORDER BY sl.created_at DESC LIMIT ? OFFSET ?"
+)
+
 class SystemService:
     def __init__(self):
-        self.libsql_url = os.getenv("LIBSQL_URL")
-        self.auth_token = os.getenv("LIBSQL_AUTH_TOKEN")
-        
-        if not self.libsql_url:
-            raise ValueError("LIBSQL_URL이 설정되지 않았습니다.")
-        
-        # HTTP URL로 변환
-        self.http_url = self.libsql_url.replace("libsql://", "https://")
+        # 설정에 따라 Turso(HTTP) / 로컬 aiosqlite / 읽기 복제본 엔진 사용
+        self.engine = get_engine()
     
     async def get_client(self):
-        """LibSQL 클라이언트 반환"""
-        return create_client(url=self.http_url, auth_token=self.auth_token)
+        """데이터베이스 클라이언트 반환"""
+        return await self.engine.get_client()
     
     # 시스템 설정 관련 메서드
     async def get_setting(self, setting_key: str) -> Optional[Dict[str, Any]]:
@@ -34,7 +54,7 @@ class SystemService:
             sql = "SELECT * FROM system_settings WHERE setting_key = ?"
             result = await client.execute(sql, [setting_key])
             if result.rows:
-                return dict(zip([col.name for col in result.columns], result.rows[0]))
+                return first_dict(result)
             return None
         finally:
             await client.close()
@@ -49,7 +69,7 @@ class SystemService:
             LIMIT ? OFFSET ?
             """
             result = await client.execute(sql, [limit, skip])
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_dicts(result)
         finally:
             await client.close()
     
@@ -64,6 +84,7 @@ class SystemService:
             """
             result = await client.execute(sql, [setting_value, setting_key])
             
+            table_versions.invalidate()
             if result.rows_affected > 0:
                 return await self.get_setting(setting_key)
             return None
@@ -84,6 +105,7 @@ class SystemService:
                 setting_data.get('setting_type', 'string'),
                 setting_data.get('description')
             ])
+            table_versions.invalidate()
             return {"id": result.last_insert_rowid}
         finally:
             await client.close()
@@ -94,6 +116,7 @@ class SystemService:
         try:
             sql = "DELETE FROM system_settings WHERE setting_key = ?"
             result = await client.execute(sql, [setting_key])
+            table_versions.invalidate()
             return result.rows_affected > 0
         finally:
             await client.close()
@@ -124,8 +147,10 @@ class SystemService:
     async def get_logs(self, skip: int = 0, limit: int = 50,
                       log_level: Optional[str] = None,
                       log_type: Optional[str] = None,
-                      user_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        """시스템 로그 목록 조회"""
+                      user_id: Optional[int] = None,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None) -> List[Record]:
+        """시스템 로그 목록 조회 (읽기 전용 레코드)"""
         client = await self.get_client()
         try:
             # 먼저 system_logs 테이블이 존재하는지 확인
@@ -139,33 +164,18 @@ class SystemService:
             except:
                 return []
             
-            sql = """
-            SELECT sl.*, u.username
-            FROM system_logs sl
-            LEFT JOIN users u ON sl.user_id = u.id
-            WHERE 1=1
-            """
-            params = []
-            
-            if log_level:
-                sql += " AND sl.log_level = ?"
-                params.append(log_level)
-            
-            if log_type:
-                sql += " AND sl.log_type = ?"
-                params.append(log_type)
-            
-            if user_id:
-                sql += " AND sl.user_id = ?"
-                params.append(user_id)
-            
-            sql += " ORDER BY sl.created_at DESC LIMIT ? OFFSET ?"
-            params.extend([limit, skip])
+            sql, params = LOG_LIST_SQL.bind({
+                "log_level": log_level,
+                "log_type": log_type,
+                "user_id": user_id,
+                "start_date": start_date.strftime("%Y-%m-%d %H:%M:%S") if start_date else None,
+                "end_date": end_date.strftime("%Y-%m-%d %H:%M:%S") if end_date else None,
+            }, limit, skip)
             
             try:
                 result = await client.execute(sql, params)
                 if result.rows:
-                    return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+                    return as_records(result)
                 else:
                     return []
             except Exception as e:
@@ -178,14 +188,15 @@ class SystemService:
             await client.close()
     
     async def clear_old_logs(self, days: int = 90) -> int:
-        """오래된 로그 정리"""
+        """오래된 로그 정리 (보관 정리는 백그라운드 레인에서 실행)"""
         client = await self.get_client()
         try:
             sql = """
             DELETE FROM system_logs
             WHERE created_at < datetime('now', '-{} days')
             """.format(days)
-            result = await client.execute(sql)
+            with db_lane(BACKGROUND):
+                result = await client.execute(sql)
             return result.rows_affected
         finally:
             await client.close()
@@ -232,7 +243,7 @@ class SystemService:
             LIMIT ? OFFSET ?
             """
             result = await client.execute(sql, [limit, skip])
-            return [dict(zip([col.name for col in result.columns], row)) for row in result.rows]
+            return as_dicts(result)
         finally:
             await client.close()
     
@@ -247,49 +258,14 @@ class SystemService:
             await client.close()
     
     # 대시보드 통계 관련 메서드
+    @singleflight.coalesce()
     async def get_dashboard_stats(self) -> Dict[str, Any]:
-        """대시보드 통계 조회"""
-        client = await self.get_client()
-        try:
-            # 성도 수 (is_active 컬럼 없이 전체 카운트)
-            member_count_result = await client.execute("SELECT COUNT(*) FROM members")
-            member_count = member_count_result.rows[0][0] if member_count_result.rows else 0
-            
-            # 가족 수 (families 테이블이 없을 수 있으므로 안전하게 처리)
-            try:
-                family_count_result = await client.execute("SELECT COUNT(*) FROM families")
-                family_count = family_count_result.rows[0][0] if family_count_result.rows else 0
-            except:
-                family_count = 0
-            
-            # 이달의 기도 제목 수
-            try:
-                prayer_count_result = await client.execute("""
-                    SELECT COUNT(*) FROM prayers
-                    WHERE strftime('%Y-%m', created_at) = strftime('%Y-%m', 'now')
-                """)
-                prayer_count = prayer_count_result.rows[0][0] if prayer_count_result.rows else 0
-            except:
-                prayer_count = 0
-            
-            # 이달의 헌금 총액
-            try:
-                offering_amount_result = await client.execute("""
-                    SELECT COALESCE(SUM(amount), 0) FROM offerings
-                    WHERE strftime('%Y-%m', offering_date) = strftime('%Y-%m', 'now')
-                """)
-                offering_amount = offering_amount_result.rows[0][0] if offering_amount_result.rows else 0
-            except:
-                offering_amount = 0
-            
-            return {
-                "member_count": member_count,
-                "family_count": family_count,
-                "monthly_prayer_count": prayer_count,
-                "monthly_offering_amount": offering_amount
-            }
-        finally:
-            await client.close()
+        """대시보드 통계 조회 (materializer 메모리 값)"""
+        return await dashboard_materializer.get_stats()
+    
+    async def get_dashboard_history(self, days: int = 30) -> List[Dict[str, Any]]:
+        """대시보드 통계 스냅샷 이력 조회"""
+        return await dashboard_materializer.get_history(days)
 
     # 엔드포인트에서 사용할 별칭 메서드들
     async def get_system_settings(self) -> List[Dict[str, Any]]:
@@ -317,8 +293,32 @@ class SystemService:
         return await self.create_log(log_data)
     
     async def create_backup(self, backup_data: Dict[str, Any]) -> Dict[str, Any]:
-        """백업 생성 (엔드포인트용 별칭)"""
-        return await self.create_backup_record(backup_data)
+        """백업 시작 (기록을 in_progress 로 만들고 실제 백업은 백그라운드에서 실행)"""
+        return await backup_service.create_backup(
+            backup_type=backup_data.get('backup_type', 'manual'),
+            created_by=backup_data.get('created_by'),
+            kind=backup_data.get('kind', 'auto')
+        )
+
+    async def get_backup(self, backup_id: int) -> Optional[Dict[str, Any]]:
+        """백업 기록 조회 (엔드포인트용 별칭)"""
+        return await backup_service.get_backup(backup_id)
+
+    # 주기 작업 관련 메서드
+    def get_jobs(self) -> List[Dict[str, Any]]:
+        """등록된 주기 작업 목록"""
+        return job_scheduler.describe()
+
+    def run_job(self, job_name: str) -> Optional[Dict[str, Any]]:
+        """주기 작업 즉시 실행 (없는 작업이면 None)"""
+        try:
+            return job_scheduler.trigger(job_name)
+        except KeyError:
+            return None
+
+    async def get_job_runs(self, job_name: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """주기 작업 실행 이력"""
+        return await job_scheduler.history(job_name, limit)
 
 # 전역 시스템 서비스 인스턴스
 system_service = SystemService() 
\ No newline at end of file
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+API 엔드포인트 벤치마크
+
+합성 데이터(synthetic_data.py)로 채운 로컬 SQLite 파일에 대해 FastAPI 앱을 프로세스 안에서 띄우고
+(httpx ASGITransport, 네트워크 없음) app/api/v1/api.py 의 모든 라우터를 동시 클라이언트로 호출합니다.
+시나리오마다 처리량, p50/p95/p99 지연, 요청당 쿼리 수를 JSON 으로 기록하고
+저장된 기준선(baselines/endpoints.json, 머신별 로컬 파일로 커밋하지 않음)과 비교해 회귀가 있으면 종료 코드 1을 반환합니다.
+
+- scale 마다 별도 프로세스에서 실행 (전역 엔진/서비스가 DB 경로를 고정하므로)
+- 시드 DB는 data/bench/ 에 한 번 만들어 두고, 실행마다 임시 복사본을 사용 (쓰기 시나리오가 원본을 바꾸지 않도록)
+
+실행: python benchmarks/bench_endpoints.py [--scales 0.01,0.1] [--concurrency 16] [--requests 300]
+      python benchmarks/bench_endpoints.py --save-baseline   # 현재 결과를 기준선으로 저장
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 프로젝트 루트 디렉토리를 시스템 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+BENCH_DIR = Path(__file__).parent
+DATA_DIR = Path(project_root) / "data" / "bench"
+RESULTS_DIR = BENCH_DIR / "results"
+BASELINE_PATH = BENCH_DIR / "baselines" / "endpoints.json"
+
+# 재현성을 위해 시드 데이터의 마지막 날짜를 고정
+DEFAULT_END_DATE = "2026-06-30"
+PASSWORD = "loadtest1234"
+
+# (이름, 메서드, 경로 생성 함수, 본문 생성 함수) - 경로/본문은 (요청 번호, 픽스처) 로 결정
+Scenario = Tuple[str, str, Callable[[int, dict], str], Optional[Callable[[int, dict], dict]]]
+
+
+def pick(values: List[Any], index: int) -> Any:
+    return values[index % len(values)]
+
+
+def scenarios() -> List[Scenario]:
+    """라우터별 시나리오 (users, members, auth, prayers, offerings, families, system)"""
+    return [
+        ("users.list", "GET", lambda i, f: "/api/v1/users/?limit=20", None),
+        ("users.get", "GET", lambda i, f: f"/api/v1/users/{pick(f['user_ids'], i)}", None),
+        ("members.list", "GET", lambda i, f: f"/api/v1/members/?skip={i % 10 * 20}&limit=20", None),
+        ("members.get", "GET", lambda i, f: f"/api/v1/members/{pick(f['member_ids'], i)}", None),
+        ("auth.login", "POST", lambda i, f: "/api/v1/auth/login",
+         lambda i, f: {"email": pick(f["emails"], i), "password": PASSWORD}),
+        ("prayers.categories", "GET", lambda i, f: "/api/v1/prayers/categories", None),
+        ("prayers.list", "GET", lambda i, f: f"/api/v1/prayers/?skip={i % 10 * 20}&limit=20", None),
+        ("prayers.list_filtered", "GET",
+         lambda i, f: f"/api/v1/prayers/?category={pick(f['categories'], i)}&status=active&limit=20", None),
+        ("prayers.comments", "GET", lambda i, f: f"/api/v1/prayers/{pick(f['prayer_ids'], i)}/comments", None),
+        ("prayers.participate", "POST",
+         lambda i, f: f"/api/v1/prayers/{pick(f['prayer_ids'], i)}/participate?user_id={pick(f['user_ids'], i * 7)}",
+         None),
+        ("offerings.types", "GET", lambda i, f: "/api/v1/offerings/types", None),
+        ("offerings.list", "GET", lambda i, f: f"/api/v1/offerings/?skip={i % 10 * 20}&limit=20", None),
+        ("offerings.list_member", "GET",
+         lambda i, f: f"/api/v1/offerings/?member_id={pick(f['member_ids'], i)}&limit=20", None),
+        ("offerings.statistics", "GET",
+         lambda i, f: f"/api/v1/offerings/statistics/period?start_date={f['month_start']}&end_date={f['end_date']}",
+         None),
+        ("offerings.member_summary", "GET",
+         lambda i, f: f"/api/v1/offerings/statistics/member/{pick(f['member_ids'], i)}?year={f['year']}", None),
+        ("offerings.create", "POST", lambda i, f: "/api/v1/offerings/",
+         lambda i, f: {"member_id": pick(f["member_ids"], i), "offering_date": f["end_date"],
+                       "offering_type": "감사헌금", "amount": 10000 + i % 10 * 1000,
+                       "created_by": pick(f["user_ids"], i)}),
+        ("families.list", "GET", lambda i, f: f"/api/v1/families/?skip={i % 10 * 20}&limit=20", None),
+        ("families.members", "GET", lambda i, f: f"/api/v1/families/{pick(f['family_ids'], i)}/members", None),
+        ("system.dashboard_stats", "GET", lambda i, f: "/api/v1/system/dashboard/stats", None),
+        ("system.dashboard_history", "GET", lambda i, f: "/api/v1/system/dashboard/history?days=90", None),
+        ("system.settings", "GET", lambda i, f: "/api/v1/system/settings", None),
+        ("system.logs", "GET", lambda i, f: f"/api/v1/system/logs?log_level={pick(['ERROR', 'WARNING'], i)}", None),
+        ("system.backups", "GET", lambda i, f: "/api/v1/system/backups", None),
+    ]
+
+
+def load_fixtures(db_path: str, end_date: date, seed: int) -> dict:
+    """시나리오에서 사용할 id 목록을 시드 DB에서 결정적으로 추출"""
+    rng = random.Random(seed)
+    connection = sqlite3.connect(db_path)
+    try:
+        def ids(table: str, count: int = 200) -> List[int]:
+            values = [row[0] for row in connection.execute(f"SELECT id FROM {table} ORDER BY id")]
+            return rng.sample(values, min(count, len(values)))
+
+        emails = [row[0] for row in connection.execute(
+            "SELECT email FROM users WHERE password_hash LIKE '$2b$04$%' AND is_active = 1 ORDER BY id LIMIT 50"
+        )]
+        categories = [row[0] for row in connection.execute("SELECT name FROM prayer_categories ORDER BY id")]
+        return {
+            "user_ids": ids("users"),
+            "member_ids": ids("members"),
+            "prayer_ids": ids("prayers"),
+            "family_ids": ids("families"),
+            "emails": emails,
+            "categories": categories,
+            "end_date": end_date.isoformat(),
+            "month_start": end_date.replace(day=1).isoformat(),
+            "year": end_date.year,
+        }
+    finally:
+        connection.close()
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(p / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def query_count(metrics) -> float:
+    return metrics.counter("db.local.reads") + metrics.counter("db.local.writes") + metrics.counter("db.local.batches")
+
+
+async def drive(client, metrics, scenario: Scenario, fixtures: dict, concurrency: int, total: int) -> Dict[str, Any]:
+    """concurrency 개의 클라이언트가 total 개 요청을 나눠서 보내고 지연 분포 집계"""
+    name, method, path_for, body_for = scenario
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    indexes = iter(range(total))
+
+    async def worker():
+        for index in indexes:
+            body = body_for(index, fixtures) if body_for else None
+            started = time.perf_counter()
+            response = await client.request(method, path_for(index, fixtures), json=body)
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    queries_before = query_count(metrics)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    queries = query_count(metrics) - queries_before
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": sum(count for status, count in statuses.items() if status >= 400),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "throughput_rps": round(total / elapsed, 1),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "queries_per_request": round(queries / total, 2),
+    }
+
+
+async def run_worker(args) -> Dict[str, Any]:
+    """(자식 프로세스) 환경 변수로 지정된 DB에 앱을 띄우고 모든 시나리오 실행"""
+    import httpx
+
+    from app.core.metrics import metrics
+    from app.main import app
+
+    # 요청마다 찍히는 httpx 로그가 측정에 섞이지 않도록
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    fixtures = load_fixtures(args.db, date.fromisoformat(args.end_date), args.seed)
+    selected = [scenario for scenario in scenarios() if not args.only or scenario[0].startswith(tuple(args.only))]
+    await app.router.startup()
+    results = {}
+    try:
+        # 앱 예외는 500 응답으로 받아 오류로 집계
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for scenario in selected:
+                # 워밍업 (문장 캐시, 레이아웃 캐시, 대시보드 스냅샷)
+                await drive(client, metrics, scenario, fixtures, 1, min(10, args.requests))
+                results[scenario[0]] = await drive(client, metrics, scenario, fixtures,
+                                                   args.concurrency, args.requests)
+    finally:
+        await app.router.shutdown()
+    return results
+
+
+def seeded_database(scale: float, seed: int, end_date: str) -> Path:
+    """scale/seed/end-date 별 시드 DB 경로 (없으면 생성)"""
+    from synthetic_data import generate
+
+    path = DATA_DIR / f"scale-{scale}-seed-{seed}-{end_date}.db"
+    if not path.exists():
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".partial.db")
+        for leftover in DATA_DIR.glob(partial.name + "*"):
+            leftover.unlink()
+        print(f"🧪 시드 DB 생성: {path.name}")
+        asyncio.run(generate(f"file:{partial}", scale=scale, seed=seed,
+                             end_date=date.fromisoformat(end_date), report=lambda line: print("  " + line)))
+        partial.rename(path)
+    else:
+        # 캐시된 DB에도 이후 추가된 마이그레이션(인덱스 등)을 적용
+        asyncio.run(migrate_cached(path))
+    return path
+
+
+async def migrate_cached(path: Path):
+    from app.db.engine import create_engine
+    from app.db.migrations import MigrationRunner
+
+    engine = create_engine(f"file:{path}", None)
+    await engine.start()
+    client = await engine.get_client()
+    try:
+        applied = await MigrationRunner(client).migrate()
+        for migration in applied:
+            print(f"🗄️  {path.name}: {migration.version:04d}_{migration.name} 적용")
+        if applied:
+            await client.execute("ANALYZE")
+    finally:
+        await client.close()
+        await engine.stop()
+
+
+def run_scale(scale: float, args) -> Dict[str, Any]:
+    """시드 DB 복사본에 대해 자식 프로세스로 벤치마크 실행"""
+    source = seeded_database(scale, args.seed, args.end_date)
+    with tempfile.TemporaryDirectory(prefix="ittlc-bench-") as workdir:
+        db_path = Path(workdir) / "bench.db"
+        shutil.copyfile(source, db_path)
+        output = Path(workdir) / "result.json"
+        env = dict(os.environ,
+                   LIBSQL_URL=f"file:{db_path}", DATABASE_ENGINE="auto",
+                   LIBSQL_REPLICA_PATH="", LIBSQL_READ_REPLICA_URLS="")
+        command = [sys.executable, __file__, "--worker", "--db", str(db_path), "--output", str(output),
+                   "--concurrency", str(args.concurrency), "--requests", str(args.requests),
+                   "--seed", str(args.seed), "--end-date", args.end_date]
+        for prefix in args.only or []:
+            command += ["--only", prefix]
+        completed = subprocess.run(command, env=env, cwd=project_root, stdout=subprocess.DEVNULL)
+        if completed.returncode != 0:
+            raise SystemExit(f"❌ scale {scale} 벤치마크 실패 (종료 코드 {completed.returncode})")
+        return json.loads(output.read_text(encoding="utf-8"))
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """기준선 대비 p95 증가 / 처리량 감소 / 요청당 쿼리 수 증가를 회귀로 판정"""
+    regressions = []
+    for scale, scenarios_result in report["scales"].items():
+        base_scale = baseline.get("scales", {}).get(scale, {})
+        for name, current in scenarios_result.items():
+            base = base_scale.get(name)
+            if not base:
+                continue
+            if current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+                regressions.append(f"scale {scale} {name}: p95 {base['p95_ms']}ms → {current['p95_ms']}ms")
+            if current["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+                regressions.append(f"scale {scale} {name}: 처리량 {base['throughput_rps']} → "
+                                   f"{current['throughput_rps']} req/s")
+            if current["queries_per_request"] > base["queries_per_request"] + 0.5:
+                regressions.append(f"scale {scale} {name}: 요청당 쿼리 {base['queries_per_request']} → "
+                                   f"{current['queries_per_request']}")
+    return regressions
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]]):
+    for scale, scenarios_result in report["scales"].items():
+        print(f"\n📊 scale {scale} (동시 {report['meta']['concurrency']}, 시나리오당 {report['meta']['requests']}요청)")
+        print(f"  {'시나리오':<26}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'q/req':>7}{'err':>5}  기준선 p95")
+        base_scale = (baseline or {}).get("scales", {}).get(scale, {})
+        for name, result in scenarios_result.items():
+            delta = ""
+            if name in base_scale and base_scale[name]["p95_ms"]:
+                change = result["p95_ms"] / base_scale[name]["p95_ms"] - 1
+                delta = f"{change:+.0%}"
+            print(f"  {name:<26}{result['throughput_rps']:>9.0f}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}"
+                  f"{result['p99_ms']:>9.2f}{result['queries_per_request']:>7.2f}{result['errors']:>5}  {delta}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 엔드포인트 벤치마크")
+    parser.add_argument("--scales", default="0.01,0.1", help="합성 데이터 scale 목록 (쉼표 구분)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=300, help="시나리오당 요청 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--end-date", default=DEFAULT_END_DATE)
+    parser.add_argument("--only", action="append", help="이 이름으로 시작하는 시나리오만 (예: offerings.)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="회귀로 볼 p95/처리량 변화 비율")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        results = asyncio.run(run_worker(args))
+        Path(args.output).write_text(json.dumps(results, ensure_ascii=False), encoding="utf-8")
+        return
+
+    scales = [float(value) for value in args.scales.split(",") if value.strip()]
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "seed": args.seed,
+            "end_date": args.end_date,
+        },
+        "scales": {str(scale): run_scale(scale, args) for scale in scales},
+    }
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    result_path = RESULTS_DIR / f"endpoints-{datetime.now():%Y%m%d-%H%M%S}.json"
+    result_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    baseline = None
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    print_report(report, baseline)
+    print(f"\n💾 결과: {result_path.relative_to(project_root)}")
+
+    if args.save_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"📌 기준선 저장: {BASELINE_PATH.relative_to(project_root)}")
+        return
+
+    if baseline:
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ 기준선({baseline['meta'].get('revision')}) 대비 회귀 {len(regressions)}건:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\n✅ 기준선({baseline['meta'].get('revision')}) 대비 회귀 없음 (허용 {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
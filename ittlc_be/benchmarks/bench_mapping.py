@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+조회 결과 매핑 벤치마크
+
+기존 서비스 코드 방식(행마다 컬럼 이름 목록을 다시 만든 뒤 dict(zip(...)))과
+app/db/mapping.py 의 캐시된 레이아웃 경로(dict / __slots__ 레코드 / 튜플)를 비교하고,
+레코드를 응답 스키마가 그대로 검증할 수 있는지도 함께 측정합니다.
+
+실행: python benchmarks/bench_mapping.py [--rows 100000] [--repeat 5]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+# 프로젝트 루트 디렉토리를 시스템 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from libsql_client.result import ResultSet, Row
+
+from app.core.serialization import list_adapter
+from app.db.mapping import as_dicts, as_records, as_tuples
+from app.schemas import Member
+
+from bench_serialization import make_members
+
+
+def make_result(count: int) -> ResultSet:
+    """libsql_client 가 돌려주는 것과 같은 ResultSet 생성"""
+    members = make_members(count)
+    columns = tuple(members[0].keys())
+    column_idxs = {name: idx for idx, name in enumerate(columns)}
+    rows = [Row(column_idxs, tuple(member.values())) for member in members]
+    return ResultSet(columns, rows, 0, None)
+
+
+def legacy_dicts(result: ResultSet) -> List[dict]:
+    """기존 서비스 코드 방식 재현 (행마다 컬럼 이름 목록 재생성)"""
+    return [dict(zip([column for column in result.columns], row)) for row in result.rows]
+
+
+def measure(func: Callable[[ResultSet], Any], result: ResultSet, repeat: int) -> float:
+    """가장 빠른 반복의 행당 마이크로초 반환"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(result)
+        best = min(best, time.perf_counter() - started)
+    return best / len(result.rows) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조회 결과 매핑 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    result = make_result(args.rows)
+    adapter = list_adapter(Member)
+    results = {
+        "legacy_dicts": measure(legacy_dicts, result, args.repeat),
+        "cached_dicts": measure(as_dicts, result, args.repeat),
+        "slots_records": measure(as_records, result, args.repeat),
+        "tuples": measure(as_tuples, result, args.repeat),
+        "records+validate": measure(
+            lambda r: adapter.validate_python(as_records(r), from_attributes=True), result, args.repeat
+        ),
+        "dicts+validate": measure(
+            lambda r: adapter.validate_python(legacy_dicts(r)), result, args.repeat
+        ),
+    }
+
+    baseline = results["legacy_dicts"]
+    print(f"📊 {args.rows:,}행 매핑 (최선 {args.repeat}회 중)")
+    for name, per_row in results.items():
+        print(f"  {name:<17} {per_row:8.3f} µs/row  "
+              f"{per_row * args.rows / 1000:8.1f} ms total  x{baseline / per_row:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+성도 목록 직렬화 벤치마크
+
+FastAPI 기본 경로(response_model 검증 → jsonable_encoder → json.dumps)와
+TypeAdapter / trusted orjson 경로의 행당 직렬화 비용을 비교합니다.
+
+실행: python benchmarks/bench_serialization.py [--rows 10000] [--repeat 5]
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+# 프로젝트 루트 디렉토리를 시스템 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.schemas import Member
+from app.core.serialization import serialize_list
+
+
+def make_members(count: int) -> List[dict]:
+    """DB 조회 결과와 같은 형태의 성도 행 생성"""
+    base = date(1960, 1, 1)
+    return [
+        {
+            "id": i,
+            "name": f"성도{i}",
+            "name_en": f"Member {i}",
+            "birth_date": (base + timedelta(days=i % 20000)).isoformat(),
+            "gender": "남" if i % 2 else "여",
+            "phone": f"010-{i % 10000:04d}-{(i * 7) % 10000:04d}",
+            "email": f"member{i}@example.com",
+            "address": "서울특별시 강남구 테헤란로 123, 4층",
+            "job": "회사원",
+            "registration_date": "2020-03-01",
+            "baptism_date": None,
+            "position": "성도",
+            "district": f"{i % 12 + 1}교구",
+            "family_id": i // 4,
+            "family_role": "자녀",
+            "is_active": 1,
+            "notes": "새가족 등록 후 양육 과정 수료",
+            "created_by": 1,
+            "created_at": "2024-01-01 10:00:00",
+            "updated_at": "2024-01-02 10:00:00",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def fastapi_default(rows: List[dict]) -> bytes:
+    """FastAPI 기본 응답 경로 재현"""
+    adapter = TypeAdapter(List[Member])
+    validated = adapter.validate_python(rows)
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False).encode("utf-8")
+
+
+def type_adapter_path(rows: List[dict]) -> bytes:
+    return serialize_list(Member, rows)
+
+
+def trusted_path(rows: List[dict]) -> bytes:
+    return serialize_list(Member, rows, trusted=True)
+
+
+def measure(func, rows: List[dict], repeat: int) -> float:
+    """가장 빠른 반복의 행당 마이크로초 반환"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - started)
+    return best / len(rows) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="성도 목록 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_members(args.rows)
+    results = {
+        "fastapi_default": measure(fastapi_default, rows, args.repeat),
+        "type_adapter": measure(type_adapter_path, rows, args.repeat),
+        "trusted_orjson": measure(trusted_path, rows, args.repeat),
+    }
+
+    baseline = results["fastapi_default"]
+    print(f"📊 성도 {args.rows:,}명 직렬화 (최선 {args.repeat}회 중)")
+    for name, per_row in results.items():
+        print(f"  {name:<16} {per_row:8.2f} µs/row  "
+              f"{per_row * args.rows / 1000:8.1f} ms total  x{baseline / per_row:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+"""
+쿼리 플랜 회귀 검사
+
+라우터가 사용하는 서비스의 모든 메서드를 합성 데이터 DB 복사본에서 실행하면서
+실제로 나가는 SQL 을 기록하고(필터 조합형 목록 조회는 모든 조합을 호출),
+SQL 모양마다 EXPLAIN QUERY PLAN 을 확인합니다.
+
+큰 테이블(합성 데이터가 scale 에 비례해 채우는 테이블은 scale 1.0 환산 --large-rows 행 이상)에서 다음이 보이면 실패(종료 코드 1)입니다.
+- full_scan: 인덱스 없이 테이블 전체 스캔 (WHERE/ORDER BY 없는 LIMIT 페이지 조회는 제외, deleted_at IS NULL 조건은 WHERE 로 보지 않음)
+- temp_btree: 임시 B-tree 정렬 (GROUP BY 결과를 다시 정렬하는 ORDER BY 는 제외)
+의도된 경우는 ALLOWED 에 이유와 함께 등록합니다.
+
+--propose 는 위반마다 복합 인덱스 후보(동등 조건 → 정렬/그룹 컬럼 → 범위 조건 순)를 만들고
+복사본에 실제로 만들어 본 뒤 플랜이 해결되는 것만 제안합니다. --write-migration 은 그 결과를
+다음 번호의 마이그레이션 초안으로 저장합니다.
+
+실행: python benchmarks/query_plans.py [--scale 0.1] [--propose] [--write-migration]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import re
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# 프로젝트 루트 디렉토리를 시스템 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from bench_endpoints import DEFAULT_END_DATE, seeded_database
+from synthetic_data import SCALE_1
+
+# 합성 데이터가 scale 에 비례해 채우는 테이블 (families 는 성도 수에서 결정)
+# 나머지(sqlite_*, 참조 테이블, 백업/스냅샷 등)는 scale 과 무관하므로 행 수를 환산하지 않음
+SCALED_TABLES = frozenset(SCALE_1) | {"families"}
+
+# (호출 이름, 위반 종류) → 허용 이유
+ALLOWED = {
+    ("offerings.statistics", "temp_btree"):
+        "기간 내 행을 종류/월별로 묶는 집계라 정렬이 불가피 (offering_date 범위 검색 후 그룹핑)",
+}
+
+_ALIASES = re.compile(
+    r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(?!(?:WHERE|JOIN|LEFT|INNER|CROSS|ON|ORDER|GROUP|LIMIT|SET|VALUES)\b)(\w+))?",
+    re.I,
+)
+_PREDICATE = re.compile(r"(?:(\w+)\.)?(\w+)\s*(=|>=|<=|>|<|\bBETWEEN\b)\s*\?", re.I)
+_WHITESPACE = re.compile(r"\s+")
+_SOFT_DELETE = re.compile(r"(?:\bAND\s+)?(?:\w+\.)?deleted_at\s+IS\s+NULL(?:\s+AND\b)?", re.I)
+_CLAUSE_END = r"(?=\bLIMIT\b|\bORDER\s+BY\b|\bGROUP\s+BY\b|\bHAVING\b|$)"
+
+
+def normalize(sql: str) -> str:
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def is_dml(sql: str) -> bool:
+    return sql.lstrip().split(None, 1)[0].upper() in ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+def aliases(sql: str) -> Dict[str, str]:
+    """{별칭 또는 테이블 이름: 테이블 이름}"""
+    mapping = {}
+    for table, alias in _ALIASES.findall(sql):
+        mapping[table] = table
+        if alias:
+            mapping[alias] = table
+    return mapping
+
+
+def clause(sql: str, keyword: str) -> str:
+    match = re.search(rf"\b{keyword}\b(.*?){_CLAUSE_END}", sql, re.I | re.S)
+    return match.group(1) if match else ""
+
+
+def column_list(text: str) -> List[Tuple[Optional[str], str, str]]:
+    """'o.offering_date DESC, created_at' → [(별칭, 컬럼, 방향)]"""
+    columns = []
+    for part in text.split(","):
+        match = re.match(r"\s*(?:(\w+)\.)?(\w+)\s*(ASC|DESC)?\s*$", part, re.I)
+        if match:
+            columns.append((match.group(1), match.group(2), (match.group(3) or "").upper()))
+    return columns
+
+
+class Shape:
+    """기록된 SQL 모양 하나 (같은 모양은 처음 호출의 파라미터로 검사)"""
+
+    def __init__(self, sql: str, params: List[Any], call: str):
+        self.sql = sql
+        self.params = params
+        self.calls = [call]
+        self.plan: List[str] = []
+        self.error: Optional[str] = None
+        self.violations: List[Tuple[str, str, str]] = []   # (종류, 테이블, 플랜 상세)
+
+    @property
+    def call(self) -> str:
+        return self.calls[0]
+
+
+class PlanChecker:
+    def __init__(self, connection: sqlite3.Connection, scale: float, large_rows: int):
+        self.connection = connection
+        self.scale = scale
+        self.large_rows = large_rows
+        self._rows: Dict[str, int] = {}
+        self._columns: Dict[str, set] = {}
+
+    def rows(self, table: str) -> int:
+        if table not in self._rows:
+            try:
+                self._rows[table] = self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            except sqlite3.Error:
+                self._rows[table] = 0
+        return self._rows[table]
+
+    def is_large(self, table: str) -> bool:
+        # scale 에 비례하는 테이블은 scale 1.0 로 환산한 행 수 기준
+        if table.startswith("sqlite_"):
+            return False
+        rows = self.rows(table)
+        if table in SCALED_TABLES:
+            rows /= self.scale
+        return rows >= self.large_rows
+
+    def columns(self, table: str) -> set:
+        if table not in self._columns:
+            self._columns[table] = {row[1] for row in self.connection.execute(f"PRAGMA table_info({table})")}
+        return self._columns[table]
+
+    def explain(self, shape: Shape) -> List[str]:
+        return [row[3] for row in self.connection.execute("EXPLAIN QUERY PLAN " + shape.sql, shape.params)]
+
+    def check(self, shape: Shape):
+        try:
+            shape.plan = self.explain(shape)
+        except sqlite3.Error as e:
+            shape.error = str(e)
+            return
+        shape.violations = self.violations(shape.sql, shape.plan)
+
+    def violations(self, sql: str, plan: List[str]) -> List[Tuple[str, str, str]]:
+        mapping = aliases(sql)
+        upper = sql.upper()
+        # 소프트 삭제 조건(deleted_at IS NULL)만 있는 조회는 조건 없는 조회로 취급
+        has_where = bool(_SOFT_DELETE.sub("", clause(sql, "WHERE")).strip())
+        has_group = "GROUP BY" in upper
+        has_order = "ORDER BY" in upper
+        bounded_page = "LIMIT" in upper and not has_where and not has_group and not has_order
+        large_tables = [table for table in set(mapping.values()) if self.is_large(table)]
+        found = []
+        for detail in plan:
+            scan = re.match(r"^SCAN (\w+)$", detail)
+            if scan:
+                table = mapping.get(scan.group(1), scan.group(1))
+                if self.is_large(table) and not bounded_page:
+                    found.append(("full_scan", table, detail))
+            elif detail.startswith("USE TEMP B-TREE"):
+                if has_group and "FOR ORDER BY" in detail:
+                    # GROUP BY 로 줄어든 결과를 정렬하는 경우
+                    continue
+                if large_tables:
+                    found.append(("temp_btree", self.sort_table(sql, mapping, detail) or large_tables[0], detail))
+        return found
+
+    def sort_table(self, sql: str, mapping: Dict[str, str], detail: str) -> Optional[str]:
+        """정렬/그룹 기준 컬럼이 속한 테이블"""
+        keyword = "GROUP BY" if "GROUP BY" in detail else "ORDER BY"
+        for alias, column, _ in column_list(clause(sql, keyword.replace(" ", r"\s+"))):
+            if alias:
+                return mapping.get(alias)
+            tables = [table for table in set(mapping.values()) if column in self.columns(table)]
+            if len(tables) == 1:
+                return tables[0]
+        return None
+
+    def candidates(self, shape: Shape, table: str) -> List[List[str]]:
+        """위반 테이블에 대한 복합 인덱스 후보 (작은 것부터)
+
+        정렬/그룹 컬럼만 → 동등 조건 하나 + 정렬 → 동등 조건 전부 + 정렬 순이며,
+        정렬이 없으면 정렬 대신 첫 범위 조건 컬럼을 뒤에 붙입니다.
+        """
+        mapping = aliases(shape.sql)
+        table_columns = self.columns(table)
+
+        def owns(alias: Optional[str], column: str) -> bool:
+            if alias:
+                return mapping.get(alias) == table
+            return column in table_columns
+
+        equalities, ranges = [], []
+        for alias, column, operator in _PREDICATE.findall(clause(shape.sql, "WHERE")):
+            if not owns(alias, column) or column not in table_columns:
+                continue
+            target = equalities if operator == "=" else ranges
+            if column not in target:
+                target.append(column)
+
+        ordering = []
+        keyword = r"GROUP\s+BY" if re.search(r"\bGROUP\s+BY\b", shape.sql, re.I) else r"ORDER\s+BY"
+        for alias, column, direction in column_list(clause(shape.sql, keyword)):
+            if owns(alias, column) and column in table_columns and column not in equalities:
+                ordering.append((column, direction))
+
+        # 방향이 섞여 있을 때만 DESC 를 인덱스에 명시 (모두 같으면 역방향 스캔 가능)
+        mixed = len({direction or "ASC" for _, direction in ordering}) > 1
+        tail = [f"{column} {direction}".strip() if mixed else column for column, direction in ordering]
+        if not tail:
+            tail = [column for column in ranges if column not in equalities][:1]
+
+        options = [tail] if tail else []
+        options += [[column] + tail for column in equalities]
+        if len(equalities) > 1:
+            options.append(equalities + tail)
+        existing = self.existing(table)
+        unique = []
+        for option in options:
+            plain = [definition.split()[0] for definition in option]
+            if option not in unique and not any(index[:len(plain)] == plain for index in existing):
+                unique.append(option)
+        return unique
+
+    def resolves(self, shape: Shape, table: str, indexes: List[Tuple[str, str, List[str]]]) -> bool:
+        """복사본에 인덱스들을 만들어 보고 위반이 없어지는지 확인 (롤백)"""
+        self.connection.execute("BEGIN")
+        try:
+            for name, index_table, definitions in indexes:
+                self.connection.execute(f"CREATE INDEX {name} ON {index_table} ({', '.join(definitions)})")
+                self.connection.execute(f"ANALYZE {name}")
+            remaining = self.violations(shape.sql, self.explain(shape))
+            return not any(found_table == table for _, found_table, _ in remaining)
+        finally:
+            self.connection.execute("ROLLBACK")
+
+    def existing(self, table: str) -> List[List[str]]:
+        """테이블의 기존 인덱스 컬럼 목록"""
+        indexes = []
+        for _, name, *_ in self.connection.execute(f"PRAGMA index_list({table})"):
+            indexes.append([row[2] for row in self.connection.execute(f"PRAGMA index_info({name})")])
+        return indexes
+
+
+def index_name(table: str, definitions: List[str]) -> str:
+    return "idx_{}_{}".format(table, "_".join(definition.split()[0] for definition in definitions))
+
+
+def propose(checker: PlanChecker, violations) -> Tuple[Dict[str, Tuple[str, List[str], List[str]]], List[str]]:
+    """위반 전체를 해결하는 작은 인덱스 집합 (탐욕적으로 선택)
+
+    필터가 적은 모양부터 처리하면서, 이미 고른 인덱스로 해결되면 새로 만들지 않고
+    아니면 후보를 작은 것부터 시도해 처음 해결되는 것을 고릅니다.
+    """
+    chosen: Dict[str, Tuple[str, List[str], List[str]]] = {}
+    unresolved = []
+    for shape, kind, table, detail, _ in sorted(violations, key=lambda item: len(item[0].sql)):
+        indexes = [(name, index_table, definitions) for name, (index_table, definitions, _) in chosen.items()]
+        if indexes and checker.resolves(shape, table, indexes):
+            for name, (index_table, _, calls) in chosen.items():
+                if index_table == table and shape.call not in calls:
+                    calls.append(shape.call)
+                    break
+            continue
+        for definitions in checker.candidates(shape, table):
+            name = index_name(table, definitions)
+            if name in chosen:
+                continue
+            if checker.resolves(shape, table, indexes + [(name, table, definitions)]):
+                chosen[name] = (table, definitions, [shape.call])
+                break
+        else:
+            unresolved.append(f"{shape.call}: {table} {detail} — {shape.sql[:120]}")
+
+    # 다른 후보의 앞부분과 같은 인덱스는 긴 쪽이 대신함
+    for name, (table, definitions, calls) in list(chosen.items()):
+        for other, (other_table, other_definitions, other_calls) in chosen.items():
+            if other != name and other_table == table and other_definitions[:len(definitions)] == definitions:
+                other_calls.extend(call for call in calls if call not in other_calls)
+                del chosen[name]
+                break
+    return chosen, unresolved
+
+
+class Recorder:
+    """엔진 execute/batch 를 감싸 호출별 SQL 기록"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.current = "startup"
+        self.shapes: Dict[str, Shape] = {}
+        execute, batch = engine.execute, engine.batch
+
+        async def recording_execute(sql, params=None):
+            self.record(sql, params or [])
+            return await execute(sql, params)
+
+        async def recording_batch(statements):
+            from libsql_client import Statement
+            for statement in statements:
+                statement = Statement.convert(statement)
+                self.record(statement.sql, list(statement.args or []))
+            return await batch(statements)
+
+        engine.execute = recording_execute
+        engine.batch = recording_batch
+
+    def record(self, sql: str, params: List[Any]):
+        if not is_dml(sql):
+            return
+        key = normalize(sql)
+        shape = self.shapes.get(key)
+        if shape is None:
+            self.shapes[key] = Shape(key, list(params), self.current)
+        elif self.current not in shape.calls:
+            shape.calls.append(self.current)
+
+
+def subsets(keys: List[str]):
+    for size in range(len(keys) + 1):
+        yield from itertools.combinations(keys, size)
+
+
+def catalogue(fixtures: Dict[str, Any]) -> List[Tuple[str, Callable[[], Awaitable]]]:
+    """라우터에서 쓰는 서비스 메서드 호출 목록 (필터 조합형 조회는 모든 조합)"""
+    from app.db.table_versions import table_versions
+    from app.services.dashboard_service import dashboard_materializer
+    from app.services.family_service import family_service
+    from app.services.libsql_service import libsql_service
+    from app.services.offering_service import offering_service
+    from app.services.prayer_service_fixed import prayer_service
+    from app.services.purge_service import purge_service
+    from app.services.system_service import system_service
+
+    f = fixtures
+    end = date.fromisoformat(f["end_date"])
+    month_start = end.replace(day=1)
+    calls: List[Tuple[str, Callable[[], Awaitable]]] = [
+        ("users.get_by_email", lambda: libsql_service.get_user_by_email(f["email"])),
+        ("users.get_by_id", lambda: libsql_service.get_user_by_id(f["user_id"])),
+        ("users.list", lambda: libsql_service.get_users(0, 20)),
+        ("members.get_by_email", lambda: libsql_service.get_member_by_email(f["member_email"])),
+        ("members.get_by_id", lambda: libsql_service.get_member_by_id(f["member_id"])),
+        ("members.list", lambda: libsql_service.get_members(0, 20)),
+        ("members.update", lambda: libsql_service.update_member(f["member_id"], {"job": "교사"})),
+        ("members.create", lambda: libsql_service.create_member({"name": "테스트"})),
+        ("families.list", lambda: family_service.get_families(0, 20)),
+        ("families.get", lambda: family_service.get_family_by_id(f["family_id"])),
+        ("families.members", lambda: family_service.get_family_members(f["family_id"])),
+        ("families.create", lambda: family_service.create_family({"family_name": "테스트 가정"})),
+        ("families.update", lambda: family_service.update_family(f["family_id"], {"address": "서울"})),
+        ("families.add_member", lambda: family_service.add_member_to_family(f["family_id"], f["member_id"], "자녀")),
+        ("families.remove_member", lambda: family_service.remove_member_from_family(f["member_id"])),
+        ("families.delete", lambda: family_service.delete_family(f["spare_family_id"])),
+        ("offerings.types", lambda: offering_service.get_offering_types(True)),
+        ("offerings.types_all", lambda: offering_service.get_offering_types(False)),
+        ("offerings.create", lambda: offering_service.create_offering({
+            "member_id": f["member_id"], "offering_date": f["end_date"], "offering_type": "감사헌금",
+            "amount": 10000, "memo": None, "created_by": f["user_id"]})),
+        ("offerings.get", lambda: offering_service.get_offering_by_id(f["offering_id"])),
+        ("offerings.update", lambda: offering_service.update_offering(f["offering_id"], {"amount": 20000})),
+        ("offerings.delete", lambda: offering_service.delete_offering(f["spare_offering_id"])),
+        ("offerings.statistics", lambda: offering_service.get_offering_statistics(month_start, end)),
+        ("offerings.member_summary", lambda: offering_service.get_member_offering_summary(f["member_id"], end.year)),
+        ("prayers.categories", lambda: prayer_service.get_prayer_categories(True)),
+        ("prayers.get", lambda: prayer_service.get_prayer_by_id(f["prayer_id"])),
+        ("prayers.update", lambda: prayer_service.update_prayer(f["prayer_id"], {"status": "answered"})),
+        ("prayers.participate", lambda: prayer_service.participate_prayer(f["prayer_id"], f["user_id"])),
+        ("prayers.participants", lambda: prayer_service.get_prayer_participants(f["prayer_id"])),
+        ("prayers.comment", lambda: prayer_service.create_prayer_comment({
+            "prayer_id": f["prayer_id"], "user_id": f["user_id"], "comment": "함께 기도합니다."})),
+        ("prayers.comments", lambda: prayer_service.get_prayer_comments(f["prayer_id"])),
+        ("prayers.delete_comment", lambda: prayer_service.delete_prayer_comment(f["comment_id"], f["comment_user_id"])),
+        ("prayers.delete", lambda: prayer_service.delete_prayer(f["spare_prayer_id"])),
+        ("purge.soft_deleted", lambda: purge_service.purge(0)),
+        ("system.setting", lambda: system_service.get_setting("church_name")),
+        ("system.settings", lambda: system_service.get_settings()),
+        ("system.update_setting", lambda: system_service.update_setting("church_name", "ITTLC")),
+        ("system.create_log", lambda: system_service.create_log({
+            "log_level": "INFO", "log_type": "시스템", "message": "쿼리 플랜 검사"})),
+        ("system.clear_old_logs", lambda: system_service.clear_old_logs(3650)),
+        ("system.backups", lambda: system_service.get_backup_history(0, 20)),
+        ("system.create_backup", lambda: system_service.create_backup_record({
+            "filename": "plan.db", "backup_type": "manual"})),
+        ("system.update_backup", lambda: system_service.update_backup_status(f["backup_id"], "success")),
+        ("dashboard.refresh", lambda: dashboard_materializer.refresh()),
+        ("dashboard.history", lambda: dashboard_materializer.get_history(90)),
+        ("table_versions.refresh", lambda: table_versions.refresh()),
+    ]
+
+    offering_filters = {"member_id": f["member_id"], "offering_type": "십일조",
+                        "start_date": month_start - timedelta(days=90), "end_date": end}
+    for keys in subsets(list(offering_filters)):
+        calls.append(("offerings.list", lambda keys=keys: offering_service.get_offerings(
+            0, 20, **{key: offering_filters[key] for key in keys})))
+
+    prayer_filters = {"category": "건강 기도", "status": "active", "visibility": "public", "user_id": f["user_id"]}
+    for keys in subsets(list(prayer_filters)):
+        calls.append(("prayers.list", lambda keys=keys: prayer_service.get_prayers(
+            0, 20, **{key: prayer_filters[key] for key in keys})))
+
+    log_filters = {"log_level": "ERROR", "log_type": "보안", "user_id": f["user_id"],
+                   "start_date": datetime.combine(month_start, datetime.min.time()),
+                   "end_date": datetime.combine(end, datetime.max.time()).replace(microsecond=0)}
+    for keys in subsets(list(log_filters)):
+        calls.append(("system.logs", lambda keys=keys: system_service.get_logs(
+            0, 50, **{key: log_filters[key] for key in keys})))
+    return calls
+
+
+def load_fixtures(db_path: Path, end_date: str) -> Dict[str, Any]:
+    connection = sqlite3.connect(db_path)
+    try:
+        one = lambda sql: connection.execute(sql).fetchone()
+        comment = one("SELECT id, user_id FROM prayer_comments ORDER BY id LIMIT 1")
+        return {
+            "end_date": end_date,
+            "user_id": one("SELECT id FROM users ORDER BY id LIMIT 1 OFFSET 3")[0],
+            "email": one("SELECT email FROM users ORDER BY id LIMIT 1")[0],
+            "member_id": one("SELECT member_id FROM offerings ORDER BY id DESC LIMIT 1")[0],
+            "member_email": one("SELECT email FROM members WHERE email IS NOT NULL ORDER BY id LIMIT 1")[0],
+            "family_id": one("SELECT id FROM families ORDER BY id LIMIT 1 OFFSET 10")[0],
+            "spare_family_id": one("SELECT MAX(id) FROM families")[0],
+            "offering_id": one("SELECT MAX(id) - 1 FROM offerings")[0],
+            "spare_offering_id": one("SELECT MAX(id) FROM offerings")[0],
+            "prayer_id": one("SELECT id FROM prayers ORDER BY id LIMIT 1 OFFSET 10")[0],
+            "spare_prayer_id": one("SELECT MAX(id) FROM prayers")[0],
+            "comment_id": comment[0],
+            "comment_user_id": comment[1],
+            "backup_id": one("SELECT MAX(id) FROM backup_history")[0],
+        }
+    finally:
+        connection.close()
+
+
+async def record_shapes(fixtures: Dict[str, Any]) -> Dict[str, Any]:
+    """(자식 프로세스) 환경 변수로 지정된 DB에서 서비스 호출을 모두 실행하고 SQL 모양 기록"""
+    from app.db.engine import get_engine
+
+    engine = get_engine()
+    await engine.start()
+    # 스케줄러를 거치지 않는 실제 엔진의 호출을 기록
+    recorder = Recorder(getattr(engine, "engine", engine))
+    failures = []
+    try:
+        for name, call in catalogue(fixtures):
+            recorder.current = name
+            try:
+                await call()
+            except Exception as e:
+                failures.append(f"{name}: {e}")
+    finally:
+        await engine.stop()
+    return {
+        "shapes": [{"sql": shape.sql, "params": shape.params, "calls": shape.calls}
+                   for shape in recorder.shapes.values()],
+        "failures": failures,
+    }
+
+
+def run_worker(db_path: Path, fixtures: Dict[str, Any]) -> Tuple[Dict[str, Shape], List[str]]:
+    """서비스 전역 엔진이 복사본을 쓰도록 자식 프로세스에서 기록"""
+    output = db_path.with_name("shapes.json")
+    env = dict(os.environ,
+               LIBSQL_URL=f"file:{db_path}", DATABASE_ENGINE="auto",
+               LIBSQL_REPLICA_PATH="", LIBSQL_READ_REPLICA_URLS="")
+    command = [sys.executable, __file__, "--worker", "--db", str(db_path), "--output", str(output),
+               "--fixtures", json.dumps(fixtures)]
+    completed = subprocess.run(command, env=env, cwd=project_root, stdout=subprocess.DEVNULL)
+    if completed.returncode != 0:
+        raise SystemExit(f"❌ SQL 기록 실패 (종료 코드 {completed.returncode})")
+    recorded = json.loads(output.read_text(encoding="utf-8"))
+    shapes = {}
+    for item in recorded["shapes"]:
+        shape = Shape(item["sql"], item["params"], item["calls"][0])
+        shape.calls = item["calls"]
+        shapes[shape.sql] = shape
+    return shapes, recorded["failures"]
+
+
+def next_migration_path() -> Path:
+    from app.db.migrations import MIGRATIONS_DIR, load_migrations
+    version = max((migration.version for migration in load_migrations()), default=0) + 1
+    return MIGRATIONS_DIR / f"{version:04d}_query_plan_indexes.sql"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서비스 쿼리 플랜 회귀 검사")
+    parser.add_argument("--scale", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--end-date", default=DEFAULT_END_DATE)
+    parser.add_argument("--large-rows", type=int, default=10_000, help="scale 1.0 환산 이 행 수 이상이면 큰 테이블")
+    parser.add_argument("--propose", action="store_true", help="위반을 해결하는 복합 인덱스 제안")
+    parser.add_argument("--write-migration", action="store_true", help="제안 인덱스를 다음 마이그레이션 초안으로 저장")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    parser.add_argument("-v", "--verbose", action="store_true", help="모든 SQL 모양의 플랜 출력")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    parser.add_argument("--fixtures", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        recorded = asyncio.run(record_shapes(json.loads(args.fixtures)))
+        Path(args.output).write_text(json.dumps(recorded, ensure_ascii=False, default=str), encoding="utf-8")
+        return
+
+    source = seeded_database(args.scale, args.seed, args.end_date)
+    with tempfile.TemporaryDirectory(prefix="ittlc-plans-") as workdir:
+        db_path = Path(workdir) / "plans.db"
+        shutil.copyfile(source, db_path)
+        fixtures = load_fixtures(db_path, args.end_date)
+
+        shapes, failures = run_worker(db_path, fixtures)
+
+        connection = sqlite3.connect(db_path, isolation_level=None)
+        connection.execute("ANALYZE")
+        checker = PlanChecker(connection, args.scale, args.large_rows)
+        for shape in shapes.values():
+            checker.check(shape)
+
+        broken = [shape for shape in shapes.values() if shape.error]
+        violations = []
+        allowed = []
+        for shape in shapes.values():
+            for kind, table, detail in shape.violations:
+                reason = next((ALLOWED[(call, kind)] for call in shape.calls if (call, kind) in ALLOWED), None)
+                (allowed if reason else violations).append((shape, kind, table, detail, reason))
+
+        print(f"🔍 SQL 모양 {len(shapes)}개 검사 (scale={args.scale}, 큰 테이블 기준 {args.large_rows:,}행 @1.0)")
+        if args.verbose:
+            for shape in shapes.values():
+                print(f"\n  [{', '.join(shape.calls)}] {shape.sql[:160]}")
+                for detail in shape.plan:
+                    print(f"      {detail}")
+        for shape, kind, table, detail, reason in allowed:
+            print(f"  ⏭️  {shape.call:<26} {kind:<10} {table:<20} {detail}  ({reason})")
+        for shape in broken:
+            print(f"  ⚠️  {shape.call:<26} 실행 불가: {shape.error}")
+        for shape, kind, table, detail, _ in violations:
+            print(f"  ❌ {shape.call:<27} {kind:<10} {table:<20} {detail}")
+            print(f"      {shape.sql[:200]}")
+        if failures:
+            print(f"  (서비스 호출 오류 {len(failures)}건은 SQL 기록 후 발생한 것으로 플랜 검사에는 영향 없음)")
+
+        proposals: Dict[str, Tuple[str, List[str], List[str]]] = {}
+        if (args.propose or args.write_migration) and violations:
+            print("\n💡 인덱스 제안")
+            proposals, unresolved = propose(checker, violations)
+            for name, (table, definitions, calls) in proposals.items():
+                print(f"  ✅ CREATE INDEX IF NOT EXISTS {name} ON {table}({', '.join(definitions)});"
+                      f"  -- {', '.join(sorted(set(calls)))}")
+            for line in unresolved:
+                print(f"  ❔ 인덱스로 해결되지 않음: {line}")
+
+        if args.write_migration and proposals:
+            path = next_migration_path()
+            lines = [f"-- 쿼리 플랜 검사(benchmarks/query_plans.py)가 제안한 인덱스 초안", ""]
+            for name, (table, definitions, calls) in proposals.items():
+                lines.append(f"-- {', '.join(sorted(set(calls)))}")
+                lines.append(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({', '.join(definitions)});")
+                lines.append("")
+            path.write_text("\n".join(lines), encoding="utf-8")
+            print(f"📝 마이그레이션 초안: {path.relative_to(project_root)} (검토 후 커밋)")
+
+        if args.json:
+            Path(args.json).write_text(json.dumps({
+                "shapes": [{"calls": shape.calls, "sql": shape.sql, "plan": shape.plan, "error": shape.error,
+                            "violations": shape.violations} for shape in shapes.values()],
+                "proposals": {name: {"table": table, "columns": definitions, "calls": calls}
+                              for name, (table, definitions, calls) in proposals.items()},
+            }, ensure_ascii=False, indent=2), encoding="utf-8")
+        connection.close()
+
+    if violations:
+        print(f"\n❌ 플랜 위반 {len(violations)}건")
+        sys.exit(1)
+    print(f"\n✅ 플랜 위반 없음 (허용 {len(allowed)}건, 실행 불가 SQL {len(broken)}건)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,887 @@
+#!/usr/bin/env python3
+"""
+부하 테스트용 대용량 합성 데이터 생성기
+
+database_schema.sql 의 모든 테이블에 실제와 비슷한 분포의 데이터를 채웁니다.
+- 같은 --seed / --scale / --end-date 이면 (빈 DB 기준) 항상 같은 데이터
+- --scale 1.0 = 성도 5만 명, 헌금 500만 건, 시스템 로그 100만 건
+- 한국식 이름/가정(가장·배우자·자녀·부모), 성도별 헌금 성향(십일조/매주/절기/비정기)
+- file: URL 은 sqlite3 로 직접 쓰기 (인덱스/트리거를 잠시 내렸다가 적재 후 재생성)
+- libsql:// URL 은 다중 행 INSERT 를 batch 로 묶어 왕복 수를 줄임
+
+실행: python benchmarks/synthetic_data.py [--url file:./data/loadtest.db] [--scale 0.1] [--seed 42]
+로그인: 생성된 사용자 계정의 비밀번호는 모두 loadtest1234 입니다.
+"""
+import argparse
+import asyncio
+import bisect
+import math
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# 프로젝트 루트 디렉토리를 시스템 경로에 추가
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from app.core.config import settings
+from app.db.engine import create_engine, local_path
+from app.db.migrations import MigrationRunner
+from app.db.table_versions import TRACKED_TABLES
+
+# scale 1.0 기준 행 수 (families 는 가정 구성에서, 참조 테이블/백업/스냅샷은 기간에서 결정)
+SCALE_1 = {
+    "users": 500,
+    "members": 50_000,
+    "member_history": 100_000,
+    "prayers": 20_000,
+    "prayer_participants": 200_000,
+    "prayer_comments": 60_000,
+    "offerings": 5_000_000,
+    "system_logs": 1_000_000,
+}
+MINIMUM = {"users": 5, "members": 20}
+
+# bcrypt("loadtest1234") - 결정적 출력을 위해 미리 계산한 값
+PASSWORD_HASH = "$2b$04$9.EduWzgQnd/.AmVDJGf2uMgedU02aJlvzOPEN01SWZMMQlTLHqHu"
+
+SURNAMES = [
+    ("김", "Kim", 21.5), ("이", "Lee", 14.7), ("박", "Park", 8.4), ("최", "Choi", 4.7),
+    ("정", "Jung", 4.3), ("강", "Kang", 2.4), ("조", "Cho", 2.1), ("윤", "Yoon", 2.1),
+    ("장", "Jang", 2.0), ("임", "Lim", 1.7), ("한", "Han", 1.5), ("오", "Oh", 1.5),
+    ("서", "Seo", 1.5), ("신", "Shin", 1.5), ("권", "Kwon", 1.4), ("황", "Hwang", 1.4),
+    ("안", "Ahn", 1.3), ("송", "Song", 1.3), ("류", "Ryu", 1.2), ("전", "Jeon", 1.1),
+    ("홍", "Hong", 1.1),
+]
+MALE_NAMES = [
+    "민준", "서준", "도윤", "예준", "시우", "하준", "주원", "지호", "지후", "준서",
+    "준우", "현우", "도현", "건우", "우진", "선우", "성민", "동현", "정훈", "영수",
+    "영호", "상철", "재현", "승민", "태현",
+]
+FEMALE_NAMES = [
+    "서연", "서윤", "지우", "서현", "민서", "하은", "하윤", "윤서", "지유", "지민",
+    "채원", "수아", "지아", "은지", "수진", "미경", "영희", "정숙", "혜진", "은영",
+    "지현", "유진", "소영", "예린", "다은",
+]
+SYLLABLES = {
+    "민": "min", "준": "jun", "서": "seo", "도": "do", "윤": "yun", "예": "ye", "시": "si",
+    "우": "woo", "하": "ha", "주": "ju", "원": "won", "지": "ji", "호": "ho", "후": "hu",
+    "현": "hyun", "건": "geon", "진": "jin", "선": "sun", "성": "sung", "동": "dong",
+    "정": "jung", "훈": "hoon", "영": "young", "수": "su", "상": "sang", "철": "chul",
+    "재": "jae", "승": "seung", "태": "tae", "연": "yeon", "은": "eun", "유": "yu",
+    "채": "chae", "아": "a", "미": "mi", "경": "kyung", "희": "hee", "숙": "sook",
+    "혜": "hye", "소": "so", "린": "rin", "다": "da",
+}
+# (시/구, 교구) - 지역별로 교구 배정
+REGIONS = [
+    ("서울특별시 강남구", "1교구"), ("서울특별시 서초구", "1교구"), ("서울특별시 송파구", "2교구"),
+    ("서울특별시 강동구", "2교구"), ("서울특별시 마포구", "3교구"), ("서울특별시 용산구", "3교구"),
+    ("서울특별시 영등포구", "4교구"), ("서울특별시 관악구", "4교구"), ("서울특별시 노원구", "5교구"),
+    ("서울특별시 성북구", "5교구"), ("경기도 성남시 분당구", "6교구"), ("경기도 용인시 수지구", "6교구"),
+    ("경기도 고양시 일산동구", "7교구"), ("경기도 수원시 영통구", "8교구"), ("인천광역시 연수구", "9교구"),
+]
+STREETS = ["중앙로", "하늘길", "은행나무로", "공원로", "새말로", "햇살길", "푸른마을로", "대학로"]
+JOBS = [
+    "회사원", "회사원", "회사원", "공무원", "교사", "자영업", "간호사", "의사", "엔지니어",
+    "주부", "주부", "대학생", "연구원", "디자이너", "은퇴", "프리랜서",
+]
+HOUSEHOLD_SIZES = [1, 2, 3, 4, 5]
+HOUSEHOLD_WEIGHTS = [25, 25, 20, 22, 8]
+
+PRAYER_CATEGORIES = [
+    ("개인 기도", "개인적인 기도 제목", "#3B82F6"),
+    ("가족 기도", "가족을 위한 기도 제목", "#10B981"),
+    ("건강 기도", "건강과 치유를 위한 기도", "#EF4444"),
+    ("사업/직장 기도", "사업과 직장을 위한 기도", "#F59E0B"),
+    ("선교 기도", "선교와 전도를 위한 기도", "#8B5CF6"),
+    ("교회 기도", "교회와 공동체를 위한 기도", "#06B6D4"),
+    ("감사 기도", "감사와 찬양의 기도", "#F97316"),
+    ("기타", "기타 기도 제목", "#6B7280"),
+]
+PRAYER_TOPICS = {
+    "개인 기도": ["믿음의 성장을 위해", "새벽기도를 꾸준히 할 수 있도록", "진로 결정을 위해"],
+    "가족 기도": ["부모님의 평안을 위해", "자녀의 신앙을 위해", "가정의 화목을 위해"],
+    "건강 기도": ["수술 회복을 위해", "어머니의 치료를 위해", "건강 검진 결과를 위해"],
+    "사업/직장 기도": ["이직 준비를 위해", "사업장의 안정을 위해", "새 직장 적응을 위해"],
+    "선교 기도": ["필리핀 선교지를 위해", "단기 선교팀을 위해", "이웃 전도를 위해"],
+    "교회 기도": ["새가족 정착을 위해", "여름 수련회를 위해", "교회학교 교사를 위해"],
+    "감사 기도": ["합격에 감사하며", "출산에 감사하며", "회복에 감사하며"],
+    "기타": ["이사 준비를 위해", "군 입대를 앞두고", "시험 준비를 위해"],
+}
+PRAYER_TAGS = ["건강", "가정", "자녀", "직장", "진로", "선교", "감사", "회복", "시험", "청년부"]
+COMMENTS = [
+    "함께 기도합니다.", "주님의 평강이 함께하시길 기도합니다.", "힘내세요! 기도하고 있어요.",
+    "좋은 소식 기다리겠습니다.", "저도 같은 마음으로 기도합니다.", "아멘, 응답하실 줄 믿습니다.",
+]
+
+OFFERING_TYPES = [
+    ("십일조", "정기적인 십일조 헌금"),
+    ("감사헌금", "감사의 마음으로 드리는 헌금"),
+    ("선교헌금", "선교 사역을 위한 헌금"),
+    ("건축헌금", "교회 건축을 위한 헌금"),
+    ("특별헌금", "특별한 목적을 위한 헌금"),
+    ("절기헌금", "절기에 드리는 헌금"),
+    ("생일헌금", "생일을 맞아 드리는 헌금"),
+    ("기타", "기타 헌금"),
+]
+# 헌금 성향: (배정 비율, 주간 선택 가중치, [(헌금 종류, 비율)])
+GIVING_PROFILES = {
+    "tither": (30, 1.6, [("십일조", 75), ("감사헌금", 15), ("선교헌금", 5), ("건축헌금", 5)]),
+    "weekly": (30, 1.4, [("감사헌금", 70), ("선교헌금", 10), ("특별헌금", 10), ("기타", 10)]),
+    "seasonal": (20, 0.35, [("절기헌금", 60), ("감사헌금", 30), ("특별헌금", 10)]),
+    "occasional": (20, 0.5, [("감사헌금", 50), ("기타", 30), ("특별헌금", 20)]),
+}
+OFFERING_MEMOS = ["감사합니다", "자녀 대학 합격 감사", "건강 회복 감사", "선교사 후원", "새 직장 감사", "결혼 감사"]
+
+SYSTEM_SETTINGS = [
+    ("church_name", "ITTLC", "string", "교회명"),
+    ("site_title", "ITTLC 교회 관리 시스템", "string", "사이트 제목"),
+    ("timezone", "Asia/Seoul", "string", "타임존"),
+    ("currency", "KRW", "string", "화폐 단위"),
+    ("items_per_page", "20", "number", "페이지당 항목 수"),
+    ("max_login_attempts", "5", "number", "최대 로그인 시도 횟수"),
+    ("auto_backup_enabled", "true", "boolean", "자동 백업 활성화"),
+    ("backup_retention_days", "30", "number", "백업 보관 일수"),
+]
+# (레벨, 가중치), (종류, 메시지, 가중치)
+LOG_LEVELS = [("INFO", 850), ("WARNING", 80), ("ERROR", 50), ("DEBUG", 15), ("CRITICAL", 5)]
+LOG_EVENTS = [
+    ("사용자", "로그인 성공", 40), ("사용자", "로그아웃", 15), ("헌금", "헌금 내역이 등록되었습니다", 15),
+    ("성도", "성도 정보가 수정되었습니다", 10), ("기도", "기도 제목이 등록되었습니다", 8),
+    ("보안", "로그인 실패", 5), ("시스템", "API 응답 지연", 4), ("설정", "시스템 설정이 변경되었습니다", 1),
+    ("데이터베이스", "쿼리 시간 초과", 1), ("백업", "데이터베이스 백업이 완료되었습니다", 1),
+]
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/124.0 Safari/537.36",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) AppleWebKit/605.1.15 Mobile/15E148",
+    "Mozilla/5.0 (Linux; Android 14; SM-S921N) AppleWebKit/537.36 Chrome/124.0 Mobile Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_4) AppleWebKit/605.1.15 Version/17.4 Safari/605.1.15",
+]
+API_PATHS = ["/api/v1/members/", "/api/v1/offerings/", "/api/v1/prayers/", "/api/v1/dashboard/stats"]
+
+# 시각 문자열 (09:00 ~ 21:45, 15분 단위)
+TIME_SLOTS = [f"{hour:02d}:{minute:02d}:00" for hour in range(9, 22) for minute in (0, 15, 30, 45)]
+
+
+def easter(year: int) -> date:
+    """부활절 (그레고리력, 익명 알고리즘)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = (h + l - 7 * m + 114) % 31 + 1
+    return date(year, month, day)
+
+
+def sunday_on_or_after(day: date) -> date:
+    return day + timedelta(days=6 - day.weekday())
+
+
+def feast_sundays(start: date, end: date) -> set:
+    """절기(신년, 부활절, 맥추감사절, 추수감사절, 성탄절)가 속한 주의 주일 ordinal"""
+    sundays = set()
+    for year in range(start.year, end.year + 1):
+        first_july_sunday = sunday_on_or_after(date(year, 7, 1))
+        third_november_sunday = sunday_on_or_after(date(year, 11, 1)) + timedelta(days=14)
+        for feast in (date(year, 1, 1), easter(year), first_july_sunday,
+                      third_november_sunday, date(year, 12, 25)):
+            sundays.add(sunday_on_or_after(feast).toordinal())
+    return sundays
+
+
+def romanize(surname_en: str, given: str) -> str:
+    return "".join(SYLLABLES[ch] for ch in given).capitalize() + " " + surname_en
+
+
+def scaled_counts(scale: float) -> Dict[str, int]:
+    """scale 에 맞춘 테이블별 목표 행 수"""
+    return {
+        table: max(MINIMUM.get(table, 1), int(round(count * scale)))
+        for table, count in SCALE_1.items()
+    }
+
+
+class SyntheticData:
+    """테이블별 행 생성기 (적재 순서대로 호출해야 함: users → members → ... → dashboard_snapshots)"""
+
+    def __init__(self, scale: float = 0.1, seed: int = 42, end_date: Optional[date] = None, years: int = 5):
+        self.scale = scale
+        self.seed = seed
+        self.end = end_date or date.today()
+        self.start = self.end - timedelta(days=365 * years)
+        self.counts = scaled_counts(scale)
+        self.id_base: Dict[str, int] = {}
+
+        # ordinal → 'YYYY-MM-DD' 캐시 (생년월일부터 종료일까지)
+        self._first_day = date(1900, 1, 1).toordinal()
+        self._iso = [date.fromordinal(o).isoformat() for o in range(self._first_day, self.end.toordinal() + 1)]
+
+        # 다른 테이블 생성에 쓰이는 상태
+        self.user_ids: List[int] = []
+        self.staff_ids: List[int] = []
+        self.member_ids: List[int] = []
+        self.member_reg: List[int] = []
+        self.member_profiles: List[Tuple[str, int, int]] = []
+        self.family_reg: List[int] = []
+        self.prayer_days: List[int] = []
+        self.prayer_ids: List[Tuple[int, int]] = []
+        self.offering_daily: Dict[int, int] = {}
+
+    def _rng(self, table: str) -> random.Random:
+        # 테이블마다 독립된 난수열 (한 테이블 규모를 바꿔도 다른 테이블 값은 유지)
+        return random.Random(f"{self.seed}:{table}")
+
+    def _day(self, ordinal: int) -> str:
+        return self._iso[ordinal - self._first_day]
+
+    def _next_id(self, table: str) -> int:
+        return self.id_base.get(table, 0) + 1
+
+    # ---------------------------------------------------------------- 참조 테이블
+
+    def prayer_categories(self) -> Iterator[tuple]:
+        return iter(PRAYER_CATEGORIES)
+
+    def offering_types(self) -> Iterator[tuple]:
+        return iter(OFFERING_TYPES)
+
+    def system_settings(self) -> Iterator[tuple]:
+        return iter(SYSTEM_SETTINGS)
+
+    # ---------------------------------------------------------------- 사용자
+
+    USER_COLUMNS = ("id", "email", "username", "password_hash", "full_name", "role", "is_active",
+                    "last_login", "failed_login_attempts", "locked_until", "created_at", "updated_at")
+
+    def users(self) -> Iterator[tuple]:
+        rng = self._rng("users")
+        start, end = self.start.toordinal(), self.end.toordinal()
+        first = self._next_id("users")
+        staff_count = max(2, self.counts["users"] // 20)
+        for offset in range(self.counts["users"]):
+            user_id = first + offset
+            surname, surname_en, _ = SURNAMES[rng.randrange(len(SURNAMES))]
+            given = rng.choice(MALE_NAMES if rng.random() < 0.5 else FEMALE_NAMES)
+            username = "".join(SYLLABLES[ch] for ch in given) + surname_en.lower() + str(user_id)
+            if offset == 0:
+                role = "admin"
+            elif offset < staff_count:
+                role = "admin" if rng.random() < 0.3 else "user"
+            else:
+                role = "guest" if rng.random() < 0.08 else "user"
+            created = rng.randint(start, end)
+            last_login = None if rng.random() < 0.1 else f"{self._day(rng.randint(created, end))} {rng.choice(TIME_SLOTS)}"
+            failed = 0 if rng.random() < 0.95 else rng.randint(1, 4)
+            created_at = f"{self._day(created)} {rng.choice(TIME_SLOTS)}"
+            self.user_ids.append(user_id)
+            if offset < staff_count:
+                self.staff_ids.append(user_id)
+            yield (user_id, f"{username}@ittlc.example", username, PASSWORD_HASH, surname + given, role,
+                   rng.random() > 0.03, last_login, failed, None, created_at, created_at)
+
+    # ---------------------------------------------------------------- 가정 / 성도
+
+    MEMBER_COLUMNS = ("id", "name", "name_en", "birth_date", "gender", "phone", "email", "address", "job",
+                      "registration_date", "baptism_date", "position", "district", "family_id", "family_role",
+                      "is_active", "notes", "created_by", "created_at", "updated_at")
+    FAMILY_COLUMNS = ("id", "family_name", "head_member_id", "address", "created_at")
+
+    def _households(self, rng: random.Random) -> List[dict]:
+        """가정 단위로 구성원 생성 (1인 가구는 가정 없이 등록)"""
+        end = self.end.toordinal()
+        start = self.start.toordinal()
+        history_start = date(1995, 1, 1).toordinal()
+        surname_weights = [weight for _, _, weight in SURNAMES]
+        target = self.counts["members"]
+        households = []
+        total = 0
+        while total < target:
+            size = min(rng.choices(HOUSEHOLD_SIZES, HOUSEHOLD_WEIGHTS)[0], target - total)
+            surname, surname_en, _ = rng.choices(SURNAMES, surname_weights)[0]
+            region, district = rng.choice(REGIONS)
+            address = f"{region} {rng.choice(STREETS)} {rng.randint(1, 300)}, {rng.randint(101, 1504)}호"
+            # 55% 는 생성 기간 이전부터 등록된 성도
+            if rng.random() < 0.55:
+                registered = rng.randint(history_start, start)
+            else:
+                registered = rng.randint(start, end)
+            head_age = rng.randint(28, 75) if size > 1 else rng.randint(19, 80)
+            head_gender = "남" if size == 1 and rng.random() < 0.45 or size > 1 and rng.random() < 0.8 else "여"
+            people = [("가장", head_gender, head_age, surname, surname_en)]
+            if size >= 2:
+                spouse = rng.choices(SURNAMES, surname_weights)[0]
+                people.append(("배우자", "여" if head_gender == "남" else "남",
+                               max(20, head_age + rng.randint(-4, 4)), spouse[0], spouse[1]))
+            for _ in range(2, min(size, 4)):
+                people.append(("자녀", "남" if rng.random() < 0.5 else "여",
+                               max(0, head_age - rng.randint(25, 38)), surname, surname_en))
+            if size == 5:
+                people.append(("부모", "여" if rng.random() < 0.6 else "남",
+                               min(98, head_age + rng.randint(25, 32)), surname, surname_en))
+            households.append({"registered": registered, "address": address, "district": district,
+                               "people": people, "family": size > 1})
+            total += size
+        households.sort(key=lambda household: household["registered"])
+        return households
+
+    def families_and_members(self) -> Tuple[List[tuple], Iterator[tuple]]:
+        """(families 행 목록, members 행 생성기) - families.head_member_id 는 성도 적재 후 채움"""
+        rng = self._rng("members")
+        households = self._households(rng)
+        end = self.end.toordinal()
+        family_id = self._next_id("families")
+        families = []
+        for household in households:
+            if household["family"]:
+                household["family_id"] = family_id
+                head = household["people"][0]
+                families.append((family_id, f"{head[3]}씨 가정", None, household["address"],
+                                 f"{self._day(household['registered'])} {rng.choice(TIME_SLOTS)}"))
+                self.family_reg.append(household["registered"])
+                family_id += 1
+        return families, self._members(rng, households, end)
+
+    def _members(self, rng: random.Random, households: List[dict], end: int) -> Iterator[tuple]:
+        profile_names = list(GIVING_PROFILES)
+        profile_weights = [GIVING_PROFILES[name][0] for name in profile_names]
+        end_year = self.end.year
+        pending = []
+        for household in households:
+            registered = household["registered"]
+            family_id = household.get("family_id")
+            for role, gender, age, surname, surname_en in household["people"]:
+                given = rng.choice(MALE_NAMES if gender == "남" else FEMALE_NAMES)
+                birth = date(end_year - age, rng.randint(1, 12), rng.randint(1, 28)).toordinal()
+                if birth > end:
+                    birth = end - rng.randint(0, 300)
+                # 가정 등록 이후에 태어난 자녀는 출생일에 등록
+                member_registered = min(end, max(registered, birth))
+                name_en = romanize(surname_en, given) if rng.random() < 0.35 else None
+                email = None
+                if age >= 15 and rng.random() < 0.45:
+                    email = f"{''.join(SYLLABLES[ch] for ch in given)}.{surname_en.lower()}{{id}}@example.com"
+                phone = f"010-{rng.randint(2000, 9999)}-{rng.randint(0, 9999):04d}" if age >= 12 else None
+                job = "학생" if age < 20 else ("은퇴" if age >= 67 and rng.random() < 0.7 else rng.choice(JOBS))
+                baptism = None
+                if age >= 14 and rng.random() < 0.7:
+                    baptism = self._day(min(end, max(member_registered, birth + 14 * 365) + rng.randint(0, 3650)))
+                position = "성도"
+                if age >= 55 and gender == "남" and rng.random() < 0.08:
+                    position = "장로"
+                elif age >= 50 and gender == "여" and rng.random() < 0.2:
+                    position = "권사"
+                elif age >= 30 and rng.random() < 0.3:
+                    position = "집사"
+                elif 19 <= age < 35 and rng.random() < 0.5:
+                    position = "청년"
+                is_active = rng.random() < 0.92
+
+                # 헌금 성향과 기준 금액
+                if age < 19:
+                    profile, base = "occasional", rng.choice((1000, 2000, 3000, 5000))
+                else:
+                    profile = rng.choices(profile_names, profile_weights)[0]
+                    if profile == "tither":
+                        income = rng.lognormvariate(math.log(3_500_000), 0.5)
+                        base = max(50_000, int(round(income * 0.1, -4)))
+                    elif profile == "weekly":
+                        base = rng.choice((5000, 10_000, 10_000, 20_000, 30_000, 50_000))
+                    elif profile == "seasonal":
+                        base = rng.choice((30_000, 50_000, 100_000, 200_000))
+                    else:
+                        base = rng.choice((5000, 10_000, 30_000, 50_000, 100_000))
+                weight = GIVING_PROFILES[profile][1] * (1.0 if is_active else 0.1)
+                created_at = f"{self._day(member_registered)} {rng.choice(TIME_SLOTS)}"
+                row = (surname + given, name_en, self._day(birth), gender, phone, email,
+                       household["address"], job, self._day(member_registered), baptism, position,
+                       household["district"], family_id, role if family_id else None, is_active,
+                       "새가족 양육 과정 수료" if rng.random() < 0.05 else None,
+                       rng.choice(self.staff_ids), created_at, created_at)
+                pending.append((member_registered, row, (profile, base, date.fromordinal(birth).month, weight)))
+
+        # id 순서 = 등록일 순서 (등록 시점 기준 집계가 이분 탐색으로 가능)
+        pending.sort(key=lambda item: item[0])
+        member_id = self._next_id("members")
+        for member_registered, row, profile in pending:
+            self.member_ids.append(member_id)
+            self.member_reg.append(member_registered)
+            self.member_profiles.append(profile)
+            if row[5]:
+                row = row[:5] + (row[5].replace("{id}", str(member_id)),) + row[6:]
+            yield (member_id,) + row
+            member_id += 1
+
+    HISTORY_COLUMNS = ("member_id", "field_name", "old_value", "new_value", "modified_by", "modified_at")
+
+    def member_history(self) -> Iterator[tuple]:
+        rng = self._rng("member_history")
+        start, end = self.start.toordinal(), self.end.toordinal()
+        days = sorted(rng.randint(start, end) for _ in range(self.counts["member_history"]))
+        positions = ["성도", "청년", "집사", "권사", "장로"]
+        for day in days:
+            active = bisect.bisect_right(self.member_reg, day)
+            if not active:
+                continue
+            member_id = self.member_ids[rng.randrange(active)]
+            field = rng.choice(("phone", "address", "position", "district", "job"))
+            if field == "phone":
+                old = f"010-{rng.randint(2000, 9999)}-{rng.randint(0, 9999):04d}"
+                new = f"010-{rng.randint(2000, 9999)}-{rng.randint(0, 9999):04d}"
+            elif field == "address":
+                old, new = (f"{rng.choice(REGIONS)[0]} {rng.choice(STREETS)} {rng.randint(1, 300)}" for _ in range(2))
+            elif field == "position":
+                index = rng.randrange(len(positions) - 1)
+                old, new = positions[index], positions[index + 1]
+            elif field == "district":
+                old, new = f"{rng.randint(1, 9)}교구", f"{rng.randint(1, 9)}교구"
+            else:
+                old, new = rng.choice(JOBS), rng.choice(JOBS)
+            yield (member_id, field, old, new, rng.choice(self.staff_ids),
+                   f"{self._day(day)} {rng.choice(TIME_SLOTS)}")
+
+    # ---------------------------------------------------------------- 기도
+
+    PRAYER_COLUMNS = ("id", "title", "content", "category", "is_anonymous", "visibility", "status",
+                      "prayer_period_start", "prayer_period_end", "answer_content", "answer_date", "tags",
+                      "created_by", "created_at", "updated_at")
+
+    def prayers(self) -> Iterator[tuple]:
+        rng = self._rng("prayers")
+        start, end = self.start.toordinal(), self.end.toordinal()
+        categories = [name for name, _, _ in PRAYER_CATEGORIES]
+        days = sorted(rng.randint(start, end) for _ in range(self.counts["prayers"]))
+        prayer_id = self._next_id("prayers")
+        for day in days:
+            category = rng.choice(categories)
+            topic = rng.choice(PRAYER_TOPICS[category])
+            age = end - day
+            roll = rng.random()
+            if age > 180:
+                status = "active" if roll < 0.3 else ("answered" if roll < 0.65 else "completed")
+            else:
+                status = "active" if roll < 0.8 else ("answered" if roll < 0.95 else "completed")
+            answer_content = answer_date = None
+            if status == "answered":
+                answer_content = "기도해 주신 덕분에 응답받았습니다. 감사합니다."
+                answer_date = self._day(min(end, day + rng.randint(7, 120)))
+            period_end = self._day(min(end, day + rng.choice((30, 90)))) if rng.random() < 0.4 else None
+            tags = ",".join(rng.sample(PRAYER_TAGS, rng.randint(0, 3))) or None
+            created_at = f"{self._day(day)} {rng.choice(TIME_SLOTS)}"
+            self.prayer_days.append(day)
+            self.prayer_ids.append((prayer_id, day))
+            yield (prayer_id, topic, f"{topic} 기도 부탁드립니다. 주님의 인도하심을 구합니다.", category,
+                   rng.random() < 0.15, rng.choices(("public", "members", "private"), (70, 25, 5))[0],
+                   status, self._day(day), period_end, answer_content, answer_date, tags,
+                   rng.choice(self.user_ids), created_at, created_at)
+            prayer_id += 1
+
+    PARTICIPANT_COLUMNS = ("prayer_id", "user_id", "participated_at")
+
+    def prayer_participants(self) -> Iterator[tuple]:
+        rng = self._rng("prayer_participants")
+        end = self.end.toordinal()
+        average = self.counts["prayer_participants"] / max(1, len(self.prayer_ids))
+        upper = min(len(self.user_ids), max(1, int(2 * average)))
+        for prayer_id, day in self.prayer_ids:
+            for user_id in rng.sample(self.user_ids, rng.randint(0, upper)):
+                yield (prayer_id, user_id, f"{self._day(min(end, day + rng.randint(0, 14)))} {rng.choice(TIME_SLOTS)}")
+
+    COMMENT_COLUMNS = ("prayer_id", "user_id", "comment", "is_anonymous", "created_at")
+
+    def prayer_comments(self) -> Iterator[tuple]:
+        rng = self._rng("prayer_comments")
+        end = self.end.toordinal()
+        upper = max(1, int(2 * self.counts["prayer_comments"] / max(1, len(self.prayer_ids))))
+        for prayer_id, day in self.prayer_ids:
+            for _ in range(rng.randint(0, upper)):
+                yield (prayer_id, rng.choice(self.user_ids), rng.choice(COMMENTS), rng.random() < 0.1,
+                       f"{self._day(min(end, day + rng.randint(0, 30)))} {rng.choice(TIME_SLOTS)}")
+
+    # ---------------------------------------------------------------- 헌금
+
+    OFFERING_COLUMNS = ("member_id", "offering_date", "offering_type", "amount", "memo",
+                        "created_by", "created_at", "updated_at")
+
+    def offerings(self) -> Iterator[tuple]:
+        """주 단위로 시간 순서대로 생성 (id 순서 = 날짜 순서)
+
+        주마다 그 시점에 등록된 성도 중 성향 가중치로 헌금자를 뽑고,
+        절기가 있는 주는 건수를 늘리고 절기헌금 비중을 높입니다.
+        """
+        rng = self._rng("offerings")
+        random_ = rng.random
+        start, end = self.start.toordinal(), self.end.toordinal()
+        first_sunday = sunday_on_or_after(self.start).toordinal()
+        sundays = list(range(first_sunday, end + 1, 7))
+        feasts = feast_sundays(self.start, self.end)
+
+        # 성향별 헌금 종류 누적 비율
+        type_tables = {}
+        for profile, (_, _, mix) in GIVING_PROFILES.items():
+            names = [name for name, _ in mix]
+            cumulative = []
+            total = 0
+            for _, share in mix:
+                total += share
+                cumulative.append(total / 100)
+            type_tables[profile] = (names, cumulative)
+
+        cumulative_weights = []
+        running = 0.0
+        for _, _, _, weight in self.member_profiles:
+            running += weight
+            cumulative_weights.append(running)
+
+        # 주별 목표 건수: 등록 성도 수 x 절기 가중치에 비례하도록 전체 목표를 배분
+        actives = [bisect.bisect_right(self.member_reg, sunday) for sunday in sundays]
+        week_weights = [active * (2.5 if sunday in feasts else 1.0) for active, sunday in zip(actives, sundays)]
+        total_weight = sum(week_weights) or 1.0
+        target = self.counts["offerings"]
+
+        profiles = self.member_profiles
+        member_ids = self.member_ids
+        member_reg = self.member_reg
+        staff_ids = self.staff_ids
+        daily = self.offering_daily
+        day_of = self._day
+        bisect_right = bisect.bisect_right
+        slots = TIME_SLOTS
+        carry = 0.0
+        for sunday, active, week_weight in zip(sundays, actives, week_weights):
+            carry += target * week_weight / total_weight
+            count = int(carry)
+            carry -= count
+            if not active or not count:
+                continue
+            is_feast = sunday in feasts
+            month = date.fromordinal(sunday).month
+            top = cumulative_weights[active - 1]
+            for _ in range(count):
+                index = bisect_right(cumulative_weights, random_() * top, 0, active - 1)
+                profile, base, birth_month, _ = profiles[index]
+                day = sunday if random_() < 0.85 else sunday - int(random_() * 6) - 1
+                if day < start or day < member_reg[index]:
+                    day = sunday
+                if is_feast and random_() < 0.5:
+                    offering_type = "절기헌금"
+                    amount = base * 2
+                elif birth_month == month and random_() < 0.1:
+                    offering_type = "생일헌금"
+                    amount = base
+                else:
+                    names, cumulative = type_tables[profile]
+                    roll = random_()
+                    offering_type = names[-1]
+                    for name, bound in zip(names, cumulative):
+                        if roll < bound:
+                            offering_type = name
+                            break
+                    amount = base if offering_type == "십일조" else base * (0.5 + random_())
+                amount = max(1000, int(amount) // 1000 * 1000)
+                daily[day] = daily.get(day, 0) + amount
+                created_at = f"{day_of(day)} {slots[int(random_() * len(slots))]}"
+                yield (member_ids[index], day_of(day), offering_type, amount,
+                       OFFERING_MEMOS[int(random_() * len(OFFERING_MEMOS))] if random_() < 0.03 else None,
+                       staff_ids[int(random_() * len(staff_ids))], created_at, created_at)
+
+    # ---------------------------------------------------------------- 시스템
+
+    LOG_COLUMNS = ("user_id", "log_level", "log_type", "message", "ip_address", "user_agent",
+                   "additional_data", "created_at")
+
+    def system_logs(self) -> Iterator[tuple]:
+        """시간 순서대로 균등 간격 + 지터로 생성"""
+        rng = self._rng("system_logs")
+        random_ = rng.random
+        count = self.counts["system_logs"]
+        start_second = self.start.toordinal() * 86400
+        span = (self.end.toordinal() + 1) * 86400 - start_second
+        step = span / count
+        levels = [level for level, _ in LOG_LEVELS]
+        level_weights = [weight for _, weight in LOG_LEVELS]
+        events = [(kind, message) for kind, message, _ in LOG_EVENTS]
+        event_weights = [weight for _, _, weight in LOG_EVENTS]
+        level_choices = rng.choices(levels, level_weights, k=1024)
+        event_choices = rng.choices(events, event_weights, k=1024)
+        user_ids = self.user_ids
+        day_of = self._day
+        for index in range(count):
+            second = start_second + int(index * step + random_() * step)
+            ordinal, seconds = divmod(second, 86400)
+            log_type, message = event_choices[int(random_() * 1024)]
+            level = level_choices[int(random_() * 1024)]
+            additional = None
+            if random_() < 0.2:
+                additional = (f'{{"path": "{API_PATHS[int(random_() * len(API_PATHS))]}", '
+                              f'"status": {200 if level == "INFO" else 500}, '
+                              f'"duration_ms": {int(random_() * 300)}}}')
+            yield (user_ids[int(random_() * len(user_ids))] if random_() < 0.7 else None, level, log_type, message,
+                   f"211.234.{int(random_() * 256)}.{int(random_() * 256)}",
+                   USER_AGENTS[int(random_() * len(USER_AGENTS))], additional,
+                   f"{day_of(ordinal)} {seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}")
+
+    BACKUP_COLUMNS = ("filename", "file_size", "backup_type", "status", "created_by", "created_at")
+
+    def backup_history(self) -> Iterator[tuple]:
+        """매일 03:00 자동 백업, 주일 예약 백업, 한 달에 한 번 정도 수동 백업"""
+        rng = self._rng("backup_history")
+        start, end = self.start.toordinal(), self.end.toordinal()
+        size = 5 * 1024 * 1024
+        growth = max(1, int(self.counts["offerings"] * 120 / max(1, end - start)))
+        for day in range(start, end + 1):
+            size += growth
+            compact = self._day(day).replace("-", "")
+            runs = [("auto", "030000")]
+            if date.fromordinal(day).weekday() == 6:
+                runs.append(("scheduled", "040000"))
+            if rng.random() < 1 / 30:
+                runs.append(("manual", f"{rng.randint(10, 18)}0000"))
+            for backup_type, clock in runs:
+                status = "success" if rng.random() < 0.97 else "failed"
+                yield (f"ittlc_backup_{compact}_{clock}.db", size if status == "success" else None,
+                       backup_type, status, self.staff_ids[0] if backup_type == "manual" else None,
+                       f"{self._day(day)} {clock[:2]}:{clock[2:4]}:{clock[4:]}")
+
+    SNAPSHOT_COLUMNS = ("snapshot_date", "member_count", "family_count", "monthly_prayer_count",
+                        "monthly_offering_amount", "created_at")
+
+    def dashboard_snapshots(self, days: int = 365) -> Iterator[tuple]:
+        """최근 days 일의 일별 대시보드 스냅샷 (생성한 데이터로 계산, offerings 이후에 호출)"""
+        end = self.end.toordinal()
+        prayer_days = sorted(self.prayer_days)
+        family_reg = sorted(self.family_reg)
+        for day in range(max(self.start.toordinal(), end - days + 1), end + 1):
+            month_start = date.fromordinal(day).replace(day=1).toordinal()
+            prayers = (bisect.bisect_right(prayer_days, day) - bisect.bisect_left(prayer_days, month_start))
+            amount = sum(self.offering_daily.get(o, 0) for o in range(month_start, day + 1))
+            yield (self._day(day), bisect.bisect_right(self.member_reg, day),
+                   bisect.bisect_right(family_reg, day), prayers, amount, f"{self._day(day)} 23:59:00")
+
+
+class SQLiteLoader:
+    """로컬 SQLite 파일에 executemany 로 직접 적재"""
+
+    def __init__(self, path: str, chunk_rows: int = 100_000):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.connection = sqlite3.connect(path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # 적재 중에는 내구성보다 속도 (실패 시 다시 생성하면 됨)
+        self.connection.execute("PRAGMA synchronous=OFF")
+        self.connection.execute("PRAGMA cache_size=-262144")
+        self.connection.execute("PRAGMA temp_store=MEMORY")
+        self._suspended: List[str] = []
+
+    async def max_id(self, table: str) -> int:
+        return self.connection.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()):
+        self.connection.execute(sql, params)
+
+    async def insert(self, table: str, columns: Sequence[str], rows: Iterable[tuple],
+                     or_ignore: bool = False) -> int:
+        sql = (f"INSERT {'OR IGNORE ' if or_ignore else ''}INTO {table} ({', '.join(columns)}) "
+               f"VALUES ({', '.join('?' * len(columns))})")
+        iterator = iter(rows)
+        count = 0
+        while True:
+            chunk = list(islice(iterator, self.chunk_rows))
+            if not chunk:
+                return count
+            self.connection.execute("BEGIN")
+            self.connection.executemany(sql, chunk)
+            self.connection.execute("COMMIT")
+            count += len(chunk)
+
+    async def suspend(self, tables: Sequence[str]):
+        """대상 테이블의 인덱스와 트리거를 내려 두기 (행마다 인덱스 갱신/버전 증가 방지)"""
+        placeholders = ", ".join("?" * len(tables))
+        rows = self.connection.execute(
+            f"SELECT type, name, sql FROM sqlite_master WHERE type IN ('index', 'trigger') "
+            f"AND sql IS NOT NULL AND tbl_name IN ({placeholders})", list(tables)
+        ).fetchall()
+        for kind, name, sql in rows:
+            self.connection.execute(f"DROP {kind.upper()} IF EXISTS {name}")
+            self._suspended.append(sql)
+
+    async def resume(self):
+        """내려 둔 인덱스/트리거 재생성 (인덱스는 한 번에 정렬해서 만드는 편이 훨씬 빠름)"""
+        while self._suspended:
+            self.connection.execute(self._suspended.pop(0))
+
+    async def close(self):
+        # 대량 적재 후 모든 테이블 통계 갱신 (일부 테이블만 통계가 있으면 플래너가 잘못된 테이블부터 읽음)
+        self.connection.execute("ANALYZE")
+        self.connection.close()
+
+
+class BatchLoader:
+    """원격 DB: 다중 행 INSERT 를 batch 로 묶어 한 번의 왕복에 많은 행을 보냄"""
+
+    # SQLITE_MAX_VARIABLE_NUMBER(32766) 보다 넉넉히 작게
+    MAX_PARAMS = 30_000
+
+    def __init__(self, client, rows_per_statement: int = 500, statements_per_batch: int = 20):
+        self.client = client
+        self.rows_per_statement = rows_per_statement
+        self.statements_per_batch = statements_per_batch
+
+    async def max_id(self, table: str) -> int:
+        result = await self.client.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+        return result.rows[0][0]
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()):
+        await self.client.execute(sql, list(params))
+
+    async def insert(self, table: str, columns: Sequence[str], rows: Iterable[tuple],
+                     or_ignore: bool = False) -> int:
+        per_statement = max(1, min(self.rows_per_statement, self.MAX_PARAMS // len(columns)))
+        prefix = f"INSERT {'OR IGNORE ' if or_ignore else ''}INTO {table} ({', '.join(columns)}) VALUES "
+        group = f"({', '.join('?' * len(columns))})"
+        statements_sql: Dict[int, str] = {}
+        iterator = iter(rows)
+        count = 0
+        while True:
+            statements = []
+            for _ in range(self.statements_per_batch):
+                chunk = list(islice(iterator, per_statement))
+                if not chunk:
+                    break
+                sql = statements_sql.get(len(chunk))
+                if sql is None:
+                    sql = statements_sql[len(chunk)] = prefix + ", ".join([group] * len(chunk))
+                statements.append((sql, [value for row in chunk for value in row]))
+                count += len(chunk)
+            if not statements:
+                return count
+            await self.client.batch(statements)
+
+    async def suspend(self, tables: Sequence[str]):
+        # 공유 원격 DB의 스키마는 건드리지 않음 (트리거/인덱스 유지)
+        pass
+
+    async def resume(self):
+        pass
+
+    async def close(self):
+        await self.client.close()
+
+
+async def generate(url: str, auth_token: Optional[str] = None, scale: float = 0.1, seed: int = 42,
+                   end_date: Optional[date] = None, years: int = 5, migrate: bool = True,
+                   report=print) -> Dict[str, int]:
+    """스키마를 최신으로 맞추고 합성 데이터 적재, 테이블별 적재 행 수 반환"""
+    engine = create_engine(url, auth_token)
+    await engine.start()
+    client = await engine.get_client()
+    if migrate:
+        applied = await MigrationRunner(client).migrate()
+        if applied:
+            report(f"🗄️  마이그레이션 {len(applied)}개 적용")
+
+    direct = url.startswith("file:")
+    if direct:
+        await client.close()
+        await engine.stop()
+        loader = SQLiteLoader(local_path(url))
+    else:
+        loader = BatchLoader(client)
+
+    data = SyntheticData(scale=scale, seed=seed, end_date=end_date, years=years)
+    loaded: Dict[str, int] = {}
+    bulk_tables = ("users", "families", "members", "member_history", "prayers", "prayer_participants",
+                   "prayer_comments", "offerings", "system_logs", "backup_history", "dashboard_snapshots")
+    for table in ("users", "families", "members", "prayers"):
+        data.id_base[table] = await loader.max_id(table)
+
+    async def load(table: str, columns: Sequence[str], rows: Iterable[tuple], or_ignore: bool = False):
+        started = time.perf_counter()
+        count = await loader.insert(table, columns, rows, or_ignore=or_ignore)
+        elapsed = time.perf_counter() - started
+        loaded[table] = count
+        report(f"  ✅ {table:<20} {count:>10,}행 {elapsed:7.2f}초 {count / max(elapsed, 1e-9):>12,.0f}행/초")
+
+    started = time.perf_counter()
+    try:
+        await loader.suspend(bulk_tables)
+        try:
+            await load("prayer_categories", ("name", "description", "color"), data.prayer_categories(), or_ignore=True)
+            await load("offering_types", ("name", "description"), data.offering_types(), or_ignore=True)
+            await load("system_settings", ("setting_key", "setting_value", "setting_type", "description"),
+                       data.system_settings(), or_ignore=True)
+            await load("users", data.USER_COLUMNS, data.users())
+            families, members = data.families_and_members()
+            await load("families", data.FAMILY_COLUMNS, families)
+            await load("members", data.MEMBER_COLUMNS, members)
+            await load("member_history", data.HISTORY_COLUMNS, data.member_history())
+            await load("prayers", data.PRAYER_COLUMNS, data.prayers())
+            await load("prayer_participants", data.PARTICIPANT_COLUMNS, data.prayer_participants(), or_ignore=True)
+            await load("prayer_comments", data.COMMENT_COLUMNS, data.prayer_comments())
+            await load("offerings", data.OFFERING_COLUMNS, data.offerings())
+            await load("system_logs", data.LOG_COLUMNS, data.system_logs())
+            await load("backup_history", data.BACKUP_COLUMNS, data.backup_history())
+            await load("dashboard_snapshots", data.SNAPSHOT_COLUMNS, data.dashboard_snapshots(), or_ignore=True)
+        finally:
+            index_started = time.perf_counter()
+            await loader.resume()
+            if direct:
+                report(f"  🔧 인덱스/트리거 재생성 {time.perf_counter() - index_started:.2f}초")
+
+        # 가장 id 는 성도 적재 후 한 문장으로 채움 (외래 키 검사가 켜져 있어도 안전)
+        await loader.execute(
+            "UPDATE families SET head_member_id = (SELECT id FROM members WHERE members.family_id = families.id "
+            "AND members.family_role = '가장' LIMIT 1) WHERE id > ?", [data.id_base["families"]]
+        )
+        # 트리거를 거치지 않은 적재이므로 캐시/ETag 가 바뀌도록 버전을 직접 올림
+        touched = [table for table in TRACKED_TABLES if table in loaded]
+        if touched:
+            await loader.execute(
+                f"UPDATE table_versions SET version = version + 1 WHERE table_name IN ({', '.join('?' * len(touched))})",
+                touched
+            )
+    finally:
+        await loader.close()
+        if not direct:
+            await engine.stop()
+
+    elapsed = time.perf_counter() - started
+    total = sum(loaded.values())
+    report(f"🎉 총 {total:,}행, {elapsed:.1f}초 ({total / max(elapsed, 1e-9):,.0f}행/초)")
+    return loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 합성 데이터 생성")
+    parser.add_argument("--url", default="file:./data/loadtest.db",
+                        help="대상 DB (file: 이면 로컬 직접 쓰기, libsql:// 이면 batch 다중 행 INSERT)")
+    parser.add_argument("--auth-token", default=settings.LIBSQL_AUTH_TOKEN)
+    parser.add_argument("--scale", type=float, default=0.1, help="1.0 = 성도 5만 / 헌금 500만 / 로그 100만")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None,
+                        help="데이터 마지막 날짜 (기본: 오늘, 재현하려면 고정)")
+    parser.add_argument("--years", type=int, default=5, help="생성 기간 (년)")
+    args = parser.parse_args()
+
+    if args.url.startswith("file:"):
+        Path(local_path(args.url)).parent.mkdir(parents=True, exist_ok=True)
+    counts = scaled_counts(args.scale)
+    end_date = args.end_date or date.today()
+    print(f"🧪 합성 데이터 생성: {args.url} (scale={args.scale}, seed={args.seed}, end-date={end_date})")
+    print("   목표: " + ", ".join(f"{table} {count:,}" for table, count in counts.items()))
+    asyncio.run(generate(args.url, args.auth_token, scale=args.scale, seed=args.seed,
+                         end_date=end_date, years=args.years))
+
+
+if __name__ == "__main__":
+    main()
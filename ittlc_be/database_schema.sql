@@ -3,6 +3,8 @@
 -- 작성일: 2024-01-XX
 -- 버전: 1.0
 -- 설명: 모든 기능을 위한 완전한 데이터베이스 스키마
+-- 참고: 실제 적용은 migrations/ 의 버전별 파일로 합니다 (python migrate.py up).
+--       이 파일은 모든 마이그레이션을 적용한 결과를 한눈에 보기 위한 참고용입니다.
 -- ====================================================================
 
 -- 1. 사용자 관리 테이블
@@ -34,6 +36,7 @@ CREATE TABLE IF NOT EXISTS families (
     head_member_id INTEGER,
     address TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    deleted_at TIMESTAMP,
     FOREIGN KEY (head_member_id) REFERENCES members(id)
 );
 
@@ -59,6 +62,7 @@ CREATE TABLE IF NOT EXISTS members (
     created_by INTEGER NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    deleted_at TIMESTAMP,
     FOREIGN KEY (family_id) REFERENCES families(id),
     FOREIGN KEY (created_by) REFERENCES users(id)
 );
@@ -106,6 +110,7 @@ CREATE TABLE IF NOT EXISTS prayers (
     created_by INTEGER NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    deleted_at TIMESTAMP,
     FOREIGN KEY (created_by) REFERENCES users(id)
 );
 
@@ -155,6 +160,7 @@ CREATE TABLE IF NOT EXISTS offerings (
     created_by INTEGER NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    deleted_at TIMESTAMP,
     FOREIGN KEY (member_id) REFERENCES members(id),
     FOREIGN KEY (created_by) REFERENCES users(id)
 );
@@ -196,9 +202,131 @@ CREATE TABLE IF NOT EXISTS backup_history (
     status VARCHAR(20) NOT NULL CHECK (status IN ('success', 'failed', 'in_progress')),
     created_by INTEGER,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    format VARCHAR(10),            -- sqlite(로컬 파일 백업) / sql(원격 덤프)
+    compression VARCHAR(10),       -- zstd / gzip
+    raw_size INTEGER,              -- 압축 전 크기
+    checksum VARCHAR(64),          -- 백업 파일 SHA-256
+    completed_at TIMESTAMP,
+    error_message TEXT,
+    backup_kind VARCHAR(12),       -- full / incremental
+    parent_filename VARCHAR(255),  -- 증분 백업의 부모 백업 파일
+    snapshot_at TIMESTAMP,         -- 백업에 담긴 스냅샷 시각 (UTC)
     FOREIGN KEY (created_by) REFERENCES users(id)
 );
 
+-- 6. 캐시 검증용 테이블
+-- ====================================================================
+
+-- 테이블 버전 카운터 (쓰기 시 트리거로 증가, ETag 계산에 사용)
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name VARCHAR(100) PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+-- 대시보드 통계 스냅샷 (일 단위, 추이 차트용)
+CREATE TABLE IF NOT EXISTS dashboard_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    snapshot_date DATE NOT NULL UNIQUE,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    family_count INTEGER NOT NULL DEFAULT 0,
+    monthly_prayer_count INTEGER NOT NULL DEFAULT 0,
+    monthly_offering_amount DECIMAL(12,2) NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 삭제 기록 (증분 백업용, 전체 백업 후 그 스냅샷 이전 기록은 정리됨)
+CREATE TABLE IF NOT EXISTS deleted_rows (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name VARCHAR(100) NOT NULL,
+    row_id INTEGER NOT NULL,
+    deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 변경 이벤트 (트랜잭셔널 아웃박스, 도메인 테이블 쓰기 시 capture_* 트리거가 기록)
+-- changed_columns: 수정된 컬럼 이름(쉼표 구분), version: 변경 후 table_versions 값, parent_id/user_id: 구독 경로용 키
+CREATE TABLE IF NOT EXISTS change_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name VARCHAR(100) NOT NULL,
+    row_id INTEGER NOT NULL,
+    op VARCHAR(6) NOT NULL CHECK (op IN ('insert', 'update', 'delete')),
+    changed_columns TEXT,
+    version INTEGER NOT NULL,
+    parent_id INTEGER,
+    user_id INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 변경 이벤트 소비자별 처리 위치
+CREATE TABLE IF NOT EXISTS outbox_cursors (
+    consumer VARCHAR(100) PRIMARY KEY,
+    last_event_id INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 7. 주기 작업 스케줄러
+-- ====================================================================
+
+-- 작업 실행 임대 (한 워커만 실행, lease_until 은 unix 초, last_slot 은 마지막으로 실행한 예약 시각)
+CREATE TABLE IF NOT EXISTS job_leases (
+    job_name VARCHAR(100) PRIMARY KEY,
+    owner VARCHAR(100),
+    lease_until REAL NOT NULL DEFAULT 0,
+    last_slot VARCHAR(20)
+);
+
+-- 작업 실행 이력
+CREATE TABLE IF NOT EXISTS job_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_name VARCHAR(100) NOT NULL,
+    trigger_type VARCHAR(10) NOT NULL CHECK (trigger_type IN ('schedule', 'manual')),
+    owner VARCHAR(100) NOT NULL,
+    status VARCHAR(20) NOT NULL CHECK (status IN ('running', 'success', 'failed')),
+    scheduled_for VARCHAR(20),
+    result TEXT,
+    error_message TEXT,
+    duration_ms REAL,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+-- 백그라운드 작업 대기열 (오래 걸리는 요청을 202 로 접수하고 앱 내 작업자가 처리)
+CREATE TABLE IF NOT EXISTS background_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_type VARCHAR(50) NOT NULL,
+    params TEXT,                   -- JSON
+    status VARCHAR(20) NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'succeeded', 'failed', 'cancelled')),
+    progress REAL NOT NULL DEFAULT 0,
+    progress_message TEXT,
+    result TEXT,                   -- JSON
+    result_path TEXT,              -- 결과 파일 (다운로드)
+    result_filename VARCHAR(255),
+    result_content_type VARCHAR(100),
+    error_message TEXT,
+    cancel_requested BOOLEAN NOT NULL DEFAULT FALSE,
+    owner VARCHAR(100),            -- 처리 중인 작업자
+    lease_until REAL NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_by INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP,
+    checkpoint INTEGER NOT NULL DEFAULT 0,  -- 재개 지점 (가져오기: 커밋한 행 수)
+    FOREIGN KEY (created_by) REFERENCES users(id)
+);
+
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES
+    ('users', 0),
+    ('members', 0),
+    ('families', 0),
+    ('prayer_categories', 0),
+    ('prayers', 0),
+    ('prayer_participants', 0),
+    ('prayer_comments', 0),
+    ('offering_types', 0),
+    ('offerings', 0),
+    ('system_settings', 0);
+
 -- ====================================================================
 -- 인덱스 생성
 -- ====================================================================
@@ -209,32 +337,68 @@ CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
 CREATE INDEX IF NOT EXISTS idx_users_role ON users(role);
 
 -- 성도 테이블 인덱스
-CREATE INDEX IF NOT EXISTS idx_members_name ON members(name);
-CREATE INDEX IF NOT EXISTS idx_members_email ON members(email);
-CREATE INDEX IF NOT EXISTS idx_members_phone ON members(phone);
-CREATE INDEX IF NOT EXISTS idx_members_family_id ON members(family_id);
-CREATE INDEX IF NOT EXISTS idx_members_is_active ON members(is_active);
+CREATE INDEX IF NOT EXISTS idx_members_name ON members(name) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_members_email ON members(email) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_members_phone ON members(phone) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_members_family_id_family_role_birth_date ON members(family_id, family_role, birth_date) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_members_is_active ON members(is_active) WHERE deleted_at IS NULL;
 
 -- 기도 테이블 인덱스
-CREATE INDEX IF NOT EXISTS idx_prayers_created_by ON prayers(created_by);
-CREATE INDEX IF NOT EXISTS idx_prayers_category ON prayers(category);
-CREATE INDEX IF NOT EXISTS idx_prayers_status ON prayers(status);
-CREATE INDEX IF NOT EXISTS idx_prayers_visibility ON prayers(visibility);
-CREATE INDEX IF NOT EXISTS idx_prayer_participants_prayer_id ON prayer_participants(prayer_id);
+CREATE INDEX IF NOT EXISTS idx_prayers_created_by_created_at ON prayers(created_by, created_at) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_category_created_at ON prayers(category, created_at) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_status ON prayers(status) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_visibility ON prayers(visibility) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_created_at ON prayers(created_at) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_prayer_participants_prayer_id_participated_at ON prayer_participants(prayer_id, participated_at);
 CREATE INDEX IF NOT EXISTS idx_prayer_participants_user_id ON prayer_participants(user_id);
+CREATE INDEX IF NOT EXISTS idx_prayer_comments_prayer_id_created_at ON prayer_comments(prayer_id, created_at);
 
 -- 헌금 테이블 인덱스
-CREATE INDEX IF NOT EXISTS idx_offerings_member_id ON offerings(member_id);
-CREATE INDEX IF NOT EXISTS idx_offerings_offering_date ON offerings(offering_date);
-CREATE INDEX IF NOT EXISTS idx_offerings_offering_type ON offerings(offering_type);
-CREATE INDEX IF NOT EXISTS idx_offerings_created_by ON offerings(created_by);
+CREATE INDEX IF NOT EXISTS idx_offerings_member_id_offering_date_created_at ON offerings(member_id, offering_date, created_at) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_offerings_member_id_offering_type ON offerings(member_id, offering_type) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_offerings_offering_date_created_at ON offerings(offering_date, created_at) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_offerings_offering_type ON offerings(offering_type) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_offerings_created_by ON offerings(created_by) WHERE deleted_at IS NULL;
 
 -- 시스템 로그 인덱스
-CREATE INDEX IF NOT EXISTS idx_system_logs_user_id ON system_logs(user_id);
+CREATE INDEX IF NOT EXISTS idx_system_logs_user_id_created_at ON system_logs(user_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_system_logs_log_level ON system_logs(log_level);
 CREATE INDEX IF NOT EXISTS idx_system_logs_log_type ON system_logs(log_type);
 CREATE INDEX IF NOT EXISTS idx_system_logs_created_at ON system_logs(created_at);
 
+-- 가정 / 백업 이력 인덱스
+CREATE INDEX IF NOT EXISTS idx_families_family_name ON families(family_name) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_backup_history_created_at ON backup_history(created_at);
+
+-- 증분 백업 워터마크/삭제 기록
+CREATE INDEX IF NOT EXISTS idx_members_updated_at ON members(updated_at);
+CREATE INDEX IF NOT EXISTS idx_prayers_updated_at ON prayers(updated_at);
+CREATE INDEX IF NOT EXISTS idx_offerings_updated_at ON offerings(updated_at);
+CREATE INDEX IF NOT EXISTS idx_member_history_modified_at ON member_history(modified_at);
+CREATE INDEX IF NOT EXISTS idx_deleted_rows_deleted_at ON deleted_rows(deleted_at);
+
+-- 작업 실행 이력 조회
+CREATE INDEX IF NOT EXISTS idx_job_runs_job_name_started_at ON job_runs(job_name, started_at);
+
+-- 백그라운드 작업 대기열
+CREATE INDEX IF NOT EXISTS idx_background_jobs_status_id ON background_jobs(status, id);
+CREATE INDEX IF NOT EXISTS idx_background_jobs_finished_at ON background_jobs(finished_at);
+
+-- 변경 이벤트 보관 기간 정리
+CREATE INDEX IF NOT EXISTS idx_change_events_created_at ON change_events(created_at);
+
+-- 성도 수정 이력 조회 (성도별 기간, 커서 페이지)
+CREATE INDEX IF NOT EXISTS idx_member_history_member_id_modified_at ON member_history(member_id, modified_at);
+
+-- 소프트 삭제 정리 작업 (헌금/기도는 삭제된 행만 담는 부분 인덱스)
+-- 성도/가정은 대시보드가 살아 있는 행 수도 세므로 전체 인덱스
+CREATE INDEX IF NOT EXISTS idx_members_deleted_at ON members(deleted_at);
+CREATE INDEX IF NOT EXISTS idx_families_deleted_at ON families(deleted_at);
+CREATE INDEX IF NOT EXISTS idx_offerings_deleted_at ON offerings(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_deleted_at ON prayers(deleted_at) WHERE deleted_at IS NOT NULL;
+-- 헌금이 남은 성도는 정리하지 않음 (삭제된 헌금 포함)
+CREATE INDEX IF NOT EXISTS idx_offerings_member_id ON offerings(member_id);
+
 -- ====================================================================
 -- 트리거 생성 (updated_at 자동 업데이트)
 -- ====================================================================
@@ -277,4 +441,357 @@ CREATE TRIGGER IF NOT EXISTS update_system_settings_updated_at
     FOR EACH ROW
 BEGIN
     UPDATE system_settings SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
-END; 
\ No newline at end of file
+END;
+
+-- ====================================================================
+-- 트리거 생성 (테이블 버전 카운터 증가)
+-- ====================================================================
+
+CREATE TRIGGER IF NOT EXISTS bump_users_version_on_insert
+    AFTER INSERT ON users
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'users';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_users_version_on_update
+    AFTER UPDATE ON users
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'users';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_users_version_on_delete
+    AFTER DELETE ON users
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'users';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_categories_version_on_insert
+    AFTER INSERT ON prayer_categories
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_categories';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_categories_version_on_update
+    AFTER UPDATE ON prayer_categories
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_categories';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_categories_version_on_delete
+    AFTER DELETE ON prayer_categories
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_categories';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_offering_types_version_on_insert
+    AFTER INSERT ON offering_types
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offering_types';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_offering_types_version_on_update
+    AFTER UPDATE ON offering_types
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offering_types';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_offering_types_version_on_delete
+    AFTER DELETE ON offering_types
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offering_types';
+END;
+
+-- ====================================================================
+-- 트리거 생성 (버전 카운터 증가 + 변경 이벤트 기록, 도메인 테이블)
+-- 수정 이벤트는 updated_at 만 바뀐 경우는 기록하지 않음
+-- deleted_at 이 채워지는 수정(소프트 삭제)은 'delete', 소프트 삭제된 행의 실제 삭제는 기록하지 않음
+-- ====================================================================
+
+CREATE TRIGGER IF NOT EXISTS capture_members_insert
+    AFTER INSERT ON members
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'members', NEW.id, 'insert', version, NEW.family_id, NULL
+    FROM table_versions WHERE table_name = 'members';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_members_update
+    AFTER UPDATE ON members
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'members', NEW.id,
+           CASE WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN 'delete' ELSE 'update' END,
+           substr(changed, 2), version, NEW.family_id, NULL
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.name IS NOT NEW.name THEN ',name' ELSE '' END || CASE WHEN OLD.name_en IS NOT NEW.name_en THEN ',name_en' ELSE '' END ||
+        CASE WHEN OLD.birth_date IS NOT NEW.birth_date THEN ',birth_date' ELSE '' END || CASE WHEN OLD.gender IS NOT NEW.gender THEN ',gender' ELSE '' END ||
+        CASE WHEN OLD.phone IS NOT NEW.phone THEN ',phone' ELSE '' END || CASE WHEN OLD.email IS NOT NEW.email THEN ',email' ELSE '' END ||
+        CASE WHEN OLD.address IS NOT NEW.address THEN ',address' ELSE '' END || CASE WHEN OLD.job IS NOT NEW.job THEN ',job' ELSE '' END ||
+        CASE WHEN OLD.registration_date IS NOT NEW.registration_date THEN ',registration_date' ELSE '' END || CASE WHEN OLD.baptism_date IS NOT NEW.baptism_date THEN ',baptism_date' ELSE '' END ||
+        CASE WHEN OLD.position IS NOT NEW.position THEN ',position' ELSE '' END || CASE WHEN OLD.district IS NOT NEW.district THEN ',district' ELSE '' END ||
+        CASE WHEN OLD.family_id IS NOT NEW.family_id THEN ',family_id' ELSE '' END || CASE WHEN OLD.family_role IS NOT NEW.family_role THEN ',family_role' ELSE '' END ||
+        CASE WHEN OLD.is_active IS NOT NEW.is_active THEN ',is_active' ELSE '' END || CASE WHEN OLD.notes IS NOT NEW.notes THEN ',notes' ELSE '' END ||
+        CASE WHEN OLD.created_by IS NOT NEW.created_by THEN ',created_by' ELSE '' END || CASE WHEN OLD.deleted_at IS NOT NEW.deleted_at THEN ',deleted_at' ELSE '' END AS changed)
+    WHERE table_name = 'members' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_members_delete
+    AFTER DELETE ON members
+    WHEN OLD.deleted_at IS NULL
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'members', OLD.id, 'delete', version, OLD.family_id, NULL
+    FROM table_versions WHERE table_name = 'members';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_families_insert
+    AFTER INSERT ON families
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'families', NEW.id, 'insert', version, NULL, NULL
+    FROM table_versions WHERE table_name = 'families';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_families_update
+    AFTER UPDATE ON families
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'families', NEW.id,
+           CASE WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN 'delete' ELSE 'update' END,
+           substr(changed, 2), version, NULL, NULL
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.family_name IS NOT NEW.family_name THEN ',family_name' ELSE '' END || CASE WHEN OLD.head_member_id IS NOT NEW.head_member_id THEN ',head_member_id' ELSE '' END ||
+        CASE WHEN OLD.address IS NOT NEW.address THEN ',address' ELSE '' END || CASE WHEN OLD.deleted_at IS NOT NEW.deleted_at THEN ',deleted_at' ELSE '' END AS changed)
+    WHERE table_name = 'families' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_families_delete
+    AFTER DELETE ON families
+    WHEN OLD.deleted_at IS NULL
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'families', OLD.id, 'delete', version, NULL, NULL
+    FROM table_versions WHERE table_name = 'families';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_offerings_insert
+    AFTER INSERT ON offerings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'offerings', NEW.id, 'insert', version, NEW.member_id, NEW.created_by
+    FROM table_versions WHERE table_name = 'offerings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_offerings_update
+    AFTER UPDATE ON offerings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'offerings', NEW.id,
+           CASE WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN 'delete' ELSE 'update' END,
+           substr(changed, 2), version, NEW.member_id, NEW.created_by
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.member_id IS NOT NEW.member_id THEN ',member_id' ELSE '' END || CASE WHEN OLD.offering_date IS NOT NEW.offering_date THEN ',offering_date' ELSE '' END ||
+        CASE WHEN OLD.offering_type IS NOT NEW.offering_type THEN ',offering_type' ELSE '' END || CASE WHEN OLD.amount IS NOT NEW.amount THEN ',amount' ELSE '' END ||
+        CASE WHEN OLD.memo IS NOT NEW.memo THEN ',memo' ELSE '' END || CASE WHEN OLD.created_by IS NOT NEW.created_by THEN ',created_by' ELSE '' END ||
+        CASE WHEN OLD.deleted_at IS NOT NEW.deleted_at THEN ',deleted_at' ELSE '' END AS changed)
+    WHERE table_name = 'offerings' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_offerings_delete
+    AFTER DELETE ON offerings
+    WHEN OLD.deleted_at IS NULL
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'offerings', OLD.id, 'delete', version, OLD.member_id, OLD.created_by
+    FROM table_versions WHERE table_name = 'offerings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayers_insert
+    AFTER INSERT ON prayers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayers', NEW.id, 'insert', version, NULL, NEW.created_by
+    FROM table_versions WHERE table_name = 'prayers';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayers_update
+    AFTER UPDATE ON prayers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'prayers', NEW.id,
+           CASE WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN 'delete' ELSE 'update' END,
+           substr(changed, 2), version, NULL, NEW.created_by
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.title IS NOT NEW.title THEN ',title' ELSE '' END || CASE WHEN OLD.content IS NOT NEW.content THEN ',content' ELSE '' END ||
+        CASE WHEN OLD.category IS NOT NEW.category THEN ',category' ELSE '' END || CASE WHEN OLD.is_anonymous IS NOT NEW.is_anonymous THEN ',is_anonymous' ELSE '' END ||
+        CASE WHEN OLD.visibility IS NOT NEW.visibility THEN ',visibility' ELSE '' END || CASE WHEN OLD.status IS NOT NEW.status THEN ',status' ELSE '' END ||
+        CASE WHEN OLD.prayer_period_start IS NOT NEW.prayer_period_start THEN ',prayer_period_start' ELSE '' END || CASE WHEN OLD.prayer_period_end IS NOT NEW.prayer_period_end THEN ',prayer_period_end' ELSE '' END ||
+        CASE WHEN OLD.answer_content IS NOT NEW.answer_content THEN ',answer_content' ELSE '' END || CASE WHEN OLD.answer_date IS NOT NEW.answer_date THEN ',answer_date' ELSE '' END ||
+        CASE WHEN OLD.tags IS NOT NEW.tags THEN ',tags' ELSE '' END || CASE WHEN OLD.created_by IS NOT NEW.created_by THEN ',created_by' ELSE '' END ||
+        CASE WHEN OLD.deleted_at IS NOT NEW.deleted_at THEN ',deleted_at' ELSE '' END AS changed)
+    WHERE table_name = 'prayers' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayers_delete
+    AFTER DELETE ON prayers
+    WHEN OLD.deleted_at IS NULL
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayers', OLD.id, 'delete', version, NULL, OLD.created_by
+    FROM table_versions WHERE table_name = 'prayers';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_participants_insert
+    AFTER INSERT ON prayer_participants
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_participants';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayer_participants', NEW.id, 'insert', version, NEW.prayer_id, NEW.user_id
+    FROM table_versions WHERE table_name = 'prayer_participants';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_participants_update
+    AFTER UPDATE ON prayer_participants
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_participants';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'prayer_participants', NEW.id, 'update', substr(changed, 2), version, NEW.prayer_id, NEW.user_id
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.prayer_id IS NOT NEW.prayer_id THEN ',prayer_id' ELSE '' END || CASE WHEN OLD.user_id IS NOT NEW.user_id THEN ',user_id' ELSE '' END ||
+        CASE WHEN OLD.participated_at IS NOT NEW.participated_at THEN ',participated_at' ELSE '' END AS changed)
+    WHERE table_name = 'prayer_participants' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_participants_delete
+    AFTER DELETE ON prayer_participants
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_participants';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayer_participants', OLD.id, 'delete', version, OLD.prayer_id, OLD.user_id
+    FROM table_versions WHERE table_name = 'prayer_participants';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_comments_insert
+    AFTER INSERT ON prayer_comments
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_comments';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayer_comments', NEW.id, 'insert', version, NEW.prayer_id, NEW.user_id
+    FROM table_versions WHERE table_name = 'prayer_comments';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_comments_update
+    AFTER UPDATE ON prayer_comments
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_comments';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'prayer_comments', NEW.id, 'update', substr(changed, 2), version, NEW.prayer_id, NEW.user_id
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.prayer_id IS NOT NEW.prayer_id THEN ',prayer_id' ELSE '' END || CASE WHEN OLD.user_id IS NOT NEW.user_id THEN ',user_id' ELSE '' END ||
+        CASE WHEN OLD.comment IS NOT NEW.comment THEN ',comment' ELSE '' END || CASE WHEN OLD.is_anonymous IS NOT NEW.is_anonymous THEN ',is_anonymous' ELSE '' END AS changed)
+    WHERE table_name = 'prayer_comments' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_comments_delete
+    AFTER DELETE ON prayer_comments
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_comments';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayer_comments', OLD.id, 'delete', version, OLD.prayer_id, OLD.user_id
+    FROM table_versions WHERE table_name = 'prayer_comments';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_system_settings_insert
+    AFTER INSERT ON system_settings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'system_settings';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'system_settings', NEW.id, 'insert', version, NULL, NULL
+    FROM table_versions WHERE table_name = 'system_settings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_system_settings_update
+    AFTER UPDATE ON system_settings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'system_settings';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'system_settings', NEW.id, 'update', substr(changed, 2), version, NULL, NULL
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.setting_key IS NOT NEW.setting_key THEN ',setting_key' ELSE '' END || CASE WHEN OLD.setting_value IS NOT NEW.setting_value THEN ',setting_value' ELSE '' END ||
+        CASE WHEN OLD.setting_type IS NOT NEW.setting_type THEN ',setting_type' ELSE '' END || CASE WHEN OLD.description IS NOT NEW.description THEN ',description' ELSE '' END AS changed)
+    WHERE table_name = 'system_settings' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_system_settings_delete
+    AFTER DELETE ON system_settings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'system_settings';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'system_settings', OLD.id, 'delete', version, NULL, NULL
+    FROM table_versions WHERE table_name = 'system_settings';
+END;
+
+-- ====================================================================
+-- 트리거 생성 (삭제 기록, 증분 백업용)
+-- ====================================================================
+
+
+CREATE TRIGGER IF NOT EXISTS record_users_delete
+    AFTER DELETE ON users
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('users', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_members_delete
+    AFTER DELETE ON members
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('members', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_prayers_delete
+    AFTER DELETE ON prayers
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('prayers', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_prayer_participants_delete
+    AFTER DELETE ON prayer_participants
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('prayer_participants', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_offerings_delete
+    AFTER DELETE ON offerings
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('offerings', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_system_settings_delete
+    AFTER DELETE ON system_settings
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('system_settings', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_system_logs_delete
+    AFTER DELETE ON system_logs
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('system_logs', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_member_history_delete
+    AFTER DELETE ON member_history
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('member_history', OLD.rowid);
+END;
@@ -36,93 +36,47 @@ async def run_full_migration():
         print("   LIBSQL_URL=libsql://your-database-url")
         return False
     
-    if not auth_token:
+    if not auth_token and not libsql_url.startswith("file:"):
         print("❌ LIBSQL_AUTH_TOKEN이 설정되지 않았습니다.")
         return False
     
     try:
-        # LibSQL 클라이언트 import
-        from libsql_client import create_client
-        
-        # HTTP URL로 변환
-        http_url = libsql_url.replace("libsql://", "https://")
-        print(f"🔄 HTTP URL로 변환: {http_url}")
-        
-        # LibSQL 클라이언트 생성 (HTTP)
-        print("🔌 LibSQL 클라이언트에 연결 중...")
-        client = create_client(url=http_url, auth_token=auth_token)
-        print("✅ LibSQL 클라이언트 연결 성공!")
-        
-        # 스키마 파일 읽기
-        schema_file = Path(__file__).parent / 'database_schema.sql'
-        if not schema_file.exists():
-            print(f"❌ 스키마 파일을 찾을 수 없습니다: {schema_file}")
-            return False
-        
-        print("📖 데이터베이스 스키마 파일을 읽는 중...")
-        with open(schema_file, 'r', encoding='utf-8') as f:
-            schema_content = f.read()
-        
-        # SQL 문장들을 분리
-        sql_statements = []
-        current_statement = ""
-        
-        for line in schema_content.split('\n'):
-            line = line.strip()
-            # 주석이나 빈 줄 건너뛰기
-            if not line or line.startswith('--'):
-                continue
-            
-            current_statement += line + '\n'
-            
-            # SQL 문장이 세미콜론으로 끝나면 완료
-            if line.rstrip().endswith(';'):
-                if current_statement.strip():
-                    sql_statements.append(current_statement.strip())
-                current_statement = ""
-        
-        print(f"📝 총 {len(sql_statements)}개의 SQL 문장을 실행합니다...")
-        
-        # 각 SQL 문장 실행
-        success_count = 0
-        error_count = 0
-        
-        for i, sql in enumerate(sql_statements, 1):
-            try:
-                # SQL 문장 미리보기 (처음 50자)
-                preview = sql[:50].replace('\n', ' ').strip()
-                if len(sql) > 50:
-                    preview += "..."
-                
-                print(f"  [{i:3d}/{len(sql_statements)}] {preview}")
-                
-                await client.execute(sql)
-                success_count += 1
-                
-            except Exception as e:
-                print(f"  ❌ 오류 발생: {str(e)}")
-                error_count += 1
-                # 계속 진행 (일부 오류는 무시 가능할 수 있음)
-        
-        print(f"\n📊 마이그레이션 완료:")
-        print(f"   ✅ 성공: {success_count}개")
-        print(f"   ❌ 오류: {error_count}개")
-        
-        # 클라이언트 종료
-        await client.close()
-        print("🔌 데이터베이스 연결을 종료했습니다.")
-        
-        if error_count == 0:
-            print("🎉 모든 스키마가 성공적으로 적용되었습니다!")
+        from app.db.engine import get_engine
+        from app.db.migrations import MigrationError, MigrationRunner
+
+        engine = get_engine()
+        print(f"🔌 데이터베이스에 연결 중... ({engine.describe()['engine']})")
+        await engine.start()
+        client = await engine.get_client()
+
+        try:
+            runner = MigrationRunner(client)
+            pending = await runner.pending()
+            print(f"📝 적용할 마이그레이션 {len(pending)}개 (마이그레이션마다 한 번의 batch로 실행)")
+
+            # 각 마이그레이션을 하나의 트랜잭션으로 적용 (실패 시 해당 마이그레이션 전체 롤백)
+            for migration in await runner.migrate():
+                print(f"  ✅ {migration.version:04d}_{migration.name} ({len(migration.statements)}개 문장)")
+
+            drift = await runner.drift()
+        finally:
+            await client.close()
+            await engine.stop()
+            print("🔌 데이터베이스 연결을 종료했습니다.")
+
+        if any(drift.values()):
+            print("⚠️  실제 스키마가 마이그레이션과 다릅니다:")
+            for kind, items in drift.items():
+                for item in items:
+                    print(f"   - [{kind}] {item}")
         else:
-            print("⚠️  일부 오류가 있었지만 마이그레이션이 완료되었습니다.")
+            print("🎉 모든 스키마가 성공적으로 적용되었습니다!")
         
         return True
         
-    except ImportError as e:
-        print(f"❌ 필요한 패키지를 가져올 수 없습니다: {e}")
-        print("📦 다음 명령어로 설치하세요:")
-        print("   pip install libsql-client python-dotenv")
+    except MigrationError as e:
+        print(f"❌ 마이그레이션 실패: {e}")
+        print("💡 기존 DB라면 'python migrate.py baseline <버전>' 으로 적용 이력을 먼저 기록하세요.")
         return False
     except Exception as e:
         print(f"❌ 마이그레이션 중 오류가 발생했습니다: {e}")
@@ -153,7 +107,8 @@ async def verify_migration():
             'users', 'families', 'members', 'member_history',
             'prayer_categories', 'prayers', 'prayer_participants', 'prayer_comments',
             'offering_types', 'offerings',
-            'system_settings', 'system_logs', 'backup_history'
+            'system_settings', 'system_logs', 'backup_history',
+            'table_versions', 'dashboard_snapshots', 'schema_migrations'
         ]
         
         existing_tables = [row[0] for row in result.rows] if result.rows else []
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+ITTLC 데이터베이스 마이그레이션 도구
+
+사용법:
+  python migrate.py status              # 파일별 적용 상태
+  python migrate.py up [--dry-run]      # 대기 중인 마이그레이션 적용 (--target N 까지)
+  python migrate.py baseline N          # 기존 DB: N 이하를 적용된 것으로 기록 (실행 안 함)
+  python migrate.py drift               # 마이그레이션 기준 스키마와 실제 스키마 비교
+
+.env 의 LIBSQL_URL (file: URL이면 로컬 파일) 에 적용합니다.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 시스템 경로에 추가
+project_root = str(Path(__file__).parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from app.db.engine import get_engine
+from app.db.migrations import MigrationError, MigrationRunner
+
+
+async def run(args) -> int:
+    engine = get_engine()
+    await engine.start()
+    client = await engine.get_client()
+    runner = MigrationRunner(client)
+    try:
+        if args.command == "status":
+            icons = {"applied": "✅", "pending": "⏳", "checksum_mismatch": "❌", "missing_file": "⚠️"}
+            rows = await runner.status()
+            for row in rows:
+                print(f"  {icons[row['state']]} {row['version']:04d}_{row['name']:<30} "
+                      f"{row['state']:<18} {row['applied_at'] or ''}")
+            return 1 if any(row["state"] in ("checksum_mismatch", "missing_file") for row in rows) else 0
+
+        if args.command == "up":
+            started = time.perf_counter()
+            migrations = await runner.migrate(dry_run=args.dry_run, target=args.target)
+            if not migrations:
+                print("✅ 적용할 마이그레이션이 없습니다.")
+                return 0
+            for migration in migrations:
+                print(f"  {'📝' if args.dry_run else '✅'} {migration.version:04d}_{migration.name} "
+                      f"({len(migration.statements)}개 문장)")
+                if args.dry_run and args.verbose:
+                    for statement in migration.statements:
+                        print("      " + statement.splitlines()[0][:100])
+            elapsed = time.perf_counter() - started
+            print(f"{'🔍 dry-run' if args.dry_run else '🎉 적용 완료'}: {len(migrations)}개 ({elapsed:.2f}초)")
+            return 0
+
+        if args.command == "baseline":
+            marked = await runner.baseline(args.version)
+            for migration in marked:
+                print(f"  📌 {migration.version:04d}_{migration.name}")
+            print(f"✅ {len(marked)}개를 적용된 것으로 기록했습니다.")
+            return 0
+
+        if args.command == "drift":
+            drift = await runner.drift()
+            if not any(drift.values()):
+                print("✅ 실제 스키마가 마이그레이션과 일치합니다.")
+                return 0
+            for kind, label in (("missing", "누락"), ("unexpected", "예상 외"), ("changed", "변경됨")):
+                for item in drift[kind]:
+                    print(f"  ❌ [{label}] {item}")
+            return 1
+    except MigrationError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        await client.close()
+        await engine.stop()
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ITTLC 데이터베이스 마이그레이션")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("status", help="파일별 적용 상태")
+    up = subparsers.add_parser("up", help="대기 중인 마이그레이션 적용")
+    up.add_argument("--dry-run", action="store_true", help="실행하지 않고 적용 대상만 출력")
+    up.add_argument("--target", type=int, default=None, help="이 번호까지만 적용")
+    up.add_argument("-v", "--verbose", action="store_true", help="dry-run 시 문장 미리보기 출력")
+    baseline = subparsers.add_parser("baseline", help="기존 DB를 지정 버전까지 적용된 것으로 기록")
+    baseline.add_argument("version", type=int)
+    subparsers.add_parser("drift", help="스키마 drift 검사")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
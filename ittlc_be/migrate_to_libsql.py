@@ -35,73 +35,31 @@ async def migrate_to_libsql():
         print(f"📁 .env 파일 경로: {env_path}")
         return False
     
-    if not auth_token:
+    if not auth_token and not libsql_url.startswith("file:"):
         print("❌ LIBSQL_AUTH_TOKEN이 설정되지 않았습니다.")
         return False
     
     try:
-        # LibSQL 클라이언트 import
-        from my_libsql_client import create_client
-        
-        # HTTP URL로 변환
-        http_url = libsql_url.replace("libsql://", "https://")
-        print(f"🔄 HTTP URL로 변환: {http_url}")
-        
-        # LibSQL 클라이언트 생성 (HTTP)
-        client = create_client(url=http_url, auth_token=auth_token)
-        
+        from app.db.engine import get_engine
+        from app.db.migrations import MigrationRunner
+
+        engine = get_engine()
+        await engine.start()
+        client = await engine.get_client()
         print("✅ LibSQL 클라이언트가 성공적으로 생성되었습니다!")
-        
-        # 테이블 생성 SQL
-        create_tables_sql = [
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email VARCHAR(100) UNIQUE NOT NULL,
-                password_hash VARCHAR(255) NOT NULL,
-                username VARCHAR(50) NOT NULL,
-                role VARCHAR(20) DEFAULT 'user',
-                is_active BOOLEAN DEFAULT 1,
-                last_login DATETIME,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS members (
-                member_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name VARCHAR(50) NOT NULL,
-                age INTEGER,
-                sex VARCHAR(10),
-                birthday DATE,
-                contact VARCHAR(20),
-                address VARCHAR(255),
-                job VARCHAR(100),
-                email VARCHAR(100),
-                baptism BOOLEAN DEFAULT 0,
-                marriage BOOLEAN DEFAULT 0,
-                prev_church VARCHAR(100),
-                registration_date DATE,
-                memo TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-        ]
-        
-        # 테이블 생성
-        for i, sql in enumerate(create_tables_sql, 1):
-            print(f"📝 테이블 {i} 생성 중...")
-            await client.execute(sql)
-        
+
+        # 테이블 생성은 migrations/ 의 버전 관리된 스키마로 일원화
+        # (예전의 users.user_id / members.member_id 스키마는 database_schema.sql 과 충돌)
+        try:
+            applied = await MigrationRunner(client).migrate()
+        finally:
+            await client.close()
+            await engine.stop()
+
+        for migration in applied:
+            print(f"📝 {migration.version:04d}_{migration.name} 적용")
         print("✅ LibSQL 테이블이 성공적으로 생성되었습니다!")
-        await client.close()
         
-    except ImportError:
-        print("❌ libsql-client 패키지가 설치되지 않았습니다.")
-        print("📦 다음 명령어로 설치하세요:")
-        print("   pip install libsql-client")
-        return False
     except Exception as e:
         print(f"❌ 마이그레이션 중 오류가 발생했습니다: {e}")
         return False
@@ -0,0 +1,208 @@
+-- ====================================================================
+-- 0002: 테이블 버전 카운터
+-- 쓰기 시 트리거로 증가하며 ETag 계산/복제본 동기화에 사용
+-- ====================================================================
+
+-- 테이블 버전 카운터 (쓰기 시 트리거로 증가, ETag 계산에 사용)
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name VARCHAR(100) PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES
+    ('users', 0),
+    ('members', 0),
+    ('families', 0),
+    ('prayer_categories', 0),
+    ('prayers', 0),
+    ('prayer_participants', 0),
+    ('prayer_comments', 0),
+    ('offering_types', 0),
+    ('offerings', 0),
+    ('system_settings', 0);
+
+CREATE INDEX IF NOT EXISTS idx_prayers_created_at ON prayers(created_at);
+
+-- ====================================================================
+-- 트리거 생성 (테이블 버전 카운터 증가)
+-- ====================================================================
+
+CREATE TRIGGER IF NOT EXISTS bump_users_version_on_insert
+    AFTER INSERT ON users
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'users';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_users_version_on_update
+    AFTER UPDATE ON users
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'users';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_users_version_on_delete
+    AFTER DELETE ON users
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'users';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_members_version_on_insert
+    AFTER INSERT ON members
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_members_version_on_update
+    AFTER UPDATE ON members
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_members_version_on_delete
+    AFTER DELETE ON members
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_families_version_on_insert
+    AFTER INSERT ON families
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_families_version_on_update
+    AFTER UPDATE ON families
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_families_version_on_delete
+    AFTER DELETE ON families
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_categories_version_on_insert
+    AFTER INSERT ON prayer_categories
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_categories';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_categories_version_on_update
+    AFTER UPDATE ON prayer_categories
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_categories';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_categories_version_on_delete
+    AFTER DELETE ON prayer_categories
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_categories';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayers_version_on_insert
+    AFTER INSERT ON prayers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayers_version_on_update
+    AFTER UPDATE ON prayers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayers_version_on_delete
+    AFTER DELETE ON prayers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_participants_version_on_insert
+    AFTER INSERT ON prayer_participants
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_participants';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_participants_version_on_update
+    AFTER UPDATE ON prayer_participants
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_participants';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_participants_version_on_delete
+    AFTER DELETE ON prayer_participants
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_participants';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_comments_version_on_insert
+    AFTER INSERT ON prayer_comments
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_comments';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_comments_version_on_update
+    AFTER UPDATE ON prayer_comments
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_comments';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_prayer_comments_version_on_delete
+    AFTER DELETE ON prayer_comments
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_comments';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_offering_types_version_on_insert
+    AFTER INSERT ON offering_types
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offering_types';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_offering_types_version_on_update
+    AFTER UPDATE ON offering_types
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offering_types';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_offering_types_version_on_delete
+    AFTER DELETE ON offering_types
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offering_types';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_offerings_version_on_insert
+    AFTER INSERT ON offerings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_offerings_version_on_update
+    AFTER UPDATE ON offerings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_offerings_version_on_delete
+    AFTER DELETE ON offerings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_system_settings_version_on_insert
+    AFTER INSERT ON system_settings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'system_settings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_system_settings_version_on_update
+    AFTER UPDATE ON system_settings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'system_settings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS bump_system_settings_version_on_delete
+    AFTER DELETE ON system_settings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'system_settings';
+END;
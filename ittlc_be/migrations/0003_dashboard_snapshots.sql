@@ -0,0 +1,14 @@
+-- ====================================================================
+-- 0003: 대시보드 통계 스냅샷
+-- ====================================================================
+
+-- 대시보드 통계 스냅샷 (일 단위, 추이 차트용)
+CREATE TABLE IF NOT EXISTS dashboard_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    snapshot_date DATE NOT NULL UNIQUE,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    family_count INTEGER NOT NULL DEFAULT 0,
+    monthly_prayer_count INTEGER NOT NULL DEFAULT 0,
+    monthly_offering_amount DECIMAL(12,2) NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
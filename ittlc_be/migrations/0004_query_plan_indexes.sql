@@ -0,0 +1,39 @@
+-- ====================================================================
+-- 0004: 쿼리 플랜 복합 인덱스
+-- benchmarks/query_plans.py 가 찾은 전체 스캔/임시 B-tree 정렬 제거
+-- (앞부분이 같은 단일 컬럼 인덱스는 복합 인덱스가 대신하므로 삭제)
+-- ====================================================================
+
+-- 가정 구성원 목록: WHERE family_id = ? ORDER BY family_role, birth_date
+CREATE INDEX IF NOT EXISTS idx_members_family_id_family_role_birth_date ON members(family_id, family_role, birth_date);
+DROP INDEX IF EXISTS idx_members_family_id;
+
+-- 가정 목록: ORDER BY family_name
+CREATE INDEX IF NOT EXISTS idx_families_family_name ON families(family_name);
+
+-- 헌금 목록: ORDER BY offering_date DESC, created_at DESC (기간/종류 필터 포함)
+CREATE INDEX IF NOT EXISTS idx_offerings_offering_date_created_at ON offerings(offering_date, created_at);
+DROP INDEX IF EXISTS idx_offerings_offering_date;
+
+-- 성도별 헌금 목록 / 성도별 연간 요약 (member_id 로 시작하는 조회)
+CREATE INDEX IF NOT EXISTS idx_offerings_member_id_offering_date_created_at ON offerings(member_id, offering_date, created_at);
+CREATE INDEX IF NOT EXISTS idx_offerings_member_id_offering_type ON offerings(member_id, offering_type);
+DROP INDEX IF EXISTS idx_offerings_member_id;
+
+-- 기도 목록: 작성자/분류 필터 + ORDER BY created_at DESC
+CREATE INDEX IF NOT EXISTS idx_prayers_created_by_created_at ON prayers(created_by, created_at);
+CREATE INDEX IF NOT EXISTS idx_prayers_category_created_at ON prayers(category, created_at);
+DROP INDEX IF EXISTS idx_prayers_created_by;
+DROP INDEX IF EXISTS idx_prayers_category;
+
+-- 기도 참여자 / 댓글: WHERE prayer_id = ? ORDER BY ...
+CREATE INDEX IF NOT EXISTS idx_prayer_participants_prayer_id_participated_at ON prayer_participants(prayer_id, participated_at);
+DROP INDEX IF EXISTS idx_prayer_participants_prayer_id;
+CREATE INDEX IF NOT EXISTS idx_prayer_comments_prayer_id_created_at ON prayer_comments(prayer_id, created_at);
+
+-- 시스템 로그: 사용자 필터 + ORDER BY created_at DESC
+CREATE INDEX IF NOT EXISTS idx_system_logs_user_id_created_at ON system_logs(user_id, created_at);
+DROP INDEX IF EXISTS idx_system_logs_user_id;
+
+-- 백업 이력: ORDER BY created_at DESC
+CREATE INDEX IF NOT EXISTS idx_backup_history_created_at ON backup_history(created_at);
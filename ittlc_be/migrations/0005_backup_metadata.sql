@@ -0,0 +1,10 @@
+-- ====================================================================
+-- 0005: 백업 결과 메타데이터 (형식, 압축, 체크섬, 완료 시각, 오류)
+-- ====================================================================
+
+ALTER TABLE backup_history ADD COLUMN format VARCHAR(10);
+ALTER TABLE backup_history ADD COLUMN compression VARCHAR(10);
+ALTER TABLE backup_history ADD COLUMN raw_size INTEGER;
+ALTER TABLE backup_history ADD COLUMN checksum VARCHAR(64);
+ALTER TABLE backup_history ADD COLUMN completed_at TIMESTAMP;
+ALTER TABLE backup_history ADD COLUMN error_message TEXT;
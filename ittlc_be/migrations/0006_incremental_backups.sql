@@ -0,0 +1,77 @@
+-- ====================================================================
+-- 0006: 증분 백업
+-- 삭제 기록(deleted_rows): 워터마크(updated_at/created_at)로 찾을 수 없는 삭제를 증분 백업에 전달
+-- 워터마크 인덱스, backup_history 의 체인 정보 (종류, 부모 백업, 스냅샷 시각)
+-- ====================================================================
+
+-- 삭제 기록 (전체 백업 후 그 스냅샷 이전 기록은 정리됨)
+CREATE TABLE IF NOT EXISTS deleted_rows (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name VARCHAR(100) NOT NULL,
+    row_id INTEGER NOT NULL,
+    deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_deleted_rows_deleted_at ON deleted_rows(deleted_at);
+
+-- 증분 백업 워터마크 조회: WHERE updated_at >= ?
+CREATE INDEX IF NOT EXISTS idx_members_updated_at ON members(updated_at);
+CREATE INDEX IF NOT EXISTS idx_prayers_updated_at ON prayers(updated_at);
+CREATE INDEX IF NOT EXISTS idx_offerings_updated_at ON offerings(updated_at);
+CREATE INDEX IF NOT EXISTS idx_member_history_modified_at ON member_history(modified_at);
+
+ALTER TABLE backup_history ADD COLUMN backup_kind VARCHAR(12);
+ALTER TABLE backup_history ADD COLUMN parent_filename VARCHAR(255);
+ALTER TABLE backup_history ADD COLUMN snapshot_at TIMESTAMP;
+
+-- ====================================================================
+-- 트리거 생성 (삭제 기록)
+-- ====================================================================
+
+CREATE TRIGGER IF NOT EXISTS record_users_delete
+    AFTER DELETE ON users
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('users', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_members_delete
+    AFTER DELETE ON members
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('members', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_prayers_delete
+    AFTER DELETE ON prayers
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('prayers', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_prayer_participants_delete
+    AFTER DELETE ON prayer_participants
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('prayer_participants', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_offerings_delete
+    AFTER DELETE ON offerings
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('offerings', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_system_settings_delete
+    AFTER DELETE ON system_settings
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('system_settings', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_system_logs_delete
+    AFTER DELETE ON system_logs
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('system_logs', OLD.rowid);
+END;
+
+CREATE TRIGGER IF NOT EXISTS record_member_history_delete
+    AFTER DELETE ON member_history
+BEGIN
+    INSERT INTO deleted_rows (table_name, row_id) VALUES ('member_history', OLD.rowid);
+END;
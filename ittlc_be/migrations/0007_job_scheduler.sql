@@ -0,0 +1,29 @@
+-- ====================================================================
+-- 0007: 주기 작업 스케줄러
+-- 작업별 실행 임대(한 워커만 실행) 와 실행 이력
+-- ====================================================================
+
+-- 작업 실행 임대 (lease_until 은 unix 초, last_slot 은 마지막으로 실행한 예약 시각)
+CREATE TABLE IF NOT EXISTS job_leases (
+    job_name VARCHAR(100) PRIMARY KEY,
+    owner VARCHAR(100),
+    lease_until REAL NOT NULL DEFAULT 0,
+    last_slot VARCHAR(20)
+);
+
+-- 작업 실행 이력
+CREATE TABLE IF NOT EXISTS job_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_name VARCHAR(100) NOT NULL,
+    trigger_type VARCHAR(10) NOT NULL CHECK (trigger_type IN ('schedule', 'manual')),
+    owner VARCHAR(100) NOT NULL,
+    status VARCHAR(20) NOT NULL CHECK (status IN ('running', 'success', 'failed')),
+    scheduled_for VARCHAR(20),
+    result TEXT,
+    error_message TEXT,
+    duration_ms REAL,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_runs_job_name_started_at ON job_runs(job_name, started_at);
@@ -0,0 +1,33 @@
+-- ====================================================================
+-- 0008: 백그라운드 작업 대기열
+-- 오래 걸리는 요청(장기간 통계, 대량 가져오기/내보내기, 백업)을 202 로 접수하고 앱 내 작업자가 처리
+-- ====================================================================
+
+CREATE TABLE IF NOT EXISTS background_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_type VARCHAR(50) NOT NULL,
+    params TEXT,                   -- JSON
+    status VARCHAR(20) NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'succeeded', 'failed', 'cancelled')),
+    progress REAL NOT NULL DEFAULT 0,
+    progress_message TEXT,
+    result TEXT,                   -- JSON
+    result_path TEXT,              -- 결과 파일 (다운로드)
+    result_filename VARCHAR(255),
+    result_content_type VARCHAR(100),
+    error_message TEXT,
+    cancel_requested BOOLEAN NOT NULL DEFAULT FALSE,
+    owner VARCHAR(100),            -- 처리 중인 작업자
+    lease_until REAL NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_by INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP,
+    FOREIGN KEY (created_by) REFERENCES users(id)
+);
+
+-- 작업자 대기열 조회: WHERE status = ? ORDER BY id
+CREATE INDEX IF NOT EXISTS idx_background_jobs_status_id ON background_jobs(status, id);
+-- 완료 작업 정리: WHERE finished_at < ?
+CREATE INDEX IF NOT EXISTS idx_background_jobs_finished_at ON background_jobs(finished_at);
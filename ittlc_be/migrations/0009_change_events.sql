@@ -0,0 +1,278 @@
+-- ====================================================================
+-- 0009: 변경 이벤트 (트랜잭셔널 아웃박스)
+-- 도메인 테이블 쓰기를 같은 트랜잭션 안에서 트리거로 change_events 에 기록하고,
+-- 앱의 디스패처가 소비자별 커서(outbox_cursors)부터 이어서 읽어 구독자에게 전달
+-- 이 테이블들의 버전 카운터 증가(bump_*)는 capture_* 트리거가 함께 수행
+-- ====================================================================
+
+-- 변경 이벤트 (changed_columns: 수정된 컬럼 이름을 쉼표로 연결, version: 변경 후 table_versions 값)
+-- parent_id/user_id: 구독 경로용 키 (기도 참여/댓글의 prayer_id 와 user_id, 헌금의 member_id 등)
+CREATE TABLE IF NOT EXISTS change_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name VARCHAR(100) NOT NULL,
+    row_id INTEGER NOT NULL,
+    op VARCHAR(6) NOT NULL CHECK (op IN ('insert', 'update', 'delete')),
+    changed_columns TEXT,
+    version INTEGER NOT NULL,
+    parent_id INTEGER,
+    user_id INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_change_events_created_at ON change_events(created_at);
+
+-- 소비자별 처리 위치 (재시작 후 이어서 전달)
+CREATE TABLE IF NOT EXISTS outbox_cursors (
+    consumer VARCHAR(100) PRIMARY KEY,
+    last_event_id INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ====================================================================
+-- 트리거 교체 (버전 카운터 증가 + 변경 이벤트 기록)
+-- 수정 이벤트는 updated_at 만 바뀐 경우(update_*_updated_at 트리거의 갱신)는 기록하지 않음
+-- ====================================================================
+
+DROP TRIGGER IF EXISTS bump_members_version_on_insert;
+DROP TRIGGER IF EXISTS bump_members_version_on_update;
+DROP TRIGGER IF EXISTS bump_members_version_on_delete;
+DROP TRIGGER IF EXISTS bump_families_version_on_insert;
+DROP TRIGGER IF EXISTS bump_families_version_on_update;
+DROP TRIGGER IF EXISTS bump_families_version_on_delete;
+DROP TRIGGER IF EXISTS bump_offerings_version_on_insert;
+DROP TRIGGER IF EXISTS bump_offerings_version_on_update;
+DROP TRIGGER IF EXISTS bump_offerings_version_on_delete;
+DROP TRIGGER IF EXISTS bump_prayers_version_on_insert;
+DROP TRIGGER IF EXISTS bump_prayers_version_on_update;
+DROP TRIGGER IF EXISTS bump_prayers_version_on_delete;
+DROP TRIGGER IF EXISTS bump_prayer_participants_version_on_insert;
+DROP TRIGGER IF EXISTS bump_prayer_participants_version_on_update;
+DROP TRIGGER IF EXISTS bump_prayer_participants_version_on_delete;
+DROP TRIGGER IF EXISTS bump_prayer_comments_version_on_insert;
+DROP TRIGGER IF EXISTS bump_prayer_comments_version_on_update;
+DROP TRIGGER IF EXISTS bump_prayer_comments_version_on_delete;
+DROP TRIGGER IF EXISTS bump_system_settings_version_on_insert;
+DROP TRIGGER IF EXISTS bump_system_settings_version_on_update;
+DROP TRIGGER IF EXISTS bump_system_settings_version_on_delete;
+
+CREATE TRIGGER IF NOT EXISTS capture_members_insert
+    AFTER INSERT ON members
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'members', NEW.id, 'insert', version, NEW.family_id, NULL
+    FROM table_versions WHERE table_name = 'members';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_members_update
+    AFTER UPDATE ON members
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'members', NEW.id, 'update', substr(changed, 2), version, NEW.family_id, NULL
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.name IS NOT NEW.name THEN ',name' ELSE '' END || CASE WHEN OLD.name_en IS NOT NEW.name_en THEN ',name_en' ELSE '' END ||
+        CASE WHEN OLD.birth_date IS NOT NEW.birth_date THEN ',birth_date' ELSE '' END || CASE WHEN OLD.gender IS NOT NEW.gender THEN ',gender' ELSE '' END ||
+        CASE WHEN OLD.phone IS NOT NEW.phone THEN ',phone' ELSE '' END || CASE WHEN OLD.email IS NOT NEW.email THEN ',email' ELSE '' END ||
+        CASE WHEN OLD.address IS NOT NEW.address THEN ',address' ELSE '' END || CASE WHEN OLD.job IS NOT NEW.job THEN ',job' ELSE '' END ||
+        CASE WHEN OLD.registration_date IS NOT NEW.registration_date THEN ',registration_date' ELSE '' END || CASE WHEN OLD.baptism_date IS NOT NEW.baptism_date THEN ',baptism_date' ELSE '' END ||
+        CASE WHEN OLD.position IS NOT NEW.position THEN ',position' ELSE '' END || CASE WHEN OLD.district IS NOT NEW.district THEN ',district' ELSE '' END ||
+        CASE WHEN OLD.family_id IS NOT NEW.family_id THEN ',family_id' ELSE '' END || CASE WHEN OLD.family_role IS NOT NEW.family_role THEN ',family_role' ELSE '' END ||
+        CASE WHEN OLD.is_active IS NOT NEW.is_active THEN ',is_active' ELSE '' END || CASE WHEN OLD.notes IS NOT NEW.notes THEN ',notes' ELSE '' END ||
+        CASE WHEN OLD.created_by IS NOT NEW.created_by THEN ',created_by' ELSE '' END AS changed)
+    WHERE table_name = 'members' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_members_delete
+    AFTER DELETE ON members
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'members', OLD.id, 'delete', version, OLD.family_id, NULL
+    FROM table_versions WHERE table_name = 'members';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_families_insert
+    AFTER INSERT ON families
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'families', NEW.id, 'insert', version, NULL, NULL
+    FROM table_versions WHERE table_name = 'families';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_families_update
+    AFTER UPDATE ON families
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'families', NEW.id, 'update', substr(changed, 2), version, NULL, NULL
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.family_name IS NOT NEW.family_name THEN ',family_name' ELSE '' END || CASE WHEN OLD.head_member_id IS NOT NEW.head_member_id THEN ',head_member_id' ELSE '' END ||
+        CASE WHEN OLD.address IS NOT NEW.address THEN ',address' ELSE '' END AS changed)
+    WHERE table_name = 'families' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_families_delete
+    AFTER DELETE ON families
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'families', OLD.id, 'delete', version, NULL, NULL
+    FROM table_versions WHERE table_name = 'families';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_offerings_insert
+    AFTER INSERT ON offerings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'offerings', NEW.id, 'insert', version, NEW.member_id, NEW.created_by
+    FROM table_versions WHERE table_name = 'offerings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_offerings_update
+    AFTER UPDATE ON offerings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'offerings', NEW.id, 'update', substr(changed, 2), version, NEW.member_id, NEW.created_by
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.member_id IS NOT NEW.member_id THEN ',member_id' ELSE '' END || CASE WHEN OLD.offering_date IS NOT NEW.offering_date THEN ',offering_date' ELSE '' END ||
+        CASE WHEN OLD.offering_type IS NOT NEW.offering_type THEN ',offering_type' ELSE '' END || CASE WHEN OLD.amount IS NOT NEW.amount THEN ',amount' ELSE '' END ||
+        CASE WHEN OLD.memo IS NOT NEW.memo THEN ',memo' ELSE '' END || CASE WHEN OLD.created_by IS NOT NEW.created_by THEN ',created_by' ELSE '' END AS changed)
+    WHERE table_name = 'offerings' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_offerings_delete
+    AFTER DELETE ON offerings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'offerings', OLD.id, 'delete', version, OLD.member_id, OLD.created_by
+    FROM table_versions WHERE table_name = 'offerings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayers_insert
+    AFTER INSERT ON prayers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayers', NEW.id, 'insert', version, NULL, NEW.created_by
+    FROM table_versions WHERE table_name = 'prayers';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayers_update
+    AFTER UPDATE ON prayers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'prayers', NEW.id, 'update', substr(changed, 2), version, NULL, NEW.created_by
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.title IS NOT NEW.title THEN ',title' ELSE '' END || CASE WHEN OLD.content IS NOT NEW.content THEN ',content' ELSE '' END ||
+        CASE WHEN OLD.category IS NOT NEW.category THEN ',category' ELSE '' END || CASE WHEN OLD.is_anonymous IS NOT NEW.is_anonymous THEN ',is_anonymous' ELSE '' END ||
+        CASE WHEN OLD.visibility IS NOT NEW.visibility THEN ',visibility' ELSE '' END || CASE WHEN OLD.status IS NOT NEW.status THEN ',status' ELSE '' END ||
+        CASE WHEN OLD.prayer_period_start IS NOT NEW.prayer_period_start THEN ',prayer_period_start' ELSE '' END || CASE WHEN OLD.prayer_period_end IS NOT NEW.prayer_period_end THEN ',prayer_period_end' ELSE '' END ||
+        CASE WHEN OLD.answer_content IS NOT NEW.answer_content THEN ',answer_content' ELSE '' END || CASE WHEN OLD.answer_date IS NOT NEW.answer_date THEN ',answer_date' ELSE '' END ||
+        CASE WHEN OLD.tags IS NOT NEW.tags THEN ',tags' ELSE '' END || CASE WHEN OLD.created_by IS NOT NEW.created_by THEN ',created_by' ELSE '' END AS changed)
+    WHERE table_name = 'prayers' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayers_delete
+    AFTER DELETE ON prayers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayers', OLD.id, 'delete', version, NULL, OLD.created_by
+    FROM table_versions WHERE table_name = 'prayers';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_participants_insert
+    AFTER INSERT ON prayer_participants
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_participants';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayer_participants', NEW.id, 'insert', version, NEW.prayer_id, NEW.user_id
+    FROM table_versions WHERE table_name = 'prayer_participants';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_participants_update
+    AFTER UPDATE ON prayer_participants
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_participants';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'prayer_participants', NEW.id, 'update', substr(changed, 2), version, NEW.prayer_id, NEW.user_id
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.prayer_id IS NOT NEW.prayer_id THEN ',prayer_id' ELSE '' END || CASE WHEN OLD.user_id IS NOT NEW.user_id THEN ',user_id' ELSE '' END ||
+        CASE WHEN OLD.participated_at IS NOT NEW.participated_at THEN ',participated_at' ELSE '' END AS changed)
+    WHERE table_name = 'prayer_participants' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_participants_delete
+    AFTER DELETE ON prayer_participants
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_participants';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayer_participants', OLD.id, 'delete', version, OLD.prayer_id, OLD.user_id
+    FROM table_versions WHERE table_name = 'prayer_participants';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_comments_insert
+    AFTER INSERT ON prayer_comments
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_comments';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayer_comments', NEW.id, 'insert', version, NEW.prayer_id, NEW.user_id
+    FROM table_versions WHERE table_name = 'prayer_comments';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_comments_update
+    AFTER UPDATE ON prayer_comments
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_comments';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'prayer_comments', NEW.id, 'update', substr(changed, 2), version, NEW.prayer_id, NEW.user_id
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.prayer_id IS NOT NEW.prayer_id THEN ',prayer_id' ELSE '' END || CASE WHEN OLD.user_id IS NOT NEW.user_id THEN ',user_id' ELSE '' END ||
+        CASE WHEN OLD.comment IS NOT NEW.comment THEN ',comment' ELSE '' END || CASE WHEN OLD.is_anonymous IS NOT NEW.is_anonymous THEN ',is_anonymous' ELSE '' END AS changed)
+    WHERE table_name = 'prayer_comments' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayer_comments_delete
+    AFTER DELETE ON prayer_comments
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayer_comments';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayer_comments', OLD.id, 'delete', version, OLD.prayer_id, OLD.user_id
+    FROM table_versions WHERE table_name = 'prayer_comments';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_system_settings_insert
+    AFTER INSERT ON system_settings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'system_settings';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'system_settings', NEW.id, 'insert', version, NULL, NULL
+    FROM table_versions WHERE table_name = 'system_settings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_system_settings_update
+    AFTER UPDATE ON system_settings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'system_settings';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'system_settings', NEW.id, 'update', substr(changed, 2), version, NULL, NULL
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.setting_key IS NOT NEW.setting_key THEN ',setting_key' ELSE '' END || CASE WHEN OLD.setting_value IS NOT NEW.setting_value THEN ',setting_value' ELSE '' END ||
+        CASE WHEN OLD.setting_type IS NOT NEW.setting_type THEN ',setting_type' ELSE '' END || CASE WHEN OLD.description IS NOT NEW.description THEN ',description' ELSE '' END AS changed)
+    WHERE table_name = 'system_settings' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_system_settings_delete
+    AFTER DELETE ON system_settings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'system_settings';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'system_settings', OLD.id, 'delete', version, NULL, NULL
+    FROM table_versions WHERE table_name = 'system_settings';
+END;
@@ -0,0 +1,6 @@
+-- ====================================================================
+-- 0010: 성도 수정 이력 조회 인덱스
+-- 성도별 기간 조회와 커서 페이지(modified_at, id 역순)를 인덱스 범위 스캔으로 처리
+-- ====================================================================
+
+CREATE INDEX IF NOT EXISTS idx_member_history_member_id_modified_at ON member_history(member_id, modified_at);
@@ -0,0 +1,178 @@
+-- ====================================================================
+-- 0011: 소프트 삭제
+-- 성도/가정/헌금/기도 삭제는 deleted_at 만 기록하고, 보관 기간이 지나면 정리 작업(soft_delete_purge)이
+-- 묶음 단위로 실제 삭제 (가정/기도에 딸린 데이터 정리도 그때 함께 수행)
+-- 조회용 인덱스는 삭제되지 않은 행만 담는 부분 인덱스로 교체 (조회문에 deleted_at IS NULL 조건 필요)
+-- updated_at 인덱스는 증분 백업이 삭제된 행도 찾아야 하므로 그대로 둠
+-- ====================================================================
+
+ALTER TABLE members ADD COLUMN deleted_at TIMESTAMP;
+ALTER TABLE families ADD COLUMN deleted_at TIMESTAMP;
+ALTER TABLE offerings ADD COLUMN deleted_at TIMESTAMP;
+ALTER TABLE prayers ADD COLUMN deleted_at TIMESTAMP;
+
+-- 부분 인덱스로 교체
+DROP INDEX IF EXISTS idx_members_name;
+DROP INDEX IF EXISTS idx_members_email;
+DROP INDEX IF EXISTS idx_members_phone;
+DROP INDEX IF EXISTS idx_members_family_id_family_role_birth_date;
+DROP INDEX IF EXISTS idx_members_is_active;
+DROP INDEX IF EXISTS idx_families_family_name;
+DROP INDEX IF EXISTS idx_offerings_member_id_offering_date_created_at;
+DROP INDEX IF EXISTS idx_offerings_member_id_offering_type;
+DROP INDEX IF EXISTS idx_offerings_offering_date_created_at;
+DROP INDEX IF EXISTS idx_offerings_offering_type;
+DROP INDEX IF EXISTS idx_offerings_created_by;
+DROP INDEX IF EXISTS idx_prayers_created_by_created_at;
+DROP INDEX IF EXISTS idx_prayers_category_created_at;
+DROP INDEX IF EXISTS idx_prayers_status;
+DROP INDEX IF EXISTS idx_prayers_visibility;
+DROP INDEX IF EXISTS idx_prayers_created_at;
+
+CREATE INDEX IF NOT EXISTS idx_members_name ON members(name) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_members_email ON members(email) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_members_phone ON members(phone) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_members_family_id_family_role_birth_date ON members(family_id, family_role, birth_date) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_members_is_active ON members(is_active) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_families_family_name ON families(family_name) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_offerings_member_id_offering_date_created_at ON offerings(member_id, offering_date, created_at) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_offerings_member_id_offering_type ON offerings(member_id, offering_type) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_offerings_offering_date_created_at ON offerings(offering_date, created_at) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_offerings_offering_type ON offerings(offering_type) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_offerings_created_by ON offerings(created_by) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_created_by_created_at ON prayers(created_by, created_at) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_category_created_at ON prayers(category, created_at) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_status ON prayers(status) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_visibility ON prayers(visibility) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_created_at ON prayers(created_at) WHERE deleted_at IS NULL;
+
+-- 정리 작업: 삭제된 행만 담는 작은 인덱스 (WHERE deleted_at < ? ORDER BY deleted_at)
+CREATE INDEX IF NOT EXISTS idx_members_deleted_at ON members(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_families_deleted_at ON families(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_offerings_deleted_at ON offerings(deleted_at) WHERE deleted_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_prayers_deleted_at ON prayers(deleted_at) WHERE deleted_at IS NOT NULL;
+
+-- ====================================================================
+-- 변경 이벤트 트리거 교체
+-- deleted_at 이 채워지는 수정은 'delete' 이벤트로 기록 (동기화/실시간 알림에는 삭제로 전달)
+-- 이미 소프트 삭제된 행의 실제 삭제(정리 작업)는 이벤트와 버전 증가 없음
+-- ====================================================================
+
+DROP TRIGGER IF EXISTS capture_members_update;
+DROP TRIGGER IF EXISTS capture_members_delete;
+DROP TRIGGER IF EXISTS capture_families_update;
+DROP TRIGGER IF EXISTS capture_families_delete;
+DROP TRIGGER IF EXISTS capture_offerings_update;
+DROP TRIGGER IF EXISTS capture_offerings_delete;
+DROP TRIGGER IF EXISTS capture_prayers_update;
+DROP TRIGGER IF EXISTS capture_prayers_delete;
+
+CREATE TRIGGER IF NOT EXISTS capture_members_update
+    AFTER UPDATE ON members
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'members', NEW.id,
+           CASE WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN 'delete' ELSE 'update' END,
+           substr(changed, 2), version, NEW.family_id, NULL
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.name IS NOT NEW.name THEN ',name' ELSE '' END || CASE WHEN OLD.name_en IS NOT NEW.name_en THEN ',name_en' ELSE '' END ||
+        CASE WHEN OLD.birth_date IS NOT NEW.birth_date THEN ',birth_date' ELSE '' END || CASE WHEN OLD.gender IS NOT NEW.gender THEN ',gender' ELSE '' END ||
+        CASE WHEN OLD.phone IS NOT NEW.phone THEN ',phone' ELSE '' END || CASE WHEN OLD.email IS NOT NEW.email THEN ',email' ELSE '' END ||
+        CASE WHEN OLD.address IS NOT NEW.address THEN ',address' ELSE '' END || CASE WHEN OLD.job IS NOT NEW.job THEN ',job' ELSE '' END ||
+        CASE WHEN OLD.registration_date IS NOT NEW.registration_date THEN ',registration_date' ELSE '' END || CASE WHEN OLD.baptism_date IS NOT NEW.baptism_date THEN ',baptism_date' ELSE '' END ||
+        CASE WHEN OLD.position IS NOT NEW.position THEN ',position' ELSE '' END || CASE WHEN OLD.district IS NOT NEW.district THEN ',district' ELSE '' END ||
+        CASE WHEN OLD.family_id IS NOT NEW.family_id THEN ',family_id' ELSE '' END || CASE WHEN OLD.family_role IS NOT NEW.family_role THEN ',family_role' ELSE '' END ||
+        CASE WHEN OLD.is_active IS NOT NEW.is_active THEN ',is_active' ELSE '' END || CASE WHEN OLD.notes IS NOT NEW.notes THEN ',notes' ELSE '' END ||
+        CASE WHEN OLD.created_by IS NOT NEW.created_by THEN ',created_by' ELSE '' END || CASE WHEN OLD.deleted_at IS NOT NEW.deleted_at THEN ',deleted_at' ELSE '' END AS changed)
+    WHERE table_name = 'members' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_members_delete
+    AFTER DELETE ON members
+    WHEN OLD.deleted_at IS NULL
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'members';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'members', OLD.id, 'delete', version, OLD.family_id, NULL
+    FROM table_versions WHERE table_name = 'members';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_families_update
+    AFTER UPDATE ON families
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'families', NEW.id,
+           CASE WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN 'delete' ELSE 'update' END,
+           substr(changed, 2), version, NULL, NULL
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.family_name IS NOT NEW.family_name THEN ',family_name' ELSE '' END || CASE WHEN OLD.head_member_id IS NOT NEW.head_member_id THEN ',head_member_id' ELSE '' END ||
+        CASE WHEN OLD.address IS NOT NEW.address THEN ',address' ELSE '' END || CASE WHEN OLD.deleted_at IS NOT NEW.deleted_at THEN ',deleted_at' ELSE '' END AS changed)
+    WHERE table_name = 'families' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_families_delete
+    AFTER DELETE ON families
+    WHEN OLD.deleted_at IS NULL
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'families';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'families', OLD.id, 'delete', version, NULL, NULL
+    FROM table_versions WHERE table_name = 'families';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_offerings_update
+    AFTER UPDATE ON offerings
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'offerings', NEW.id,
+           CASE WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN 'delete' ELSE 'update' END,
+           substr(changed, 2), version, NEW.member_id, NEW.created_by
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.member_id IS NOT NEW.member_id THEN ',member_id' ELSE '' END || CASE WHEN OLD.offering_date IS NOT NEW.offering_date THEN ',offering_date' ELSE '' END ||
+        CASE WHEN OLD.offering_type IS NOT NEW.offering_type THEN ',offering_type' ELSE '' END || CASE WHEN OLD.amount IS NOT NEW.amount THEN ',amount' ELSE '' END ||
+        CASE WHEN OLD.memo IS NOT NEW.memo THEN ',memo' ELSE '' END || CASE WHEN OLD.created_by IS NOT NEW.created_by THEN ',created_by' ELSE '' END ||
+        CASE WHEN OLD.deleted_at IS NOT NEW.deleted_at THEN ',deleted_at' ELSE '' END AS changed)
+    WHERE table_name = 'offerings' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_offerings_delete
+    AFTER DELETE ON offerings
+    WHEN OLD.deleted_at IS NULL
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'offerings';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'offerings', OLD.id, 'delete', version, OLD.member_id, OLD.created_by
+    FROM table_versions WHERE table_name = 'offerings';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayers_update
+    AFTER UPDATE ON prayers
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+    INSERT INTO change_events (table_name, row_id, op, changed_columns, version, parent_id, user_id)
+    SELECT 'prayers', NEW.id,
+           CASE WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN 'delete' ELSE 'update' END,
+           substr(changed, 2), version, NULL, NEW.created_by
+    FROM table_versions, (SELECT
+        CASE WHEN OLD.title IS NOT NEW.title THEN ',title' ELSE '' END || CASE WHEN OLD.content IS NOT NEW.content THEN ',content' ELSE '' END ||
+        CASE WHEN OLD.category IS NOT NEW.category THEN ',category' ELSE '' END || CASE WHEN OLD.is_anonymous IS NOT NEW.is_anonymous THEN ',is_anonymous' ELSE '' END ||
+        CASE WHEN OLD.visibility IS NOT NEW.visibility THEN ',visibility' ELSE '' END || CASE WHEN OLD.status IS NOT NEW.status THEN ',status' ELSE '' END ||
+        CASE WHEN OLD.prayer_period_start IS NOT NEW.prayer_period_start THEN ',prayer_period_start' ELSE '' END || CASE WHEN OLD.prayer_period_end IS NOT NEW.prayer_period_end THEN ',prayer_period_end' ELSE '' END ||
+        CASE WHEN OLD.answer_content IS NOT NEW.answer_content THEN ',answer_content' ELSE '' END || CASE WHEN OLD.answer_date IS NOT NEW.answer_date THEN ',answer_date' ELSE '' END ||
+        CASE WHEN OLD.tags IS NOT NEW.tags THEN ',tags' ELSE '' END || CASE WHEN OLD.created_by IS NOT NEW.created_by THEN ',created_by' ELSE '' END ||
+        CASE WHEN OLD.deleted_at IS NOT NEW.deleted_at THEN ',deleted_at' ELSE '' END AS changed)
+    WHERE table_name = 'prayers' AND changed != '';
+END;
+
+CREATE TRIGGER IF NOT EXISTS capture_prayers_delete
+    AFTER DELETE ON prayers
+    WHEN OLD.deleted_at IS NULL
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'prayers';
+    INSERT INTO change_events (table_name, row_id, op, version, parent_id, user_id)
+    SELECT 'prayers', OLD.id, 'delete', version, NULL, OLD.created_by
+    FROM table_versions WHERE table_name = 'prayers';
+END;
@@ -0,0 +1,7 @@
+-- ====================================================================
+-- 0012: 백그라운드 작업 재개 지점
+-- 가져오기 작업은 행 묶음을 INSERT 하는 batch 에서 커밋한 행 수(checkpoint)를 함께 기록하고,
+-- 다시 대기열로 돌아가거나 임대가 넘어가면 기록된 지점부터 이어서 처리 (같은 행을 두 번 넣지 않음)
+-- ====================================================================
+
+ALTER TABLE background_jobs ADD COLUMN checkpoint INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,7 @@
+-- ====================================================================
+-- 0013: 성도 정리용 헌금 인덱스
+-- 소프트 삭제 정리 작업은 삭제 여부와 관계없이 헌금 기록이 남은 성도를 건너뜀
+-- (NOT EXISTS ... WHERE member_id = ?). 0011 의 member_id 인덱스는 삭제되지 않은 헌금만 담으므로 전체 인덱스를 추가
+-- ====================================================================
+
+CREATE INDEX IF NOT EXISTS idx_offerings_member_id ON offerings(member_id);
@@ -0,0 +1,12 @@
+-- ====================================================================
+-- 0014: 성도/가정 삭제 시각 인덱스를 전체 인덱스로 교체
+-- 대시보드의 COUNT(*) ... WHERE deleted_at IS NULL 은 부분 인덱스를 쓰지 못해 테이블 전체를 읽음.
+-- 전체 인덱스면 살아 있는 행 수를 인덱스 검색(deleted_at=NULL)으로 세고,
+-- 정리 작업의 deleted_at < ? 범위 검색도 그대로 사용 가능
+-- ====================================================================
+
+DROP INDEX IF EXISTS idx_members_deleted_at;
+DROP INDEX IF EXISTS idx_families_deleted_at;
+
+CREATE INDEX IF NOT EXISTS idx_members_deleted_at ON members(deleted_at);
+CREATE INDEX IF NOT EXISTS idx_families_deleted_at ON families(deleted_at);
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+ITTLC 백업 복원 도구
+
+사용법:
+  python restore.py list                                  # 백업 목록 (체인별)
+  python restore.py restore OUTPUT [--until 시각]         # 시각(UTC) 이전 마지막 스냅샷을 OUTPUT 에 복원
+  python restore.py restore OUTPUT --backup 파일이름      # 지정한 백업까지의 체인을 복원
+  python restore.py verify [--backup 파일이름]            # 임시 파일로 복원해 검증만 수행
+
+백업 디렉터리(.env 의 BACKUP_DIR)의 메타데이터 파일만 사용하므로 DB 연결 없이 실행됩니다.
+전체 백업에 증분을 순서대로 적용한 뒤 integrity_check 와 백업 시점의 테이블별 행 수/체크섬을 비교합니다.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 시스템 경로에 추가
+project_root = str(Path(__file__).parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from app.core.config import settings
+from app.db.backup import FULL, BackupCatalog, BackupVerificationError, restore_chain, verify_database
+
+
+def select_chain(catalog: BackupCatalog, args):
+    if args.backup:
+        entry = catalog.get(args.backup)
+        if entry is None:
+            raise BackupVerificationError(f"백업을 찾을 수 없습니다: {args.backup}")
+    elif getattr(args, "until", None):
+        # 2026-10-19T12:00:00 / 2026-10-19 12:00 형식 모두 허용
+        until = args.until.replace("T", " ")
+        until = until + ":00" if len(until) == 16 else until
+        entry = catalog.until(until, args.source)
+        if entry is None:
+            raise BackupVerificationError(f"{until} (UTC) 이전의 백업이 없습니다")
+    else:
+        entry = catalog.latest(args.source)
+        if entry is None:
+            raise BackupVerificationError("백업이 없습니다")
+    return catalog.chain(entry)
+
+
+def restore(chain, output: Path):
+    started = time.perf_counter()
+    for entry in chain:
+        print(f"  {'📦' if entry['kind'] == FULL else '➕'} {entry['filename']} (스냅샷 {entry['snapshot_at']} UTC)")
+    restore_chain(chain, output)
+    target = chain[-1]
+    checksums = verify_database(output, target.get("counts"), target.get("tables"))
+    elapsed = time.perf_counter() - started
+    print(f"✅ 검증 완료: 테이블 {len(checksums)}개, 행 {sum(value['rows'] for value in checksums.values())}개 "
+          f"({elapsed:.2f}초)")
+
+
+def run(args) -> int:
+    catalog = BackupCatalog(Path(args.dir or settings.BACKUP_DIR))
+    try:
+        if args.command == "list":
+            entries = catalog.entries()
+            if not entries:
+                print("백업이 없습니다.")
+            for entry in entries:
+                if entry["kind"] == FULL:
+                    print(f"📦 {entry['filename']}  {entry['snapshot_at']} UTC  {entry['file_size']} bytes  "
+                          f"[{entry.get('source')}]")
+                else:
+                    print(f"   ➕ {entry['filename']}  {entry['snapshot_at']} UTC  {entry['file_size']} bytes  "
+                          f"← {entry['parent']}")
+            return 0
+
+        chain = select_chain(catalog, args)
+        if args.command == "restore":
+            output = Path(args.output)
+            if output.exists() and not args.force:
+                print(f"❌ {output} 이(가) 이미 있습니다 (덮어쓰려면 --force)")
+                return 1
+            restore(chain, output)
+            print(f"💾 {output}")
+            return 0
+
+        if args.command == "verify":
+            with tempfile.TemporaryDirectory() as directory:
+                restore(chain, Path(directory) / "verify.db")
+            return 0
+    except BackupVerificationError as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ITTLC 백업 복원")
+    parser.add_argument("--dir", default=None, help="백업 디렉터리 (기본: BACKUP_DIR)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="백업 목록")
+    restore_parser = subparsers.add_parser("restore", help="백업 체인을 새 데이터베이스 파일로 복원")
+    restore_parser.add_argument("output", help="복원할 데이터베이스 파일 경로")
+    restore_parser.add_argument("--until", default=None, help="이 시각(UTC, 'YYYY-MM-DD HH:MM:SS') 이전 마지막 스냅샷")
+    restore_parser.add_argument("--force", action="store_true", help="기존 파일 덮어쓰기")
+    verify = subparsers.add_parser("verify", help="임시 파일로 복원해 검증")
+    for subparser in (restore_parser, verify):
+        subparser.add_argument("--backup", default=None, help="이 백업 파일까지의 체인")
+        subparser.add_argument("--source", default=None, help="원본 (file:경로 또는 URL, 여러 원본이 섞인 경우)")
+    args = parser.parse_args()
+    sys.exit(run(args))
+
+
+if __name__ == "__main__":
+    main()
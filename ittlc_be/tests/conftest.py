@@ -0,0 +1,21 @@
+"""
+테스트 공통 준비
+
+DB 가 필요한 테스트는 임시 디렉터리의 로컬 SQLite 파일에 마이그레이션을 적용해 사용합니다.
+비동기 코드는 테스트마다 asyncio.run 으로 실행합니다.
+"""
+import pytest
+
+from app.db.engine import LocalSQLiteEngine
+from app.db.migrations import MigrationRunner
+
+
+@pytest.fixture
+def make_engine(tmp_path):
+    """마이그레이션을 적용한 로컬 엔진을 만드는 비동기 함수 (이벤트 루프 안에서 호출)"""
+    async def factory(migrate: bool = True) -> LocalSQLiteEngine:
+        engine = LocalSQLiteEngine(str(tmp_path / "test.db"), readers=1)
+        if migrate:
+            await MigrationRunner(await engine.get_client()).migrate()
+        return engine
+    return factory
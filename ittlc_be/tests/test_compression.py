@@ -0,0 +1,122 @@
+"""
+응답 압축: Accept-Encoding 협상과 미들웨어 동작
+"""
+import asyncio
+import gzip
+import json
+
+import brotli
+import pytest
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding, parse_accept_encoding
+
+BODY = json.dumps({"rows": [{"id": i, "name": "성도"} for i in range(200)]}).encode()
+
+
+def test_parse_accept_encoding_quality_values():
+    assert parse_accept_encoding("gzip, br;q=0.5, identity;q=0, deflate;q=abc") == {
+        "gzip": 1.0, "br": 0.5, "identity": 0.0, "deflate": 0.0
+    }
+    assert parse_accept_encoding("") == {}
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate, br", "br"),
+    ("gzip;q=1.0, br;q=0.8", "gzip"),
+    ("br;q=0, gzip", "gzip"),
+    ("*", "br"),
+    ("*;q=0.5, br;q=0", "gzip"),
+    ("identity", None),
+    ("gzip;q=0", None),
+    ("", None),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header, ("br", "gzip")) == expected
+
+
+def test_negotiate_without_brotli():
+    assert negotiate_encoding("br, gzip;q=0.1", ("gzip",)) == "gzip"
+
+
+def call(middleware: CompressionMiddleware, accept_encoding: str, body: bytes = BODY,
+         content_type: bytes = b"application/json", method: str = "GET", chunks: int = 1,
+         extra_headers: list = ()):
+    """미들웨어에 요청 하나를 보내고 (상태, 헤더, 본문) 반환"""
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", content_type), *extra_headers]})
+        size = len(body) // chunks + 1
+        parts = [body[i:i + size] for i in range(0, len(body), size)]
+        for index, part in enumerate(parts):
+            await send({"type": "http.response.body", "body": part, "more_body": index < len(parts) - 1})
+
+    middleware.app = app
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "path": "/", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    asyncio.run(middleware(scope, receive, send))
+    headers = {key.decode().lower(): value.decode() for key, value in messages[0]["headers"]}
+    return headers, b"".join(message.get("body", b"") for message in messages[1:])
+
+
+def test_middleware_compresses_with_negotiated_encoding():
+    middleware = CompressionMiddleware(app=None)
+    headers, body = call(middleware, "gzip;q=0.9, br")
+    assert headers["content-encoding"] == "br"
+    assert headers["vary"] == "Accept-Encoding"
+    assert brotli.decompress(body) == BODY
+
+    headers, body = call(middleware, "gzip")
+    assert headers["content-encoding"] == "gzip"
+    assert int(headers["content-length"]) == len(body)
+    assert gzip.decompress(body) == BODY
+
+
+def test_middleware_skips_unacceptable_small_streaming_and_binary_responses():
+    middleware = CompressionMiddleware(app=None, minimum_size=1024)
+    for kwargs in (
+        {"accept_encoding": "identity"},
+        {"accept_encoding": "gzip", "body": b'{"ok": true}'},
+        {"accept_encoding": "gzip", "chunks": 3},
+        {"accept_encoding": "gzip", "content_type": b"image/png"},
+        {"accept_encoding": "gzip", "extra_headers": [(b"content-encoding", b"zstd")]},
+    ):
+        headers, body = call(middleware, **kwargs)
+        assert headers.get("content-encoding") in (None, "zstd")
+        assert body == kwargs.get("body", BODY)
+
+
+def test_strong_etag_becomes_weak_and_get_results_are_cached():
+    middleware = CompressionMiddleware(app=None)
+    headers, first = call(middleware, "gzip", extra_headers=[(b"etag", b'"abc"')])
+    assert headers["etag"] == 'W/"abc"'
+    _, second = call(middleware, "gzip")
+    assert first == second
+    assert len(middleware.cache._entries) == 1
+    call(middleware, "gzip", method="POST")
+    assert len(middleware.cache._entries) == 1
+
+
+def test_large_bodies_are_compressed_off_the_event_loop(monkeypatch):
+    middleware = CompressionMiddleware(app=None, offload_size=len(BODY))
+    offloaded = []
+
+    async def to_thread(func, *args):
+        offloaded.append(len(args[1]))
+        return func(*args)
+
+    monkeypatch.setattr(asyncio, "to_thread", to_thread)
+    headers, body = call(middleware, "gzip")
+    assert gzip.decompress(body) == BODY
+    assert offloaded == [len(BODY)]
+
+    # 작은 본문은 이벤트 루프에서 바로 압축
+    headers, body = call(middleware, "gzip", body=BODY[:2048])
+    assert gzip.decompress(body) == BODY[:2048]
+    assert offloaded == [len(BODY)]
@@ -0,0 +1,79 @@
+"""
+주기 작업 cron 표현식 파싱과 다음 실행 시각
+"""
+from datetime import datetime
+
+import pytest
+
+from app.services.job_scheduler import CronSchedule
+
+
+def test_wildcards_and_aliases():
+    schedule = CronSchedule("* * * * *")
+    assert schedule.minutes == frozenset(range(60))
+    assert schedule.weekdays == frozenset(range(7))
+    assert CronSchedule("@daily").next_after(datetime(2025, 3, 1, 10, 30)) == datetime(2025, 3, 2, 0, 0)
+
+
+def test_lists_ranges_and_steps():
+    schedule = CronSchedule("0,15,45 9-17 1-10/3 */4 1-5")
+    assert schedule.minutes == {0, 15, 45}
+    assert schedule.hours == set(range(9, 18))
+    assert schedule.days == {1, 4, 7, 10}
+    assert schedule.months == {1, 5, 9}
+    assert schedule.weekdays == {1, 2, 3, 4, 5}
+
+
+def test_step_applies_only_to_its_own_list_item():
+    schedule = CronSchedule("0,30/15 * * * *")
+    assert schedule.minutes == {0, 30, 45}
+    assert CronSchedule("5/20 * * * *").minutes == {5, 25, 45}
+    assert CronSchedule("*/20 * * * *").minutes == {0, 20, 40}
+
+
+def test_sunday_is_zero_or_seven():
+    assert CronSchedule("0 0 * * 7").weekdays == {0}
+    # 2025-03-02 는 일요일
+    assert CronSchedule("0 0 * * 7").next_after(datetime(2025, 2, 28, 12, 0)) == datetime(2025, 3, 2, 0, 0)
+
+
+@pytest.mark.parametrize("expression", [
+    "* * * *",
+    "60 * * * *",
+    "* 24 * * *",
+    "* * 0 * *",
+    "* * * 13 *",
+    "* * * * 8",
+    "10-5 * * * *",
+    "*/0 * * * *",
+    "a * * * *",
+])
+def test_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_day_of_month_or_day_of_week_when_both_restricted():
+    # 매월 15일 또는 월요일
+    schedule = CronSchedule("0 9 15 * 1")
+    # 2025-03-10 (월) → 같은 날 9시
+    assert schedule.next_after(datetime(2025, 3, 10, 8, 0)) == datetime(2025, 3, 10, 9, 0)
+    # 2025-03-11 (화) 이후 첫 후보는 13일이 아니라 15일 (토)
+    assert schedule.next_after(datetime(2025, 3, 11, 9, 0)) == datetime(2025, 3, 15, 9, 0)
+    # 15일 다음은 17일 (월)
+    assert schedule.next_after(datetime(2025, 3, 15, 9, 0)) == datetime(2025, 3, 17, 9, 0)
+
+
+def test_day_of_month_and_wildcard_weekday():
+    # 요일이 * 이면 일 조건만
+    schedule = CronSchedule("30 4 1 * *")
+    assert schedule.next_after(datetime(2025, 3, 10, 0, 0)) == datetime(2025, 4, 1, 4, 30)
+    # 일이 * 이면 요일 조건만 (2025-03-14 는 금요일)
+    schedule = CronSchedule("0 0 * * 5")
+    assert schedule.next_after(datetime(2025, 3, 10, 0, 0)) == datetime(2025, 3, 14, 0, 0)
+
+
+def test_next_after_skips_to_the_following_minute():
+    schedule = CronSchedule("*/15 * * * *")
+    assert schedule.next_after(datetime(2025, 3, 1, 10, 15, 30)) == datetime(2025, 3, 1, 10, 30)
+    assert schedule.next_after(datetime(2025, 12, 31, 23, 59)) == datetime(2026, 1, 1, 0, 0)
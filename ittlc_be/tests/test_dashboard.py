@@ -0,0 +1,64 @@
+"""
+대시보드 materializer: 자기 쓰기의 증분 반영과 외부 쓰기 감지
+"""
+import asyncio
+
+from app.core.etag import current_month
+from app.services import dashboard_service
+from app.services.dashboard_service import DashboardMaterializer
+
+
+class FakeVersions:
+    """메모리에 둔 table_versions"""
+
+    def __init__(self):
+        self.versions = {table: 10 for table in dashboard_service.SOURCE_TABLES}
+
+    def is_fresh(self):
+        return True
+
+    async def get_versions(self, tables):
+        return {table: self.versions[table] for table in tables}
+
+
+def make_materializer(monkeypatch):
+    versions = FakeVersions()
+    monkeypatch.setattr(dashboard_service, "table_versions", versions)
+    materializer = DashboardMaterializer()
+    materializer._stats = {"member_count": 5, "family_count": 2,
+                           "monthly_prayer_count": 1, "monthly_offering_amount": 0}
+    materializer._month = current_month()
+    materializer._source_versions = dict(versions.versions)
+    stale = []
+    monkeypatch.setattr(materializer, "mark_stale", lambda: stale.append(True))
+    return materializer, versions, stale
+
+
+def test_own_writes_do_not_trigger_a_recompute(monkeypatch):
+    materializer, versions, stale = make_materializer(monkeypatch)
+
+    # 이 워커가 성도 추가와 지난달 헌금 기록을 한 뒤 트리거가 버전을 올림
+    materializer.record_member(1)
+    materializer.record_offering(10000, "2000-01-07")
+    versions.versions["members"] += 1
+    versions.versions["offerings"] += 1
+
+    stats = asyncio.run(materializer.get_stats())
+    assert stats["member_count"] == 6
+    assert stats["monthly_offering_amount"] == 0
+    assert not stale
+
+
+def test_unexplained_version_change_triggers_a_recompute(monkeypatch):
+    materializer, versions, stale = make_materializer(monkeypatch)
+
+    # 자기 쓰기가 아직 보이지 않는 읽기는 무시
+    materializer.record_prayer(1)
+    asyncio.run(materializer.get_stats())
+    assert not stale
+
+    # 자기 쓰기 하나 + 다른 워커의 쓰기 하나
+    versions.versions["prayers"] += 2
+    asyncio.run(materializer.get_stats())
+    assert stale == [True]
+    assert materializer._source_versions["prayers"] == 12
@@ -0,0 +1,158 @@
+"""
+DB 호출 스케줄러: 동시 실행 상한, 레인 가중치(stride), background 상한, 대기 시간 초과
+"""
+import asyncio
+import contextlib
+
+import pytest
+
+from app.db.scheduler import BACKGROUND, READ, WRITE, DBScheduler, QueueTimeout, db_lane, lane_for, parse_weights
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def hold(scheduler: DBScheduler, lane: str, order: list, release: asyncio.Event):
+    async with scheduler.slot(lane):
+        order.append(lane)
+        await release.wait()
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_lane_for_uses_statement_kind_or_explicit_lane():
+    assert lane_for("SELECT * FROM members") == READ
+    assert lane_for("UPDATE members SET name = ?") == WRITE
+    assert lane_for() == WRITE
+    with db_lane(BACKGROUND):
+        assert lane_for("SELECT 1") == BACKGROUND
+    assert lane_for("SELECT 1") == READ
+    with pytest.raises(ValueError):
+        with db_lane("bulk"):
+            pass
+
+
+def test_parse_weights():
+    assert parse_weights("write=4, read=2,background=0.5") == {WRITE: 4.0, READ: 2.0, BACKGROUND: 0.5}
+    assert parse_weights(None) == {}
+    with pytest.raises(ValueError):
+        parse_weights("bulk=1")
+
+
+def test_admits_up_to_the_concurrency_cap():
+    async def scenario():
+        scheduler = DBScheduler(max_concurrency=2)
+        order, release = [], asyncio.Event()
+        tasks = [asyncio.create_task(hold(scheduler, READ, order, release)) for _ in range(3)]
+        await settle()
+        assert scheduler.in_flight == 2
+        assert len(order) == 2
+        release.set()
+        await asyncio.gather(*tasks)
+        assert order == [READ] * 3
+        assert scheduler.in_flight == 0
+
+    run(scenario())
+
+
+def test_waiting_lanes_share_slots_by_weight():
+    async def scenario():
+        scheduler = DBScheduler(max_concurrency=1, weights={WRITE: 4.0, READ: 2.0, BACKGROUND: 1.0},
+                                background_limit=1)
+        order: list = []
+        blocker_release = asyncio.Event()
+        blocker = asyncio.create_task(hold(scheduler, WRITE, [], blocker_release))
+        await settle()
+
+        async def quick(lane):
+            async with scheduler.slot(lane):
+                order.append(lane)
+                await asyncio.sleep(0)
+
+        tasks = [asyncio.create_task(quick(lane)) for lane in (WRITE, READ, BACKGROUND) for _ in range(14)]
+        await settle()
+        blocker_release.set()
+        await asyncio.gather(blocker, *tasks)
+        first = order[:14]
+        # 가중치 4:2:1 → 14 슬롯 중 8:4:2
+        assert (first.count(WRITE), first.count(READ), first.count(BACKGROUND)) == (8, 4, 2)
+
+    run(scenario())
+
+
+def test_idle_lane_does_not_bank_its_share():
+    async def scenario():
+        scheduler = DBScheduler(max_concurrency=1, weights={WRITE: 1.0, READ: 1.0})
+        # 쓰기만 오래 몰려 pass 값이 커진 뒤 읽기가 들어와도 번갈아 배정
+        for _ in range(20):
+            async with scheduler.slot(WRITE):
+                pass
+        order: list = []
+        release = asyncio.Event()
+        blocker = asyncio.create_task(hold(scheduler, WRITE, [], release))
+        await settle()
+
+        async def quick(lane):
+            async with scheduler.slot(lane):
+                order.append(lane)
+                await asyncio.sleep(0)
+
+        writes = [asyncio.create_task(quick(WRITE)) for _ in range(6)]
+        await settle()
+        reads = [asyncio.create_task(quick(READ)) for _ in range(6)]
+        await settle()
+        release.set()
+        await asyncio.gather(blocker, *writes, *reads)
+        assert order[:6].count(READ) == 3
+
+    run(scenario())
+
+
+def test_background_limit_leaves_room_for_requests():
+    async def scenario():
+        scheduler = DBScheduler(max_concurrency=4, background_limit=1)
+        order, release = [], asyncio.Event()
+        background = [asyncio.create_task(hold(scheduler, BACKGROUND, order, release)) for _ in range(2)]
+        await settle()
+        assert order == [BACKGROUND]
+        reads = [asyncio.create_task(hold(scheduler, READ, order, release)) for _ in range(3)]
+        await settle()
+        assert order == [BACKGROUND, READ, READ, READ]
+        assert scheduler.lanes[BACKGROUND].in_flight == 1
+        release.set()
+        await asyncio.gather(*background, *reads)
+
+    run(scenario())
+
+
+def test_queue_timeout_and_cancellation_remove_the_waiter():
+    async def scenario():
+        scheduler = DBScheduler(max_concurrency=1, queue_timeout=0.05)
+        release = asyncio.Event()
+        blocker = asyncio.create_task(hold(scheduler, WRITE, [], release))
+        await settle()
+
+        with pytest.raises(QueueTimeout) as raised:
+            async with scheduler.slot(READ):
+                pass
+        assert raised.value.lane == READ
+        assert not scheduler.lanes[READ].waiters
+
+        waiting = asyncio.create_task(hold(scheduler, WRITE, [], release))
+        await settle()
+        waiting.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await waiting
+        assert not scheduler.lanes[WRITE].waiters
+
+        release.set()
+        await blocker
+        assert scheduler.in_flight == 0
+        async with scheduler.slot(READ):
+            assert scheduler.in_flight == 1
+
+    run(scenario())
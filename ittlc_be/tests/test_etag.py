@@ -0,0 +1,40 @@
+"""
+ETag 비교와 월 단위 보조 값
+"""
+from datetime import datetime
+
+import pytest
+
+from app.core import etag as etag_module
+from app.core.etag import etag_matches
+from app.services import dashboard_service
+
+
+@pytest.mark.parametrize("header, matches", [
+    (None, False),
+    ("*", True),
+    ('"v1"', True),
+    ('W/"v1"', True),
+    ('"v0", W/"v1"', True),
+    ('"v2"', False),
+])
+def test_etag_matches_uses_weak_comparison(header, matches):
+    assert etag_matches(header, 'W/"v1"') is matches
+
+
+def test_current_month_is_utc_and_shared_with_dashboard(monkeypatch):
+    class FixedClock(datetime):
+        @classmethod
+        def utcnow(cls):
+            # 서울 기준으로는 이미 2025-04-01 09:30
+            return cls(2025, 4, 1, 0, 30)
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2025, 4, 1, 9, 30)
+
+    monkeypatch.setattr(etag_module, "datetime", FixedClock)
+    assert etag_module.current_month() == "2025-04"
+    FixedClock.utcnow = classmethod(lambda cls: cls(2025, 3, 31, 23, 30))
+    assert etag_module.current_month() == "2025-03"
+    assert dashboard_service.current_month is etag_module.current_month
@@ -0,0 +1,121 @@
+"""
+백그라운드 작업 대기열: 헌금 가져오기 입력 파일과 재개 지점(checkpoint)
+"""
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from app.db.my_libsql_client import DatabaseUnavailable
+from app.services.job_queue import QUEUED, JobCancelled, JobContext, JobQueue, offerings_import_job
+
+ROWS = [
+    {"member_id": 1, "offering_date": "2025-01-05", "offering_type": "주일헌금", "amount": 1000 + i,
+     "memo": None, "created_by": 1}
+    for i in range(2500)
+]
+
+
+class FailAfterCommit:
+    """n 번째 batch 를 커밋한 뒤 연결이 끊긴 것처럼 DatabaseUnavailable 을 던지는 클라이언트"""
+
+    def __init__(self, client, fail_on: int):
+        self.client = client
+        self.fail_on = fail_on
+        self.batches = 0
+
+    async def execute(self, sql, params=None):
+        return await self.client.execute(sql, params)
+
+    async def batch(self, statements):
+        result = await self.client.batch(statements)
+        self.batches += 1
+        if self.batches == self.fail_on:
+            raise DatabaseUnavailable("연결이 끊겼습니다")
+        return result
+
+    async def close(self):
+        await self.client.close()
+
+
+def make_queue(engine, tmp_path) -> JobQueue:
+    queue = JobQueue(result_dir=str(tmp_path / "jobs"), processes=0, lease_ttl=60.0)
+    queue.handlers["offerings_import"] = offerings_import_job
+    queue.get_client = engine.get_client
+    return queue
+
+
+async def count_offerings(queue: JobQueue) -> int:
+    return (await queue._execute("SELECT COUNT(*) FROM offerings")).rows[0][0]
+
+
+def test_import_rows_are_staged_in_a_file_not_params(make_engine, tmp_path):
+    async def scenario():
+        engine = await make_engine()
+        try:
+            queue = make_queue(engine, tmp_path)
+            submitted = await queue.submit("offerings_import", {"rows": len(ROWS)}, 1, input_rows=ROWS)
+            params = json.loads((await queue._execute(
+                "SELECT params FROM background_jobs WHERE id = ?", [submitted["id"]])).rows[0][0])
+            assert params["rows"] == len(ROWS)
+            input_path = Path(params["input_path"])
+            assert input_path.parent == tmp_path / "jobs"
+            assert input_path.exists()
+
+            await queue._run(await queue._claim())
+            job = await queue.get(submitted["id"])
+            assert job["status"] == "succeeded"
+            assert job["result"] == {"imported": len(ROWS)}
+            assert await count_offerings(queue) == len(ROWS)
+            assert not input_path.exists()
+        finally:
+            await engine.stop()
+
+    asyncio.run(scenario())
+
+
+def test_requeued_import_resumes_from_checkpoint(make_engine, tmp_path):
+    async def scenario():
+        engine = await make_engine()
+        try:
+            queue = make_queue(engine, tmp_path)
+            submitted = await queue.submit("offerings_import", {"rows": len(ROWS)}, 1, input_rows=ROWS)
+
+            # 두 번째 batch 는 커밋됐지만 응답을 받지 못함 → 다시 대기열로
+            flaky = FailAfterCommit(await engine.get_client(), fail_on=2)
+            queue.get_client = lambda: asyncio.sleep(0, flaky)
+            await queue._run(await queue._claim())
+            assert (await queue.get(submitted["id"]))["status"] == QUEUED
+            assert await count_offerings(queue) == 2000
+
+            queue.get_client = engine.get_client
+            job = await queue._claim()
+            assert job["checkpoint"] == 2000
+            await queue._run(job)
+            assert (await queue.get(submitted["id"]))["result"] == {"imported": len(ROWS)}
+            assert await count_offerings(queue) == len(ROWS)
+        finally:
+            await engine.stop()
+
+    asyncio.run(scenario())
+
+
+def test_import_inserts_nothing_after_losing_the_lease(make_engine, tmp_path):
+    async def scenario():
+        engine = await make_engine()
+        try:
+            queue = make_queue(engine, tmp_path)
+            await queue.submit("offerings_import", {}, 1, input_rows=ROWS)
+            job = await queue._claim()
+            # 임대가 만료돼 다른 작업자가 가져감
+            await queue._execute("UPDATE background_jobs SET owner = 'other' WHERE id = ?", [job["id"]])
+            context = JobContext(queue, job)
+            with pytest.raises(JobCancelled):
+                await offerings_import_job(context)
+            assert context.lease_lost
+            assert await count_offerings(queue) == 0
+        finally:
+            await engine.stop()
+
+    asyncio.run(scenario())
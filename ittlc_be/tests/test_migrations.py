@@ -0,0 +1,78 @@
+"""
+스키마 마이그레이션: 문장 분리, 체크섬, drift
+"""
+import asyncio
+
+import pytest
+
+from app.db.migrations import Migration, MigrationError, MigrationRunner, checksum, load_migrations, split_statements
+
+
+def test_split_statements_ignores_comments_strings_and_trigger_bodies():
+    sql = """
+    -- 머리 주석; 여기서 끊지 않음
+    CREATE TABLE a (id INTEGER, note TEXT DEFAULT 'x;y');  -- 줄 끝 주석
+    /* 블록; 주석 */
+    CREATE TRIGGER t AFTER UPDATE ON a WHEN NEW.id > 0 BEGIN
+        UPDATE a SET note = CASE WHEN NEW.id = 1 THEN 'one' ELSE 'other' END WHERE id = NEW.id;
+        DELETE FROM a WHERE id < 0;
+    END;
+    DROP TABLE b
+    """
+    statements = split_statements(sql)
+    assert len(statements) == 3
+    assert statements[0] == "CREATE TABLE a (id INTEGER, note TEXT DEFAULT 'x;y')"
+    assert statements[1].startswith("CREATE TRIGGER t") and statements[1].endswith("END")
+    assert "--" not in statements[1] and "/*" not in "".join(statements)
+    assert statements[2] == "DROP TABLE b"
+
+
+def test_checksum_ignores_line_endings_but_not_content():
+    assert checksum("CREATE TABLE a (id INTEGER);\n") == checksum("CREATE TABLE a (id INTEGER);\r\n")
+    assert checksum("CREATE TABLE a (id INTEGER);") != checksum("CREATE TABLE a (id TEXT);")
+
+
+def test_fresh_database_has_no_drift(make_engine):
+    async def scenario():
+        engine = await make_engine()
+        try:
+            runner = MigrationRunner(await engine.get_client())
+            assert await runner.pending() == []
+            assert await runner.drift() == {"missing": [], "unexpected": [], "changed": []}
+        finally:
+            await engine.stop()
+
+    asyncio.run(scenario())
+
+
+def test_drift_reports_manual_schema_changes(make_engine):
+    async def scenario():
+        engine = await make_engine()
+        try:
+            client = await engine.get_client()
+            await client.execute("DROP INDEX idx_background_jobs_finished_at")
+            await client.execute("CREATE INDEX idx_manual ON background_jobs(created_at)")
+            drift = await MigrationRunner(client).drift()
+            assert drift["missing"] == ["index idx_background_jobs_finished_at"]
+            assert drift["unexpected"] == ["index idx_manual"]
+        finally:
+            await engine.stop()
+
+    asyncio.run(scenario())
+
+
+def test_modified_applied_migration_is_rejected(make_engine):
+    async def scenario():
+        engine = await make_engine()
+        try:
+            migrations = load_migrations()
+            first = migrations[0]
+            migrations[0] = Migration(first.version, first.name, first.sql + "\n-- 수정됨\n")
+            runner = MigrationRunner(await engine.get_client(), migrations)
+            with pytest.raises(MigrationError):
+                await runner.pending()
+            assert (await runner.status())[0]["state"] == "checksum_mismatch"
+        finally:
+            await engine.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,55 @@
+"""
+실시간 알림: WebSocket 구독 요청 처리
+"""
+import asyncio
+import json
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+pytest.importorskip("email_validator")  # 엔드포인트 모듈이 app.schemas 를 import
+
+from app.api.v1.endpoints import realtime as realtime_endpoint
+from app.services.realtime import Connection, prayer_channel, realtime_hub
+
+
+class FakeWebSocket:
+    """보낸 순서대로 요청을 돌려주고, 다 쓰면 연결 종료"""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    async def receive_json(self):
+        if not self.frames:
+            raise WebSocketDisconnect(1000)
+        frame = self.frames.pop(0)
+        return json.loads(frame)
+
+
+def test_failed_request_is_reported_and_the_receiver_keeps_running(monkeypatch):
+    async def can_subscribe(prayer_id, user_id):
+        if prayer_id == 1:
+            raise ConnectionError("DB 연결 실패")
+        return True
+
+    monkeypatch.setattr(realtime_hub, "can_subscribe_prayer", can_subscribe)
+    connection = Connection(1, user_id=7)
+    websocket = FakeWebSocket([
+        '{"action": "subscribe", "prayer_id": 1}',
+        "not json",
+        '["subscribe"]',
+        '{"action": "subscribe"}',
+        '{"action": "publish", "prayer_id": 2}',
+        '{"action": "subscribe", "prayer_id": 2}',
+        '{"action": "unsubscribe", "prayer_id": 2}',
+        '{"action": "subscribe", "prayer_id": 3}',
+    ])
+    try:
+        asyncio.run(realtime_endpoint._receive(websocket, connection))
+        replies = [message["type"] for message in connection.pending.values()]
+        assert replies == ["error"] * 5 + ["subscribed", "unsubscribed", "subscribed"]
+        assert connection.channels == {prayer_channel(3)}
+        # 클라이언트가 연결을 끊었을 때만 종료
+        assert connection.closed
+    finally:
+        realtime_hub.disconnect(connection)
@@ -0,0 +1,42 @@
+"""
+임베디드 복제본: read-your-writes 판단
+"""
+import pytest
+
+from app.db import replica as replica_module
+from app.db.replica import EmbeddedReplica, current_session
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(replica_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(replica_module, "_session_writes", replica_module.OrderedDict())
+    token = current_session.set("writer")
+    yield now
+    current_session.reset(token)
+
+
+def test_session_reads_from_primary_until_a_later_sync_starts(clock):
+    replica = EmbeddedReplica("file:primary.db", None, "replica.db")
+    assert not replica._session_needs_primary()
+
+    replica._record_write()
+    assert replica._session_needs_primary()
+    # 엔진마다 따로 두지 않고 공유 기록만 사용
+    assert list(replica_module._session_writes) == ["writer"]
+    assert not hasattr(replica, "_session_writes")
+
+    # 쓰기 이전에 시작한 동기화는 쓰기를 담지 못함
+    replica._last_sync_started = clock[0] - 1
+    assert replica._session_needs_primary()
+    clock[0] += 1
+    replica._last_sync_started = clock[0]
+    assert not replica._session_needs_primary()
+
+
+def test_session_write_expires_after_the_window(clock):
+    replica = EmbeddedReplica("file:primary.db", None, "replica.db")
+    replica._record_write()
+    clock[0] += replica_module.READ_YOUR_WRITES_WINDOW + 1
+    assert not replica._session_needs_primary()
@@ -0,0 +1,126 @@
+"""
+읽기/쓰기 라우팅: 복제본 지연 추정과 대상 선택
+"""
+import asyncio
+
+import pytest
+
+from app.db import replica as replica_module
+from app.db import router as router_module
+from app.db.replica import current_session
+from app.db.router import RoutingEngine, read_primary
+
+
+class Rows:
+    def __init__(self, rows):
+        self.rows = rows
+
+
+class FakeEngine:
+    """버전 합계만 돌려주는 엔진"""
+
+    def __init__(self, name, version_sum=0):
+        self.name = name
+        self.version_sum = version_sum
+        self.failing = False
+
+    async def get_client(self):
+        return self
+
+    async def execute(self, sql, params=None):
+        if self.failing:
+            raise ConnectionError("down")
+        return Rows([[self.version_sum]])
+
+    async def close(self):
+        pass
+
+    def describe(self):
+        return {"engine": self.name}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(router_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def make_router(primary_sum=10, replica_sum=10):
+    primary, replica = FakeEngine("primary", primary_sum), FakeEngine("replica", replica_sum)
+    return RoutingEngine(primary, [("r1", replica)], max_lag=5.0), primary, replica
+
+
+def test_lagging_replica_is_stale_on_first_observation(clock):
+    routing, primary, replica = make_router(primary_sum=10, replica_sum=5)
+    asyncio.run(routing.probe())
+    assert routing.replicas[0].lag_seconds is None
+    assert routing.choose("SELECT 1") == (primary, "stale_replicas")
+
+    # 복제본이 관측한 합계까지 따라오면 최신
+    replica.version_sum = 10
+    clock[0] += 1
+    asyncio.run(routing.probe())
+    assert routing.replicas[0].lag_seconds == 0.0
+    assert routing.choose("SELECT 1") == (replica, "replica.r1")
+
+
+def test_lag_grows_from_the_last_observation_the_replica_reached(clock):
+    routing, primary, replica = make_router()
+    asyncio.run(routing.probe())
+    assert routing.choose("SELECT 1")[1] == "replica.r1"
+
+    primary.version_sum = 12
+    clock[0] += 3
+    asyncio.run(routing.probe())
+    assert routing.replicas[0].synced_through == 1000.0
+    assert routing.replicas[0].lag_seconds == 3.0
+    assert routing.choose("SELECT 1")[1] == "replica.r1"
+
+    clock[0] += 3
+    asyncio.run(routing.probe())
+    assert routing.replicas[0].lag_seconds == 6.0
+    assert routing.choose("SELECT 1") == (primary, "stale_replicas")
+
+
+def test_failed_probe_marks_replica_unhealthy(clock):
+    routing, primary, replica = make_router()
+    replica.failing = True
+    asyncio.run(routing.probe())
+    assert not routing.replicas[0].healthy
+    assert routing.choose("SELECT 1") == (primary, "stale_replicas")
+
+
+def test_writes_and_hints_go_to_primary(clock):
+    routing, primary, replica = make_router()
+    asyncio.run(routing.probe())
+    assert routing.choose("UPDATE members SET name = ?") == (primary, "write")
+    with read_primary():
+        assert routing.choose("SELECT 1") == (primary, "hint")
+    assert routing.choose("SELECT 1") == (replica, "replica.r1")
+
+
+def test_session_reads_its_write_from_primary_until_replicas_catch_up(clock, monkeypatch):
+    monkeypatch.setattr(replica_module, "_session_writes", replica_module.OrderedDict())
+    routing, primary, replica = make_router()
+    asyncio.run(routing.probe())
+    clock[0] += 1
+
+    async def write_then_read():
+        current_session.set("writer")
+        await routing.execute("UPDATE members SET name = ?", ["새 이름"])
+
+    asyncio.run(write_then_read())
+    # 라우터는 따로 두지 않고 공유 기록만 사용
+    assert list(replica_module._session_writes) == ["writer"]
+    assert not hasattr(routing, "_session_writes")
+
+    token = current_session.set("writer")
+    try:
+        assert routing.choose("SELECT 1") == (primary, "session")
+        primary.version_sum = replica.version_sum = 11
+        clock[0] += 1
+        asyncio.run(routing.probe())
+        assert routing.choose("SELECT 1") == (replica, "replica.r1")
+    finally:
+        current_session.reset(token)
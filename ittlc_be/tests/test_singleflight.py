@@ -0,0 +1,198 @@
+"""
+동일 조회 요청 병합 (single-flight)
+"""
+import asyncio
+
+import pytest
+
+from app.db import replica as replica_module
+from app.db.replica import current_session, record_session_write, session_written_at
+from app.db.router import read_primary
+from app.db.scheduler import BACKGROUND, db_lane
+from app.services.singleflight import SingleFlight
+
+
+class Backend:
+    """호출 수를 세고 release 될 때까지 기다리는 가짜 조회"""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def fetch(self, value="result"):
+        self.calls += 1
+        await self.release.wait()
+        return value
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_concurrent_calls_share_one_execution():
+    async def scenario():
+        flight, backend = SingleFlight(), Backend()
+        callers = [asyncio.create_task(flight.do("key", backend.fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        backend.release.set()
+        assert await asyncio.gather(*callers) == ["result"] * 5
+        assert backend.calls == 1
+        # 끝난 뒤의 호출은 다시 실행
+        assert await flight.do("key", backend.fetch) == "result"
+        assert backend.calls == 2
+
+    run(scenario())
+
+
+def test_first_caller_cancellation_does_not_cancel_others():
+    async def scenario():
+        flight, backend = SingleFlight(), Backend()
+        first = asyncio.create_task(flight.do("key", backend.fetch))
+        second = asyncio.create_task(flight.do("key", backend.fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        backend.release.set()
+        assert await second == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert backend.calls == 1
+
+    run(scenario())
+
+
+def test_errors_are_shared_but_not_cached():
+    async def scenario():
+        flight = SingleFlight(ttl=60.0)
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(flight.do("key", failing), flight.do("key", failing),
+                                       return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert calls == 1
+        with pytest.raises(RuntimeError):
+            await flight.do("key", failing)
+        assert calls == 2
+
+    run(scenario())
+
+
+def test_ttl_results_are_reused_until_forgotten():
+    async def scenario():
+        flight, backend = SingleFlight(ttl=60.0), Backend()
+        backend.release.set()
+        key = ("Service.method", None, (), ())
+        assert await flight.do(key, backend.fetch) == "result"
+        assert await flight.do(key, lambda: backend.fetch("other")) == "result"
+        assert backend.calls == 1
+        flight.forget("Other.method")
+        assert await flight.do(key, backend.fetch) == "result"
+        assert backend.calls == 1
+        flight.forget("Service.method")
+        assert await flight.do(key, lambda: backend.fetch("fresh")) == "fresh"
+        assert backend.calls == 2
+
+    run(scenario())
+
+
+def test_callers_pinned_to_primary_do_not_coalesce():
+    async def scenario():
+        flight, backend = SingleFlight(), Backend()
+        replica_reader = asyncio.create_task(flight.do("key", backend.fetch))
+        await asyncio.sleep(0)
+
+        async def pinned():
+            with read_primary():
+                return await flight.do("key", lambda: backend.fetch("primary"))
+
+        pinned_reader = asyncio.create_task(pinned())
+        await asyncio.sleep(0)
+        backend.release.set()
+        assert await replica_reader == "result"
+        assert await pinned_reader == "primary"
+        assert backend.calls == 2
+
+    run(scenario())
+
+
+def test_session_that_recently_wrote_does_not_coalesce():
+    async def scenario():
+        flight, backend = SingleFlight(), Backend()
+        other = asyncio.create_task(flight.do("key", backend.fetch))
+        await asyncio.sleep(0)
+
+        async def writer_session():
+            current_session.set("writer")
+            record_session_write()
+            return await flight.do("key", lambda: backend.fetch("own write"))
+
+        async def reader_session():
+            current_session.set("reader")
+            return await flight.do("key", lambda: backend.fetch("unused"))
+
+        writer = asyncio.create_task(writer_session())
+        reader = asyncio.create_task(reader_session())
+        await asyncio.sleep(0)
+        backend.release.set()
+        assert await asyncio.gather(other, writer, reader) == ["result", "own write", "result"]
+        assert backend.calls == 2
+
+    run(scenario())
+
+
+def test_coalesce_key_includes_db_lane():
+    async def scenario():
+        flight, backend = SingleFlight(), Backend()
+
+        class Service:
+            @flight.coalesce()
+            async def load(self, value):
+                return await backend.fetch(value)
+
+        service = Service()
+
+        async def background(value):
+            with db_lane(BACKGROUND):
+                return await service.load(value)
+
+        callers = [
+            asyncio.create_task(service.load("a")),
+            asyncio.create_task(service.load("a")),
+            asyncio.create_task(background("a")),
+            asyncio.create_task(service.load("b")),
+        ]
+        await asyncio.sleep(0)
+        backend.release.set()
+        assert await asyncio.gather(*callers) == ["a", "a", "a", "b"]
+        assert backend.calls == 3
+
+    run(scenario())
+
+
+def test_session_write_tracking_expires_and_is_capped(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(replica_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(replica_module, "MAX_TRACKED_SESSIONS", 3)
+    monkeypatch.setattr(replica_module, "_session_writes", replica_module.OrderedDict())
+    tracked = replica_module._session_writes
+
+    for session in ("a", "b", "c", "d"):
+        current_session.set(session)
+        record_session_write()
+    # 상한을 넘으면 가장 오래된 세션부터 버림
+    assert list(tracked) == ["b", "c", "d"]
+    assert session_written_at() == 1000.0
+
+    # 창이 지난 세션은 다음 쓰기 기록 때 정리
+    now[0] += replica_module.READ_YOUR_WRITES_WINDOW + 1
+    assert session_written_at() is None
+    current_session.set("e")
+    record_session_write()
+    assert list(tracked) == ["e"]
+    current_session.set(None)
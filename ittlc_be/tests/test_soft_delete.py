@@ -0,0 +1,120 @@
+"""
+소프트 삭제: 정리 작업과 삭제된 기도 제목의 참여/댓글
+"""
+import asyncio
+
+from app.services.prayer_service_fixed import prayer_service
+from app.services.purge_service import purge_service
+
+OLD = "2000-01-01 00:00:00"
+
+
+async def seed(client):
+    await client.execute(
+        "INSERT INTO users (email, username, password_hash, full_name) VALUES ('a@example.com', 'a', 'x', 'A')"
+    )
+    for name in ("정리 대상", "최근 헌금", "살아 있는 헌금"):
+        await client.execute(
+            "INSERT INTO members (name, birth_date, gender, registration_date, created_by, deleted_at) "
+            "VALUES (?, '1990-01-01', '남', '2020-01-01', 1, ?)",
+            [name, OLD]
+        )
+    # 1: 오래전에 삭제된 헌금 / 2: 최근 삭제된 헌금 / 3: 삭제되지 않은 헌금
+    for member_id, deleted_at in ((1, OLD), (2, "now"), (3, None)):
+        await client.execute(
+            "INSERT INTO offerings (member_id, offering_date, offering_type, amount, created_by, deleted_at) "
+            "VALUES (?, '2024-01-07', '주일헌금', 1000, 1, "
+            "CASE WHEN ? = 'now' THEN CURRENT_TIMESTAMP ELSE ? END)",
+            [member_id, deleted_at, deleted_at]
+        )
+
+
+def test_purge_keeps_members_referenced_by_any_offering(make_engine, monkeypatch):
+    async def scenario():
+        engine = await make_engine()
+        monkeypatch.setattr(purge_service, "get_client", engine.get_client)
+        try:
+            client = await engine.get_client()
+            await seed(client)
+            purged = await purge_service.purge(30)
+            assert purged["offerings"] == 1
+            # 헌금이 같은 실행에서 정리된 성도만 삭제, 최근 삭제된 헌금이 남은 성도는 유지
+            assert purged["members"] == 1
+            members = await client.execute("SELECT name FROM members ORDER BY id")
+            assert [row[0] for row in members.rows] == ["최근 헌금", "살아 있는 헌금"]
+            dangling = await client.execute(
+                "SELECT COUNT(*) FROM offerings o WHERE NOT EXISTS (SELECT 1 FROM members m WHERE m.id = o.member_id)"
+            )
+            assert dangling.rows[0][0] == 0
+        finally:
+            await engine.stop()
+
+    asyncio.run(scenario())
+
+
+def test_purged_family_is_unlinked_from_soft_deleted_members(make_engine, monkeypatch):
+    async def scenario():
+        engine = await make_engine()
+        monkeypatch.setattr(purge_service, "get_client", engine.get_client)
+        try:
+            client = await engine.get_client()
+            await client.execute(
+                "INSERT INTO users (email, username, password_hash, full_name) VALUES ('a@example.com', 'a', 'x', 'A')"
+            )
+            await client.execute("INSERT INTO families (family_name, deleted_at) VALUES ('정리 가정', ?)", [OLD])
+            # 1: 살아 있는 구성원 / 2: 최근 소프트 삭제된 구성원 (아직 정리 대상 아님)
+            for name, deleted_at in (("구성원", None), ("삭제된 구성원", "now")):
+                await client.execute(
+                    "INSERT INTO members (name, birth_date, gender, registration_date, created_by, "
+                    "family_id, family_role, deleted_at) VALUES (?, '1990-01-01', '남', '2020-01-01', 1, 1, '자녀', "
+                    "CASE WHEN ? = 'now' THEN CURRENT_TIMESTAMP ELSE ? END)",
+                    [name, deleted_at, deleted_at]
+                )
+            purged = await purge_service.purge(30)
+            assert purged["families"] == 1
+            assert purged["members"] == 0
+            linked = await client.execute("SELECT COUNT(*) FROM members WHERE family_id IS NOT NULL")
+            assert linked.rows[0][0] == 0
+        finally:
+            await engine.stop()
+
+    asyncio.run(scenario())
+
+def test_deleted_prayer_rejects_participation_and_comments(make_engine, monkeypatch):
+    async def scenario():
+        engine = await make_engine()
+        monkeypatch.setattr(prayer_service, "get_client", engine.get_client)
+        try:
+            client = await engine.get_client()
+            await client.execute(
+                "INSERT INTO users (email, username, password_hash, full_name) VALUES ('a@example.com', 'a', 'x', 'A')"
+            )
+            for title in ("살아 있음", "삭제됨"):
+                await client.execute(
+                    "INSERT INTO prayers (title, content, category, created_by) VALUES (?, '내용', '일반', 1)", [title]
+                )
+            assert await prayer_service.get_prayer_participants(1) == []
+            assert await prayer_service.get_prayer_comments(1) == []
+            joined = await prayer_service.participate_prayer(1, 1)
+            # 다시 참여해도 같은 참여 id
+            assert await prayer_service.participate_prayer(1, 1) == joined
+            assert (await prayer_service.create_prayer_comment(
+                {"prayer_id": 1, "user_id": 1, "comment": "함께 기도합니다"}))["id"]
+            assert [row["user_id"] for row in await prayer_service.get_prayer_participants(1)] == [1]
+            assert [row["comment"] for row in await prayer_service.get_prayer_comments(1)] == ["함께 기도합니다"]
+
+            assert await prayer_service.delete_prayer(2)
+            assert await prayer_service.participate_prayer(2, 1) is None
+            assert await prayer_service.create_prayer_comment({"prayer_id": 2, "user_id": 1, "comment": "x"}) is None
+            assert await prayer_service.get_prayer_participants(2) is None
+            assert await prayer_service.get_prayer_comments(2) is None
+            assert await prayer_service.get_prayer_participants(99) is None
+            orphans = await client.execute(
+                "SELECT (SELECT COUNT(*) FROM prayer_participants WHERE prayer_id = 2)"
+                " + (SELECT COUNT(*) FROM prayer_comments WHERE prayer_id = 2)"
+            )
+            assert orphans.rows[0][0] == 0
+        finally:
+            await engine.stop()
+
+    asyncio.run(scenario())